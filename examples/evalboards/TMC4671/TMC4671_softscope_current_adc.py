@@ -0,0 +1,37 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Sample the raw phase current ADC values of a TMC4671 at a fixed rate via the direct UART interface.
+
+The TMC4671 has no RAMDebug on this path, so the host-side SoftScope is used.
+"""
+
+import pytrinamic
+from pytrinamic.connections import ConnectionManager
+from pytrinamic.ic import TMC4671
+from pytrinamic.datalogger import DataLogger
+from pytrinamic.softscope import SoftScope
+
+pytrinamic.show_info()
+
+with ConnectionManager("--interface uart_ic --port COM10 --data-rate 115200").connect() as my_interface:
+    mc = TMC4671(my_interface)
+
+    scope = SoftScope(my_interface, device=mc)
+    scope.config.log_data = {
+        "ADC_I0_RAW": DataLogger.DataTypeField(block=0, field=TMC4671.FIELD.ADC_I0_RAW, channel=0),
+        "ADC_I1_RAW": DataLogger.DataTypeField(block=0, field=TMC4671.FIELD.ADC_I1_RAW, channel=0),
+    }
+    scope.config.samples_per_channel = 500
+    scope.config.rate_hz = 250
+    scope.start()
+    scope.wait_till_done()
+
+    log = scope.get_log()
+    print(scope.get_statistics())
+    for name, data in log.data.items():
+        print(f"{name}: min={min(data.samples)} max={max(data.samples)}")
+
+print("\nReady.")
@@ -48,7 +48,6 @@ Where <COM-PORT> needs to be replaced by the COM port of the USB-UART cable.
 """
 
 from typing import Literal
-import ctypes
 
 from pytrinamic.connections import ConnectionManager
 from pytrinamic.ic import TMC9660
@@ -72,10 +71,10 @@ with cm.connect() as my_interface:
     elif connection_mode == "headless":
         tmc9660_device = TMC9660(my_interface)
 
-    for register in TMC9660.MCC.registers():
-        register_value = tmc9660_device.read(register)
-        # Convert to unsigned for the hex print not to be negative
-        register_value = ctypes.c_uint32(register_value).value
+    # Read all readable registers in one sweep, read to clear registers are skipped
+    snapshot = tmc9660_device.dump(TMC9660.MCC)
+    for register in snapshot.registers():
+        register_value = snapshot[register.address]
         print(f"{register.name:17}: 0x{register_value:08X}")
         if len(register.fields()) == 1 and register.fields()[0].name == register.name:
             # Do not print the field value if the field is the same as the register
@@ -88,4 +87,3 @@ with cm.connect() as my_interface:
             else:
                 # Just print the field value decimal
                 print(f"  {field.name:24}: {field_value}")
-
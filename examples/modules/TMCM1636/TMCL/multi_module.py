@@ -9,7 +9,7 @@
 """Example script for the TMCM-1636-TMCL that shows how to access two modules within one CAN network."""
 
 from pytrinamic.connections import ConnectionManager
-from pytrinamic.modules import TMCM1636
+from pytrinamic.modules import TMCM1636, scan
 
 
 connection_manager = ConnectionManager("--interface kvaser_tmcl")
@@ -25,3 +25,7 @@ with connection_manager.connect() as my_interface:
         motor = module.motors[0]
         print(motor.get_axis_parameter(motor.AP.AdcOffsetPhaseA))
 
+    # Alternatively, find the modules on the bus instead of hard-coding their IDs
+    for found in scan(my_interface):
+        print(f"Module ID {found.module_id}: {found.name}")
+
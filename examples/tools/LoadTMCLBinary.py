@@ -10,20 +10,19 @@
 # Such binary files can be generated using the TMCL Creator in the TMCL-IDE
 # (switch on the option "Generate binary file") or by the command line tool TMCLAsm.
 
-from functools import partial;
 from pytrinamic.connections import ConnectionManager
-from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.tmclprog import ProgramLoader, load
 
 filename = "test.bin"   # This can be any TMCL binary file generated by the TMCL-IDE or by TMCLAsm
 
-with open(filename, 'rb') as TMCLFile:
-    connection_manager = ConnectionManager("--interface serial_tmcl --port COM4 --data-rate 9600")   # This can also be any other interface
-    with connection_manager.connect() as my_interface:
-        my_interface.send(TMCLCommand.START_DOWNLOAD_MODE, 0, 0, 0)
-        for cmd_array in iter(partial(TMCLFile.read, 8), b''):
-            my_interface.send(cmd_array[0], cmd_array[1], cmd_array[2], (cmd_array[3]<<24)|(cmd_array[4]<<16)|(cmd_array[5]<<8)|(cmd_array[6]))
-       
-        my_interface.send(TMCLCommand.QUIT_DOWNLOAD_MODE, 0, 0, 0)
-        my_interface.send(TMCLCommand.RESET_APPLICATION, 0, 0, 0)
-        my_interface.send(TMCLCommand.RUN_APPLICATION, 0, 0, 0)    # This can be omitted if the porgram does not need to be started right after downloading
-    TMCLFile.close()
+program = load(filename)
+connection_manager = ConnectionManager("--interface serial_tmcl --port COM4 --data-rate 9600")   # This can also be any other interface
+with connection_manager.connect() as my_interface:
+    loader = ProgramLoader(my_interface)
+    # The download is skipped if the module already holds the program
+    if loader.download(program):
+        print(f"Downloaded {len(program)} instructions")
+    else:
+        print("The module already holds the program")
+    loader.reset()
+    loader.run()    # This can be omitted if the program does not need to be started right after downloading
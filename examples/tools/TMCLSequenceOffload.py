@@ -0,0 +1,27 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This program compiles a back-and-forth motion into a TMCL program and runs it on the module.
+# Each step runs on the module itself, so there are no link round trips between the steps.
+
+from pytrinamic.connections import ConnectionManager
+from pytrinamic.tmclprog import Sequence
+
+seq = Sequence()
+seq.set_axis_parameter(4, 0, 51200)     # Maximum velocity
+with seq.repeat(10):
+    seq.move_to(0, 51200)
+    seq.wait_position_reached(0)
+    seq.set_output(0, True)
+    seq.move_to(0, 0)
+    seq.wait_position_reached(0)
+    seq.set_output(0, False)
+
+print(seq.compile().listing())
+
+connection_manager = ConnectionManager("--interface serial_tmcl --port COM4 --data-rate 9600")   # This can also be any other interface
+with connection_manager.connect() as my_interface:
+    seq.run(my_interface, timeout_s=120)
+    print("Done")
@@ -6,69 +6,33 @@
 # This software is proprietary to Analog Devices, Inc. and its licensors.
 ################################################################################
 
-from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError, TMCLStatus
+"""Legacy RAMDebug interface.
+
+This module is kept for existing scripts. It is a thin layer over the Rd class
+also used by the DataLogger: the configuration is sent pipelined, the sample
+buffer is downloaded with pipelined GET_SAMPLE requests and decoded per channel.
+New code should use the DataLogger.
+"""
+
 from enum import IntEnum
 
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError, TMCLStatus
+from pytrinamic.rd import Rd, build_column_decoder
+
 
-class RAMDebug_Command(IntEnum):
-    INIT                        =  0
-    SET_SAMPLE_COUNT            =  1
-    SET_SAMPLING_SOURCE         =  2 # Placeholder
-    SET_PRESCALER               =  3
-    SET_CHANNEL                 =  4
-    SET_TRIGGER_CHANNEL         =  5
-    SET_SHIFT_MASK              =  6
-    ENABLE_TRIGGER              =  7
-    GET_STATE                   =  8
-    GET_SAMPLE                  =  9
-    GET_INFO                    = 10
-    GET_CHANNEL_TYPE            = 11
-    GET_CHANNEL_ADDRESS         = 12
-    SET_PRETRIGGER_SAMPLE_COUNT = 13
-    GET_PRETRIGGER_SAMPLE_COUNT = 14
-    SET_PROCESS_FREQUENCY       = 15
-    SET_TYPE                    = 16
-    SET_EVAL_CHANNEL            = 17
-    SET_ADDRESS                 = 18
-    SET_TRIGGER_TYPE            = 19
-    SET_TRIGGER_EVAL_CHANNEL    = 20
-    SET_TRIGGER_ADDRESS         = 21
-
-
-class RAMDebug_Channel(IntEnum):
-    CHANNEL_CAPTURE_DISABLED   = 0
-    CHANNEL_AXIS_PARAMETER     = 1
-    CHANNEL_REGISTER           = 2
-    CHANNEL_STACKED_REGISTER   = 3
-    CHANNEL_SYSTICK            = 4
-    CHANNEL_RAMDEBUG_PARAMETER = 5
-    CHANNEL_ANALOG_INPUT       = 6
-    CHANNEL_GLOBAL_PARAMETER   = 8
-
-
-class RAMDebug_Info(IntEnum):
-    INFO_MAX_CHANNELS       = 0
-    INFO_BUFFER_ELEMENTS    = 1
-    INFO_SAMPLING_FREQUENCY = 2
-    INFO_CAPTURED_SAMPLES   = 3
-
-
-class RAMDebug_Trigger(IntEnum):
-    TRIGGER_UNCONDITIONAL         = 0
-    TRIGGER_RISING_EDGE_SIGNED    = 1
-    TRIGGER_FALLING_EDGE_SIGNED   = 2
-    TRIGGER_DUAL_EDGE_SIGNED      = 3
-    TRIGGER_RISING_EDGE_UNSIGNED  = 4
-    TRIGGER_FALLING_EDGE_UNSIGNED = 5
-    TRIGGER_DUAL_EDGE_UNSIGNED    = 6
+# The legacy enums are derived from the Rd enums, only the member names differ.
+RAMDebug_Command = IntEnum("RAMDebug_Command", {member.name: member.value for member in Rd._Command}, module=__name__)
+RAMDebug_Channel = IntEnum("RAMDebug_Channel", {f"CHANNEL_{member.name}": member.value for member in Rd.Channel}, module=__name__)
+RAMDebug_Info = IntEnum("RAMDebug_Info", {f"INFO_{member.name}": member.value for member in Rd.Info}, module=__name__)
+RAMDebug_Trigger = IntEnum("RAMDebug_Trigger", {f"TRIGGER_{member.name}": member.value for member in Rd.Trigger}, module=__name__)
 
 
 class RAMDebug_State(IntEnum):
-    IDLE           = 0
-    TRIGGER        = 1
-    CAPTURE        = 2
-    COMPLETE       = 3
-    PRETRIGGER     = 4
+    IDLE           = Rd.State.IDLE
+    TRIGGER        = Rd.State.TRIGGER
+    CAPTURE        = Rd.State.CAPTURE
+    COMPLETE       = Rd.State.COMPLETE
+    PRETRIGGER     = Rd.State.PRETRIGGER
 
     UNKNOWN_STATUS = -1 # Placeholder value in case invalid state values were returned
 
@@ -143,13 +107,19 @@ class Channel():
 
 
 class RAMDebug():
-    def __init__(self, connection):
+    def __init__(self, connection, module_id=None):
+        """
+        If no module ID is given, the default module ID of the connection is used.
+        """
         self._connection = connection
+        self._rd = Rd(connection, module_id)
 
         # Read out the constant RAMDEBUG parameters
-        self.MAX_CHANNELS  = self._command(RAMDebug_Command.GET_INFO.value, 0, RAMDebug_Info.INFO_MAX_CHANNELS.value).value
-        self.MAX_ELEMENTS  = self._command(RAMDebug_Command.GET_INFO.value, 0, RAMDebug_Info.INFO_BUFFER_ELEMENTS.value).value
-        self.MAX_FREQUENCY = self._command(RAMDebug_Command.GET_INFO.value, 0, RAMDebug_Info.INFO_SAMPLING_FREQUENCY.value).value
+        self.MAX_CHANNELS, self.MAX_ELEMENTS, self.MAX_FREQUENCY = self._rd.send_commands([
+            self._rd.build_command(Rd._Command.GET_INFO, 0, Rd.Info.MAX_CHANNELS),
+            self._rd.build_command(Rd._Command.GET_INFO, 0, Rd.Info.BUFFER_ELEMENTS),
+            self._rd.build_command(Rd._Command.GET_INFO, 0, Rd.Info.SAMPLING_FREQUENCY),
+        ])
 
         self._prescaler = 0
         self._process_frequency = 1000
@@ -259,12 +229,14 @@ class RAMDebug():
                 # Non-strict mode: Limit the pretrigger sample count
                 pretrigger_samples = samples
 
-        self._command(RAMDebug_Command.INIT.value, 0, 0)
-        self._command(RAMDebug_Command.SET_SAMPLE_COUNT.value, 0, samples)
-        self._command(RAMDebug_Command.SET_PRESCALER.value, 0, self._prescaler)
+        self._rd.send_commands([
+            self._rd.build_command(Rd._Command.INIT, 0, 0),
+            self._rd.build_command(Rd._Command.SET_SAMPLE_COUNT, 0, samples),
+            self._rd.build_command(Rd._Command.SET_PRESCALER, 0, self._prescaler),
+        ])
 
         try:
-            self._command(RAMDebug_Command.SET_PROCESS_FREQUENCY, 0, self._process_frequency)
+            self._rd.set_process_frequency(self._process_frequency)
         except TMCLReplyStatusError as e:
             if e.status_code == TMCLStatus.WRONG_TYPE:
                 # SET_PROCESS_FREQUENCY not supported -> skip exception
@@ -273,14 +245,14 @@ class RAMDebug():
                 # A different error occurred -> reraise exception
                 raise e
 
-        for channel in self.channels:
-            self._command(RAMDebug_Command.SET_CHANNEL.value, channel.type.value, channel.value)
-
-        self._command(RAMDebug_Command.SET_PRETRIGGER_SAMPLE_COUNT.value, 0, self._pretrigger_samples * self.channel_count())
+        commands = [self._rd.build_command(Rd._Command.SET_CHANNEL, channel.type.value, channel.value) for channel in self.channels]
+        commands.append(self._rd.build_command(Rd._Command.SET_PRETRIGGER_SAMPLE_COUNT, 0, pretrigger_samples))
         if self._trigger_type != RAMDebug_Trigger.TRIGGER_UNCONDITIONAL:
-            self._command(RAMDebug_Command.SET_SHIFT_MASK.value, self._trigger_shift, self._trigger_mask)
-            self._command(RAMDebug_Command.SET_TRIGGER_CHANNEL.value, self._trigger_channel.type.value, self._trigger_channel.value)
-        self._command(RAMDebug_Command.ENABLE_TRIGGER.value, self._trigger_type.value, self._trigger_threshold)
+            commands.append(self._rd.build_command(Rd._Command.SET_SHIFT_MASK, self._trigger_shift, self._trigger_mask))
+            commands.append(self._rd.build_command(Rd._Command.SET_TRIGGER_CHANNEL, self._trigger_channel.type.value, self._trigger_channel.value))
+        commands.append(self._rd.build_command(Rd._Command.ENABLE_TRIGGER, self._trigger_type.value, self._trigger_threshold))
+        self._rd.send_commands(commands)
+        self.samples = None
 
     def is_pretriggering(self):
         return self.get_state() == RAMDebug_State.PRETRIGGER
@@ -293,43 +265,16 @@ class RAMDebug():
         if self.samples:
             return self.samples
 
-        i = 0
-        data = []
-
-        while i < min(self.get_total_samples(), self.MAX_ELEMENTS):
-            reply = self._command(RAMDebug_Command.GET_SAMPLE.value, 0, i)
-            done = reply.status != 0x64
-            if done:
-                break
-            data.append(reply.value)
+        data = self._rd.get_samples(0, min(self.get_total_samples(), self.MAX_ELEMENTS))
 
-            i += 1
-
-        # Split data into list for each channel and apply mask/shift to samples on each channel
+        # Split data into list for each channel and apply mask/shift/sign to samples on each channel
         self.samples = []
-        for i in range(self.channel_count()):
-            # Extract the channel data out of the raw buffer
-            values = data[i::self.channel_count()]
-
-            # Apply mask/shift
-            mask  = self.channels[i].mask
-            shift = self.channels[i].shift
-            values = [(x & mask) >> shift for x in values]
-
-            # Apply signedness
-            if self.channels[i].signed:
-                bits = bin(mask).count("1")
-                values = [self.__to_signed(x, bits) for x in values]
-
-            self.samples.append(values)
+        for i, channel in enumerate(self.channels):
+            decode = build_column_decoder(channel.mask, channel.shift, channel.signed)
+            self.samples.append(decode(data[i::self.channel_count()]))
 
         return self.samples
 
-    @staticmethod
-    def __to_signed(value, bits):
-        mask = 1<<(bits-1)
-        return (value ^ mask) - mask
-
     # Calculates total number of samples across all channels
     def get_total_samples(self):
         if (self._sample_count * self.channel_count() > self.MAX_ELEMENTS) | self._sample_count == 0:
@@ -344,7 +289,7 @@ class RAMDebug():
         """
         Returns the state of this measurement as a RAMDebug_State enum
         """
-        return RAMDebug_State(self._command(RAMDebug_Command.GET_STATE.value, 0, 0).value)
+        return RAMDebug_State(self._rd.get_state())
 
     def __str__(self):
         text  = f"RAMDebug handler for connection {self._connection}\n"
@@ -358,4 +303,4 @@ class RAMDebug():
         """
         Helper wrapper for sending RAMDebug TMCL opcodes
         """
-        return self._connection.send(TMCLCommand.RAMDEBUG, cmd_type, motor, value)
+        return self._connection.send(TMCLCommand.RAMDEBUG, cmd_type, motor, value, self._rd.module_id)
@@ -0,0 +1,370 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Compact binary storage for DataLogger captures.
+
+A capture file holds any number of captures. New captures are appended, an
+index at the end of the file allows to seek to any capture directly. The reader
+memory-maps the file and returns per-channel views without copying the data.
+
+File layout, all numbers little-endian::
+
+    File header:  b"TMCLCAPT", format version (u32), reserved (u32)
+    Capture 0:    b"CAPT", header length (u32), JSON header, padding to 8 bytes,
+                  time vector (f64 * sample count),
+                  channel 0 samples, padding to 8 bytes,
+                  channel 1 samples, padding to 8 bytes, ...
+    Capture 1:    ...
+    Index:        b"INDX", capture count (u32), capture offsets (u64 * count)
+    Trailer:      index offset (u64), b"TEND", reserved (u32)
+
+The JSON header contains the rate, the sample count, trigger information,
+optional user metadata and for every channel its name, the sample typecode and
+the identity of the object requested for logging.
+
+Usage::
+
+    with CaptureFileWriter("captures.tmclog") as writer:
+        writer.append(datalogger.log, datalogger=datalogger)
+
+    with CaptureFileReader("captures.tmclog") as reader:
+        capture = reader[-1]
+        currents = capture.samples("ADC_I0")  # memoryview, no copy
+        log = capture.to_log()
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass
+from array import array
+import numbers
+import struct
+import json
+import mmap
+import sys
+import os
+
+from pytrinamic.datalogger import DataLogger
+from pytrinamic.modules.tmcl_module import Parameter
+from pytrinamic.ic.tmc_ic import Register, Field
+
+
+_FILE_MAGIC = b"TMCLCAPT"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<8sII")
+_CAPTURE_HEADER = struct.Struct("<4sI")
+_INDEX_HEADER = struct.Struct("<4sI")
+_TRAILER = struct.Struct("<Q4sI")
+
+_ITEM_SIZES = {"i": 4, "I": 4, "q": 8, "d": 8}
+
+
+class CaptureFileError(Exception):
+    pass
+
+
+def _padding(length: int) -> int:
+    return -length % 8
+
+
+def _choose_typecode(samples) -> str:
+    if not samples:
+        return "i"
+    if not all(isinstance(sample, numbers.Integral) for sample in samples):
+        # Scaled samples, e.g. currents in ampere
+        if not all(isinstance(sample, numbers.Real) for sample in samples):
+            raise CaptureFileError("Samples have to be integers or floats!")
+        return "d"
+    low = min(samples)
+    high = max(samples)
+    if -2**31 <= low and high < 2**31:
+        return "i"
+    if 0 <= low and high < 2**32:
+        return "I"
+    return "q"
+
+
+def _identity(request_object) -> dict:
+    """Describe the object requested for logging in a JSON compatible way."""
+    if isinstance(request_object, Parameter):
+        return {
+            "kind": "parameter",
+            "group": request_object.parent.name,
+            "name": request_object.name,
+            "category": request_object.category.name,
+            "index": request_object.index,
+            "block": request_object.parent.block,
+            "signed": request_object.datatype == Parameter.Datatype.SIGNED,
+        }
+    if isinstance(request_object, Register):
+        return {
+            "kind": "register",
+            "group": request_object.parent.name,
+            "name": request_object.name,
+            "block": request_object.parent.block,
+            "channel": request_object.parent.channel,
+            "address": request_object.address,
+            "signed": bool(request_object.signed),
+        }
+    if isinstance(request_object, Field):
+        return {
+            "kind": "field",
+            "register": request_object.parent.name,
+            "name": request_object.name,
+            "block": request_object.parent.parent.block,
+            "channel": request_object.parent.parent.channel,
+            "address": request_object.parent.address,
+            "mask": request_object.mask,
+            "shift": request_object.shift,
+            "signed": bool(request_object.signed),
+        }
+    if isinstance(request_object, DataLogger.DataTypeAp):
+        return {"kind": "datatype_ap", "index": request_object.index, "axis": request_object.axis, "signed": request_object.signed}
+    if isinstance(request_object, DataLogger.DataTypeGp):
+        return {"kind": "datatype_gp", "index": request_object.index, "bank": request_object.bank, "signed": request_object.signed}
+    if isinstance(request_object, DataLogger.DataTypeRegister):
+        return {"kind": "datatype_register", "block": request_object.block, "channel": request_object.channel, "address": request_object.address, "signed": request_object.signed}
+    if isinstance(request_object, DataLogger.DataTypeField):
+        return {"kind": "datatype_field", "block": request_object.block, "channel": request_object.channel, "address": request_object.address, "mask": request_object.mask, "shift": request_object.shift, "signed": request_object.signed}
+    if isinstance(request_object, DataLogger.DataTypeSysTick):
+        return {"kind": "datatype_systick"}
+    if request_object is None:
+        return {"kind": "none"}
+    return {"kind": "other", "repr": repr(request_object)}
+
+
+def _datatype_from_identity(identity: dict):
+    """Recreate a DataLogger.DataType from an identity, None if that is not possible."""
+    kind = identity["kind"]
+    if kind == "datatype_ap" or (kind == "parameter" and identity["category"] == "AXIS"):
+        return DataLogger.DataTypeAp(index=identity["index"], axis=identity.get("axis", 0), signed=identity["signed"])
+    if kind == "datatype_gp" or (kind == "parameter" and identity["category"] == "GLOBAL"):
+        return DataLogger.DataTypeGp(index=identity["index"], bank=identity.get("bank", identity.get("block", 0)), signed=identity["signed"])
+    if kind in ("datatype_register", "register"):
+        return DataLogger.DataTypeRegister(block=identity["block"], channel=identity["channel"], address=identity["address"], signed=identity["signed"])
+    if kind in ("datatype_field", "field"):
+        return DataLogger.DataTypeField(
+            block=identity["block"],
+            field=(identity["address"], identity["mask"], identity["shift"]),
+            channel=identity["channel"],
+            signed=identity["signed"],
+        )
+    if kind == "datatype_systick":
+        return DataLogger.DataTypeSysTick()
+    return None
+
+
+class CaptureFileWriter:
+    """Appends captures to a capture file, the file is created if it does not exist."""
+
+    def __init__(self, path):
+        self._path = path
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as file:
+                file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, 0))
+                index_offset = file.tell()
+                file.write(_INDEX_HEADER.pack(b"INDX", 0))
+                file.write(_TRAILER.pack(index_offset, b"TEND", 0))
+        self._file = open(path, "r+b")
+        self._offsets = _read_index(self._file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def append(self, log: DataLogger.Log, *, datalogger: Optional[DataLogger] = None, metadata: Optional[dict] = None) -> int:
+        """Append a capture and return its index in the file.
+
+        :param log: The log to store.
+        :param datalogger: If given, the trigger configuration is stored with the capture.
+        :param metadata: Additional JSON compatible information to store with the capture.
+        """
+        sample_count = len(log.time_vector)
+        channels = []
+        blocks = []
+        for name, log_data in log.data.items():
+            if len(log_data.samples) != sample_count:
+                raise CaptureFileError(f"Channel {name} has {len(log_data.samples)} samples, the time vector {sample_count}!")
+            typecode = _choose_typecode(log_data.samples)
+            channels.append({"name": name, "typecode": typecode, "identity": _identity(log_data.request_object)})
+            blocks.append(array(typecode, log_data.samples))
+
+        header = {
+            "rate_hz": log.rate_hz,
+            "period_s": log.period_s,
+            "sample_count": sample_count,
+            "trigger": self._trigger_info(datalogger),
+            "metadata": metadata or {},
+            "channels": channels,
+        }
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+        self._file.seek(self._index_offset())
+        self._file.truncate()
+        offset = self._file.tell()
+        self._file.write(_CAPTURE_HEADER.pack(b"CAPT", len(header_bytes)))
+        self._file.write(header_bytes)
+        self._file.write(bytes(_padding(_CAPTURE_HEADER.size + len(header_bytes))))
+        for block in [array("d", log.time_vector)] + blocks:
+            if sys.byteorder != "little":
+                block.byteswap()
+            data = block.tobytes()
+            self._file.write(data)
+            self._file.write(bytes(_padding(len(data))))
+        self._offsets.append(offset)
+
+        index_offset = self._file.tell()
+        self._file.write(_INDEX_HEADER.pack(b"INDX", len(self._offsets)))
+        self._file.write(struct.pack(f"<{len(self._offsets)}Q", *self._offsets))
+        self._file.write(_TRAILER.pack(index_offset, b"TEND", 0))
+        self._file.flush()
+        return len(self._offsets) - 1
+
+    def _index_offset(self) -> int:
+        self._file.seek(-_TRAILER.size, os.SEEK_END)
+        index_offset, _, _ = _TRAILER.unpack(self._file.read(_TRAILER.size))
+        return index_offset
+
+    @staticmethod
+    def _trigger_info(datalogger: Optional[DataLogger]) -> Optional[dict]:
+        if datalogger is None:
+            return None
+        return {
+            "type": datalogger._trigger_type.name,
+            "threshold": datalogger._trigger_threshold,
+            "on": _identity(datalogger._trigger_on),
+            "pretrigger_samples_per_channel": datalogger._pretrigger_samples_per_channel,
+            "down_sampling_factor": datalogger._down_sampling_factor,
+        }
+
+
+def _read_index(file) -> List[int]:
+    file.seek(0)
+    magic, version, _ = _FILE_HEADER.unpack(file.read(_FILE_HEADER.size))
+    if magic != _FILE_MAGIC:
+        raise CaptureFileError("Not a capture file!")
+    if version != _FILE_VERSION:
+        raise CaptureFileError(f"Unsupported capture file version {version}!")
+    file.seek(-_TRAILER.size, os.SEEK_END)
+    index_offset, end_magic, _ = _TRAILER.unpack(file.read(_TRAILER.size))
+    if end_magic != b"TEND":
+        raise CaptureFileError("The capture file is truncated!")
+    file.seek(index_offset)
+    index_magic, count = _INDEX_HEADER.unpack(file.read(_INDEX_HEADER.size))
+    if index_magic != b"INDX":
+        raise CaptureFileError("The capture file index is corrupted!")
+    return list(struct.unpack(f"<{count}Q", file.read(8*count)))
+
+
+class CaptureFileReader:
+    """Memory-maps a capture file for random access to its captures."""
+
+    @dataclass
+    class Channel:
+        name: str
+        typecode: str
+        identity: dict
+        offset: int
+
+    class Capture:
+        """One capture of the file, the sample views point directly into the mapped file."""
+
+        def __init__(self, buffer: memoryview, offset: int):
+            magic, header_length = _CAPTURE_HEADER.unpack_from(buffer, offset)
+            if magic != b"CAPT":
+                raise CaptureFileError(f"No capture at offset {offset}!")
+            start = offset + _CAPTURE_HEADER.size
+            self.header = json.loads(bytes(buffer[start:start + header_length]).decode("utf-8"))
+            self.rate_hz = self.header["rate_hz"]
+            self.period_s = self.header["period_s"]
+            self.sample_count = self.header["sample_count"]
+            self.trigger = self.header["trigger"]
+            self.metadata = self.header["metadata"]
+            self._buffer = buffer
+
+            position = start + header_length
+            position += _padding(position - offset)
+            self._time_offset = position
+            position += 8*self.sample_count
+            self.channels: Dict[str, CaptureFileReader.Channel] = {}
+            for channel in self.header["channels"]:
+                self.channels[channel["name"]] = CaptureFileReader.Channel(
+                    name=channel["name"],
+                    typecode=channel["typecode"],
+                    identity=channel["identity"],
+                    offset=position,
+                )
+                length = _ITEM_SIZES[channel["typecode"]]*self.sample_count
+                position += length + _padding(length)
+
+        def _view(self, offset: int, typecode: str):
+            raw = self._buffer[offset:offset + _ITEM_SIZES[typecode]*self.sample_count]
+            if sys.byteorder == "little":
+                return raw.cast(typecode)
+            # Big-endian hosts cannot use the data in place.
+            values = array(typecode, raw.tobytes())
+            values.byteswap()
+            return memoryview(values)
+
+        @property
+        def time_vector(self) -> memoryview:
+            return self._view(self._time_offset, "d")
+
+        def samples(self, name: str) -> memoryview:
+            channel = self.channels[name]
+            return self._view(channel.offset, channel.typecode)
+
+        def to_log(self, resolver: Optional[Callable[[dict], object]] = None) -> DataLogger.Log:
+            """Copy the capture into a DataLogger.Log.
+
+            The request objects are recreated as DataLogger.DataType objects. Map
+            objects like Parameter, Register or Field cannot be recreated from the
+            file, pass a `resolver` to map the stored identities to such objects.
+            """
+            data = {}
+            for name, channel in self.channels.items():
+                request_object = resolver(channel.identity) if resolver else _datatype_from_identity(channel.identity)
+                data[name] = DataLogger.LogData(samples=self.samples(name).tolist(), request_object=request_object)
+            return DataLogger.Log(
+                rate_hz=self.rate_hz,
+                period_s=self.period_s,
+                time_vector=self.time_vector.tolist(),
+                data=data,
+            )
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._offsets = _read_index(self._file)
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exit_type, value, traceback):
+        del exit_type, value, traceback
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file. All views returned by captures must be released before."""
+        self._buffer.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> CaptureFileReader.Capture:
+        return CaptureFileReader.Capture(self._buffer, self._offsets[index])
+
+    def __iter__(self):
+        for offset in self._offsets:
+            yield CaptureFileReader.Capture(self._buffer, offset)
@@ -0,0 +1,284 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Update the firmware of many modules at once.
+
+The targets are listed in a JSON manifest::
+
+    [
+        {"interface": "pcan_tmcl", "port": "0", "module_id": 1, "hex_file": "TMCM-1636.hex"},
+        {"interface": "pcan_tmcl", "port": "0", "module_id": 2, "hex_file": "TMCM-1636.hex"},
+        {"interface": "usb_tmcl", "port": "COM5", "module_id": 1, "hex_file": "TMCM-1617.hex", "data_rate": 115200}
+    ]
+
+Every physical link (interface and port) is served by its own thread. Modules
+sharing a link, e.g. a CAN bus, are updated together: the buffer writes of
+their pages are interleaved into one pipelined stream.
+
+The outcome of every target is stored in a results file. Running again with
+the same results file only retries the targets that did not succeed.
+"""
+
+from typing import Dict, List, Optional
+import dataclasses
+import argparse
+import threading
+import logging
+import json
+import time
+import sys
+import os
+
+from pytrinamic.connections import ConnectionManager
+from pytrinamic.tmcl import TMCLCommand, TMCLReplyStatusError
+from pytrinamic.cli.tmclfwupload import FirmwareUpdateError, prepare_update, verify_update, finish_update, page_write_requests, check_written_page
+
+
+@dataclasses.dataclass
+class Target:
+    interface: str
+    port: str
+    module_id: int
+    hex_file: str
+    data_rate: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.interface}:{self.port}#{self.module_id}"
+
+    @property
+    def link(self) -> tuple:
+        return (self.interface, self.port, self.data_rate)
+
+
+@dataclasses.dataclass
+class TargetResult:
+    name: str
+    success: bool
+    verified: bool = False
+    """The checksum of the flash matched the image after the upload."""
+    pages_written: int = 0
+    pages_total: int = 0
+    duration_s: float = 0.0
+    error: Optional[str] = None
+
+
+def load_manifest(path) -> List[Target]:
+    with open(path, "r") as f:
+        entries = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    targets = []
+    for entry in entries:
+        target = Target(**entry)
+        # Hex files are relative to the manifest.
+        target.hex_file = os.path.join(base_dir, target.hex_file)
+        targets.append(target)
+    names = [target.name for target in targets]
+    if len(set(names)) != len(names):
+        raise ValueError("The manifest lists a module more than once!")
+    return targets
+
+
+def load_results(path) -> Dict[str, TargetResult]:
+    if path is None or not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return {entry["name"]: TargetResult(**entry) for entry in json.load(f)}
+
+
+def save_results(path, results: Dict[str, TargetResult]) -> None:
+    with open(path, "w") as f:
+        json.dump([dataclasses.asdict(result) for result in results.values()], f, indent=4)
+
+
+def connect(link):
+    interface, port, data_rate = link
+    arguments = ["--interface", interface, "--port", str(port)]
+    if data_rate is not None:
+        arguments += ["--data-rate", str(data_rate)]
+    return ConnectionManager(arguments).connect()
+
+
+class _Reporter:
+    """Prefixes the output of every target with its name, shared by all worker threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def for_target(self, target):
+        def log(*args):
+            with self._lock:
+                print(f"[{target.name}]", *args)
+        return log
+
+
+def update_link(iface, targets: List[Target], *, reporter=None, **options) -> Dict[str, TargetResult]:
+    """Update all targets on one link.
+
+    :param options: Passed on to prepare_update(), e.g. delta=True.
+    """
+    reporter = reporter or _Reporter()
+    results = {}
+    plans = {}
+    start_times = {}
+    for target in targets:
+        log = reporter.for_target(target)
+        start_times[target.name] = time.perf_counter()
+        try:
+            plans[target.name] = prepare_update(iface, target.hex_file, module_id=target.module_id, log=log, **options)
+        except Exception as e:
+            results[target.name] = TargetResult(name=target.name, success=False, error=str(e))
+            log(f"Error: {e}")
+
+    active = [target for target in targets if target.name in plans]
+    failed = _interleaved_upload(iface, [plans[target.name] for target in active], reporter, {target.module_id: target for target in active})
+
+    for target in active:
+        plan = plans[target.name]
+        log = reporter.for_target(target)
+        result = TargetResult(name=target.name, success=False, pages_written=len(plan.pages_to_write), pages_total=len(plan.pages))
+        try:
+            if target.module_id in failed:
+                raise failed[target.module_id]
+            verify_update(iface, plan)
+            result.verified = True
+            finish_update(iface, plan, log=log, verified=True)
+            result.success = True
+        except Exception as e:
+            result.error = str(e)
+            log(f"Error: {e}")
+        result.duration_s = time.perf_counter() - start_times[target.name]
+        results[target.name] = result
+    return results
+
+
+def _interleaved_upload(iface, plans, reporter, targets_by_module_id) -> dict:
+    """Upload the pages of all plans step by step, return the errors by module ID.
+
+    In every step the buffer writes of the next page of every module are
+    interleaved and sent pipelined, followed by the page writes.
+    """
+    failed = {}
+    step = 0
+    while True:
+        active = [plan for plan in plans if plan.module_id not in failed and step < len(plan.pages_to_write)]
+        if not active:
+            return failed
+
+        streams = [page_write_requests(iface, plan.image, plan.pages_to_write[step].address, plan.page_size, plan.module_id) for plan in active]
+        requests = [request for group in _round_robin(streams) for request in group]
+        page_requests = [
+            iface.build_request(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, plan.pages_to_write[step].address, plan.module_id)
+            for plan in active
+        ]
+        try:
+            iface.send_requests(requests)
+            iface.send_requests(page_requests)
+        except TMCLReplyStatusError as e:
+            # Drop the failing module and redo the step for the others, their page buffers are simply refilled.
+            module_id = e.reply.module_address
+            if module_id not in targets_by_module_id:
+                raise
+            failed[module_id] = e
+            continue
+
+        for plan in active:
+            reporter.for_target(targets_by_module_id[plan.module_id])(
+                f"Page {step + 1}/{len(plan.pages_to_write)} written (0x{plan.pages_to_write[step].address:08X})"
+            )
+            if plan.delta and step == 0:
+                try:
+                    check_written_page(iface, plan, plan.pages_to_write[0])
+                except FirmwareUpdateError as e:
+                    failed[plan.module_id] = e
+        step += 1
+
+
+def _round_robin(streams):
+    """Yield one request of every stream in turn, as tuples."""
+    length = max(len(stream) for stream in streams)
+    for i in range(length):
+        yield tuple(stream[i] for stream in streams if i < len(stream))
+
+
+def run_fleet(targets: List[Target], *, results=None, connect_link=connect, **options) -> Dict[str, TargetResult]:
+    """Update all targets, one thread per link. Targets already successful in `results` are skipped."""
+    results = dict(results or {})
+    pending = [target for target in targets if not (target.name in results and results[target.name].success)]
+    by_link = {}
+    for target in pending:
+        by_link.setdefault(target.link, []).append(target)
+
+    reporter = _Reporter()
+    lock = threading.Lock()
+
+    def worker(link, link_targets):
+        try:
+            iface = connect_link(link)
+        except Exception as e:
+            link_results = {target.name: TargetResult(name=target.name, success=False, error=f"Connection failed: {e}") for target in link_targets}
+        else:
+            try:
+                link_results = update_link(iface, link_targets, reporter=reporter, **options)
+            except Exception as e:
+                link_results = {target.name: TargetResult(name=target.name, success=False, error=str(e)) for target in link_targets}
+            finally:
+                iface.close()
+        with lock:
+            results.update(link_results)
+
+    threads = [threading.Thread(target=worker, args=item, name=f"tmclfwfleet {item[0]}") for item in by_link.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def main(cmd_line_args=None):
+    parser = argparse.ArgumentParser(description="Update the firmware of the modules listed in a manifest")
+    parser.add_argument("manifest", help="JSON list of targets with interface, port, module_id, hex_file and optional data_rate")
+    parser.add_argument('--results', default="tmclfwfleet_results.json",
+                        help="Results file. Targets marked successful in it are skipped, so a rerun only retries the failed ones")
+    parser.add_argument('-v', '--verbose', action="count", default=0, help="Verbosity level")
+    parser.add_argument('--delta', action="store_true",
+                        help="Only rewrite the pages that differ from the flash content, without a full erase."
+                             " The bootloader has to erase a page when writing it, a module stops after the first page otherwise")
+    parser.add_argument('--verify-memory', action="store_true", help="In delta mode, compare pages with matching checksums word by word")
+    parser.add_argument('--blank-value', type=lambda x: int(x, 0), default=None, help="Value of erased flash bytes")
+    parser.add_argument('--cache-dir', default=None, help="Directory for the cached page index of hex files")
+    args = parser.parse_args(cmd_line_args)
+
+    if args.verbose == 0:
+        log_level = logging.ERROR
+    elif args.verbose == 1:
+        log_level = logging.WARNING
+    elif args.verbose == 2:
+        log_level = logging.INFO
+    else:
+        log_level = logging.DEBUG
+    logging.basicConfig(stream=sys.stdout, level=log_level)
+
+    targets = load_manifest(args.manifest)
+    results = run_fleet(
+        targets,
+        results=load_results(args.results),
+        delta=args.delta,
+        verify_memory=args.verify_memory,
+        blank_value=args.blank_value,
+        cache_dir=args.cache_dir,
+    )
+    save_results(args.results, results)
+
+    print()
+    for target in targets:
+        result = results[target.name]
+        status = "OK" if result.success else f"FAILED ({result.error})"
+        print(f"{target.name:32} {status:40} {result.pages_written:4}/{result.pages_total:<4} pages {result.duration_s:7.1f} s")
+    return 0 if all(results[target.name].success for target in targets) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,9 +9,13 @@
 import argparse
 import sys
 import time
-import math
 import re
+import os
+import json
+import struct
+import hashlib
 import logging
+import dataclasses
 import intelhex
 import serial
 
@@ -19,13 +23,163 @@ import pytrinamic
 from pytrinamic.connections import ConnectionManager
 from pytrinamic.connections import UsbTmclInterface, CanTmclInterface
 from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.poller import wait_until, PollTimeoutError
 
 # Timeout in seconds for reconnecting to the module after sending the TMCL_BOOT
 # command.
 SERIAL_BOOT_TIMEOUT = 100
 
-current_page = None
-current_page_dirty = None
+
+@dataclasses.dataclass
+class PageInfo:
+    address: int
+    """Start address of the flash page."""
+    start: int
+    """First address of the page covered by the image."""
+    end: int
+    """End of the range covered by the image (exclusive)."""
+    checksum: int
+    """Byte sum of the image data within the page."""
+    blank: bool
+    """The page contains no data of the hex file, only padding."""
+
+
+class FirmwareImage:
+    """The firmware of a hex file as one contiguous, padded buffer.
+
+    The buffer is padded to a multiple of 4 bytes, so it can be split into the
+    32 bit words written with BOOT_WRITE_BUFFER.
+    """
+
+    def __init__(self, file: intelhex.IntelHex, padding=0x00):
+        self.start_address = file.minaddr()
+        self.end_address = file.maxaddr() + 1
+        self.length = self.end_address - self.start_address
+        self.padding = padding
+        file.padding = padding
+        data = file.tobinarray(start=self.start_address, size=self.length).tobytes()
+        # The gaps are filled with the padding, the checksum covers it as the device will.
+        self.checksum = sum(data) & 0xFFFFFFFF
+        self.data = data + bytes(-len(data) % 4)
+        self._segments = file.segments()
+
+    def words(self, start_address, end_address):
+        """Return the little-endian 32 bit words between the two addresses."""
+        start = max(start_address - self.start_address, 0)
+        end = min(end_address - self.start_address, len(self.data))
+        if end <= start:
+            return ()
+        return struct.unpack_from(f"<{(end - start)//4}I", self.data, start)
+
+    def page_index(self, page_size):
+        """Split the image into the flash pages of the bootloader."""
+        pages = []
+        first_page = self.start_address - self.start_address % page_size
+        for address in range(first_page, self.end_address, page_size):
+            start = max(address, self.start_address)
+            end = min(address + page_size, self.end_address)
+            pages.append(PageInfo(
+                address=address,
+                start=start,
+                end=end,
+                checksum=sum(self.data[start - self.start_address:end - self.start_address]) & 0xFFFFFFFF,
+                blank=not any(seg_start < address + page_size and address < seg_end for seg_start, seg_end in self._segments),
+            ))
+        return pages
+
+
+def load_page_index(image, hex_file, page_size, cache_dir=None):
+    """Return the page index of the image, cached on disk by the hash of the hex file."""
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "pytrinamic", "tmclfwupload")
+    with open(hex_file, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{digest}_{page_size:X}_{image.start_address:X}_{image.padding:02X}.json")
+
+    try:
+        with open(cache_file, "r") as f:
+            return [PageInfo(**entry) for entry in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        pass
+
+    pages = image.page_index(page_size)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump([dataclasses.asdict(page) for page in pages], f)
+    except OSError as e:
+        logging.warning(f"Failed to cache the page index: {e}")
+    return pages
+
+
+def read_device_page_checksums(iface, pages, *, module_id=None):
+    """Return the byte sum of the flash content of every page.
+
+    BOOT_GET_CHECKSUM returns the byte sum from the start of the firmware area
+    up to the given address. The sums of the single pages are the differences
+    of the cumulative sums at the page ends, queried pipelined.
+    """
+    requests = [iface.build_request(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, page.end - 1, module_id) for page in pages]
+    cumulative = [reply.value for reply in iface.send_requests(requests)]
+    return [(total - previous) & 0xFFFFFFFF for previous, total in zip([0] + cumulative, cumulative)]
+
+
+def page_matches_memory(iface, image, page, *, module_id=None):
+    """Compare the flash content of a page word by word using BOOT_READ_MEMORY.
+
+    The value of the BOOT_READ_MEMORY request is the address, the reply value
+    the 32 bit word stored there.
+    """
+    start = page.start - (page.start - image.start_address) % 4
+    addresses = range(start, page.end, 4)
+    requests = [iface.build_request(TMCLCommand.BOOT_READ_MEMORY, 0, 0, address, module_id) for address in addresses]
+    device_words = [reply.value for reply in iface.send_requests(requests)]
+    return device_words == list(image.words(start, start + 4*len(device_words)))
+
+
+def check_written_page(iface, plan, page):
+    """Raise a FirmwareUpdateError if the flash content of a written page differs from the image.
+
+    Delta updates skip the full erase and rely on BOOT_WRITE_PAGE erasing the
+    page. Checking the first written page stops the update of a bootloader
+    which does not, before more pages are corrupted.
+    """
+    addresses = [page.end - 1] if page.start == plan.image.start_address else [page.start - 1, page.end - 1]
+    requests = [iface.build_request(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, address, plan.module_id) for address in addresses]
+    cumulative = [reply.value for reply in iface.send_requests(requests)]
+    checksum = (cumulative[-1] - (cumulative[0] if len(cumulative) > 1 else 0)) & 0xFFFFFFFF
+    if checksum != page.checksum:
+        raise FirmwareUpdateError(
+            f"Page 0x{page.address:08X} differs from the image after writing it, the bootloader does not erase pages on write."
+            " Update without delta mode."
+        )
+
+
+def page_write_requests(iface, image, page, page_size, module_id=None):
+    """Return the BOOT_WRITE_BUFFER requests filling the page buffer with the image data of a page."""
+    requests = []
+    offset = max(image.start_address - page, 0)//4
+    for word in image.words(page, page + page_size):
+        requests.append(iface.build_request(TMCLCommand.BOOT_WRITE_BUFFER, offset % 256, offset // 256, word, module_id))
+        offset += 1
+    return requests
+
+
+def upload_pages(iface, image, page_size, page_addresses, *, module_id=None):
+    """Write the image data of the given pages.
+
+    The BOOT_WRITE_BUFFER requests of one page are sent pipelined. The page is
+    written with BOOT_WRITE_PAGE once all buffer writes are acknowledged.
+    """
+    for page in page_addresses:
+        if page == 0:
+            raise ValueError
+
+        iface.send_requests(page_write_requests(iface, image, page, page_size, module_id))
+
+        print("Writing page 0x{0:08X}".format(page))
+        iface.send(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, page, module_id)
+
 
 def main(cmd_line_args=None):
     # ################################ Commandline ##################################
@@ -36,6 +190,13 @@ def main(cmd_line_args=None):
 
     # Optional arguments
     parser.add_argument('-v', '--verbose', action="count", default=0, help="Verbosity level")
+    parser.add_argument('--delta', action="store_true",
+                        help="Only rewrite the pages that differ from the flash content, without a full erase."
+                             " The bootloader has to erase a page when writing it, the update stops after the first page otherwise")
+    parser.add_argument('--verify-memory', action="store_true", help="In delta mode, compare pages with matching checksums word by word")
+    parser.add_argument('--blank-value', type=lambda x: int(x, 0), default=None,
+                        help="Value of erased flash bytes. Gaps of the hex file are filled with it and pages without data are skipped")
+    parser.add_argument('--cache-dir', default=None, help="Directory for the cached page index of hex files")
 
     # ConnectionManager arguments
     ConnectionManager.argparse(parser)
@@ -60,70 +221,122 @@ def main(cmd_line_args=None):
 
     print("Connecting")
 
-    return firmware_update(connection_manager.connect(), args.hex_file)
+    return firmware_update(
+        connection_manager.connect(),
+        args.hex_file,
+        delta=args.delta,
+        verify_memory=args.verify_memory,
+        blank_value=args.blank_value,
+        cache_dir=args.cache_dir,
+    )
+
+
+class FirmwareUpdateError(Exception):
+    pass
+
+
+@dataclasses.dataclass
+class UpdatePlan:
+    """A module in bootloader mode, ready to receive the pages of the image."""
+    module_id: int
+    image: FirmwareImage
+    page_size: int
+    pages: list
+    pages_to_write: list
+    delta: bool = False
+    """The flash was not erased, see check_written_page()."""
+
+
+def firmware_update(iface, hex_file, *, delta=False, verify_memory=False, blank_value=None, cache_dir=None, module_id=None):
+    """
+    Upload a firmware hex file through the TMCL bootloader.
+
+    :param delta: Do not erase the whole flash, only rewrite the pages whose
+        content differs from the image. The bootloader has to erase a page when
+        it is written, which is checked after the first page. There is no TMCL
+        command to erase a single page.
+    :param verify_memory: In delta mode, additionally compare the pages with
+        matching checksums word by word.
+    :param blank_value: The value of erased flash bytes. The gaps in the hex
+        file are filled with it, so pages without any data can be skipped.
+    :param cache_dir: Where the page index of the hex file is cached.
+    :param module_id: The module to update, the default module ID of the interface if None.
+    """
+    try:
+        plan = prepare_update(iface, hex_file, delta=delta, verify_memory=verify_memory, blank_value=blank_value, cache_dir=cache_dir, module_id=module_id)
+
+        print("Uploading new firmware...")
+        pages_to_write = plan.pages_to_write
+        if plan.delta and pages_to_write:
+            upload_pages(iface, plan.image, plan.page_size, [pages_to_write[0].address], module_id=module_id)
+            check_written_page(iface, plan, pages_to_write[0])
+            pages_to_write = pages_to_write[1:]
+        upload_pages(iface, plan.image, plan.page_size, [page.address for page in pages_to_write], module_id=module_id)
+
+        print()
+        finish_update(iface, plan)
+    except FirmwareUpdateError as e:
+        print(f"Error: {e}")
+        return 1
 
 
-def firmware_update(iface, hex_file):
+def prepare_update(iface, hex_file, *, delta=False, verify_memory=False, blank_value=None, cache_dir=None, module_id=None, log=print):
+    """
+    Bring the module into bootloader mode, check the image against it and
+    either erase the flash or, in delta mode, find the pages that differ.
 
+    Raises a FirmwareUpdateError if the image does not fit the module.
+    """
     ############################### Hex file parsing ###############################
-    print("Opening hex file (" + hex_file + ")")
+    log("Opening hex file (" + hex_file + ")")
     file = intelhex.IntelHex(hex_file)
-    file.padding = 0x00
     # ########################## Binary data preparation ############################
 
-    # Get the boundaries and size of the data
-    start_address = file.minaddr()
-    end_address = file.maxaddr() + 1
-    length = end_address - start_address
-
-    # Calculate the checksum
-    checksum = 0
-    for addr in file.addresses():
-        checksum += file[addr]
-        checksum &= 0xFFFFFFFF
+    image = FirmwareImage(file, padding=0x00 if blank_value is None else blank_value)
 
-    logging.info("Start address: 0x{0:08X}".format(start_address))
-    logging.info("End address:   0x{0:08X}".format(end_address))
-    logging.info("Length:        0x{0:08X}".format(length))
-    logging.info("Checksum:      0x{0:08X}".format(checksum))
+    logging.info("Start address: 0x{0:08X}".format(image.start_address))
+    logging.info("End address:   0x{0:08X}".format(image.end_address))
+    logging.info("Length:        0x{0:08X}".format(image.length))
+    logging.info("Checksum:      0x{0:08X}".format(image.checksum))
 
     # Some TMCL-CAN based bootloaders use 0x7FF as CAN-identifier in the response frame, so we need to let it through. 
     if isinstance(iface, CanTmclInterface):
         filters = iface._connection.filters
-        filters.append({"can_id": 0x7FF, "can_mask": 0x7FF})
-        iface._connection.set_filters(filters)
+        if {"can_id": 0x7FF, "can_mask": 0x7FF} not in filters:
+            filters.append({"can_id": 0x7FF, "can_mask": 0x7FF})
+            iface._connection.set_filters(filters)
 
     # ############################# Bootloader entry ################################
-    # Connect to the evaluation board
+    boot_module_id = 1 if module_id is None else module_id
 
     # If not already in bootloader, enter it
-    if not "B" in iface.get_version_string().upper():
+    if not "B" in iface.get_version_string(module_id).upper():
         # Send the boot command
-        print("Switching to bootloader mode")
-        iface.send_boot(1)
+        log("Switching to bootloader mode")
+        iface.send_boot(boot_module_id)
 
         if isinstance(iface, UsbTmclInterface):
             iface.close()
             time.sleep(1)
             # Reconnect after a small delay
-            print("Reconnecting")
-            timestamp = time.time()
-            while (time.time() - timestamp) < SERIAL_BOOT_TIMEOUT:
+            log("Reconnecting")
+
+            def try_open():
                 try:
-                    # Attempt to connect
                     iface._serial.open()
-                    # If no exception occurred, exit the retry loop
-                    break
+                    return True
                 except serial.serialutil.SerialException:
-                    pass
-            else:
-                print("Error: Timeout when attempting to reconnect to bootloader")
-                return 1
+                    return False
+
+            try:
+                wait_until(try_open, timeout_s=SERIAL_BOOT_TIMEOUT, initial_interval_s=0.01, max_interval_s=0.5, description="the bootloader")
+            except PollTimeoutError:
+                raise FirmwareUpdateError("Timeout when attempting to reconnect to bootloader")
 
     time.sleep(1)
 
     # Retrieve the bootloader version
-    bootloaderVersion = iface.get_version_string(1)
+    bootloaderVersion = iface.get_version_string(boot_module_id)
     found = re.search(r"\d\d\d\dB\d\d\d", bootloaderVersion)
     if found:
         pattern = found.group(0)[0:4] + r"V\d\d\d"
@@ -134,13 +347,12 @@ def firmware_update(iface, hex_file):
             pattern = found.group(0)[0:3] + r"V\d\.\d\d"
             logging.info(f"Scanning new firmware data for correct module string ({found.group(0)[0:3]}V#.##)")
         else:
-            logging.error(f"GetVersion returned invalid answer ({bootloaderVersion})")
-            return 1
+            raise FirmwareUpdateError(f"GetVersion returned invalid answer ({bootloaderVersion})")
 
     # Scan for the module string
     found = None
     for segment in file.segments():
-        print(segment)
+        log(segment)
         segment_start = segment[0]
         segment_length = segment[1] - segment[0]
         firmware_bytes = file.gets(segment_start, segment_length)
@@ -150,20 +362,19 @@ def firmware_update(iface, hex_file):
         if found:
             break
     else:
-        print("Error: No matching version string found in firmware image")
-        return 1
+        raise FirmwareUpdateError("No matching version string found in firmware image")
 
-    print("Bootloader version: " + bootloaderVersion)
-    print("Firmware version:   " + found.group(0))
+    log("Bootloader version: " + bootloaderVersion)
+    log("Firmware version:   " + found.group(0))
 
-    print()
+    log()
 
     # Get the memory parameters
-    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 0, 0, 0)
+    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 0, 0, 0, module_id)
     mem_page_size = reply.value
-    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 1, 0, 0)
+    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 1, 0, 0, module_id)
     mem_start_address = reply.value
-    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 2, 0, 0)
+    reply = iface.send(TMCLCommand.BOOT_GET_INFO, 2, 0, 0, module_id)
     mem_size = reply.value
 
     logging.debug(f"Bootloader memory page size:      0x{mem_page_size:08X}")
@@ -172,83 +383,63 @@ def firmware_update(iface, hex_file):
 
     # Check if the page size is a power of two
     if not(((mem_page_size & (mem_page_size - 1)) == 0) and mem_page_size != 0):
-        print("Error: Page size of module is not a power of two")
-        print("Reported page size: {0:X}".format(mem_page_size))
-        return 1
+        raise FirmwareUpdateError("Page size of module is not a power of two\nReported page size: {0:X}".format(mem_page_size))
 
     # Check if the start addresses match
-    if start_address != mem_start_address:
-        print("Error: Start address of firmware (0x{0:08X}) does not match start address of bootloader (0x{1:08X})".format(start_address, mem_start_address))
-        return 1
+    if image.start_address != mem_start_address:
+        raise FirmwareUpdateError("Start address of firmware (0x{0:08X}) does not match start address of bootloader (0x{1:08X})".format(image.start_address, mem_start_address))
 
     # ############################## Firmware upload ################################
 
-    # Erase the old firmware
-    print("Erasing the old firmware")
-    reply = iface.send(TMCLCommand.BOOT_ERASE_ALL, 0, 0, 0)
-
-    global current_page
-    global current_page_dirty
-    # Calculate the starting page
-    current_page = math.floor(start_address/mem_page_size) * mem_page_size
-    # Store the internal page buffer state
-    current_page_dirty = False
+    pages = load_page_index(image, hex_file, mem_page_size, cache_dir)
 
+    if delta:
+        log("Comparing the firmware with the flash content")
+        device_checksums = read_device_page_checksums(iface, pages, module_id=module_id)
+        pages_to_write = [
+            page for page, device_checksum in zip(pages, device_checksums)
+            if device_checksum != page.checksum or (verify_memory and not page_matches_memory(iface, image, page, module_id=module_id))
+        ]
+        log(f"{len(pages_to_write)} of {len(pages)} pages differ")
+    else:
+        # Erase the old firmware
+        log("Erasing the old firmware")
+        iface.send(TMCLCommand.BOOT_ERASE_ALL, 0, 0, 0, module_id)
+        # Erased pages already hold the padding of pages without data.
+        pages_to_write = [page for page in pages if blank_value is None or not page.blank]
 
-    # Helper function: BOOT_WRITE_PAGE safety wrapper
-    def writePage(page):
-        if page == 0:
-            raise ValueError
-
-        print("Writing page 0x{0:08X}".format(page))
-        iface.send(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, current_page)
-
-
-    # Helper function: Write a 32 bit data block
-    def write32Bit(address, write_data):
-        global current_page
-        global current_page_dirty
-
-        # Split the address of the entry into page/offset values
-        page = math.floor(address/mem_page_size) * mem_page_size
-        offset = address - page
-
-        if page != current_page:
-            writePage(current_page)
-            current_page = page
-            current_page_dirty = False
+    return UpdatePlan(module_id=module_id, image=image, page_size=mem_page_size, pages=pages, pages_to_write=pages_to_write, delta=delta)
 
-        # print("Writing {0:08X} to offset {1:04X} on page {2:08X}".format(writeData, offset, page))
-        iface.send(TMCLCommand.BOOT_WRITE_BUFFER, math.floor(offset / 4) % 256, math.floor(math.floor(offset / 4) / 256), write_data)
-        current_page_dirty = True
 
-    print("Uploading new firmware...")
-    for addr in range(start_address, end_address, 4):
-        value = file[addr+3] << 24 | file[addr+2] << 16 | file[addr+1] << 8 | file[addr]
-        write32Bit(addr, value)
+def verify_update(iface, plan):
+    """Raise a FirmwareUpdateError if the checksum of the flash does not match the image."""
+    image = plan.image
+    reply = iface.send(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, image.end_address - 1, plan.module_id)
+    if reply.value != image.checksum:
+        raise FirmwareUpdateError("Checksums don't match! (Checksum: 0x{0:08X}, received: 0x{1:08X}".format(image.checksum, reply.value))
 
-    # If the last page didn't get written yet, write it
-    if current_page_dirty:
-        writePage(current_page)
 
-    print()
+def finish_update(iface, plan, *, log=print, verified=False):
+    """Verify the checksum of the flash, store length and checksum and start the firmware.
 
-    # Checksum verification
-    reply = iface.send(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, end_address - 1)
-    if reply.value != checksum:
-        print("Error: Checksums don't match! (Checksum: 0x{0:08X}, received: 0x{1:08X}".format(checksum, reply.value))
-        return 1
+    :param verified: The checksum was already checked with verify_update().
+    """
+    image = plan.image
+    module_id = plan.module_id
 
-    print("Checksum of the uploaded firmware matches")
-    print("Finalizing upload (Writing length and checksum)")
+    if not verified:
+        verify_update(iface, plan)
+    log("Checksum of the uploaded firmware matches")
+    log("Finalizing upload (Writing length and checksum)")
     # Write firmware length
-    iface.send(TMCLCommand.BOOT_WRITE_LENGTH, 0, 0, length)
+    iface.send(TMCLCommand.BOOT_WRITE_LENGTH, 0, 0, image.length, module_id)
     # Write firmware checksum
-    iface.send(TMCLCommand.BOOT_WRITE_LENGTH, 1, 0, checksum)
+    iface.send(TMCLCommand.BOOT_WRITE_LENGTH, 1, 0, image.checksum, module_id)
 
     # Restart the firmware
-    print("Starting the firmware")
-    iface.send_start_app()
+    log("Starting the firmware")
+    iface.send_start_app(module_id)
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,50 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""List the modules responding on a bus, e.g. tmclscan --interface pcan_tmcl"""
+
+import argparse
+import logging
+import time
+import sys
+
+from pytrinamic.connections import ConnectionManager
+from pytrinamic.modules import scan
+
+
+def _module_id_range(text):
+    first, _, last = text.partition("-")
+    first = int(first, 0)
+    last = int(last, 0) if last else first
+    if not 0 <= first <= last <= 255:
+        raise argparse.ArgumentTypeError(f"Invalid module ID range: {text}")
+    return range(first, last + 1)
+
+
+def main(cmd_line_args=None):
+    parser = argparse.ArgumentParser(description="Find and identify the modules on a bus")
+    parser.add_argument('--ids', type=_module_id_range, default=range(1, 256), help="Module IDs to probe, e.g. 1-16 (default: 1-255)")
+    parser.add_argument('--scan-timeout', type=float, default=0.02, help="Receive timeout per probe window in seconds")
+    parser.add_argument('-v', '--verbose', action="count", default=0, help="Verbosity level")
+    ConnectionManager.argparse(parser)
+    args = parser.parse_args(cmd_line_args)
+
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG if args.verbose else logging.ERROR)
+
+    connection_manager = ConnectionManager(cmd_line_args if cmd_line_args is not None else sys.argv)
+    with connection_manager.connect() as iface:
+        start = time.perf_counter()
+        found = scan(iface, args.ids, timeout_s=args.scan_timeout)
+        duration = time.perf_counter() - start
+
+    for module in found:
+        major, minor = module.firmware_version
+        print(f"Module ID {module.module_id:3}: {module.name} (module number {module.module_number}), firmware {major}.{minor:02}")
+    print(f"Found {len(found)} module(s) in {duration:.3f} s")
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
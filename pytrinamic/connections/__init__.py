@@ -1,12 +1,37 @@
-from .dummy_tmcl_interface import DummyTmclInterface
-from .can_tmcl.pcan_tmcl_interface import PcanTmclInterface
-from .can_tmcl.socketcan_tmcl_interface import SocketcanTmclInterface
-from .can_tmcl.kvaser_tmcl_interface import KvaserTmclInterface
-from .serial_tmcl_interface import SerialTmclInterface
-from .socket_tmcl_interface import SocketTmclInterface
-from .uart_ic_interface import UartIcInterface
-from .usb_tmcl_interface import UsbTmclInterface
-from .can_tmcl_interface import CanTmclInterface
-from .can_tmcl.slcan_tmcl_interface import SlcanTmclInterface
-from .can_tmcl.ixxat_tmcl_interface import IxxatTmclInterface
-from .connection_manager import ConnectionManager
+"""
+The interface classes are imported on first access, so the optional backends
+(python-can, pyserial, ...) are only needed for the interfaces actually used.
+"""
+
+import sys
+
+from pytrinamic.lazy import LazyPackage, lazy_import
+from .connection_manager import ConnectionManager, ProbeResult
+from .link_speed import LinkSpeedStep
+
+_LAZY_ATTRIBUTES = {
+    "DummyTmclInterface": ".dummy_tmcl_interface",
+    "PcanTmclInterface": ".can_tmcl.pcan_tmcl_interface",
+    "SocketcanTmclInterface": ".can_tmcl.socketcan_tmcl_interface",
+    "KvaserTmclInterface": ".can_tmcl.kvaser_tmcl_interface",
+    "SerialTmclInterface": ".serial_tmcl_interface",
+    "SocketTmclInterface": ".socket_tmcl_interface",
+    "UartIcInterface": ".uart_ic_interface",
+    "UsbTmclInterface": ".usb_tmcl_interface",
+    "CanTmclInterface": ".can_tmcl_interface",
+    "SlcanTmclInterface": ".can_tmcl.slcan_tmcl_interface",
+    "IxxatTmclInterface": ".can_tmcl.ixxat_tmcl_interface",
+}
+
+__all__ = ['ConnectionManager', 'ProbeResult', 'LinkSpeedStep'] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    return lazy_import(sys.modules[__name__], name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = LazyPackage
@@ -14,6 +14,12 @@ from ..connections.tmcl_interface import TmclInterface
 class CanTmclInterface(TmclInterface):
     """Generic CAN interface class for the CAN adapters."""
 
+    # CAN arbitration rules out collisions, only the receive buffers of the modules limit the window.
+    _PIPELINE_WINDOW = 4
+
+    # Data rates tried by ConnectionManager.probe() after the default data rate
+    PROBE_DATA_RATES = [1000000, 500000, 250000, 125000]
+
     def __init__(self, channel, datarate, host_id, default_module_id, timeout_s):
 
         TmclInterface.__init__(self, host_id, default_module_id)
@@ -86,6 +92,12 @@ class CanTmclInterface(TmclInterface):
 
         return bytearray([msg.arbitration_id]) + msg.data
 
+    def set_timeout(self, timeout):
+        self._timeout_s = timeout if timeout != 0 else None
+
+    def get_timeout(self):
+        return self._timeout_s
+
     @staticmethod
     def supports_tmcl():
         return True
@@ -7,23 +7,90 @@
 ################################################################################
 
 import sys
+import time
 import logging
 import argparse
+import threading
+import dataclasses
+import collections.abc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
-from ..connections import DummyTmclInterface
-from ..connections import PcanTmclInterface
-from ..connections import SocketcanTmclInterface
-from ..connections import KvaserTmclInterface
-from ..connections import SerialTmclInterface
-from ..connections import UartIcInterface
-from ..connections import UsbTmclInterface
-from ..connections import SlcanTmclInterface
-from ..connections import IxxatTmclInterface
-from ..connections import SocketTmclInterface
+from ..tmcl import TMCLCommand
+from .. import connections
 
 logger = logging.getLogger(__name__)
 
 
+class _InterfaceList(collections.abc.MutableSequence):
+    """
+    The list type of ConnectionManager.INTERFACES.
+
+    Reading an entry returns a (string representation, class, default
+    datarate) tuple. A class may be stored by its name in
+    pytrinamic.connections, it is imported when its entry is read.
+    """
+
+    def __init__(self, entries=()):
+        self._entries = list(entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _InterfaceList(self._entries[index])
+        return self._resolve(self._entries[index])
+
+    def __setitem__(self, index, entry):
+        self._entries[index] = entry
+
+    def __delitem__(self, index):
+        del self._entries[index]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def insert(self, index, entry):
+        self._entries.insert(index, entry)
+
+    def __add__(self, other):
+        return _InterfaceList(self._entries + _entries(other))
+
+    def __radd__(self, other):
+        return _InterfaceList(_entries(other) + self._entries)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._entries!r})"
+
+    @staticmethod
+    def _resolve(entry):
+        name, interface_class, data_rate = entry
+        if isinstance(interface_class, str):
+            try:
+                interface_class = getattr(connections, interface_class)
+            except ImportError as e:
+                raise ImportError(f"The interface {name} is not available, its backend is missing: {e}") from e
+        return name, interface_class, data_rate
+
+
+def _entries(interfaces):
+    """Return the entries of an interface list without importing their classes."""
+    if isinstance(interfaces, _InterfaceList):
+        return list(interfaces._entries)
+    return list(interfaces)
+
+
+@dataclasses.dataclass
+class ProbeResult:
+    port: str
+    data_rate: int
+    module_number: int
+    firmware_version: Tuple[int, int]
+    """Major and minor version."""
+    latency_s: float
+    """Round trip time of the GET_FIRMWARE_VERSION handshake."""
+    connection: Optional[object] = None
+    """The open connection if probe() was asked to keep it open, otherwise None."""
+
+
 class ConnectionManager:
     """
     This class provides a centralized way of extracting connection-specific
@@ -57,6 +124,9 @@ class ConnectionManager:
                 number 0.
             - "interactive":
                 Shows an interactive dialoge for selecting the port to use.
+            - "probe":
+                Use the first port that answers a TMCL handshake, trying the
+                data rates of probe() unless --data-rate is given.
             - Any other string:
                 Attempt to use the provided string to connect with the selected
                 interface directly. E.g. for a serial connection you can use
@@ -99,19 +169,21 @@ class ConnectionManager:
     """
 
     # All available interfaces
-    # The tuples consist of (string representation, class type, default datarate)
-    INTERFACES = [
-        ("dummy_tmcl", DummyTmclInterface, 0),
-        ("kvaser_tmcl", KvaserTmclInterface, 1000000),
-        ("pcan_tmcl", PcanTmclInterface, 1000000),
-        ("slcan_tmcl", SlcanTmclInterface, 1000000),
-        ("socketcan_tmcl", SocketcanTmclInterface, 1000000),
-        ("serial_tmcl", SerialTmclInterface, 9600),
-        ("uart_ic", UartIcInterface, 9600),
-        ("usb_tmcl", UsbTmclInterface, 115200),
-        ("ixxat_tmcl", IxxatTmclInterface, 1000000),
-        ("socket_serial_tmcl", SocketTmclInterface, 1000000),
-    ]
+    # The tuples consist of (string representation, class, default datarate).
+    # The classes are given by their names in pytrinamic.connections and only imported when their entry is read,
+    # so a missing backend, e.g. python-can, only matters for its interfaces.
+    INTERFACES = _InterfaceList([
+        ("dummy_tmcl", "DummyTmclInterface", 0),
+        ("kvaser_tmcl", "KvaserTmclInterface", 1000000),
+        ("pcan_tmcl", "PcanTmclInterface", 1000000),
+        ("slcan_tmcl", "SlcanTmclInterface", 1000000),
+        ("socketcan_tmcl", "SocketcanTmclInterface", 1000000),
+        ("serial_tmcl", "SerialTmclInterface", 9600),
+        ("uart_ic", "UartIcInterface", 9600),
+        ("usb_tmcl", "UsbTmclInterface", 115200),
+        ("ixxat_tmcl", "IxxatTmclInterface", 1000000),
+        ("socket_serial_tmcl", "SocketTmclInterface", 1000000),
+    ])
 
     def __init__(self, arg_list=None, connection_type="any"):
         # Attributes
@@ -135,10 +207,11 @@ class ConnectionManager:
         args = arg_parser.parse_known_args(arg_list)[0]
 
         # Argument storage - default parameters are set here
-        self.__interface = UsbTmclInterface
+        self.__interface = None
         self.__port = "any"
         self.__no_port = []
         self.__data_rate = 115200
+        self.__data_rate_given = False
         self.__host_id = 2
         self.__module_id = 1
 
@@ -146,16 +219,13 @@ class ConnectionManager:
 
         # ## Interpret given arguments
         # Interface
-        for actual_interface in self.INTERFACES:
-            if connection_type == "tmcl" and not (actual_interface[1].supports_tmcl()):
-                continue
-
+        for actual_interface in _entries(self.INTERFACES):
             if args.interface[0] == actual_interface[0]:
-                self.__interface = actual_interface[1]
+                self.__interface = self.interface_class(actual_interface[0])
                 self.__data_rate = actual_interface[2]
                 break
-        else:
-            # The for loop never hit the break statement -> invalid interface
+
+        if self.__interface is None or (connection_type == "tmcl" and not self.__interface.supports_tmcl()):
             raise ValueError("Invalid interface: {0:s}".format(args.interface[0]))
 
         # Port
@@ -164,7 +234,7 @@ class ConnectionManager:
 
         # No-Port
         for port in args.exclude:
-            if port in ["any", "interactive"]:
+            if port in ["any", "interactive", "probe"]:
                 raise ValueError(
                     "Port blacklist (no-port) cannot use the special port: " + port
                 )
@@ -172,6 +242,7 @@ class ConnectionManager:
         # Data rate
         try:
             self.__data_rate = int(args.data_rate[0])
+            self.__data_rate_given = True
         except ValueError as exc:
             raise ValueError("Invalid data rate: " + args.data_rate[0]) from exc
         except TypeError:
@@ -232,6 +303,12 @@ class ConnectionManager:
 
             # "interactive" -> Show a selection dialog
             port = self.__interactive_port_selection()
+        elif self.__port == "probe":
+            results = self.probe(first_only=True, keep_open=True)
+            if not results:
+                raise ConnectionError("No port answered the TMCL handshake")
+            self.__connection = results[0].connection
+            return self.__connection
         elif self.__port == "any":
             # Check if ports are available
             if len(port_list) == 0:
@@ -290,6 +367,88 @@ class ConnectionManager:
     def disconnect(self):
         self.__connection.close()
 
+    def probe_data_rates(self):
+        """Return the data rates probe() tries, in order."""
+        if self.__data_rate_given:
+            return [self.__data_rate]
+        common = getattr(self.__interface, "PROBE_DATA_RATES", [])
+        return [self.__data_rate] + [rate for rate in common if rate != self.__data_rate]
+
+    def probe(self, *, first_only=True, keep_open=False, timeout_s=0.1):
+        """
+        Find the ports with a responding TMCL module.
+
+        All ports of list_connections() are probed concurrently, each with the
+        data rates of probe_data_rates() one after another. A port counts as
+        responding when the module answers GET_FIRMWARE_VERSION within the
+        timeout. The probe therefore takes at most one timeout per data rate,
+        independent of the number of ports.
+
+        :param first_only: Stop probing as soon as one port responded.
+        :param keep_open: Keep the responding connections open in the
+            results, otherwise they are closed again.
+        :param timeout_s: The receive timeout of the handshake.
+
+        Returns a list of ProbeResult objects, sorted by latency.
+        """
+        if not self.__interface.supports_tmcl():
+            raise ValueError(f"Probing needs a TMCL interface, {self.__interface.__name__} is none")
+
+        found = threading.Event()
+        data_rates = self.probe_data_rates()
+
+        def probe_port(port):
+            for data_rate in data_rates:
+                if first_only and found.is_set():
+                    return None
+                result = self.__probe_endpoint(port, data_rate, timeout_s)
+                if result is None:
+                    continue
+                if first_only and found.is_set():
+                    # Another port was faster.
+                    result.connection.close()
+                    return None
+                found.set()
+                if not keep_open:
+                    result.connection.close()
+                    result.connection = None
+                return result
+            return None
+
+        ports = self.list_connections()
+        if not ports:
+            return []
+        with ThreadPoolExecutor(max_workers=len(ports), thread_name_prefix="ConnectionManager.probe") as executor:
+            results = [result for result in executor.map(probe_port, ports) if result is not None]
+        return sorted(results, key=lambda result: result.latency_s)
+
+    def __probe_endpoint(self, port, data_rate, timeout_s):
+        try:
+            connection = self.__interface(port, data_rate, self.__host_id, self.__module_id, timeout_s=timeout_s)
+        except Exception as e:
+            # The adapters raise all kinds of exceptions for ports that are busy or gone.
+            logger.debug("Probing %s at %s failed to open: %s", port, data_rate, e)
+            return None
+        try:
+            start = time.perf_counter()
+            reply = connection.send(TMCLCommand.GET_FIRMWARE_VERSION, 1, 0, 0)
+            latency_s = time.perf_counter() - start
+        except Exception as e:
+            logger.debug("Probing %s at %s got no handshake: %s", port, data_rate, e)
+            connection.close()
+            return None
+        if hasattr(connection, "set_timeout"):
+            connection.set_timeout(self.__timeout_s)
+        logger.info("Probing %s at %s: module %d answered in %.1f ms", port, data_rate, reply.value >> 16, latency_s * 1000)
+        return ProbeResult(
+            port=port,
+            data_rate=data_rate,
+            module_number=reply.value >> 16,
+            firmware_version=((reply.value >> 8) & 0xFF, reply.value & 0xFF),
+            latency_s=latency_s,
+            connection=connection,
+        )
+
     def list_connections(self):
         # Get the list of ports
         port_list = self.__interface.list()
@@ -359,7 +518,7 @@ class ConnectionManager:
             nargs=1,
             type=str,
             choices=[
-                actual_interface[0] for actual_interface in ConnectionManager.INTERFACES
+                actual_interface[0] for actual_interface in _entries(ConnectionManager.INTERFACES)
             ],
             default=["usb_tmcl"],
             help="Connection interface (default: %(default)s)",
@@ -371,7 +530,7 @@ class ConnectionManager:
             nargs=1,
             type=str,
             default=["any"],
-            help='Connection port (default: %(default)s, n: Use n-th available port, "any": Use any available port, "interactive": Interactive dialogue for port selection, String: Attempt to use the provided string - e.g. COM6 or /dev/tty3)',
+            help='Connection port (default: %(default)s, n: Use n-th available port, "any": Use any available port, "interactive": Interactive dialogue for port selection, "probe": Use the first port answering a TMCL handshake, String: Attempt to use the provided string - e.g. COM6 or /dev/tty3)',
         )
         group.add_argument(
             "--no-port",
@@ -425,7 +584,19 @@ class ConnectionManager:
 
     @staticmethod
     def list_supported_interfaces():
-        return [x[0] for x in ConnectionManager.INTERFACES]
+        return [x[0] for x in _entries(ConnectionManager.INTERFACES)]
+
+    @staticmethod
+    def interface_class(name):
+        """
+        Return the class of the interface with the given name, importing its backend on first use.
+
+        Raises a ValueError for unknown names and an ImportError if the backend is not installed.
+        """
+        for entry in _entries(ConnectionManager.INTERFACES):
+            if entry[0] == name:
+                return _InterfaceList._resolve(entry)[1]
+        raise ValueError("Invalid interface: {0:s}".format(name))
 
 
 if __name__ == "__main__":
@@ -433,6 +604,7 @@ if __name__ == "__main__":
 
     print("Verifying interfaces list...\n")
     for interface in ConnectionManager.INTERFACES:
+        interface = (interface[0], ConnectionManager.interface_class(interface[0]))
         if not hasattr(interface[1], "supports_tmcl"):
             raise NotImplementedError(
                 "Interface " + interface[0] + " is missing the supports_tmcl() function"
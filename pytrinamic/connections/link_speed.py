@@ -0,0 +1,138 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import dataclasses
+import time
+from typing import List, Optional
+
+
+@dataclasses.dataclass
+class LinkSpeedStep:
+    data_rate: int
+    success: bool
+    throughput_bytes_s: Optional[float] = None
+    """Payload bytes per second over verified round trips, in both directions."""
+    error: Optional[str] = None
+
+
+class LinkSpeedMixin:
+    """
+    Adds upgrade_link_speed() to serial interfaces.
+
+    The interface implements the hooks below. The device is asked to switch
+    first, then the host follows, so _request_device_data_rate() is always
+    sent at the rate both sides currently use.
+    """
+
+    LINK_DATA_RATES: List[int] = []
+    """The data rates the device can be switched to."""
+    _LINK_ROUND_TRIP_BYTES = 0
+    _LINK_NEGOTIATION_TIMEOUT_S = 0.2
+    """Receive timeout while trying data rates, a failed rate only costs a few of them."""
+
+    def _link_data_rate(self) -> int:
+        raise NotImplementedError
+
+    def _set_host_data_rate(self, data_rate):
+        raise NotImplementedError
+
+    def _request_device_data_rate(self, data_rate):
+        raise NotImplementedError
+
+    def _link_round_trip(self):
+        """Do one round trip and raise if the reply is missing or wrong."""
+        raise NotImplementedError
+
+    def _get_link_timeout(self):
+        raise NotImplementedError
+
+    def _set_link_timeout(self, timeout_s):
+        raise NotImplementedError
+
+    def measure_link_throughput(self, round_trips=20) -> float:
+        """Return the payload bytes per second of `round_trips` verified round trips."""
+        start = time.perf_counter()
+        for _ in range(round_trips):
+            self._link_round_trip()
+        return round_trips * self._LINK_ROUND_TRIP_BYTES / (time.perf_counter() - start)
+
+    def upgrade_link_speed(self, data_rates=None, *, round_trips=20) -> List[LinkSpeedStep]:
+        """
+        Switch the link to the highest data rate that works.
+
+        The rates above the current one are tried from the highest down. For
+        every rate the device is asked to switch, the host follows and the link
+        is verified and measured with `round_trips` round trips. On failure
+        both sides fall back to the previous rate before the next lower rate
+        is tried. If the device accepted a rate but still talks at the
+        previous one, e.g. because it applies the rate after a restart, no
+        further rates are tried.
+
+        The receive timeout is shortened to _LINK_NEGOTIATION_TIMEOUT_S
+        meanwhile and restored afterwards.
+
+        :param data_rates: The rates to try, defaults to LINK_DATA_RATES.
+        :return: One step per tried rate, the first one measures the current rate.
+        :raises ConnectionError: If the link is lost and the fall back fails.
+        """
+        original = self._link_data_rate()
+        timeout_s = self._get_link_timeout()
+        self._set_link_timeout(self._LINK_NEGOTIATION_TIMEOUT_S)
+        try:
+            steps = [LinkSpeedStep(original, True, self.measure_link_throughput(round_trips))]
+            candidates = sorted({rate for rate in (data_rates or self.LINK_DATA_RATES) if rate > original}, reverse=True)
+            for data_rate in candidates:
+                try:
+                    self._request_device_data_rate(data_rate)
+                except Exception as e:
+                    # The device refused the rate, nothing has changed.
+                    steps.append(LinkSpeedStep(data_rate, False, error=str(e)))
+                    continue
+                self._set_host_data_rate(data_rate)
+                try:
+                    throughput = self.measure_link_throughput(round_trips)
+                except Exception as e:
+                    if self._fall_back(data_rate, original):
+                        # The next rates would be accepted without effect as well.
+                        steps.append(LinkSpeedStep(data_rate, False, error=f"The device accepted {data_rate} but still uses {original}"))
+                        break
+                    steps.append(LinkSpeedStep(data_rate, False, error=str(e)))
+                    continue
+                steps.append(LinkSpeedStep(data_rate, True, throughput))
+                break
+        finally:
+            self._set_link_timeout(timeout_s)
+        return steps
+
+    def _fall_back(self, failed_rate, original) -> bool:
+        """Bring both sides back to the original rate, return True if the device never left it."""
+        self._set_host_data_rate(original)
+        try:
+            self._link_round_trip()
+        except Exception:
+            pass
+        else:
+            # The device may have stored the request, take it back.
+            self._request_device_data_rate(original)
+            return True
+
+        # The device has switched, tell it to go back at the failed rate.
+        self._set_host_data_rate(failed_rate)
+        try:
+            self._request_device_data_rate(original)
+        except Exception:
+            pass
+        self._set_host_data_rate(original)
+        # Garbled bytes may have left the device in the middle of a datagram, give it a few tries to resynchronize.
+        for attempt in range(3):
+            try:
+                self._link_round_trip()
+                break
+            except Exception as e:
+                if attempt == 2:
+                    raise ConnectionError(f"Lost the link after trying {failed_rate}, it does not work at {original} anymore") from e
+        # The device may not have switched but stored the request, take it back.
+        self._request_device_data_rate(original)
+        return False
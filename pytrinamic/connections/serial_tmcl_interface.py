@@ -11,13 +11,40 @@ import logging
 from serial import Serial, SerialException
 import serial.tools.list_ports
 from ..connections.tmcl_interface import TmclInterface
-from ..tmcl import TMCLReplyChecksumError
+from ..connections.link_speed import LinkSpeedMixin
+from ..tmcl import TMCLCommand, TMCLReplyChecksumError
 
 
-class SerialTmclInterface(TmclInterface):
+class SerialTmclInterface(TmclInterface, LinkSpeedMixin):
     """
     Opens a serial TMCL connection
+
+    upgrade_link_speed() switches the module with global parameter 65, the
+    RS232/RS485 baud rate. Modules which only apply it after a restart stay
+    at the current rate. On an RS485 bus only the addressed module switches,
+    the other modules are not reachable at the new rate anymore.
     """
+
+    # Data rates tried by ConnectionManager.probe() after the default data rate
+    PROBE_DATA_RATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600, 1000000]
+
+    # Values of global parameter 65 by baud rate
+    BAUD_RATE_INDEX = {
+        9600: 0,
+        14400: 1,
+        19200: 2,
+        28800: 3,
+        38400: 4,
+        57600: 5,
+        76800: 6,
+        115200: 7,
+        230400: 8,
+        250000: 9,
+        500000: 10,
+        1000000: 11,
+    }
+    LINK_DATA_RATES = list(BAUD_RATE_INDEX)
+    _LINK_ROUND_TRIP_BYTES = 18
     def __init__(self, com_port, datarate=115200, host_id=2, module_id=1, timeout_s=5):
         if not isinstance(com_port, str):
             raise TypeError
@@ -86,6 +113,27 @@ class SerialTmclInterface(TmclInterface):
     def get_timeout(self):
         return self._serial.timeout
 
+    def _link_data_rate(self):
+        return self._baudrate
+
+    def _set_host_data_rate(self, data_rate):
+        self.logger.info("Switching to %s baud.", data_rate)
+        self._serial.baudrate = data_rate
+        self._baudrate = data_rate
+        self._serial.reset_input_buffer()
+
+    def _request_device_data_rate(self, data_rate):
+        self.send(TMCLCommand.SGP, 65, 0, self.BAUD_RATE_INDEX[data_rate])
+
+    def _link_round_trip(self):
+        self.send(TMCLCommand.GET_FIRMWARE_VERSION, 1, 0, 0)
+
+    def _get_link_timeout(self):
+        return self.get_timeout()
+
+    def _set_link_timeout(self, timeout_s):
+        self.set_timeout(timeout_s)
+
     @staticmethod
     def supports_tmcl():
         return True
@@ -8,6 +8,7 @@
 
 import logging
 import warnings
+import collections
 from abc import ABC
 from ..tmcl import TMCL, TMCLRequest, TMCLCommand, TMCLReply, TMCLReplyChecksumError, TMCLReplyStatusError
 from ..helpers import to_signed_32
@@ -29,8 +30,13 @@ class TmclInterface(ABC):
         _send(self, host_id, module_id, data)
         _recv(self, host_id, module_id)
 
+    A subclass may override _PIPELINE_WINDOW to allow send_requests() to keep
+    more than one request in flight. This is only safe on links where a reply
+    can never collide with the next request (e.g. CAN or USB).
     """
 
+    _PIPELINE_WINDOW = 1
+
     def __init__(self, host_id=2, default_module_id=1, default_ap_index_bit_width=8, default_register_address_bit_width=12):
         """
         :param int host_id: The ID of the TMCL host. This ID is the same for each module
@@ -58,6 +64,7 @@ class TmclInterface(ABC):
 
         self._default_ap_index_bit_width = default_ap_index_bit_width
         self._default_register_address_bit_width = default_register_address_bit_width
+        self._pipeline_window = self._PIPELINE_WINDOW
 
     def _send(self, host_id, module_id, data):
         """
@@ -107,21 +114,144 @@ class TmclInterface(ABC):
         self.logger.debug("Rx: %s", reply.oneline_str_repr())
 
         self._reply_check(reply)
+        self._reply_status_check(request, reply)
+
+        return reply
 
+    def send_requests(self, requests, *, window=None):
+        """
+        Send a sequence of TMCL_Requests and return the TMCL_Replies in request
+        order.
+
+        Up to ``window`` requests are kept in flight before the oldest reply is
+        awaited. Replies are matched to the oldest outstanding request of the
+        replying module, so requests to different module IDs may be interleaved
+        on a shared bus. If a reply reports an error, the replies still in
+        flight are drained before the error is raised.
+
+        :param requests: A sequence of TMCLRequest objects.
+        :param int window: Maximum number of outstanding requests. Defaults to
+            the window of the interface, see get_pipeline_window().
+        """
+        if window is None:
+            window = self._pipeline_window
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window must be at least 1!")
+
+        replies = [None] * len(requests)
+        pending = collections.deque()
+        next_index = 0
+        error = None
+        while pending or (next_index < len(requests) and error is None):
+            while error is None and next_index < len(requests) and len(pending) < window:
+                request = requests[next_index]
+                self.logger.debug("Tx: %s", request.oneline_str_repr())
+                self._send(self._host_id, request.moduleAddress, request.to_buffer())
+                pending.append(next_index)
+                next_index += 1
+
+            reply = TMCLReply.from_buffer(self._recv(self._host_id, requests[pending[0]].moduleAddress))
+            self.logger.debug("Rx: %s", reply.oneline_str_repr())
+
+            for position, index in enumerate(pending):
+                if requests[index].moduleAddress == reply.module_address:
+                    break
+            else:
+                # Point-to-point links do not always echo the module ID, the replies arrive in order there.
+                position, index = 0, pending[0]
+            del pending[position]
+            replies[index] = reply
+
+            if error is None:
+                try:
+                    self._reply_check(reply)
+                    self._reply_status_check(requests[index], reply)
+                except (TMCLReplyChecksumError, TMCLReplyStatusError) as exc:
+                    error = exc
+
+        if error is not None:
+            raise error
+
+        return replies
+
+    def send_probes(self, requests, *, window=None):
+        """
+        Send TMCL_Requests which may stay unanswered, e.g. to module IDs that
+        are not present, and return the TMCL_Replies in request order with
+        None for the missing ones.
+
+        Up to ``window`` requests are sent at once. As soon as no further reply
+        arrives within the timeout of the interface, the requests still
+        outstanding count as unanswered. Replies are matched by module ID, so
+        the requests of one window must address different modules. Error
+        replies are returned, not raised.
+
+        :param requests: A sequence of TMCLRequest objects.
+        :param int window: Number of requests sent at once. Defaults to the
+            window of the interface, see get_pipeline_window().
+        """
+        if window is None:
+            window = self._pipeline_window
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window must be at least 1!")
+
+        replies = [None] * len(requests)
+        for start in range(0, len(requests), window):
+            pending = {}
+            for index in range(start, min(start + window, len(requests))):
+                request = requests[index]
+                self.logger.debug("Tx: %s", request.oneline_str_repr())
+                self._send(self._host_id, request.moduleAddress, request.to_buffer())
+                pending[request.moduleAddress] = index
+
+            while pending:
+                try:
+                    data = self._recv(self._host_id, next(iter(pending)))
+                except (ConnectionError, RuntimeError, TimeoutError):
+                    break
+                reply = TMCLReply.from_buffer(data)
+                self.logger.debug("Rx: %s", reply.oneline_str_repr())
+                try:
+                    self._reply_check(reply)
+                except TMCLReplyChecksumError:
+                    self.logger.warning("Ignoring probe reply with wrong checksum: %s", reply.oneline_str_repr())
+                    continue
+                index = pending.pop(reply.module_address, None)
+                if index is None:
+                    self.logger.warning("Ignoring unexpected probe reply: %s", reply.oneline_str_repr())
+                    continue
+                replies[index] = reply
+
+        return replies
+
+    def _reply_status_check(self, request, reply):
         # Status codes below 100 indicate an error response.
-        # Ignore status when reading TMCL memory. 
+        # Ignore status when reading TMCL memory.
         if reply.status < 100 and request.command != TMCLCommand.READ_TMCL_MEMORY:
             raise TMCLReplyStatusError(reply)
 
-        return reply
+    def get_pipeline_window(self):
+        """Return the number of requests send_requests() keeps in flight by default."""
+        return self._pipeline_window
 
-    def send(self, opcode, op_type, motor, value, module_id=None, *, no_reply=False):
+    def set_pipeline_window(self, window):
         """
-        Send a TMCL datagram and read back a reply. This function blocks until
-        the reply has been received.
+        Set the number of requests send_requests() keeps in flight by default.
 
-        When no_reply is set, do not read back a reply. This must only be used for
-        special commands that do not send back a reply!
+        A window of 1 disables pipelining.
+        """
+        if not isinstance(window, int):
+            raise TypeError("Pipeline window must be of type int!")
+        if window < 1:
+            raise ValueError(f"Value {window} for parameter window must be at least 1!")
+        self._pipeline_window = window
+
+    def build_request(self, opcode, op_type, motor, value, module_id=None):
+        """
+        Create a TMCL_Request without sending it.
+
+        This is useful to prepare requests for send_requests(). If no module ID
+        is given, the default one is used.
         """
         if any(not isinstance(arg, int) for arg in [opcode, op_type, motor, value]):
             raise TypeError("Expected integer values!")
@@ -130,7 +260,44 @@ class TmclInterface(ABC):
         if not module_id:
             module_id = self._default_module_id
 
-        request = TMCLRequest(module_id, opcode, op_type, motor, value)
+        return TMCLRequest(module_id, opcode, op_type, motor, value)
+
+    def build_register_request(self, cmd, register_address, channel, value=0, module_id=None, address_bit_width=None):
+        """
+        Create the TMCL_Request of a register read or write command without sending it.
+
+        The register address and channel are packed into the type and motor
+        fields like read_register() and write_register() do. This is useful to
+        access many registers with send_requests().
+        """
+        if not address_bit_width:
+            address_bit_width = self._default_register_address_bit_width
+
+        if not (8 <= address_bit_width <= 15):
+            raise ValueError(f"Value {address_bit_width} for parameter address_bit_width is outside the allowed range (8..15)!")
+
+        channel_bit_width = 16 - address_bit_width
+
+        if register_address >= 2**address_bit_width:
+            raise ValueError(f"Value {register_address} for parameter register_address is outside the allowed range (0..{2**address_bit_width - 1})!")
+        if channel >= 2**channel_bit_width:
+            raise ValueError(f"Value {channel} for parameter channel is outside the allowed range (0..{2**channel_bit_width - 1})!")
+
+        address_shift = 8 - channel_bit_width
+        address_mask = ((2**address_bit_width) - 1) << 8
+        tmcl_motor = channel | ((register_address & address_mask) >> address_shift)
+        tmcl_type = register_address & 0xFF
+        return self.build_request(cmd, tmcl_type, tmcl_motor, value, module_id)
+
+    def send(self, opcode, op_type, motor, value, module_id=None, *, no_reply=False):
+        """
+        Send a TMCL datagram and read back a reply. This function blocks until
+        the reply has been received.
+
+        When no_reply is set, do not read back a reply. This must only be used for
+        special commands that do not send back a reply!
+        """
+        request = self.build_request(opcode, op_type, motor, value, module_id)
 
         return self.send_request(request, no_reply=no_reply)
 
@@ -182,6 +349,9 @@ class TmclInterface(ABC):
         return self.send(p_command, p_type, p_axis, p_value, module_id)
 
     def _send_ap_cmd(self, cmd, index, axis, value, module_id, index_bit_width):
+        return self.send_request(self._build_ap_request(cmd, index, axis, value, module_id, index_bit_width))
+
+    def _build_ap_request(self, cmd, index, axis, value, module_id, index_bit_width):
         if not index_bit_width:
             index_bit_width = self._default_ap_index_bit_width
 
@@ -199,7 +369,7 @@ class TmclInterface(ABC):
         index_mask = ((2**index_bit_width) - 1) << 8
         tmcl_motor = axis | ((index & index_mask) >> index_shift)
         tmcl_type = index & 0xFF
-        return self.send(cmd, tmcl_type, tmcl_motor, value, module_id)
+        return self.build_request(cmd, tmcl_type, tmcl_motor, value, module_id)
 
     # Axis parameter access functions
     def get_axis_parameter(self, index, axis, module_id=None, signed=False, index_bit_width=None):
@@ -266,24 +436,7 @@ class TmclInterface(ABC):
         return self._send_register_cmd(command, register_address, channel, value, module_id, address_bit_width).value
     
     def _send_register_cmd(self, cmd, register_address, channel, value, module_id, address_bit_width):
-        if not address_bit_width:
-            address_bit_width = self._default_register_address_bit_width
-
-        if not (8 <= address_bit_width <= 15):
-            raise ValueError(f"Value {address_bit_width} for parameter address_bit_width is outside the allowed range (8..15)!")
-
-        channel_bit_width = 16 - address_bit_width
-
-        if register_address >= 2**address_bit_width:
-            raise ValueError(f"Value {register_address} for parameter register_address is outside the allowed range (0..{2**address_bit_width - 1})!")
-        if channel >= 2**channel_bit_width:
-            raise ValueError(f"Value {channel} for parameter channel is outside the allowed range (0..{2**channel_bit_width - 1})!")
-
-        address_shift = 8 - channel_bit_width
-        address_mask = ((2**address_bit_width) - 1) << 8
-        tmcl_motor = channel | ((register_address & address_mask) >> address_shift)
-        tmcl_type = register_address & 0xFF
-        return self.send(cmd, tmcl_type, tmcl_motor, value, module_id)
+        return self.send_request(self.build_register_request(cmd, register_address, channel, value, module_id, address_bit_width))
 
     # Motion control functions
     def rotate(self, motor, velocity, module_id=None):
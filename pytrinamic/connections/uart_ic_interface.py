@@ -11,6 +11,8 @@ import struct
 from serial import Serial
 import serial.tools.list_ports
 
+from ..connections.link_speed import LinkSpeedMixin
+
 REGISTER_PACKAGE_STRUCTURE = ">BI"
 REGISTER_PACKAGE_LENGTH = 5
 
@@ -39,7 +41,17 @@ class RegisterReply:
         return self.value
 
 
-class UartIcInterface:
+class UartIcInterface(LinkSpeedMixin):
+    """
+    Register access over UART, e.g. to the TMC4671.
+
+    upgrade_link_speed() switches the IC with the UART_BPS register, which
+    holds the baud rate as decimal digits, e.g. 0x00115200 for 115200 baud.
+    """
+
+    UART_BPS = 0x79
+    LINK_DATA_RATES = [9600, 19200, 38400, 57600, 115200, 921600, 3000000]
+    _LINK_ROUND_TRIP_BYTES = 2 * REGISTER_PACKAGE_LENGTH
 
     def __init__(self, com_port, datarate=9600, timeout_s=5):
         self.baudrate = datarate
@@ -85,6 +97,38 @@ class UartIcInterface:
 
         return reply
 
+    @staticmethod
+    def _uart_bps_value(data_rate):
+        return int(f"{data_rate:08d}", 16)
+
+    def _link_data_rate(self):
+        return self.baudrate
+
+    def _set_host_data_rate(self, data_rate):
+        self.logger.info("Switching to %s baud.", data_rate)
+        self.serial.baudrate = data_rate
+        self.baudrate = data_rate
+        self.serial.reset_input_buffer()
+
+    def _request_device_data_rate(self, data_rate):
+        # The reply is not read, it may already be sent at the new rate.
+        self.serial.write(RegisterRequest(self.UART_BPS | 0x80, self._uart_bps_value(data_rate)).to_buffer())
+        self.serial.flush()
+
+    def _link_round_trip(self):
+        data = self.send_datagram(RegisterRequest(self.UART_BPS, 0).to_buffer(), REGISTER_PACKAGE_LENGTH)
+        if len(data) != REGISTER_PACKAGE_LENGTH:
+            raise RuntimeError("UART datagram timed out")
+        reply = RegisterReply(struct.unpack(REGISTER_PACKAGE_STRUCTURE, data))
+        if reply.value != self._uart_bps_value(self.baudrate):
+            raise RuntimeError(f"UART_BPS reads {reply.value:#010x} at {self.baudrate} baud")
+
+    def _get_link_timeout(self):
+        return self.serial.timeout
+
+    def _set_link_timeout(self, timeout_s):
+        self.serial.timeout = timeout_s
+
     @staticmethod
     def list():
         """
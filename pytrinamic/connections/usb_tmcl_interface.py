@@ -18,8 +18,23 @@ class UsbTmclInterface(SerialTmclInterface):
     The only difference are the functions for the connection manager, which
     filter the available serial connections to only include the serial over
     USB ones.
+
+    As USB is a point-to-point link, send_requests() keeps multiple requests in
+    flight by default.
+
+    The baud rate of a virtual COM port has no effect, so upgrade_link_speed()
+    only measures the link and reports it as already at its maximum.
     """
 
+    _PIPELINE_WINDOW = 4
+
+    # Global parameter 65 would change the RS485 rate instead of the USB link.
+    LINK_DATA_RATES = []
+
+    def upgrade_link_speed(self, data_rates=None, *, round_trips=20):
+        # Never ask the module to switch, whatever rates the caller passes.
+        return super().upgrade_link_speed([], round_trips=round_trips)
+
     # USB Vendor and Product IDs
     __USB_IDS = [
         {  # Landungsbrücke
@@ -9,20 +9,19 @@ Improvements/Todo:
 * Add an optional explode mode that will unpack all fields of a register in the logs.
 * Add a way to call download_logs() without waiting for the logging to be done.
 * Add parameters to download_logs() that allow to download only a part of the logs.
-* Add timeouts to wait_till_done() and wait_for_trigger().
 """
 
 from __future__ import annotations
-from typing import Union, List, Dict
+from typing import Callable, Union, List, Dict
 from dataclasses import dataclass
 from enum import Enum, auto
 import decimal
 import math
 
-from pytrinamic.rd import Rd
+from pytrinamic.rd import Rd, build_column_decoder
+from pytrinamic.poller import Poller
 from pytrinamic.modules.tmcl_module import ParameterGroup, Parameter
 from pytrinamic.ic.tmc_ic import Register, Field
-from pytrinamic.helpers import to_signed_32
 
 
 class DataLoggerConfigError(Exception):
@@ -41,6 +40,18 @@ class DataLogger:
         def __init__(self):
             self.reuse_obj = None
 
+        @property
+        def channel_key(self) -> tuple:
+            """Hashable identity of the RAMDebug channel this data is captured from.
+
+            Data types with the same channel key share one channel.
+            """
+            raise NotImplementedError
+
+        def build_decoder(self):
+            """Return a function decoding the raw samples of the channel into this data type."""
+            return build_column_decoder(signed=self.signed)
+
     class DataTypeAp(DataType):
         def __init__(self, index, axis=0, signed=False):
             super().__init__()
@@ -64,6 +75,13 @@ class DataLogger:
             else:
                 return False
 
+        def __hash__(self):
+            return hash(self.channel_key)
+
+        @property
+        def channel_key(self) -> tuple:
+            return (Rd.Channel.AXIS_PARAMETER, self.axis, self.index)
+
     class DataTypeGp(DataType):
         def __init__(self, index, bank=0, signed=False):
             super().__init__()
@@ -86,6 +104,13 @@ class DataLogger:
                 return True
             else:
                 return False
+
+        def __hash__(self):
+            return hash(self.channel_key)
+
+        @property
+        def channel_key(self) -> tuple:
+            return (Rd.Channel.GLOBAL_PARAMETER, self.bank, self.index)
     
     class DataTypeRegister(DataType):
         def __init__(self, block, channel, address, signed=False):
@@ -115,6 +140,13 @@ class DataLogger:
                 return True
             else:
                 return False
+
+        def __hash__(self):
+            return hash(self.channel_key)
+
+        @property
+        def channel_key(self) -> tuple:
+            return (Rd.Channel.REGISTER, self.block, self.channel, self.address)
         
     class DataTypeField(DataType):
         def __init__(self, block, field, channel, signed=False):
@@ -135,6 +167,14 @@ class DataLogger:
                 signed=field.signed,
             )
 
+        @property
+        def channel_key(self) -> tuple:
+            # Fields are extracted from the samples of their register.
+            return (Rd.Channel.REGISTER, self.block, self.channel, self.address)
+
+        def build_decoder(self):
+            return build_column_decoder(self.mask, self.shift, self.signed)
+
         def get(self, register_value) -> int:
             value = (register_value & self.mask) >> self.shift
             if self.signed:
@@ -142,6 +182,22 @@ class DataLogger:
                 sign_mask = base_mask & (~base_mask >> 1)
                 value = (value ^ sign_mask) - sign_mask
             return value
+
+    class DataTypeSysTick(DataType):
+        """The system tick counter of the device, captured like any other channel."""
+        def __init__(self):
+            super().__init__()
+            self.signed = False
+
+        def __eq__(self, other):
+            return isinstance(other, DataLogger.DataTypeSysTick)
+
+        def __hash__(self):
+            return hash(self.channel_key)
+
+        @property
+        def channel_key(self) -> tuple:
+            return (Rd.Channel.SYSTICK,)
         
     class TriggerEdge(Enum):
         RISING = auto()
@@ -211,6 +267,13 @@ class DataLogger:
         datatype: DataLogger.DataType
         request_object: None
 
+    @dataclass
+    class _DecodeStep:
+        name: str
+        channel_index: int
+        decode: Callable[[list], list]
+        request_object: None
+
     def __init__(self, connection, module_id=1):
         self.rd = Rd(connection, module_id)
         self.config = DataLogger.Config(
@@ -221,6 +284,7 @@ class DataLogger:
         self.log = DataLogger.Log(rate_hz=0, period_s=0, time_vector=[], data={})
         self._log_data = None
         self._effectively_log_data = None
+        self._decode_plan: List[DataLogger._DecodeStep] = []
         self._info = None
         self._down_sampling_factor = 1
         self._channels_used_count = 0
@@ -232,6 +296,7 @@ class DataLogger:
         self._trigger_on = None
         self._trigger_threshold = None
         self._pretrigger_samples_per_channel = 0
+        self._extra_log_data = []
 
     def get_info(self) -> DataLogger.Info:
         return DataLogger.Info(
@@ -276,6 +341,13 @@ class DataLogger:
         self._activation()
 
     def _activation(self) -> None:
+        self.rd.send_commands(self._build_activation_commands())
+
+    def _build_activation_commands(self) -> list:
+        """Validate the configuration and return the RAMDebug requests that arm the data logger.
+
+        The last request is the one enabling the trigger.
+        """
         if self.config.down_sampling_factor < 1:
             raise DataLoggerConfigError("The `config.down_sampling_factor` must be greater than 0!")
         self._down_sampling_factor = self.config.down_sampling_factor
@@ -294,6 +366,7 @@ class DataLogger:
             self._log_data = [self._RequestEntry(name=name, datatype=dt, request_object=dt) for name, dt in self.config.log_data.items()]
         else:
             raise DataLoggerConfigError("`config.log_data` must be a list or a dict!")
+        self._log_data.extend(self._extra_log_data)
         
         self._reduce()
 
@@ -304,72 +377,91 @@ class DataLogger:
             raise DataLoggerConfigError("Exceeding number of channels!")
         if self._total_number_of_samples > self._info.sample_buffer_length:
             raise DataLoggerConfigError(f"`config.samples_per_channel` exceeds sample buffer length! You can use {math.floor(self._info.sample_buffer_length/self._channels_used_count)} at max.")
-        self.rd.init()
-        self.rd.set_sample_count(self.config.samples_per_channel*self._channels_used_count)
-        self.rd.set_prescaler(self._down_sampling_factor-1)
+
+        commands = []
+        commands.append(self.rd.build_command(Rd._Command.INIT, 0, 0))
+        commands.append(self.rd.build_command(Rd._Command.SET_SAMPLE_COUNT, 0, self.config.samples_per_channel*self._channels_used_count))
+        commands.append(self.rd.build_command(Rd._Command.SET_PRESCALER, 0, self._down_sampling_factor-1))
         if self._trigger_type != Rd.TriggerType.UNCONDITIONAL:
             if self._trigger_on is None:
                 raise DataLoggerConfigError("Trigger type specified but no trigger data given in `_trigger_on`!")
             channel_type, select = self._get_channel_type_and_select(datatype=self._trigger_on)
-            self.rd.set_trigger_channel(channel_type=channel_type, select=select)
+            commands.append(self.rd.build_command(Rd._Command.SET_TRIGGER_CHANNEL, channel_type, select))
             if isinstance(self._trigger_on, DataLogger.DataTypeField):
-                self.rd.set_shift_mask(shift=self._trigger_on.shift, mask=self._trigger_on.mask)
+                commands.append(self.rd.build_command(Rd._Command.SET_SHIFT_MASK, self._trigger_on.shift, self._trigger_on.mask))
         
         # Set channels
         for datatype in self._effectively_log_data.values():
             channel_type, select = self._get_channel_type_and_select(datatype=datatype)
-            self.rd.set_channel(
-                channel_type=channel_type,
-                select=select
-            )
+            commands.append(self.rd.build_command(Rd._Command.SET_CHANNEL, channel_type, select))
 
-        self.rd.set_pretrigger_sample_count(self._pretrigger_samples_per_channel*self._channels_used_count)
+        commands.append(self.rd.build_command(Rd._Command.SET_PRETRIGGER_SAMPLE_COUNT, 0, self._pretrigger_samples_per_channel*self._channels_used_count))
         if self._trigger_type == Rd.TriggerType.UNCONDITIONAL:
-            self.rd.enable_trigger(self._trigger_type, 0)
+            commands.append(self.rd.build_command(Rd._Command.ENABLE_TRIGGER, self._trigger_type, 0))
         else:
             if self._trigger_threshold is None:
                 raise DataLoggerConfigError("Trigger type specified is conditional but no threshold given in `_trigger_threshold!")
-            self.rd.enable_trigger(self._trigger_type, self._trigger_threshold)
+            commands.append(self.rd.build_command(Rd._Command.ENABLE_TRIGGER, self._trigger_type, self._trigger_threshold))
+        return commands
 
     def is_pretriggering(self) -> bool:
         return self.rd.get_state() == Rd.State.PRETRIGGER
 
-    def wait_for_pretrigger_completion(self) -> None:
-        while self.is_pretriggering():
-            pass
+    def wait_for_pretrigger_completion(self, timeout_s=None) -> None:
+        Poller(timeout_s=timeout_s, expected_duration_s=self._capture_duration_s(self._pretrigger_samples_per_channel)).wait_until(
+            lambda: not self.is_pretriggering(),
+            description="the pretrigger completion",
+        )
 
     def is_triggered(self) -> bool:
         return self.rd.get_state() >= Rd.State.CAPTURE
     
-    def wait_for_trigger(self) -> None:
-        while not self.is_triggered():
-            pass
+    def wait_for_trigger(self, timeout_s=None) -> None:
+        Poller(timeout_s=timeout_s).wait_until(self.is_triggered, description="the trigger")
 
     def is_done(self) -> bool:
         return self.rd.get_state() == Rd.State.COMPLETE
     
-    def wait_till_done(self) -> None:
-        while not self.is_done():
-            pass
+    def wait_till_done(self, timeout_s=None) -> None:
+        """Wait until the sample buffer is full, raises a PollTimeoutError after `timeout_s`."""
+        Poller(timeout_s=timeout_s, expected_duration_s=self._capture_duration_s(self.config.samples_per_channel)).wait_until(
+            self.is_done,
+            description="the data logger to finish",
+        )
+
+    def _capture_duration_s(self, samples_per_channel: int):
+        """The time it takes to capture the given number of samples per channel, None if unknown."""
+        if self._info is None or not self._info.base_frequency_hz:
+            return None
+        return samples_per_channel*self._down_sampling_factor/self._info.base_frequency_hz
 
     def download_log_step(self) -> bool:
-        @dataclass
-        class EffectiveDataSet:
-            name: str
-            datatype: DataLogger.DataType
-            samples: list
         self._download_is_done = False
         self._downloaded_raw_data.append(self.rd.get_sample(self._download_offset))
         self._download_offset += 1
         if self._download_offset < self._total_number_of_samples:
             return True
 
-        # Download is done - extract the data
-        log_samples: List[EffectiveDataSet] = []
-        for i in range(len(self._effectively_log_data)):
-            name, datatype = list(self._effectively_log_data.items())[i]
-            samples = self._downloaded_raw_data[i::self._channels_used_count]
-            log_samples.append(EffectiveDataSet(name=name, datatype=datatype, samples=samples))
+        self._finish_download()
+        return False
+    
+    def download_log(self) -> None:
+        """Download the remaining samples using pipelined requests."""
+        self._download_is_done = False
+        remaining = self._total_number_of_samples - self._download_offset
+        self._downloaded_raw_data.extend(self.rd.get_samples(self._download_offset, remaining))
+        self._download_offset += remaining
+        self._finish_download()
+
+    def _finish_download(self) -> None:
+        """Extract the log from the downloaded raw data and reset the download state."""
+        self._extract_log(self._downloaded_raw_data)
+        self._downloaded_raw_data = []
+        self._download_offset = 0
+        self._download_is_done = True
+
+    def _extract_log(self, raw_data: list) -> None:
+        columns = [raw_data[i::self._channels_used_count] for i in range(self._channels_used_count)]
 
         period_s = self._down_sampling_factor/self._info.base_frequency_hz
         time_offset = self._pretrigger_samples_per_channel*period_s
@@ -378,34 +470,12 @@ class DataLogger:
         self.log.period_s = period_s
         self.log.time_vector = time_vector
         self.log.data = {}
-        for entry in self._log_data:
-            if entry.datatype.reuse_obj is None:
-                use_datatype_obj = next((x for x in log_samples if x.datatype == entry.datatype))
-            else:
-                use_datatype_obj = next((x for x in log_samples if x.datatype == entry.datatype.reuse_obj))
-
-            if isinstance(entry.datatype, DataLogger.DataTypeField):
-                samples = [entry.datatype.get(sample) for sample in use_datatype_obj.samples]
-            else:
-                if entry.datatype.signed:
-                    samples = [to_signed_32(sample) for sample in use_datatype_obj.samples]
-                else:
-                    samples = use_datatype_obj.samples
-
-            self.log.data[entry.name] = DataLogger.LogData(
-                samples=samples,
-                request_object=entry.request_object,
+        for step in self._decode_plan:
+            self.log.data[step.name] = DataLogger.LogData(
+                samples=step.decode(columns[step.channel_index]),
+                request_object=step.request_object,
             )
 
-        self._downloaded_raw_data = []
-        self._download_offset = 0
-        self._download_is_done = True
-        return False
-    
-    def download_log(self) -> None:
-        while self.download_log_step():
-            pass
-
     def _get_channel_type_and_select(self, datatype):
         if isinstance(datatype, DataLogger.DataTypeAp):
             select = ((datatype.axis << 24) & 0xFF00_0000) | ((datatype.index << 0) & 0x00FF_FFFF)
@@ -416,6 +486,8 @@ class DataLogger:
         elif isinstance(datatype, DataLogger.DataTypeRegister) or isinstance(datatype, DataLogger.DataTypeField):
             select = ((datatype.block << 24) & 0xFF00_0000) | (datatype.address & 0x00FF_FFFF)
             return self.rd.Channel.REGISTER, select
+        elif isinstance(datatype, DataLogger.DataTypeSysTick):
+            return self.rd.Channel.SYSTICK, 0
         else:
             raise ValueError("Unknown DataType")
         
@@ -435,29 +507,25 @@ class DataLogger:
             raise DataLoggerConfigError("Only Parameter, Register or Field objects can be transformed!")
         
     def _reduce(self):
+        """Assign the requested data to as few channels as possible and plan the decoding."""
         self._effectively_log_data = {}
+        self._decode_plan = []
+        channels = {}
         for entry in self._log_data:
-            if isinstance(entry.datatype, DataLogger.DataTypeRegister) or isinstance(entry.datatype, DataLogger.DataTypeAp) or isinstance(entry.datatype, DataLogger.DataTypeGp):
-                for existing_datatype in self._effectively_log_data.values():
-                    if entry.datatype == existing_datatype:
-                        entry.datatype.reuse_obj = existing_datatype
-                        break
-                else:
-                    self._effectively_log_data[entry.name] = entry.datatype
-            elif isinstance(entry.datatype, DataLogger.DataTypeField):
-                for existing_datatype in self._effectively_log_data.values():
-                    if isinstance(existing_datatype, (DataLogger.DataTypeField, DataLogger.DataTypeRegister)):
-                        if all([
-                            entry.datatype.block == existing_datatype.block,
-                            entry.datatype.channel == existing_datatype.channel,
-                            entry.datatype.address == existing_datatype.address,
-                        ]):
-                            entry.datatype.reuse_obj = existing_datatype
-                            break
-                else:
-                    self._effectively_log_data[entry.name] = entry.datatype
+            key = entry.datatype.channel_key
+            if key in channels:
+                channel_index, existing_datatype = channels[key]
+                entry.datatype.reuse_obj = existing_datatype
             else:
+                channel_index = len(channels)
+                channels[key] = (channel_index, entry.datatype)
                 self._effectively_log_data[entry.name] = entry.datatype
+            self._decode_plan.append(DataLogger._DecodeStep(
+                name=entry.name,
+                channel_index=channel_index,
+                decode=entry.datatype.build_decoder(),
+                request_object=entry.request_object,
+            ))
 
     def _get_base_frequency_hz(self) -> int:
         return self.get_info().base_frequency_hz
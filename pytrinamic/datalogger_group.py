@@ -0,0 +1,191 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Synchronized capture with the data loggers of multiple devices.
+
+Each member of a DataLoggerGroup is a regular DataLogger. The group arms all
+members in one pipelined burst per connection, captures the SYSTICK channel on
+every device to align their timelines, and downloads all sample buffers
+concurrently. Requests to members sharing a connection (e.g. modules on one CAN
+bus) are interleaved, members on different connections are served by one thread
+per connection.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+import threading
+import time
+
+from pytrinamic.datalogger import DataLogger, DataLoggerConfigError
+from pytrinamic.poller import Poller
+
+
+class DataLoggerGroup:
+
+    SYSTICK_NAME = "SYSTICK"
+
+    @dataclass
+    class MemberLog:
+        """The log of one member with the time vector aligned to the group's timeline."""
+        module_id: int
+        log: DataLogger.Log
+        time_vector: list
+        arm_time_s: float
+
+    @dataclass
+    class Log:
+        """The merged log of all members.
+
+        The keys of `data` are "<module_id>.<name>", every member's aligned time
+        vector is available in `members`.
+        """
+        members: Dict[int, DataLoggerGroup.MemberLog]
+        data: Dict[str, DataLogger.LogData]
+
+    def __init__(self, dataloggers: List[DataLogger], *, systick_frequency_hz: Optional[float] = None):
+        """
+        :param dataloggers: The data loggers of the devices to capture. Each one
+            needs its own `config` set up before calling start_logging().
+        :param systick_frequency_hz: The frequency of the SYSTICK counter. If not
+            given, it is estimated from each capture using the nominal sample rate.
+        """
+        module_ids = [datalogger.rd.module_id for datalogger in dataloggers]
+        if len(set(module_ids)) != len(module_ids):
+            raise DataLoggerConfigError("The data loggers of a group need distinct module IDs!")
+        self.dataloggers = list(dataloggers)
+        self.systick_frequency_hz = systick_frequency_hz
+        self.log = DataLoggerGroup.Log(members={}, data={})
+        self._arm_times_s = {}
+
+    def start_logging(self) -> None:
+        """Configure all members and start logging unconditionally in one burst."""
+        commands = {}
+        for datalogger in self.dataloggers:
+            # The group settings only apply to this capture, the member keeps its own.
+            saved = (datalogger._trigger_type, datalogger._extra_log_data)
+            datalogger._trigger_type = datalogger.rd.TriggerType.UNCONDITIONAL
+            datalogger._extra_log_data = [DataLogger._RequestEntry(
+                name=self.SYSTICK_NAME,
+                datatype=DataLogger.DataTypeSysTick(),
+                request_object=None,
+            )]
+            try:
+                commands[datalogger] = datalogger._build_activation_commands()
+            finally:
+                datalogger._trigger_type, datalogger._extra_log_data = saved
+
+        # Configure everything except for the trigger enable commands ...
+        for connection, members in self._by_connection().items():
+            requests = [request for datalogger in members for request in commands[datalogger][:-1]]
+            connection.send_requests(requests)
+
+        # ... and then arm all members back-to-back.
+        def arm(connection, members):
+            start_time_s = time.perf_counter()
+            connection.send_requests([commands[datalogger][-1] for datalogger in members])
+            stop_time_s = time.perf_counter()
+            # The arm requests are sent in member order, spread the burst duration over the members.
+            step_s = (stop_time_s - start_time_s)/len(members)
+            for i, datalogger in enumerate(members):
+                self._arm_times_s[datalogger] = start_time_s + i*step_s
+
+        self._run_per_connection(arm)
+
+    def is_done(self) -> bool:
+        return all(datalogger.is_done() for datalogger in self.dataloggers)
+
+    def wait_till_done(self, timeout_s=None) -> None:
+        """Wait until the sample buffers of all members are full, raises a PollTimeoutError after `timeout_s`."""
+        durations_s = [datalogger._capture_duration_s(datalogger.config.samples_per_channel) for datalogger in self.dataloggers]
+        Poller(timeout_s=timeout_s, expected_duration_s=None if None in durations_s else max(durations_s)).wait_until(
+            self.is_done,
+            description="the data loggers of the group to finish",
+        )
+
+    def download_log(self, timeout_s=None) -> DataLoggerGroup.Log:
+        """
+        Wait until all members are done, then download their sample buffers concurrently and merge them.
+
+        :param timeout_s: Raise a PollTimeoutError if the members are not done within this time.
+        """
+        self.wait_till_done(timeout_s)
+
+        def download(connection, members):
+            # Interleave the sample requests of all members on this connection.
+            requests = []
+            owners = []
+            longest = max(datalogger._total_number_of_samples for datalogger in members)
+            for offset in range(longest):
+                for datalogger in members:
+                    if offset < datalogger._total_number_of_samples:
+                        requests.append(datalogger.rd.build_get_sample(offset))
+                        owners.append(datalogger)
+            replies = connection.send_requests(requests)
+            raw_data = {datalogger: [] for datalogger in members}
+            for owner, reply in zip(owners, replies):
+                raw_data[owner].append(reply.value)
+            for datalogger in members:
+                datalogger._downloaded_raw_data = raw_data[datalogger]
+                datalogger._finish_download()
+
+        self._run_per_connection(download)
+        self._merge()
+        return self.log
+
+    def _merge(self) -> None:
+        zero_time_s = min(self._arm_times_s[datalogger] for datalogger in self.dataloggers)
+        self.log = DataLoggerGroup.Log(members={}, data={})
+        for datalogger in self.dataloggers:
+            module_id = datalogger.rd.module_id
+            log = datalogger.log
+            arm_time_s = self._arm_times_s[datalogger] - zero_time_s
+            self.log.members[module_id] = DataLoggerGroup.MemberLog(
+                module_id=module_id,
+                log=log,
+                time_vector=self._aligned_time_vector(log, arm_time_s),
+                arm_time_s=arm_time_s,
+            )
+            for name, log_data in log.data.items():
+                self.log.data[f"{module_id}.{name}"] = log_data
+
+    def _aligned_time_vector(self, log: DataLogger.Log, arm_time_s: float) -> list:
+        systicks = log.data[self.SYSTICK_NAME].samples
+        # Unwrap the 32 bit counter relative to the first sample.
+        ticks = [(systick - systicks[0]) & 0xFFFF_FFFF for systick in systicks]
+        if self.systick_frequency_hz is not None:
+            tick_period_s = 1/self.systick_frequency_hz
+        elif len(ticks) > 1 and ticks[-1] > 0:
+            tick_period_s = (len(ticks) - 1)*log.period_s/ticks[-1]
+        else:
+            return [arm_time_s + t for t in log.time_vector]
+        return [arm_time_s + tick*tick_period_s for tick in ticks]
+
+    def _by_connection(self) -> dict:
+        by_connection = {}
+        for datalogger in self.dataloggers:
+            by_connection.setdefault(datalogger.rd.connection, []).append(datalogger)
+        return by_connection
+
+    def _run_per_connection(self, function) -> None:
+        by_connection = self._by_connection()
+        if len(by_connection) == 1:
+            function(*next(iter(by_connection.items())))
+            return
+
+        errors = []
+        def worker(connection, members):
+            try:
+                function(connection, members)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=item) for item in by_connection.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
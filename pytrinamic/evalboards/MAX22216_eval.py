@@ -8,12 +8,15 @@
 
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import MAX22216
+from pytrinamic.tmcl import TMCLCommand
 
 
 class MAX22216_eval(TMCLEval):
     """
     This class represents a MAX22216 Evaluation board.
     """
+    _REGISTER_COMMANDS = (TMCLCommand.WRITE_DRV, TMCLCommand.READ_DRV, 1)
+
     def __init__(self, connection, module_id=1):
         """
         Constructor for the MAX22216 evalboard instance.
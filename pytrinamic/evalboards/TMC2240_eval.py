@@ -9,7 +9,7 @@
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC2240
 from pytrinamic.features import MotorControlModule
-from pytrinamic.helpers import BitField
+from pytrinamic.tmcl import TMCLCommand
 
 
 class TMC2240_eval(TMCLEval):
@@ -21,6 +21,8 @@ class TMC2240_eval(TMCLEval):
     are provided properly. See __init__ for details on the function
     requirements.
     """
+    _REGISTER_COMMANDS = (TMCLCommand.WRITE_DRV, TMCLCommand.READ_DRV, 1)
+
     def __init__(self, connection, module_id=1):
         """
         Parameters:
@@ -48,13 +50,6 @@ class TMC2240_eval(TMCLEval):
     def read_register(self, register_address, signed=False):
         return self._connection.read_drv(register_address, self._module_id, signed)
 
-    def write_register_field(self, field, value):
-        return self.write_register(field[0], BitField.field_set(self.read_register(field[0]),
-                                                                field[1], field[2], value))
-
-    def read_register_field(self, field):
-        return BitField.field_get(self.read_register(field[0]), field[1], field[2])
-
     # Motion control functions
 
     def rotate(self, motor, value):
@@ -9,6 +9,7 @@
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC5072
 from pytrinamic.features import MotorControlModule
+from pytrinamic.tmcl import TMCLCommand
 
 # from pytrinamic.features.linear_ramp_module import LinearRampModule
 # from pytrinamic.features.stallguard2_module import StallGuard2Module
@@ -19,6 +20,8 @@ class TMC5072_eval(TMCLEval):
     """
     This class represents a TMC5072 Evaluation board.
     """
+    _REGISTER_COMMANDS = (TMCLCommand.WRITE_MC, TMCLCommand.READ_MC, 0)
+
     def __init__(self, connection, module_id=1):
         """
         Constructor for the TMC5130 evalboard instance.
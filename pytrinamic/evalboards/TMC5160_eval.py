@@ -9,6 +9,7 @@
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC5160
 from pytrinamic.features import MotorControlModule
+from pytrinamic.tmcl import TMCLCommand
 
 
 class TMC5160_eval(TMCLEval):
@@ -20,6 +21,8 @@ class TMC5160_eval(TMCLEval):
     are provided properly. See __init__ for details on the function
     requirements.
     """
+    _REGISTER_COMMANDS = (TMCLCommand.WRITE_MC, TMCLCommand.READ_MC, 0)
+
     def __init__(self, connection, module_id=1):
         """
         Parameters:
@@ -6,6 +6,7 @@
 from pytrinamic.evalboards import TMCLEval
 from pytrinamic.ic import TMC5272
 from pytrinamic.features import MotorControlModule
+from pytrinamic.tmcl import TMCLCommand
 
 
 class TMC5272_eval(TMCLEval):
@@ -17,6 +18,8 @@ class TMC5272_eval(TMCLEval):
     are provided properly. See __init__ for details on the function
     requirements.
     """
+    _REGISTER_COMMANDS = (TMCLCommand.WRITE_MC, TMCLCommand.READ_MC, 0)
+
     def __init__(self, connection, module_id=1):
         """
         Parameters:
@@ -49,6 +49,22 @@ class TMC9660_eval(RegisterApiDevice, ParameterApiDevice):
             module_id=self._module_id,
             signed=signed,
         )
+
+    def read_registers(self, registers):
+        """Implementation of the RegisterApiDevice::read_registers() function, the reads are pipelined."""
+        requests = [
+            self._connection.build_register_request(TMCLCommand.READ_MC, register_address, block, 0, self._module_id, None)
+            for register_address, block in registers
+        ]
+        return [reply.value for reply in self._connection.send_requests(requests)]
+
+    def write_registers(self, writes):
+        """Implementation of the RegisterApiDevice::write_registers() function, the writes are pipelined."""
+        requests = [
+            self._connection.build_register_request(TMCLCommand.WRITE_MC, register_address, block, value, self._module_id, None)
+            for register_address, block, value in writes
+        ]
+        self._connection.send_requests(requests)
     
     def get_digital_input(self, gpio_target: Union[int, TMC9660._Io.Gpio]):
         """Get the digital input state."""
@@ -1,32 +1,53 @@
+"""The evaluation board classes are imported on first access, e.g. `from pytrinamic.evalboards import TMC4671_eval` only imports TMC4671_eval."""
+
+import sys
+
+from pytrinamic.lazy import LazyPackage, lazy_import
 from .tmcl_eval import TMCLEval
-from .MAX22216_eval import MAX22216_eval
-from .TMC2100_eval import TMC2100_eval
-from .TMC2130_eval import TMC2130_eval
-from .TMC2160_eval import TMC2160_eval
-from .TMC2208_eval import TMC2208_eval
-from .TMC2209_eval import TMC2209_eval
-from .TMC2224_eval import TMC2224_eval
-from .TMC2225_eval import TMC2225_eval
-from .TMC2240_eval import TMC2240_eval
-from .TMC2300_eval import TMC2300_eval
-from .TMC2590_eval import TMC2590_eval
-from .TMC2660_eval import TMC2660_eval
-from .TMC4361_eval import TMC4361_eval
-from .TMC4671_eval import TMC4671_eval
-from .TMC5031_eval import TMC5031_eval
-from .TMC5041_eval import TMC5041_eval
-from .TMC5062_eval import TMC5062_eval
-from .TMC5072_eval import TMC5072_eval
-from .TMC5130_eval import TMC5130_eval
-from .TMC5160_eval import TMC5160_eval
-from .TMC5160_shield import TMC5160_shield
-from .TMC5240_eval import TMC5240_eval
-from .TMC6100_eval import TMC6100_eval
-from .TMC6140_eval import TMC6140_eval
-from .TMC6200_eval import TMC6200_eval
-from .TMC6300_eval import TMC6300_eval
-from .TMC7300_eval import TMC7300_eval
-from .TMC5272_eval import TMC5272_eval
-from .TMC5271_eval import TMC5271_eval
-from .TMC9660_eval import TMC9660_3PH_eval
-from .TMC9660_eval import TMC9660_STEPPER_eval
\ No newline at end of file
+
+_LAZY_ATTRIBUTES = {
+    "MAX22216_eval": ".MAX22216_eval",
+    "TMC2100_eval": ".TMC2100_eval",
+    "TMC2130_eval": ".TMC2130_eval",
+    "TMC2160_eval": ".TMC2160_eval",
+    "TMC2208_eval": ".TMC2208_eval",
+    "TMC2209_eval": ".TMC2209_eval",
+    "TMC2224_eval": ".TMC2224_eval",
+    "TMC2225_eval": ".TMC2225_eval",
+    "TMC2240_eval": ".TMC2240_eval",
+    "TMC2300_eval": ".TMC2300_eval",
+    "TMC2590_eval": ".TMC2590_eval",
+    "TMC2660_eval": ".TMC2660_eval",
+    "TMC4361_eval": ".TMC4361_eval",
+    "TMC4671_eval": ".TMC4671_eval",
+    "TMC5031_eval": ".TMC5031_eval",
+    "TMC5041_eval": ".TMC5041_eval",
+    "TMC5062_eval": ".TMC5062_eval",
+    "TMC5072_eval": ".TMC5072_eval",
+    "TMC5130_eval": ".TMC5130_eval",
+    "TMC5160_eval": ".TMC5160_eval",
+    "TMC5160_shield": ".TMC5160_shield",
+    "TMC5240_eval": ".TMC5240_eval",
+    "TMC6100_eval": ".TMC6100_eval",
+    "TMC6140_eval": ".TMC6140_eval",
+    "TMC6200_eval": ".TMC6200_eval",
+    "TMC6300_eval": ".TMC6300_eval",
+    "TMC7300_eval": ".TMC7300_eval",
+    "TMC5272_eval": ".TMC5272_eval",
+    "TMC5271_eval": ".TMC5271_eval",
+    "TMC9660_3PH_eval": ".TMC9660_eval",
+    "TMC9660_STEPPER_eval": ".TMC9660_eval",
+}
+
+__all__ = ['TMCLEval'] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    return lazy_import(sys.modules[__name__], name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = LazyPackage
@@ -6,10 +6,19 @@
 # This software is proprietary to Analog Devices, Inc. and its licensors.
 ################################################################################
 
+from contextlib import contextmanager
+
 from pytrinamic.helpers import BitField
+from pytrinamic.ic.tmc_ic import PendingRegisterWrite
 
 class TMCLEval(object):
 
+    _REGISTER_COMMANDS = None
+    """(write command, read command, channel) of the register access, lets read_registers() and write_registers() pipeline."""
+
+    _transaction = None
+    """address -> PendingRegisterWrite while a transaction() is open"""
+
     def __init__(self, connection, module_id=1):
         """
         Constructor for the module instance.
@@ -52,12 +61,34 @@ class TMCLEval(object):
         return self._connection.get_axis_parameter(ap_type, axis, self._module_id, signed=signed)
 
     def write_register_field(self, field, value):
+        if self._transaction is not None:
+            address, mask, shift = field
+            if address not in self._transaction:
+                self._transaction[address] = PendingRegisterWrite()
+            self._transaction[address].set_field(mask, shift, value)
+            return None
         return self.write_register(field[0], BitField.field_set(self.read_register(field[0]),
                                                                 field[1], field[2], value))
 
     def read_register_field(self, field):
         return BitField.field_get(self.read_register(field[0]), field[1], field[2])
 
+    def read_many(self, fields):
+        """
+        Reads several register fields with as few register reads as possible.
+        Every register is read once however many of its fields are requested,
+        the reads are pipelined like with read_registers().
+
+        Parameters:
+        fields: Register fields to read.
+
+        Returns: Dict of field to value.
+        """
+        fields = list(fields)
+        addresses = sorted({field[0] for field in fields})
+        register_values = dict(zip(addresses, self.read_registers(addresses)))
+        return {field: BitField.field_get(register_values[field[0]], field[1], field[2]) for field in fields}
+
     def write_axis_field(self, axis, field, value):
         """
         Writes the given value to the axis-dependent register field.
@@ -86,6 +117,61 @@ class TMCLEval(object):
         value = self.read_register_field(field[axis] if type(field) == list else field)
         return BitField.to_signed_32(value) if signed else value
 
+    @contextmanager
+    def transaction(self):
+        """
+        Collect the register field writes of a with-block and do them at its end.
+
+        The writes are grouped by register, every touched register is read at
+        most once and written once, in address order. Registers whose fields
+        cover all 32 bits are not read. Inside the block write_register_field()
+        returns None and reads do not see the pending writes. If the block
+        raises, nothing is written. A nested transaction joins the outer one.
+        """
+        if self._transaction is not None:
+            yield
+            return
+        pending = self._transaction = {}
+        try:
+            yield
+        finally:
+            self._transaction = None
+        addresses = sorted(pending)
+        unknown = [address for address in addresses if pending[address].mask != 0xFFFFFFFF]
+        for address, register_value in zip(unknown, self.read_registers(unknown)):
+            pending[address].base = register_value
+        for address in addresses:
+            if pending[address].base is None:
+                pending[address].base = 0
+        self.write_registers([(address, pending[address].value()) for address in addresses])
+
+    def read_registers(self, addresses):
+        """
+        Read several registers and return their unsigned values.
+
+        The reads are pipelined if the board sets _REGISTER_COMMANDS and the
+        connection supports it, otherwise they are done one after the other.
+        """
+        if self._REGISTER_COMMANDS is None or not hasattr(self._connection, "send_requests"):
+            return [self.read_register(address) for address in addresses]
+        _, read_command, channel = self._REGISTER_COMMANDS
+        requests = [self._connection.build_register_request(read_command, address, channel, 0, self._module_id, None) for address in addresses]
+        return [reply.value for reply in self._connection.send_requests(requests)]
+
+    def write_registers(self, writes):
+        """
+        Write several registers, given as (address, value) tuples, in order.
+
+        Pipelined like read_registers().
+        """
+        if self._REGISTER_COMMANDS is None or not hasattr(self._connection, "send_requests"):
+            for address, value in writes:
+                self.write_register(address, value)
+            return
+        write_command, _, channel = self._REGISTER_COMMANDS
+        requests = [self._connection.build_register_request(write_command, address, channel, value, self._module_id, None) for address, value in writes]
+        self._connection.send_requests(requests)
+
     def __str__(self):
         return "{} {}".format(
                 self.name,
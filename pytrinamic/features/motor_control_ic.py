@@ -6,6 +6,8 @@
 # This software is proprietary to Analog Devices, Inc. and its licensors.
 ################################################################################
 
+from contextlib import nullcontext
+
 from ..features.motor_control import MotorControl
 from ..helpers import to_signed_32
 
@@ -28,12 +30,14 @@ class MotorControlIc(MotorControl):
 
         Returns: None
         """
-        self.write_axis_field(self._ic.FIELD.RAMPMODE, 0)
+        # The registers are written in address order, RAMPMODE before VMAX before XTARGET.
+        with self._transaction():
+            self.write_axis_field(self._ic.FIELD.RAMPMODE, 0)
 
-        if velocity and velocity != 0:
-            self.write_axis_field(self._ic.FIELD.VMAX, velocity)
+            if velocity and velocity != 0:
+                self.write_axis_field(self._ic.FIELD.VMAX, velocity)
 
-        self.write_axis_field(self._ic.FIELD.XTARGET, position)
+            self.write_axis_field(self._ic.FIELD.XTARGET, position)
 
     def move_by(self, distance, velocity=None):
         """
@@ -145,6 +149,10 @@ class MotorControlIc(MotorControl):
 
     # ic specific functions
 
+    def _transaction(self):
+        transaction = getattr(self._parent, "transaction", None)
+        return transaction() if transaction else nullcontext()
+
     def write_axis_field(self, field, value):
         """
         Writes the given value to the axis-dependent register field.
@@ -91,6 +91,17 @@ class SolenoidIC(Solenoid):
     def __u_ac_real(u_ac_value, u_supply, vdr):
         return ((u_ac_value * (36 if vdr else u_supply)) / 0xFFFF)
     
+    def __read_fields(self, *fields):
+        """Read fields of this axis, every register only once."""
+        fields = [field[self._axis] if type(field) == list else field for field in fields]
+        values = self._parent.read_many(fields)
+        return [values[field] for field in fields]
+
+    def __read_mode(self, *fields):
+        """Read the voltage/duty and control mode, and the given fields along with them."""
+        vdr_nduty, ctrl_mode, *values = self.__read_fields(self._ic.FIELD.VDR_NDUTY, self._ic.FIELD.CTRL_MODE, *fields)
+        return (vdr_nduty == 1, ctrl_mode == 1, self.__map_fsf.get(ctrl_mode, 1.0), *values)
+
     def set_voltage_high(self, u_dc_h):
         """
         Set high DC voltage.
@@ -99,9 +110,7 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_h: High DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
+        vdr, cdr, fsf = self.__read_mode()
         print("U_DC_H {}".format(round(self.__u_dc_value(u_dc_h, self.__u_supply, vdr, cdr, fsf))))
         self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_H, round(self.__u_dc_value(u_dc_h, self.__u_supply, vdr, cdr, fsf)))
 
@@ -113,10 +122,8 @@ class SolenoidIC(Solenoid):
         Returns:
         High DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_H), self.__u_supply, vdr, cdr, fsf)
+        vdr, cdr, fsf, u_dc = self.__read_mode(self._ic.FIELD.DC_H)
+        return self.__u_dc_real(u_dc, self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_low(self, u_dc_l):
         """
@@ -126,9 +133,7 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_l: Low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
+        vdr, cdr, fsf = self.__read_mode()
         self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_L, round(self.__u_dc_value(u_dc_l, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_low(self):
@@ -139,10 +144,8 @@ class SolenoidIC(Solenoid):
         Returns:
         Low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_L), self.__u_supply, vdr, cdr, fsf)
+        vdr, cdr, fsf, u_dc = self.__read_mode(self._ic.FIELD.DC_L)
+        return self.__u_dc_real(u_dc, self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_low_high(self, u_dc_l2h):
         """
@@ -152,9 +155,7 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_l2h: Low to high DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
+        vdr, cdr, fsf = self.__read_mode()
         self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_L2H, round(self.__u_dc_value(u_dc_l2h, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_low_high(self):
@@ -165,10 +166,8 @@ class SolenoidIC(Solenoid):
         Returns:
         Low to high DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_L2H), self.__u_supply, vdr, cdr, fsf)
+        vdr, cdr, fsf, u_dc = self.__read_mode(self._ic.FIELD.DC_L2H)
+        return self.__u_dc_real(u_dc, self.__u_supply, vdr, cdr, fsf)
 
     def set_voltage_high_low(self, u_dc_h2l):
         """
@@ -178,9 +177,7 @@ class SolenoidIC(Solenoid):
         Parameters:
         u_dc_h2l: High to low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
+        vdr, cdr, fsf = self.__read_mode()
         self._parent.write_axis_field(self._axis, self._ic.FIELD.DC_H2L, round(self.__u_dc_value(u_dc_h2l, self.__u_supply, vdr, cdr, fsf)))
 
     def get_voltage_high_low(self):
@@ -191,10 +188,8 @@ class SolenoidIC(Solenoid):
         Returns:
         High to low DC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        cdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE) == 1)
-        fsf = self.__map_fsf.get(self._parent.read_axis_field(self._axis, self._ic.FIELD.CTRL_MODE), 1.0)
-        return self.__u_dc_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.DC_H2L), self.__u_supply, vdr, cdr, fsf)
+        vdr, cdr, fsf, u_dc = self.__read_mode(self._ic.FIELD.DC_H2L)
+        return self.__u_dc_real(u_dc, self.__u_supply, vdr, cdr, fsf)
 
     def set_frequency(self, u_ac_freq):
         """
@@ -238,8 +233,8 @@ class SolenoidIC(Solenoid):
         Returns:
         AC voltage.
         """
-        vdr = (self._parent.read_axis_field(self._axis, self._ic.FIELD.VDR_NDUTY) == 1)
-        return self.__u_ac_real(self._parent.read_axis_field(self._axis, self._ic.FIELD.U_AC), self.__u_supply, vdr)
+        vdr_nduty, u_ac = self.__read_fields(self._ic.FIELD.VDR_NDUTY, self._ic.FIELD.U_AC)
+        return self.__u_ac_real(u_ac, self.__u_supply, vdr_nduty == 1)
 
     # Properties
     u_supply = property(get_voltage_supply, set_voltage_supply)
@@ -0,0 +1,60 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, access, address, signed, ((name, access, mask, shift, signed, options), ...)
+REGISTERS = (
+    ('SRC_CONFIG', 'RW', 0x0001, False, (
+        ('ADC0_MUX0_CFG', 'RW', 0x00000003, 0, False, (('ADC0_MUX0_OFF', 0), ('ADC0_MUX0_1ST', 1), ('ADC0_MUX0_2ND', 2), ('ADC0_MUX0_3RD', 3))),
+        ('ADC0_MUX1_CFG', 'RW', 0x0000000C, 2, False, (('ADC0_MUX1_OFF', 0), ('ADC0_MUX1_1ST', 1), ('ADC0_MUX1_2ND', 2), ('ADC0_MUX1_3RD', 3))),
+        ('ADC0_MUX2_CFG', 'RW', 0x00000030, 4, False, (('ADC0_MUX2_OFF', 0), ('ADC0_MUX2_1ST', 1), ('ADC0_MUX2_2ND', 2), ('ADC0_MUX2_3RD', 3))),
+        ('ADC0_MUX3_DIS', 'RW', 0x00000040, 6, False, None),
+        ('ADC0_MUX2_DETOUR', 'RW', 0x00000080, 7, False, (('NO_CHANGE', False), ('ADC0_MUX2_DETOUR', True))),
+        ('ADC1_MUX0_CFG', 'RW', 0x00000300, 8, False, (('ADC1_MUX0_OFF', 0), ('ADC1_MUX0_1ST', 1), ('ADC1_MUX0_2ND', 2), ('ADC1_MUX0_3RD', 3))),
+        ('ADC1_MUX1_CFG', 'RW', 0x00000C00, 10, False, (('ADC1_MUX1_OFF', 0), ('ADC1_MUX1_1ST', 1), ('ADC1_MUX1_2ND', 2), ('ADC1_MUX1_3RD', 3))),
+        ('ADC1_MUX2_CFG', 'RW', 0x00003000, 12, False, (('ADC1_MUX2_OFF', 0), ('ADC1_MUX2_1ST', 1), ('ADC1_MUX2_2ND', 2), ('ADC1_MUX2_3RD', 3))),
+        ('ADC1_MUX2_DETOUR', 'RW', 0x00008000, 15, False, (('NO_CHANGE', False), ('ADC1_MUX2_DETOUR', True))),
+        ('ADC2_MUX0_CFG', 'RW', 0x00030000, 16, False, (('ADC2_MUX0_OFF', 0), ('ADC2_MUX0_1ST', 1), ('ADC2_MUX0_2ND', 2), ('ADC2_MUX0_3RD', 3))),
+        ('ADC2_MUX1_CFG', 'RW', 0x000C0000, 18, False, (('ADC2_MUX1_OFF', 0), ('ADC2_MUX1_1ST', 1), ('ADC2_MUX1_2ND', 2), ('ADC2_MUX1_3RD', 3))),
+        ('ADC2_MUX2_CFG', 'RW', 0x00300000, 20, False, (('ADC2_MUX2_OFF', 0), ('ADC2_MUX2_1ST', 1), ('ADC2_MUX2_2ND', 2), ('ADC2_MUX2_3RD', 3))),
+        ('ADC2_MUX3_DIS', 'RW', 0x00400000, 22, False, None),
+        ('ADC2_MUX2_DETOUR', 'RW', 0x00800000, 23, False, (('NO_CHANGE', False), ('ADC2_MUX2_DETOUR', True))),
+        ('ADC3_MUX0_CFG', 'RW', 0x03000000, 24, False, (('ADC3_MUX0_OFF', 0), ('ADC3_MUX0_1ST', 1), ('ADC3_MUX0_2ND', 2), ('ADC3_MUX0_3RD', 3))),
+        ('ADC3_MUX1_CFG', 'RW', 0x0C000000, 26, False, (('ADC3_MUX1_OFF', 0), ('ADC3_MUX1_1ST', 1), ('ADC3_MUX1_2ND', 2), ('ADC3_MUX1_3RD', 3))),
+        ('ADC3_MUX2_CFG', 'RW', 0x30000000, 28, False, (('ADC3_MUX2_OFF', 0), ('ADC3_MUX2_1ST', 1), ('ADC3_MUX2_2ND', 2), ('ADC3_MUX2_3RD', 3))),
+        ('ADC3_MUX2_DETOUR', 'RW', 0x80000000, 31, False, (('NO_CHANGE', False), ('ADC3_MUX2_DETOUR', True))),
+    )),
+    ('SETUP', 'RW', 0x0002, False, (
+        ('ADC_SHIFT_SAMPLE', 'RW', 0x000F0000, 16, False, (('ADC_SHIFT_500NS', 0), ('ADC_SHIFT_600NS', 1), ('ADC_SHIFT_700NS', 2), ('ADC_SHIFT_800NS', 3), ('ADC_SHIFT_900NS', 4), ('ADC_SHIFT_1000NS', 5), ('ADC_SHIFT_1100NS', 6), ('ADC_SHIFT_1200NS', 7), ('ADC_SHIFT_1300NS', 8), ('ADC_SHIFT_1400NS', 9), ('ADC_SHIFT_1500NS', 10), ('ADC_SHIFT_1600NS', 11), ('ADC_SHIFT_1700NS', 12), ('ADC_SHIFT_1800NS', 13), ('ADC_SHIFT_1900NS', 14), ('ADC_SHIFT_2000NS', 15))),
+    )),
+    ('STATUS', 'R', 0x0005, False, (
+        ('RDY_ADC_0', 'R', 0x00000001, 0, False, (('ADC0_NRDY', False), ('ADC0_RDY', True))),
+        ('RDY_ADC_1', 'R', 0x00000002, 1, False, (('ADC1_NRDY', False), ('ADC1_RDY', True))),
+        ('RDY_ADC_2', 'R', 0x00000004, 2, False, (('ADC2_NRDY', False), ('ADC2_RDY', True))),
+        ('RDY_ADC_3', 'R', 0x00000008, 3, False, (('ADC3_NRDY', False), ('ADC3_RDY', True))),
+        ('ADC0_WTCHDG_FAIL', 'R', 0x00000100, 8, False, (('ADC0_OK', False), ('ADC0_FAIL', True))),
+        ('ADC1_WTCHDG_FAIL', 'R', 0x00000200, 9, False, (('ADC1_OK', False), ('ADC1_FAIL', True))),
+        ('ADC2_WTCHDG_FAIL', 'R', 0x00000400, 10, False, (('ADC2_OK', False), ('ADC2_FAIL', True))),
+        ('ADC3_WTCHDG_FAIL', 'R', 0x00000800, 11, False, (('ADC3_OK', False), ('ADC3_FAIL', True))),
+        ('ADC0_MUXSEQ_FAIL', 'R', 0x00001000, 12, False, (('ADC0_SEQ_OK', False), ('ADC0_SEQ_FAIL', True))),
+        ('ADC1_MUXSEQ_FAIL', 'R', 0x00002000, 13, False, (('ADC1_SEQ_OK', False), ('ADC1_SEQ_FAIL', True))),
+        ('ADC2_MUXSEQ_FAIL', 'R', 0x00004000, 14, False, (('ADC2_SEQ_OK', False), ('ADC2_SEQ_FAIL', True))),
+        ('ADC3_MUXSEQ_FAIL', 'R', 0x00008000, 15, False, (('ADC3_SEQ_OK', False), ('ADC3_SEQ_FAIL', True))),
+    )),
+    ('CSA_SETUP', 'RW', 0x0007, False, (
+        ('CSA0_EN', 'RW', 0x00000001, 0, False, (('CSA0_OFF', False), ('CSA0_EN', True))),
+        ('CSA1_EN', 'RW', 0x00000002, 1, False, (('CSA1_OFF', False), ('CSA1_EN', True))),
+        ('CSA2_EN', 'RW', 0x00000004, 2, False, (('CSA2_OFF', False), ('CSA2_EN', True))),
+        ('CSA3_EN', 'RW', 0x00000008, 3, False, (('CSA3_OFF', False), ('CSA3_EN', True))),
+        ('CSA012_GAIN', 'RW', 0x00000030, 4, False, (('CSA012_GAIN_x5', 0), ('CSA012_GAIN_x10', 1), ('CSA012_GAIN_x20', 2), ('CSA012_GAIN_x40', 3))),
+        ('CSA012_BYPASS', 'RW', 0x00000040, 6, False, (('CSA012_BYPASS_OFF', False), ('CSA012_BYPASS_EN', True))),
+        ('CSA3_GAIN', 'RW', 0x00000300, 8, False, (('CSA3_GAIN_x5', 0), ('CSA3_GAIN_x10', 1), ('CSA3_GAIN_x20', 2), ('CSA3_GAIN_x40', 3))),
+        ('CSA3_BYPASS', 'RW', 0x00000400, 10, False, (('CSA3_BYPASS_OFF', False), ('CSA3_BYPASS_EN', True))),
+        ('CSA012_FILT', 'RW', 0x00003000, 12, False, (('CSA012_FILT_0u55', 0), ('CSA012_FILT_0u75', 1), ('CSA012_FILT_1u00', 2), ('CSA012_FILT_1u35', 3))),
+        ('CSA3_FILT', 'RW', 0x0000C000, 14, False, (('CSA3_FILT_0u55', 0), ('CSA3_FILT_0u75', 1), ('CSA3_FILT_1u00', 2), ('CSA3_FILT_1u35', 3))),
+        ('CSA_AZ_FLTLNGTH_EXP', 'RW', 0x000F0000, 16, False, (('CSA_AZ_FILT_off', 0), ('CSA_AZ_FILT_2', 1), ('CSA_AZ_FILT_4', 2), ('CSA_AZ_FILT_8', 3))),
+    )),
+)
@@ -0,0 +1,817 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, access, address, signed, ((name, access, mask, shift, signed, options), ...)
+REGISTERS = (
+    ('INFO_CHIP', 'R', 0x0000, False, (
+        ('ID', 'R', 0xFFFFFFFF, 0, False, None),
+    )),
+    ('ADC_I1_I0_RAW', 'R', 0x0020, False, (
+        ('I0', 'R', 0x0000FFFF, 0, True, None),
+        ('I1', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I3_I2_RAW', 'R', 0x0021, False, (
+        ('I2', 'R', 0x0000FFFF, 0, True, None),
+        ('I3', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_U1_U0_RAW', 'R', 0x0022, False, (
+        ('U0', 'R', 0x0000FFFF, 0, True, None),
+        ('U1', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_U3_U2_RAW', 'R', 0x0023, False, (
+        ('U2', 'R', 0x0000FFFF, 0, True, None),
+        ('U3', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_TEMP_VM_RAW', 'R', 0x0024, False, (
+        ('VM', 'R', 0x0000FFFF, 0, True, None),
+        ('TEMP', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_AIN1_AIN0_RAW', 'R', 0x0025, False, (
+        ('AIN0', 'R', 0x0000FFFF, 0, True, None),
+        ('AIN1', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_AIN3_AIN2_RAW', 'R', 0x0026, False, (
+        ('AIN2', 'R', 0x0000FFFF, 0, True, None),
+        ('AIN3', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I_GEN_CONFIG', 'RW', 0x0040, False, (
+        ('UX1_SELECT', 'RW', 0x00000003, 0, False, (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3))),
+        ('VX2_SELECT', 'RW', 0x0000000C, 2, False, (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3))),
+        ('WY1_SELECT', 'RW', 0x00000030, 4, False, (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3))),
+        ('Y2_SELECT', 'RW', 0x000000C0, 6, False, (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3))),
+        ('MEASUREMENT_MODE', 'RW', 0x00000E00, 9, False, (('INLINE', 0), ('INLINE_VW', 1), ('INLINE_UW', 2), ('INLINE_UV', 3), ('BOTTOM', 4))),
+        ('TRIGGER_SELECT', 'RW', 0x00001000, 12, False, (('INLINE', False), ('SYNC_TRIGGER', True))),
+        ('TRIGGER_POS', 'RW', 0xFFFF0000, 16, False, None),
+    )),
+    ('ADC_I0_CONFIG', 'RW', 0x0041, False, (
+        ('OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+        ('SCALE', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I1_CONFIG', 'RW', 0x0042, False, (
+        ('OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+        ('SCALE', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I2_CONFIG', 'RW', 0x0043, False, (
+        ('OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+        ('SCALE', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I3_CONFIG', 'RW', 0x0044, False, (
+        ('OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+        ('SCALE', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I1_I0_SCALED', 'R', 0x0045, False, (
+        ('I0', 'R', 0x0000FFFF, 0, True, None),
+        ('I1', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I3_I2_SCALED', 'R', 0x0046, False, (
+        ('I2', 'R', 0x0000FFFF, 0, True, None),
+        ('I3', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_IWY_IUX', 'R', 0x0047, False, (
+        ('IUX', 'R', 0x0000FFFF, 0, True, None),
+        ('IWY', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_IV', 'R', 0x0048, True, (
+        ('IV', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('ADC_STATUS', 'RWC', 0x0049, False, (
+        ('I0_CLIPPED', 'RWC', 0x00000001, 0, False, None),
+        ('I1_CLIPPED', 'RWC', 0x00000002, 1, False, None),
+        ('I2_CLIPPED', 'RWC', 0x00000004, 2, False, None),
+        ('I3_CLIPPED', 'RWC', 0x00000008, 3, False, None),
+        ('U0_CLIPPED', 'RWC', 0x00000010, 4, False, None),
+        ('U1_CLIPPED', 'RWC', 0x00000020, 5, False, None),
+        ('U2_CLIPPED', 'RWC', 0x00000040, 6, False, None),
+        ('U3_CLIPPED', 'RWC', 0x00000080, 7, False, None),
+        ('AIN0_CLIPPED', 'RWC', 0x00000100, 8, False, None),
+        ('AIN1_CLIPPED', 'RWC', 0x00000200, 9, False, None),
+        ('AIN2_CLIPPED', 'RWC', 0x00000400, 10, False, None),
+        ('AIN3_CLIPPED', 'RWC', 0x00000800, 11, False, None),
+        ('VM_CLIPPED', 'RWC', 0x00001000, 12, False, None),
+        ('TEMP_CLIPPED', 'RWC', 0x00002000, 13, False, None),
+        ('I0_DONE', 'RWC', 0x00010000, 16, False, None),
+        ('I1_DONE', 'RWC', 0x00020000, 17, False, None),
+        ('I2_DONE', 'RWC', 0x00040000, 18, False, None),
+        ('I3_DONE', 'RWC', 0x00080000, 19, False, None),
+        ('U0_DONE', 'RWC', 0x00100000, 20, False, None),
+        ('U1_DONE', 'RWC', 0x00200000, 21, False, None),
+        ('U2_DONE', 'RWC', 0x00400000, 22, False, None),
+        ('U3_DONE', 'RWC', 0x00800000, 23, False, None),
+        ('AIN0_DONE', 'RWC', 0x01000000, 24, False, None),
+        ('AIN1_DONE', 'RWC', 0x02000000, 25, False, None),
+        ('AIN2_DONE', 'RWC', 0x04000000, 26, False, None),
+        ('AIN3_DONE', 'RWC', 0x08000000, 27, False, None),
+        ('VM_DONE', 'RWC', 0x10000000, 28, False, None),
+        ('TEMP_DONE', 'RWC', 0x20000000, 29, False, None),
+    )),
+    ('MOTOR_CONFIG', 'RW', 0x0060, False, (
+        ('N_POLE_PAIRS', 'RW', 0x0000007F, 0, False, None),
+        ('TYPE', 'RW', 0x00030000, 16, False, (('NONE', 0), ('DC', 1), ('STEPPER', 2), ('BLDC', 3))),
+    )),
+    ('MOTION_CONFIG', 'RW', 0x0061, False, (
+        ('MOTION_MODE', 'RW', 0x0000000F, 0, False, (('STOPPED', 0), ('TORQUE', 1), ('VELOCITY', 2), ('POSITION', 3), ('PRBS_FLUX', 4), ('PRBS_TORQUE', 5), ('PRBS_VELOCITY', 6), ('PRBS_POSITION', 7), ('VOLTAGE_EXT', 8), ('PRBS_UD', 9))),
+        ('RAMP_ENABLE', 'RW', 0x00000010, 4, False, None),
+        ('RAMP_MODE', 'RW', 0x00000020, 5, False, (('POSITION', False), ('VELOCITY', True))),
+        ('FEEDFORWARD', 'RW', 0x000000C0, 6, False, (('DISABLED', 0), ('MCC_RAMPER_V_ACTUAL', 1), ('MCC_RAMPER_A_ACTUAL', 2), ('BOTH', 3))),
+    )),
+    ('PHI_E_SELECTION', 'RW', 0x0062, False, (
+        ('PHI_E_SELECTION', 'RW', 0x0000000F, 0, False, (('RESERVED', 0), ('PHI_E_EXT', 1), ('PHI_E_RAMP', 2), ('PHI_E_ABN', 3), ('RAMP_X_ACTUAL', 4), ('PHI_E_HAL', 5))),
+    )),
+    ('PHI_E', 'R', 0x0063, True, (
+        ('PHI_E', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('PWM_CONFIG', 'RW', 0x0080, False, (
+        ('CHOP', 'RW', 0x00000007, 0, False, (('OFF_FREE', 0), ('OFF_LSON', 1), ('OFF_HSON', 2), ('OFF_FREE2', 3), ('OFF_FREE3', 4), ('LSPWM_HSOFF', 5), ('HSPWM_LSOFF', 6), ('CENTERED', 7))),
+        ('SV_MODE', 'RW', 0x00000030, 4, False, (('DISABLED', 0), ('HARMONIC', 1), ('BOTTOM', 2), ('BOTTOM_OFFSET', 3))),
+        ('Y2_HS_SRC', 'RW', 0x000000C0, 6, False, (('Y2_HS', 0), ('Y2_ALT', 1), ('TIM_BASIC', 2))),
+        ('ENABLE_UX1', 'RW', 0x00000100, 8, False, None),
+        ('ENABLE_VX2', 'RW', 0x00000200, 9, False, None),
+        ('ENABLE_WY1', 'RW', 0x00000400, 10, False, None),
+        ('ENABLE_Y2', 'RW', 0x00000800, 11, False, None),
+        ('EXT_ENABLE_UX1', 'RW', 0x00001000, 12, False, None),
+        ('EXT_ENABLE_VX2', 'RW', 0x00002000, 13, False, None),
+        ('EXT_ENABLE_WY1', 'RW', 0x00004000, 14, False, None),
+        ('EXT_ENABLE_Y2', 'RW', 0x00008000, 15, False, None),
+        ('DUTY_CYCLE_OFFSET', 'RW', 0xFFFF0000, 16, False, None),
+    )),
+    ('PWM_MAXCNT', 'RW', 0x0081, False, (
+        ('PWM_MAXCNT', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('PWM_SWITCH_LIMIT', 'RW', 0x0083, False, (
+        ('PWM_SWITCH_LIMIT', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('ABN_PHI_E_PHI_M', 'R', 0x00A0, False, (
+        ('PHI_M', 'R', 0x0000FFFF, 0, True, None),
+        ('PHI_E', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('ABN_MODE', 'RW', 0x00A1, False, (
+        ('A_POL', 'RW', 0x00000001, 0, False, (('HIGH_ACT', False), ('LOW_ACT', True))),
+        ('B_POL', 'RW', 0x00000002, 1, False, (('HIGH_ACT', False), ('LOW_ACT', True))),
+        ('N_POL', 'RW', 0x00000004, 2, False, (('HIGH_ACT', False), ('LOW_ACT', True))),
+        ('COMBINED_N', 'RW', 0x00000008, 3, False, (('ONLY_N', False), ('ALL', True))),
+        ('CLEAR_COUNT_ON_N', 'RW', 0x00000010, 4, False, (('DISABLED', False), ('ENABLED', True))),
+        ('DISABLE_FILTER', 'RW', 0x00000020, 5, False, (('FILTERED', False), ('UNFILTERED', True))),
+        ('CLN', 'RW', 0x00000100, 8, False, (('OFF', False), ('ON', True))),
+        ('DIRECTION', 'RW', 0x00001000, 12, False, (('POS', False), ('NEG', True))),
+    )),
+    ('ABN_CPR', 'RW', 0x00A2, False, (
+        ('ABN_CPR', 'RW', 0x00FFFFFF, 0, False, None),
+    )),
+    ('ABN_CPR_INV', 'RW', 0x00A3, False, (
+        ('ABN_CPR_INV', 'RW', 0xFFFFFFFF, 0, False, None),
+    )),
+    ('ABN_COUNT', 'RW', 0x00A4, False, (
+        ('ABN_COUNT', 'RW', 0x00FFFFFF, 0, False, None),
+    )),
+    ('ABN_COUNT_N', 'RW', 0x00A5, False, (
+        ('ABN_COUNT_N', 'RW', 0x00FFFFFF, 0, False, None),
+    )),
+    ('ABN_PHI_E_OFFSET', 'RW', 0x00A6, True, (
+        ('ABN_PHI_E_OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+    )),
+    ('HALL_MODE', 'RW', 0x00C0, False, (
+        ('POLARITY', 'RW', 0x00000001, 0, False, (('NORMAL', False), ('INVERSED', True))),
+        ('EXTRAPOLATION', 'RW', 0x00000002, 1, False, (('DISABLED', False), ('ENABLED', True))),
+        ('ORDER', 'RW', 0x00000070, 4, False, (('UVW', 0), ('VWU', 1), ('WUV', 2), ('RESERVED', 3), ('UWV', 4), ('VUW', 5), ('WVU', 6), ('RESERVED2', 7))),
+        ('FILTER', 'RW', 0x0000FF00, 8, False, None),
+    )),
+    ('HALL_DPHI_MAX', 'RW', 0x00C1, False, (
+        ('HALL_DPHI_MAX', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('HALL_PHI_E_OFFSET', 'RW', 0x00C2, True, (
+        ('HALL_PHI_E_OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+    )),
+    ('HALL_COUNT', 'R', 0x00C3, True, (
+        ('HALL_COUNT', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('HALL_PHI_E_EXTRAPOLATED_PHI_E', 'R', 0x00C4, False, (
+        ('PHI_E', 'R', 0x0000FFFF, 0, True, None),
+        ('PHI_E_EXTRAPOLATED', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('HALL_POSITION_060_POSITION_000', 'RW', 0x00C5, False, (
+        ('POSITION_000', 'RW', 0x0000FFFF, 0, True, None),
+        ('POSITION_060', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('HALL_POSITION_180_POSITION_120', 'RW', 0x00C6, False, (
+        ('POSITION_120', 'RW', 0x0000FFFF, 0, True, None),
+        ('POSITION_180', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('HALL_POSITION_300_POSITION_240', 'RW', 0x00C7, False, (
+        ('POSITION_240', 'RW', 0x0000FFFF, 0, True, None),
+        ('POSITION_300', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('BIQUAD_V_A_1', 'RW', 0x00E0, True, (
+        ('BIQUAD_V_A_1', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_V_A_2', 'RW', 0x00E1, True, (
+        ('BIQUAD_V_A_2', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_V_B_0', 'RW', 0x00E2, True, (
+        ('BIQUAD_V_B_0', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_V_B_1', 'RW', 0x00E3, True, (
+        ('BIQUAD_V_B_1', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_V_B_2', 'RW', 0x00E4, True, (
+        ('BIQUAD_V_B_2', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_V_ENABLE', 'RW', 0x00E5, False, (
+        ('BIQUAD_V_ENABLE', 'RW', 0x00000001, 0, False, None),
+    )),
+    ('BIQUAD_T_A_1', 'RW', 0x00E6, True, (
+        ('BIQUAD_T_A_1', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_T_A_2', 'RW', 0x00E7, True, (
+        ('BIQUAD_T_A_2', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_T_B_0', 'RW', 0x00E8, True, (
+        ('BIQUAD_T_B_0', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_T_B_1', 'RW', 0x00E9, True, (
+        ('BIQUAD_T_B_1', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_T_B_2', 'RW', 0x00EA, True, (
+        ('BIQUAD_T_B_2', 'RW', 0x00FFFFFF, 0, True, None),
+    )),
+    ('BIQUAD_T_ENABLE', 'RW', 0x00EB, False, (
+        ('BIQUAD_T_ENABLE', 'RW', 0x00000001, 0, False, None),
+    )),
+    ('VELOCITY_CONFIG', 'RW', 0x0100, False, (
+        ('SELECTION', 'RW', 0x000000FF, 0, False, (('PHI_E', 0), ('PHI_E_EXT', 1), ('PHI_E_RAMP', 2), ('PHI_E_ABN', 3), ('RAMP_X_ACTUAL', 4), ('PHI_E_HAL', 5), ('PHI_M_EXT', 6), ('Reserved', 11), ('ABN_COUNT', 8), ('PHI_M_ABN', 9), ('HALL_COUNT', 12))),
+        ('METER_SYNC_PULSE', 'RW', 0x00000100, 8, False, (('PWM_Z', False), ('PWM_C', True))),
+        ('METER_TYPE', 'RW', 0x00000600, 9, False, (('VELOCITY_PER', 0), ('VELOCITY_FREQ', 1), ('VELOCITY_EXT', 2))),
+        ('MOVING_AVRG_FILTER_SAMPLES', 'RW', 0x00007000, 12, False, (('AVRG_1', 0), ('AVRG_2', 1), ('AVRG_3', 2), ('AVRG_4', 3), ('AVRG_5', 4), ('AVRG_6', 5), ('AVRG_7', 6), ('AVRG_8', 7))),
+    )),
+    ('VELOCITY_SCALING', 'RW', 0x0101, True, (
+        ('VELOCITY_SCALING', 'RW', 0x0000FFFF, 0, True, None),
+    )),
+    ('V_MIN_POS_DEV_TIME_COUNTER_LIMIT', 'RW', 0x0102, False, (
+        ('TIME_COUNTER_LIMIT', 'RW', 0x0000FFFF, 0, False, None),
+        ('V_MIN_POS_DEV', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('MAX_VEL_DEVIATION', 'RW', 0x0103, False, (
+        ('MAX_VEL_DEVIATION', 'RW', 0x7FFFFFFF, 0, False, None),
+    )),
+    ('POSITION_CONFIG', 'RW', 0x0120, False, (
+        ('SELECTION', 'RW', 0x000000FF, 0, False, (('PHI_E', 0), ('PHI_E_EXT', 1), ('PHI_E_RAMP', 2), ('PHI_E_ABN', 3), ('RAMP_X_ACTUAL', 4), ('PHI_E_HAL', 5), ('PHI_M_EXT', 6), ('Reserved', 11), ('ABN_COUNT', 8), ('PHI_M_ABN', 9), ('HALL_COUNT', 12))),
+    )),
+    ('MAX_POS_DEVIATION', 'RW', 0x0121, False, (
+        ('MAX_POS_DEVIATION', 'RW', 0x7FFFFFFF, 0, False, None),
+    )),
+    ('RAMPER_STATUS', 'RWC', 0x0140, False, (
+        ('STATUS_STOP_L', 'R', 0x00000001, 0, False, None),
+        ('STATUS_STOP_R', 'R', 0x00000002, 1, False, None),
+        ('STATUS_STOP_H', 'R', 0x00000004, 2, False, None),
+        ('STATUS_LATCH_L', 'RWC', 0x00000008, 3, False, None),
+        ('STATUS_LATCH_R', 'RWC', 0x00000010, 4, False, None),
+        ('STATUS_LATCH_H', 'RWC', 0x00000020, 5, False, None),
+        ('EVENT_STOP_L', 'R', 0x00000040, 6, False, None),
+        ('EVENT_STOP_R', 'R', 0x00000080, 7, False, None),
+        ('EVENT_STOP_H', 'R', 0x00000100, 8, False, None),
+        ('EVENT_STOP_SG', 'RWC', 0x00000200, 9, False, None),
+        ('EVENT_POS_REACHED', 'RWC', 0x00000400, 10, False, None),
+        ('VELOCITY_REACHED', 'R', 0x00000800, 11, False, None),
+        ('POSITION_REACHED', 'R', 0x00001000, 12, False, None),
+        ('V_ZERO', 'R', 0x00002000, 13, False, None),
+        ('T_ZEROWAIT_ACTIVE', 'R', 0x00004000, 14, False, None),
+        ('SECOND_MOVE', 'RWC', 0x00008000, 15, False, None),
+        ('STALL_IN_VEL_ERR', 'R', 0x00010000, 16, False, None),
+        ('STALL_IN_POS_ERR', 'R', 0x00020000, 17, False, None),
+    )),
+    ('RAMPER_A1', 'RW', 0x0141, False, (
+        ('RAMPER_A1', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_A2', 'RW', 0x0142, False, (
+        ('RAMPER_A2', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_A_MAX', 'RW', 0x0143, False, (
+        ('RAMPER_A_MAX', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_D1', 'RW', 0x0144, False, (
+        ('RAMPER_D1', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_D2', 'RW', 0x0145, False, (
+        ('RAMPER_D2', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_D_MAX', 'RW', 0x0146, False, (
+        ('RAMPER_D_MAX', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_V_START', 'RW', 0x0147, False, (
+        ('RAMPER_V_START', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_V1', 'RW', 0x0148, False, (
+        ('RAMPER_V1', 'RW', 0x07FFFFFF, 0, False, None),
+    )),
+    ('RAMPER_V2', 'RW', 0x0149, False, (
+        ('RAMPER_V2', 'RW', 0x07FFFFFF, 0, False, None),
+    )),
+    ('RAMPER_V_STOP', 'RW', 0x014A, False, (
+        ('RAMPER_V_STOP', 'RW', 0x007FFFFF, 0, False, None),
+    )),
+    ('RAMPER_V_MAX', 'RW', 0x014B, False, (
+        ('RAMPER_V_MAX', 'RW', 0x07FFFFFF, 0, False, None),
+    )),
+    ('RAMPER_V_TARGET', 'RW', 0x014C, True, (
+        ('RAMPER_V_TARGET', 'RW', 0x0FFFFFFF, 0, True, None),
+    )),
+    ('RAMPER_SWITCH_MODE', 'RW', 0x014D, False, (
+        ('STOP_L_ENABLE', 'RW', 0x00000001, 0, False, None),
+        ('STOP_R_ENABLE', 'RW', 0x00000002, 1, False, None),
+        ('STOP_H_ENABLE', 'RW', 0x00000004, 2, False, None),
+        ('STOP_L_POL', 'RW', 0x00000008, 3, False, (('NORMAL', False), ('INVERTED', True))),
+        ('STOP_R_POL', 'RW', 0x00000010, 4, False, (('NORMAL', False), ('INVERTED', True))),
+        ('STOP_H_POL', 'RW', 0x00000020, 5, False, (('NORMAL', False), ('INVERTED', True))),
+        ('SWAP_LR', 'RW', 0x00000040, 6, False, None),
+        ('LATCH_L_ACTIVE', 'RW', 0x00000080, 7, False, None),
+        ('LATCH_L_INACTIVE', 'RW', 0x00000100, 8, False, None),
+        ('LATCH_R_ACTIVE', 'RW', 0x00000200, 9, False, None),
+        ('LATCH_R_INACTIVE', 'RW', 0x00000400, 10, False, None),
+        ('LATCH_H_ACTIVE', 'RW', 0x00000800, 11, False, None),
+        ('LATCH_H_INACTIVE', 'RW', 0x00001000, 12, False, None),
+        ('SG_STOP_ENABLE', 'RW', 0x00004000, 14, False, None),
+        ('SOFTSTOP_ENABLE', 'RW', 0x00008000, 15, False, None),
+        ('SW_HARD_STOP', 'RW', 0x00010000, 16, False, None),
+        ('STOP_ON_POS_DEVIATION', 'RW', 0x00020000, 17, False, None),
+        ('STOP_ON_VEL_DEVIATION', 'RW', 0x00040000, 18, False, None),
+        ('VELOCITY_OVERWRITE', 'RW', 0x00080000, 19, False, None),
+    )),
+    ('RAMPER_TIME_CONFIG', 'RW', 0x014E, False, (
+        ('T_ZEROWAIT', 'RW', 0x0000FFFF, 0, False, None),
+        ('T_VMAX', 'RW', 0xFFFF0000, 16, False, None),
+    )),
+    ('RAMPER_A_ACTUAL', 'R', 0x014F, True, (
+        ('RAMPER_A_ACTUAL', 'R', 0x00FFFFFF, 0, True, None),
+    )),
+    ('RAMPER_X_ACTUAL', 'R', 0x0150, True, (
+        ('RAMPER_X_ACTUAL', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('RAMPER_V_ACTUAL', 'R', 0x0151, True, (
+        ('RAMPER_V_ACTUAL', 'R', 0x0FFFFFFF, 0, True, None),
+    )),
+    ('RAMPER_X_TARGET', 'RW', 0x0152, True, (
+        ('RAMPER_X_TARGET', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('RAMPER_PHI_E', 'R', 0x0153, True, (
+        ('RAMPER_PHI_E', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('RAMPER_PHI_E_OFFSET', 'RW', 0x0154, True, (
+        ('RAMPER_PHI_E_OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+    )),
+    ('RAMPER_ACC_FF', 'RW', 0x0155, False, (
+        ('GAIN', 'RW', 0x0000FFFF, 0, False, None),
+        ('SHIFT', 'RW', 0x00070000, 16, False, (('SHIFT_0', 0), ('SHIFT_4', 1), ('SHIFT_8', 2), ('SHIFT_12', 3), ('SHIFT_16', 4), ('SHIFT_20', 5), ('SHIFT_24', 6))),
+    )),
+    ('RAMPER_X_ACTUAL_LATCH', 'R', 0x0156, True, (
+        ('RAMPER_X_ACTUAL_LATCH', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('POSITION_ACTUAL_LATCH', 'R', 0x0157, True, (
+        ('POSITION_ACTUAL_LATCH', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PRBS_AMPLITUDE', 'RW', 0x0160, True, (
+        ('PRBS_AMPLITUDE', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PRBS_DOWN_SAMPLING_RATIO', 'RW', 0x0161, False, (
+        ('PRBS_DOWN_SAMPLING_RATIO', 'RW', 0x000000FF, 0, False, None),
+    )),
+    ('PID_CONFIG', 'RW', 0x0180, False, (
+        ('KEEP_POS_TARGET', 'RW', 0x00000001, 0, False, (('OVERWRITE', False), ('KEEP', True))),
+        ('CURRENT_NORM_P', 'RW', 0x00000004, 2, False, (('SHIFT_8', False), ('SHIFT_16', True))),
+        ('CURRENT_NORM_I', 'RW', 0x00000008, 3, False, (('SHIFT_8', False), ('SHIFT_16', True))),
+        ('VELOCITY_NORM_P', 'RW', 0x00000030, 4, False, (('SHIFT_0', 0), ('SHIFT_8', 1), ('SHIFT_16', 2), ('SHIFT_24', 3))),
+        ('VELOCITY_NORM_I', 'RW', 0x000000C0, 6, False, (('SHIFT_8', 0), ('SHIFT_16', 1), ('SHIFT_24', 2), ('SHIFT_32', 3))),
+        ('POSITION_NORM_P', 'RW', 0x00000300, 8, False, (('SHIFT_0', 0), ('SHIFT_8', 1), ('SHIFT_16', 2), ('SHIFT_24', 3))),
+        ('POSITION_NORM_I', 'RW', 0x00000C00, 10, False, (('SHIFT_8', 0), ('SHIFT_16', 1), ('SHIFT_24', 2), ('SHIFT_32', 3))),
+        ('VEL_SCALE', 'RW', 0x0000F000, 12, False, None),
+        ('POS_SMPL', 'RW', 0x007F0000, 16, False, None),
+        ('VEL_SMPL', 'RW', 0x7F000000, 24, False, None),
+    )),
+    ('PID_FLUX_COEFF', 'RW', 0x0181, False, (
+        ('I', 'RW', 0x00007FFF, 0, False, None),
+        ('P', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_TORQUE_COEFF', 'RW', 0x0182, False, (
+        ('I', 'RW', 0x00007FFF, 0, False, None),
+        ('P', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_FIELDWEAK_COEFF', 'RW', 0x0183, False, (
+        ('I', 'RW', 0x00007FFF, 0, False, None),
+        ('P', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_U_S_MAX', 'RW', 0x0184, False, (
+        ('U_S_MAX', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('PID_VELOCITY_COEFF', 'RW', 0x0185, False, (
+        ('I', 'RW', 0x00007FFF, 0, False, None),
+        ('P', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_POSITION_COEFF', 'RW', 0x0186, False, (
+        ('I', 'RW', 0x00007FFF, 0, False, None),
+        ('P', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_POSITION_TOLERANCE', 'RW', 0x0187, False, (
+        ('PID_POSITION_TOLERANCE', 'RW', 0x7FFFFFFF, 0, False, None),
+    )),
+    ('PID_POSITION_TOLERANCE_DELAY', 'RW', 0x0188, False, (
+        ('PID_POSITION_TOLERANCE_DELAY', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('PID_UQ_UD_LIMITS', 'RW', 0x0189, False, (
+        ('PID_UQ_UD_LIMITS', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('PID_TORQUE_FLUX_LIMITS', 'RW', 0x018A, False, (
+        ('PID_FLUX_LIMIT', 'RW', 0x00007FFF, 0, False, None),
+        ('PID_TORQUE_LIMIT', 'RW', 0x7FFF0000, 16, False, None),
+    )),
+    ('PID_VELOCITY_LIMIT', 'RW', 0x018B, False, (
+        ('PID_VELOCITY_LIMIT', 'RW', 0x7FFFFFFF, 0, False, None),
+    )),
+    ('PID_POSITION_LIMIT_LOW', 'RW', 0x018C, True, (
+        ('PID_POSITION_LIMIT_LOW', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_LIMIT_HIGH', 'RW', 0x018D, True, (
+        ('PID_POSITION_LIMIT_HIGH', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_TORQUE_FLUX_TARGET', 'RW', 0x018E, False, (
+        ('PID_FLUX_TARGET', 'RW', 0x0000FFFF, 0, True, None),
+        ('PID_TORQUE_TARGET', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('PID_TORQUE_FLUX_OFFSET', 'RW', 0x018F, False, (
+        ('PID_FLUX_OFFSET', 'RW', 0x0000FFFF, 0, True, None),
+        ('PID_TORQUE_OFFSET', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('PID_VELOCITY_TARGET', 'RW', 0x0190, True, (
+        ('PID_VELOCITY_TARGET', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_VELOCITY_OFFSET', 'RW', 0x0191, True, (
+        ('PID_VELOCITY_OFFSET', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_TARGET', 'RW', 0x0192, True, (
+        ('PID_POSITION_TARGET', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_TORQUE_FLUX_ACTUAL', 'R', 0x0193, False, (
+        ('PID_FLUX_ACTUAL', 'R', 0x0000FFFF, 0, True, None),
+        ('PID_TORQUE_ACTUAL', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('PID_VELOCITY_ACTUAL', 'R', 0x0194, True, (
+        ('PID_VELOCITY_ACTUAL', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_ACTUAL', 'RW', 0x0195, True, (
+        ('PID_POSITION_ACTUAL', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_ACTUAL_OFFSET', 'RW', 0x0196, True, (
+        ('PID_POSITION_ACTUAL_OFFSET', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_TORQUE_ERROR', 'R', 0x0197, True, (
+        ('PID_TORQUE_ERROR', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('PID_FLUX_ERROR', 'R', 0x0198, True, (
+        ('PID_FLUX_ERROR', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('PID_VELOCITY_ERROR', 'R', 0x0199, True, (
+        ('PID_VELOCITY_ERROR', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_ERROR', 'R', 0x019A, True, (
+        ('PID_POSITION_ERROR', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_TORQUE_INTEGRATOR', 'RW', 0x019B, True, (
+        ('PID_TORQUE_INTEGRATOR', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_FLUX_INTEGRATOR', 'RW', 0x019C, True, (
+        ('PID_FLUX_INTEGRATOR', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_VELOCITY_INTEGRATOR', 'RW', 0x019D, True, (
+        ('PID_VELOCITY_INTEGRATOR', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PID_POSITION_INTEGRATOR', 'RW', 0x019E, True, (
+        ('PID_POSITION_INTEGRATOR', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PIDIN_TORQUE_FLUX_TARGET', 'R', 0x01A0, False, (
+        ('PIDIN_FLUX_TARGET', 'R', 0x0000FFFF, 0, True, None),
+        ('PIDIN_TORQUE_TARGET', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('PIDIN_VELOCITY_TARGET', 'R', 0x01A1, True, (
+        ('PIDIN_VELOCITY_TARGET', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PIDIN_POSITION_TARGET', 'R', 0x01A2, True, (
+        ('PIDIN_POSITION_TARGET', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PIDIN_TORQUE_FLUX_TARGET_LIMITED', 'R', 0x01A3, False, (
+        ('PIDIN_FLUX_TARGET_LIMITED', 'R', 0x0000FFFF, 0, True, None),
+        ('PIDIN_TORQUE_TARGET_LIMITED', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('PIDIN_VELOCITY_TARGET_LIMITED', 'R', 0x01A4, True, (
+        ('PIDIN_VELOCITY_TARGET_LIMITED', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('PIDIN_POSITION_TARGET_LIMITED', 'R', 0x01A5, True, (
+        ('PIDIN_POSITION_TARGET_LIMITED', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('FOC_IBETA_IALPHA', 'R', 0x01A6, False, (
+        ('IALPHA', 'R', 0x0000FFFF, 0, True, None),
+        ('IBETA', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_IQ_ID', 'R', 0x01A7, False, (
+        ('ID', 'R', 0x0000FFFF, 0, True, None),
+        ('IQ', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_UQ_UD', 'R', 0x01A8, False, (
+        ('UD', 'R', 0x0000FFFF, 0, True, None),
+        ('UQ', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_UQ_UD_LIMITED', 'R', 0x01A9, False, (
+        ('UD', 'R', 0x0000FFFF, 0, True, None),
+        ('UQ', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_UBETA_UALPHA', 'R', 0x01AA, False, (
+        ('UALPHA', 'R', 0x0000FFFF, 0, True, None),
+        ('UBETA', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_UWY_UUX', 'R', 0x01AB, False, (
+        ('UUX', 'R', 0x0000FFFF, 0, True, None),
+        ('UWY', 'R', 0xFFFF0000, 16, True, None),
+    )),
+    ('FOC_UV', 'R', 0x01AC, True, (
+        ('UV', 'R', 0x0000FFFF, 0, True, None),
+    )),
+    ('PWM_VX2_UX1', 'R', 0x01AD, False, (
+        ('UX1', 'R', 0x0000FFFF, 0, False, None),
+        ('VX2', 'R', 0xFFFF0000, 16, False, None),
+    )),
+    ('PWM_Y2_WY1', 'R', 0x01AE, False, (
+        ('WY1', 'R', 0x0000FFFF, 0, False, None),
+        ('Y2', 'R', 0xFFFF0000, 16, False, None),
+    )),
+    ('VELOCITY_FRQ', 'R', 0x01AF, True, (
+        ('VELOCITY_FRQ', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('VELOCITY_PER', 'R', 0x01B0, True, (
+        ('VELOCITY_PER', 'R', 0xFFFFFFFF, 0, True, None),
+    )),
+    ('U_S_ACTUAL_I_S_ACTUAL', 'R', 0x01C0, False, (
+        ('I_S_ACTUAL', 'R', 0x0000FFFF, 0, False, None),
+        ('U_S_ACTUAL', 'R', 0xFFFF0000, 16, False, None),
+    )),
+    ('P_MOTOR', 'R', 0x01C1, False, (
+        ('P_MOTOR', 'R', 0xFFFFFFFF, 0, False, None),
+    )),
+    ('INPUTS_RAW', 'R', 0x01C2, False, (
+        ('ENC_A', 'R', 0x00000001, 0, False, None),
+        ('ENC_B', 'R', 0x00000002, 1, False, None),
+        ('ENC_N', 'R', 0x00000004, 2, False, None),
+        ('HALL_U', 'R', 0x00000100, 8, False, None),
+        ('HALL_V', 'R', 0x00000200, 9, False, None),
+        ('HALL_W', 'R', 0x00000400, 10, False, None),
+        ('REF_SW_R', 'R', 0x00001000, 12, False, None),
+        ('REF_SW_L', 'R', 0x00002000, 13, False, None),
+        ('REF_SW_H', 'R', 0x00004000, 14, False, None),
+        ('ENI', 'R', 0x00008000, 15, False, None),
+        ('HALL_U_FILT', 'R', 0x00100000, 20, False, None),
+        ('HALL_V_FILT', 'R', 0x00200000, 21, False, None),
+        ('HALL_W_FILT', 'R', 0x00400000, 22, False, None),
+    )),
+    ('OUTPUTS_RAW', 'R', 0x01C3, False, (
+        ('PWM_UX1_L', 'R', 0x00000001, 0, False, None),
+        ('PWM_UX1_H', 'R', 0x00000002, 1, False, None),
+        ('PWM_VX2_L', 'R', 0x00000004, 2, False, None),
+        ('PWM_VX2_H', 'R', 0x00000008, 3, False, None),
+        ('PWM_WY1_L', 'R', 0x00000010, 4, False, None),
+        ('PWM_WY1_H', 'R', 0x00000020, 5, False, None),
+        ('PWM_Y2_L', 'R', 0x00000040, 6, False, None),
+        ('PWM_Y2_H', 'R', 0x00000080, 7, False, None),
+    )),
+    ('STATUS_FLAGS', 'RWC', 0x01C4, False, (
+        ('PID_X_TARGET_LIMIT', 'RWC', 0x00000001, 0, False, None),
+        ('PID_X_OUTPUT_LIMIT', 'RWC', 0x00000002, 1, False, None),
+        ('PID_V_TARGET_LIMIT', 'RWC', 0x00000004, 2, False, None),
+        ('PID_V_OUTPUT_LIMIT', 'RWC', 0x00000008, 3, False, None),
+        ('PID_ID_TARGET_LIMIT', 'RWC', 0x00000010, 4, False, None),
+        ('PID_ID_OUTPUT_LIMIT', 'RWC', 0x00000020, 5, False, None),
+        ('PID_IQ_TARGET_LIMIT', 'RWC', 0x00000040, 6, False, None),
+        ('PID_IQ_OUTPUT_LIMIT', 'RWC', 0x00000080, 7, False, None),
+        ('IPARK_VOLTLIM_LIMIT_U', 'RWC', 0x00000100, 8, False, None),
+        ('PWM_SWITCH_LIMIT_ACTIVE', 'RWC', 0x00000200, 9, False, None),
+        ('HALL_ERROR', 'RWC', 0x00000800, 11, False, None),
+        ('POSITION_TRACKING_ERROR', 'RWC', 0x00001000, 12, False, None),
+        ('VELOCITY_TRACKING_ERROR', 'RWC', 0x00002000, 13, False, None),
+        ('PID_FW_OUTPUT_LIMIT', 'RWC', 0x00004000, 14, False, None),
+        ('SHORT', 'RWC', 0x00020000, 17, False, None),
+        ('REF_SW_L', 'RWC', 0x00100000, 20, False, None),
+        ('REF_SW_R', 'RWC', 0x00200000, 21, False, None),
+        ('REF_SW_H', 'RWC', 0x00400000, 22, False, None),
+        ('POSITION_REACHED', 'RWC', 0x00800000, 23, False, None),
+        ('ADC_I_CLIPPED', 'RWC', 0x04000000, 26, False, None),
+        ('ENC_N', 'RWC', 0x10000000, 28, False, None),
+        ('ENI', 'RWC', 0x80000000, 31, False, None),
+    )),
+    ('GDRV_HW', 'RW', 0x01E3, False, (
+        ('BRIDGE_ENABLE_U', 'RW', 0x00000001, 0, False, (('DISABLED', False), ('ENABLED', True))),
+        ('BRIDGE_ENABLE_V', 'RW', 0x00000002, 1, False, (('DISABLED', False), ('ENABLED', True))),
+        ('BRIDGE_ENABLE_W', 'RW', 0x00000004, 2, False, (('DISABLED', False), ('ENABLED', True))),
+        ('BRIDGE_ENABLE_Y2', 'RW', 0x00000008, 3, False, (('DISABLED', False), ('ENABLED', True))),
+        ('LS_OCP_CMP_EN', 'RW', 0x00000010, 4, False, None),
+        ('HS_OCP_CMP_EN', 'RW', 0x00000020, 5, False, None),
+        ('VDRV_UVLO_CMP_EN', 'RW', 0x00000040, 6, False, None),
+        ('VS_UVLO_CMP_EN', 'RW', 0x00000080, 7, False, None),
+        ('BST_ILIM_MAX', 'RW', 0x00000700, 8, False, (('LIM_45MA', 0), ('LIM_91MA', 1), ('LIM_141MA', 2), ('LIM_191MA', 3), ('LIM_267MA', 4), ('LIM_292MA', 5), ('LIM_341MA', 6), ('LIM_391MA', 7))),
+        ('BST_SW_CP_EN', 'RW', 0x00000800, 11, False, (('OFF', False), ('ON', True))),
+        ('CHARGEPUMP_EN', 'RW', 0x01000000, 24, False, None),
+        ('BIAS_EN', 'RW', 0x02000000, 25, False, None),
+        ('HS_AS_LS_Y2', 'RW', 0x10000000, 28, False, None),
+    )),
+    ('GDRV_CFG', 'RW', 0x01E4, False, (
+        ('IGATE_SINK_UVW', 'RW', 0x0000000F, 0, False, (('SINK_50MA', 0), ('SINK_100MA', 1), ('SINK_160MA', 2), ('SINK_210MA', 3), ('SINK_270MA', 4), ('SINK_320MA', 5), ('SINK_380MA', 6), ('SINK_430MA', 7), ('SINK_580MA', 8), ('SINK_720MA', 9), ('SINK_860MA', 10), ('SINK_1000MA', 11), ('SINK_1250MA', 12), ('SINK_1510MA', 13), ('SINK_1770MA', 14), ('SINK_2000MA', 15))),
+        ('IGATE_SOURCE_UVW', 'RW', 0x000000F0, 4, False, (('SOURCE_25MA', 0), ('SOURCE_50MA', 1), ('SOURCE_80MA', 2), ('SOURCE_105MA', 3), ('SOURCE_135MA', 4), ('SOURCE_160MA', 5), ('SOURCE_190MA', 6), ('SOURCE_215MA', 7), ('SOURCE_290MA', 8), ('SOURCE_360MA', 9), ('SOURCE_430MA', 10), ('SOURCE_500MA', 11), ('SOURCE_625MA', 12), ('SOURCE_755MA', 13), ('SOURCE_885MA', 14), ('SOURCE_1000MA', 15))),
+        ('IGATE_SINK_Y2', 'RW', 0x00000F00, 8, False, (('SINK_50MA', 0), ('SINK_100MA', 1), ('SINK_160MA', 2), ('SINK_210MA', 3), ('SINK_270MA', 4), ('SINK_320MA', 5), ('SINK_380MA', 6), ('SINK_430MA', 7), ('SINK_580MA', 8), ('SINK_720MA', 9), ('SINK_860MA', 10), ('SINK_1000MA', 11), ('SINK_1250MA', 12), ('SINK_1510MA', 13), ('SINK_1770MA', 14), ('SINK_2000MA', 15))),
+        ('IGATE_SOURCE_Y2', 'RW', 0x0000F000, 12, False, (('SOURCE_25MA', 0), ('SOURCE_50MA', 1), ('SOURCE_80MA', 2), ('SOURCE_105MA', 3), ('SOURCE_135MA', 4), ('SOURCE_160MA', 5), ('SOURCE_190MA', 6), ('SOURCE_215MA', 7), ('SOURCE_290MA', 8), ('SOURCE_360MA', 9), ('SOURCE_430MA', 10), ('SOURCE_500MA', 11), ('SOURCE_625MA', 12), ('SOURCE_755MA', 13), ('SOURCE_885MA', 14), ('SOURCE_1000MA', 15))),
+        ('ADAPTIVE_MODE_UVW', 'RW', 0x00010000, 16, False, None),
+        ('ADAPTIVE_MODE_Y2', 'RW', 0x00020000, 17, False, None),
+        ('VS_UVLO_LVL', 'RW', 0x00F00000, 20, False, (('VSUVLO_44', 0), ('VSUVLO_46', 1), ('VSUVLO_48', 2), ('VSUVLO_50', 3), ('VSUVLO_52', 4), ('VSUVLO_54', 5), ('VSUVLO_56', 6), ('VSUVLO_58', 7), ('VSUVLO_60', 8), ('VSUVLO_63', 9), ('VSUVLO_66', 10), ('VSUVLO_69', 11), ('VSUVLO_72', 12), ('VSUVLO_75', 13), ('VSUVLO_78', 14), ('VSUVLO_81', 15))),
+    )),
+    ('GDRV_TIMING', 'RW', 0x01E9, False, (
+        ('T_DRIVE_SINK_UVW', 'RW', 0x000000FF, 0, False, None),
+        ('T_DRIVE_SOURCE_UVW', 'RW', 0x0000FF00, 8, False, None),
+        ('T_DRIVE_SINK_Y2', 'RW', 0x00FF0000, 16, False, None),
+        ('T_DRIVE_SOURCE_Y2', 'RW', 0xFF000000, 24, False, None),
+    )),
+    ('GDRV_BBM', 'RW', 0x01EA, False, (
+        ('BBM_L_UVW', 'RW', 0x000000FF, 0, False, None),
+        ('BBM_H_UVW', 'RW', 0x0000FF00, 8, False, None),
+        ('BBM_L_Y2', 'RW', 0x00FF0000, 16, False, None),
+        ('BBM_H_Y2', 'RW', 0xFF000000, 24, False, None),
+    )),
+    ('GDRV_PROT', 'RW', 0x01EB, False, (
+        ('VGS_DEGLITCH_UVW', 'RW', 0x00000007, 0, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('VGS_BLANKING_UVW', 'RW', 0x00000030, 4, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3))),
+        ('VGS_DEGLITCH_Y2', 'RW', 0x00000700, 8, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('VGS_BLANKING_Y2', 'RW', 0x00003000, 12, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3))),
+        ('LS_RETRIES_UVW', 'RW', 0x00030000, 16, False, (('OFF', 0), ('ONE', 1), ('TWO', 2), ('THREE', 3))),
+        ('HS_RETRIES_UVW', 'RW', 0x000C0000, 18, False, (('OFF', 0), ('ONE', 1), ('TWO', 2), ('THREE', 3))),
+        ('LS_RETRIES_Y2', 'RW', 0x00300000, 20, False, (('OFF', 0), ('ONE', 1), ('TWO', 2), ('THREE', 3))),
+        ('HS_RETRIES_Y2', 'RW', 0x00C00000, 22, False, (('OFF', 0), ('ONE', 1), ('TWO', 2), ('THREE', 3))),
+        ('TERM_PWM_ON_SHORT', 'RW', 0x10000000, 28, False, (('OFF', False), ('ON', True))),
+    )),
+    ('GDRV_OCP_UVW', 'RW', 0x01EC, False, (
+        ('LS_OCP_DEGLITCH_UVW', 'RW', 0x00000007, 0, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('LS_OCP_BLANKING_UVW', 'RW', 0x00000070, 4, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3), ('BLK_2000NS', 4), ('BLK_4000NS', 5), ('BLK_6000NS', 6), ('BLK_8000NS', 7))),
+        ('LS_OCP_THRES_UVW', 'RW', 0x00000F00, 8, False, (('THRES_80_63MV', 0), ('THRES_165_125MV', 1), ('THRES_250_187MV', 2), ('THRES_330_248MV', 3), ('THRES_415_312MV', 4), ('THRES_500_374MV', 5), ('THRES_582_434MV', 6), ('THRES_660_504MV', 7), ('THRES_125_705MV', 8), ('THRES_250_940MV', 9), ('THRES_375_1180MV', 10), ('THRES_500_1410MV', 11), ('THRES_625_1650MV', 12), ('THRES_750_1880MV', 13), ('THRES_873_2110MV', 14), ('THRES_1000_2350MV', 15))),
+        ('LS_OCP_USE_VDS_UVW', 'RW', 0x00008000, 15, False, None),
+        ('HS_OCP_DEGLITCH_UVW', 'RW', 0x00070000, 16, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('HS_OCP_BLANKING_UVW', 'RW', 0x00700000, 20, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3), ('BLK_2000NS', 4), ('BLK_4000NS', 5), ('BLK_6000NS', 6), ('BLK_8000NS', 7))),
+        ('HS_OCP_THRES_UVW', 'RW', 0x0F000000, 24, False, None),
+    )),
+    ('GDRV_OCP_Y2', 'RW', 0x01ED, False, (
+        ('LS_OCP_DEGLITCH_Y2', 'RW', 0x00000007, 0, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('LS_OCP_BLANKING_Y2', 'RW', 0x00000070, 4, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3), ('BLK_2000NS', 4), ('BLK_4000NS', 5), ('BLK_6000NS', 6), ('BLK_8000NS', 7))),
+        ('LS_OCP_THRES_Y2', 'RW', 0x00000F00, 8, False, (('THRES_80_63MV', 0), ('THRES_165_125MV', 1), ('THRES_250_187MV', 2), ('THRES_330_248MV', 3), ('THRES_415_312MV', 4), ('THRES_500_374MV', 5), ('THRES_582_434MV', 6), ('THRES_660_504MV', 7), ('THRES_125_705MV', 8), ('THRES_250_940MV', 9), ('THRES_375_1180MV', 10), ('THRES_500_1410MV', 11), ('THRES_625_1650MV', 12), ('THRES_750_1880MV', 13), ('THRES_873_2110MV', 14), ('THRES_1000_2350MV', 15))),
+        ('LS_OCP_USE_VDS_Y2', 'RW', 0x00008000, 15, False, None),
+        ('HS_OCP_DEGLITCH_Y2', 'RW', 0x00070000, 16, False, (('DEG_OFF', 0), ('DEG_250NS', 1), ('DEG_500NS', 2), ('DEG_1000NS', 3), ('DEG_2000NS', 4), ('DEG_4000NS', 5), ('DEG_6000NS', 6), ('DEG_8000NS', 7))),
+        ('HS_OCP_BLANKING_Y2', 'RW', 0x00700000, 20, False, (('BLK_OFF', 0), ('BLK_250NS', 1), ('BLK_500NS', 2), ('BLK_1000NS', 3), ('BLK_2000NS', 4), ('BLK_4000NS', 5), ('BLK_6000NS', 6), ('BLK_8000NS', 7))),
+        ('HS_OCP_THRES_Y2', 'RW', 0x0F000000, 24, False, None),
+    )),
+    ('GDRV_PROT_EN', 'RW', 0x01EE, False, (
+        ('LS_SHORT_PROT_U', 'RW', 0x00000001, 0, False, None),
+        ('LS_SHORT_PROT_V', 'RW', 0x00000002, 1, False, None),
+        ('LS_SHORT_PROT_W', 'RW', 0x00000004, 2, False, None),
+        ('LS_SHORT_PROT_Y2', 'RW', 0x00000008, 3, False, None),
+        ('LS_VGS_OFF_SHORT_PROT_U', 'RW', 0x00000010, 4, False, None),
+        ('LS_VGS_OFF_SHORT_PROT_V', 'RW', 0x00000020, 5, False, None),
+        ('LS_VGS_OFF_SHORT_PROT_W', 'RW', 0x00000040, 6, False, None),
+        ('LS_VGS_OFF_SHORT_PROT_Y2', 'RW', 0x00000080, 7, False, None),
+        ('LS_VGS_ON_SHORT_PROT_U', 'RW', 0x00000100, 8, False, None),
+        ('LS_VGS_ON_SHORT_PROT_V', 'RW', 0x00000200, 9, False, None),
+        ('LS_VGS_ON_SHORT_PROT_W', 'RW', 0x00000400, 10, False, None),
+        ('LS_VGS_ON_SHORT_PROT_Y2', 'RW', 0x00000800, 11, False, None),
+        ('BST_UVLO_PROT_U', 'RW', 0x00001000, 12, False, None),
+        ('BST_UVLO_PROT_V', 'RW', 0x00002000, 13, False, None),
+        ('BST_UVLO_PROT_W', 'RW', 0x00004000, 14, False, None),
+        ('BST_UVLO_PROT_Y2', 'RW', 0x00008000, 15, False, None),
+        ('HS_SHORT_PROT_U', 'RW', 0x00010000, 16, False, None),
+        ('HS_SHORT_PROT_V', 'RW', 0x00020000, 17, False, None),
+        ('HS_SHORT_PROT_W', 'RW', 0x00040000, 18, False, None),
+        ('HS_SHORT_PROT_Y2', 'RW', 0x00080000, 19, False, None),
+        ('HS_VGS_OFF_SHORT_PROT_U', 'RW', 0x00100000, 20, False, None),
+        ('HS_VGS_OFF_SHORT_PROT_V', 'RW', 0x00200000, 21, False, None),
+        ('HS_VGS_OFF_SHORT_PROT_W', 'RW', 0x00400000, 22, False, None),
+        ('HS_VGS_OFF_SHORT_PROT_Y2', 'RW', 0x00800000, 23, False, None),
+        ('HS_VGS_ON_SHORT_PROT_U', 'RW', 0x01000000, 24, False, None),
+        ('HS_VGS_ON_SHORT_PROT_V', 'RW', 0x02000000, 25, False, None),
+        ('HS_VGS_ON_SHORT_PROT_W', 'RW', 0x04000000, 26, False, None),
+        ('HS_VGS_ON_SHORT_PROT_Y2', 'RW', 0x08000000, 27, False, None),
+        ('VDRV_UVLO_PROT', 'RW', 0x20000000, 29, False, None),
+        ('VS_UVLO_PROT', 'RW', 0x80000000, 31, False, None),
+    )),
+    ('GDRV_STATUS_EN', 'RW', 0x01EF, False, (
+        ('LS_SHORT_EN_U', 'RW', 0x00000001, 0, False, None),
+        ('LS_SHORT_EN_V', 'RW', 0x00000002, 1, False, None),
+        ('LS_SHORT_EN_W', 'RW', 0x00000004, 2, False, None),
+        ('LS_SHORT_EN_Y2', 'RW', 0x00000008, 3, False, None),
+        ('LS_VGS_OFF_SHORT_EN_U', 'RW', 0x00000010, 4, False, None),
+        ('LS_VGS_OFF_SHORT_EN_V', 'RW', 0x00000020, 5, False, None),
+        ('LS_VGS_OFF_SHORT_EN_W', 'RW', 0x00000040, 6, False, None),
+        ('LS_VGS_OFF_SHORT_EN_Y2', 'RW', 0x00000080, 7, False, None),
+        ('LS_VGS_ON_SHORT_EN_U', 'RW', 0x00000100, 8, False, None),
+        ('LS_VGS_ON_SHORT_EN_V', 'RW', 0x00000200, 9, False, None),
+        ('LS_VGS_ON_SHORT_EN_W', 'RW', 0x00000400, 10, False, None),
+        ('LS_VGS_ON_SHORT_EN_Y2', 'RW', 0x00000800, 11, False, None),
+        ('BST_UVLO_EN_U', 'RW', 0x00001000, 12, False, None),
+        ('BST_UVLO_EN_V', 'RW', 0x00002000, 13, False, None),
+        ('BST_UVLO_EN_W', 'RW', 0x00004000, 14, False, None),
+        ('BST_UVLO_EN_Y2', 'RW', 0x00008000, 15, False, None),
+        ('HS_SHORT_EN_U', 'RW', 0x00010000, 16, False, None),
+        ('HS_SHORT_EN_V', 'RW', 0x00020000, 17, False, None),
+        ('HS_SHORT_EN_W', 'RW', 0x00040000, 18, False, None),
+        ('HS_SHORT_EN_Y2', 'RW', 0x00080000, 19, False, None),
+        ('HS_VGS_OFF_SHORT_EN_U', 'RW', 0x00100000, 20, False, None),
+        ('HS_VGS_OFF_SHORT_EN_V', 'RW', 0x00200000, 21, False, None),
+        ('HS_VGS_OFF_SHORT_EN_W', 'RW', 0x00400000, 22, False, None),
+        ('HS_VGS_OFF_SHORT_EN_Y2', 'RW', 0x00800000, 23, False, None),
+        ('HS_VGS_ON_SHORT_EN_U', 'RW', 0x01000000, 24, False, None),
+        ('HS_VGS_ON_SHORT_EN_V', 'RW', 0x02000000, 25, False, None),
+        ('HS_VGS_ON_SHORT_EN_W', 'RW', 0x04000000, 26, False, None),
+        ('HS_VGS_ON_SHORT_EN_Y2', 'RW', 0x08000000, 27, False, None),
+        ('VDRV_UVLO_EN', 'RW', 0x20000000, 29, False, None),
+        ('VDRV_UVLWRN_EN', 'RW', 0x40000000, 30, False, None),
+        ('VS_UVLO_EN', 'RW', 0x80000000, 31, False, None),
+    )),
+    ('GDRV_STATUS', 'RWC', 0x01F0, False, (
+        ('LS_SHORT_U', 'RWC', 0x00000001, 0, False, None),
+        ('LS_SHORT_V', 'RWC', 0x00000002, 1, False, None),
+        ('LS_SHORT_W', 'RWC', 0x00000004, 2, False, None),
+        ('LS_SHORT_Y2', 'RWC', 0x00000008, 3, False, None),
+        ('LS_VGS_OFF_SHORT_U', 'RWC', 0x00000010, 4, False, None),
+        ('LS_VGS_OFF_SHORT_V', 'RWC', 0x00000020, 5, False, None),
+        ('LS_VGS_OFF_SHORT_W', 'RWC', 0x00000040, 6, False, None),
+        ('LS_VGS_OFF_SHORT_Y2', 'RWC', 0x00000080, 7, False, None),
+        ('LS_VGS_ON_SHORT_U', 'RWC', 0x00000100, 8, False, None),
+        ('LS_VGS_ON_SHORT_V', 'RWC', 0x00000200, 9, False, None),
+        ('LS_VGS_ON_SHORT_W', 'RWC', 0x00000400, 10, False, None),
+        ('LS_VGS_ON_SHORT_Y2', 'RWC', 0x00000800, 11, False, None),
+        ('BST_UVLO_U', 'RWC', 0x00001000, 12, False, None),
+        ('BST_UVLO_V', 'RWC', 0x00002000, 13, False, None),
+        ('BST_UVLO_W', 'RWC', 0x00004000, 14, False, None),
+        ('BST_UVLO_Y2', 'RWC', 0x00008000, 15, False, None),
+        ('HS_SHORT_U', 'RWC', 0x00010000, 16, False, None),
+        ('HS_SHORT_V', 'RWC', 0x00020000, 17, False, None),
+        ('HS_SHORT_W', 'RWC', 0x00040000, 18, False, None),
+        ('HS_SHORT_Y2', 'RWC', 0x00080000, 19, False, None),
+        ('HS_VGS_OFF_SHORT_U', 'RWC', 0x00100000, 20, False, None),
+        ('HS_VGS_OFF_SHORT_V', 'RWC', 0x00200000, 21, False, None),
+        ('HS_VGS_OFF_SHORT_W', 'RWC', 0x00400000, 22, False, None),
+        ('HS_VGS_OFF_SHORT_Y2', 'RWC', 0x00800000, 23, False, None),
+        ('HS_VGS_ON_SHORT_U', 'RWC', 0x01000000, 24, False, None),
+        ('HS_VGS_ON_SHORT_V', 'RWC', 0x02000000, 25, False, None),
+        ('HS_VGS_ON_SHORT_W', 'RWC', 0x04000000, 26, False, None),
+        ('HS_VGS_ON_SHORT_Y2', 'RWC', 0x08000000, 27, False, None),
+        ('VDRV_UVLO', 'RWC', 0x20000000, 29, False, None),
+        ('VDRV_UVLWRN', 'RWC', 0x40000000, 30, False, None),
+        ('VS_UVLO', 'RWC', 0x80000000, 31, False, None),
+    )),
+    ('GDRV_FAULT', 'RWC', 0x01F1, False, (
+        ('LS_FAULT_ACTIVE_U', 'RWC', 0x00000001, 0, False, None),
+        ('LS_FAULT_ACTIVE_V', 'RWC', 0x00000002, 1, False, None),
+        ('LS_FAULT_ACTIVE_W', 'RWC', 0x00000004, 2, False, None),
+        ('LS_FAULT_ACTIVE_Y2', 'RWC', 0x00000008, 3, False, None),
+        ('BST_UVLO_STS_U', 'R', 0x00001000, 12, False, None),
+        ('BST_UVLO_STS_V', 'R', 0x00002000, 13, False, None),
+        ('BST_UVLO_STS_W', 'R', 0x00004000, 14, False, None),
+        ('BST_UVLO_STS_Y2', 'R', 0x00008000, 15, False, None),
+        ('HS_FAULT_ACTIVE_U', 'RWC', 0x00010000, 16, False, None),
+        ('HS_FAULT_ACTIVE_V', 'RWC', 0x00020000, 17, False, None),
+        ('HS_FAULT_ACTIVE_W', 'RWC', 0x00040000, 18, False, None),
+        ('HS_FAULT_ACTIVE_Y2', 'RWC', 0x00080000, 19, False, None),
+        ('VDRV_UVLO_STS', 'R', 0x20000000, 29, False, None),
+        ('VDRV_UVLWRN_STS', 'R', 0x40000000, 30, False, None),
+        ('VS_UVLO_STS', 'R', 0x80000000, 31, False, None),
+    )),
+    ('ADC_I1_I0_EXT', 'RW', 0x0200, False, (
+        ('I0', 'RW', 0x0000FFFF, 0, True, None),
+        ('I1', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('ADC_I2_EXT', 'RW', 0x0201, True, (
+        ('I2', 'RW', 0x0000FFFF, 0, True, None),
+    )),
+    ('PWM_VX2_UX1_EXT', 'RW', 0x0202, False, (
+        ('UX1', 'RW', 0x0000FFFF, 0, False, None),
+        ('VX2', 'RW', 0xFFFF0000, 16, False, None),
+    )),
+    ('PWM_Y2_WY1_EXT', 'RW', 0x0203, False, (
+        ('WY1', 'RW', 0x0000FFFF, 0, False, None),
+        ('Y2', 'RW', 0xFFFF0000, 16, False, None),
+    )),
+    ('PWM_EXT_Y2_ALT', 'RW', 0x0204, False, (
+        ('PWM_EXT_Y2_ALT', 'RW', 0x0000FFFF, 0, False, None),
+    )),
+    ('VOLTAGE_EXT', 'RW', 0x0205, False, (
+        ('UD', 'RW', 0x0000FFFF, 0, True, None),
+        ('UQ', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('PHI_EXT', 'RW', 0x0206, False, (
+        ('PHI_E_EXT', 'RW', 0x0000FFFF, 0, True, None),
+        ('PHI_M_EXT', 'RW', 0xFFFF0000, 16, True, None),
+    )),
+    ('VELOCITY_EXT', 'RW', 0x0208, True, (
+        ('VELOCITY_EXT', 'RW', 0xFFFFFFFF, 0, True, None),
+    )),
+)
@@ -0,0 +1,56 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, access, address, signed, ((name, access, mask, shift, signed, options), ...)
+REGISTERS = (
+    ('FAULT_STS', 'R', 0x0008, False, (
+        ('BCK_UVLO', 'R', 0x00000001, 0, False, None),
+        ('BCK_SHORT', 'R', 0x00000002, 1, False, None),
+        ('LDOEXT_TSD', 'R', 0x00000004, 2, False, None),
+        ('LDOEXT1_SHORT', 'R', 0x00000008, 3, False, None),
+        ('LDOEXT2_SHORT', 'R', 0x00000010, 4, False, None),
+        ('CHGP_OK', 'R', 0x00000020, 5, False, None),
+        ('CHGP_SHORT', 'R', 0x00000040, 6, False, None),
+        ('VSA_UVLO', 'R', 0x00000080, 7, False, None),
+        ('VDD_UVLO', 'R', 0x00000100, 8, False, None),
+        ('VDDA_UVLO', 'R', 0x00000200, 9, False, None),
+        ('VCCIO_UVLO', 'R', 0x00000400, 10, False, None),
+        ('LDO1_READY', 'R', 0x00000800, 11, False, None),
+        ('LDO2_READY', 'R', 0x00001000, 12, False, None),
+    )),
+    ('FAULT_R_INT', 'RWC', 0x0009, False, (
+        ('BCK_UVLO_LTC', 'RWC', 0x00000001, 0, False, None),
+        ('BCK_SHORT_RE_LTC', 'RWC', 0x00000002, 1, False, None),
+        ('LDOEXT_TSD_LTC', 'RWC', 0x00000004, 2, False, None),
+        ('LDOEXT1_SHORT_LTC', 'RWC', 0x00000008, 3, False, None),
+        ('LDOEXT2_SHORT_LTC', 'RWC', 0x00000010, 4, False, None),
+        ('CHGP_OK_LTC', 'RWC', 0x00000020, 5, False, None),
+        ('CHGP_SHORT_LTC', 'RWC', 0x00000040, 6, False, None),
+        ('VSA_UVLO_LTC', 'RWC', 0x00000080, 7, False, None),
+        ('VDD_UVLO_LTC', 'RWC', 0x00000100, 8, False, None),
+        ('VDDA_UVLO_LTC', 'RWC', 0x00000200, 9, False, None),
+        ('VCCIO_UVLO_LTC', 'RWC', 0x00000400, 10, False, None),
+        ('LDO1_READY_RE_LTC', 'RWC', 0x00000800, 11, False, None),
+        ('LDO2_READY_RE_LTC', 'RWC', 0x00001000, 12, False, None),
+        ('UC_FAULT', 'RW', 0x00008000, 15, False, None),
+    )),
+    ('FAULT_R_ENA_F', 'RW', 0x000A, False, (
+        ('BCK_UVLO_ENA_F', 'RW', 0x00000001, 0, False, None),
+        ('BCK_SHORT_RE_ENA_F', 'RW', 0x00000002, 1, False, None),
+        ('LDOEXT_TSD_ENA_F', 'RW', 0x00000004, 2, False, None),
+        ('LDOEXT1_SHORT_ENA_F', 'RW', 0x00000008, 3, False, None),
+        ('LDOEXT2_SHORT_ENA_F', 'RW', 0x00000010, 4, False, None),
+        ('CHGP_OK_ENA_F', 'RW', 0x00000020, 5, False, None),
+        ('CHGP_SHORT_ENA_F', 'RW', 0x00000040, 6, False, None),
+        ('VSA_UVLO_ENA_F', 'RW', 0x00000080, 7, False, None),
+        ('VDD_UVLO_ENA_F', 'RW', 0x00000100, 8, False, None),
+        ('VDDA_UVLO_ENA_F', 'RW', 0x00000200, 9, False, None),
+        ('VCCIO_UVLO_ENA_F', 'RW', 0x00000400, 10, False, None),
+        ('LDO1_READY_RE_ENA_F', 'RW', 0x00000800, 11, False, None),
+        ('LDO2_READY_RE_ENA_F', 'RW', 0x00001000, 12, False, None),
+    )),
+)
@@ -3,18 +3,53 @@
 # This software is proprietary to Analog Devices, Inc. and its licensors.
 ################################################################################
 
-from ...ic import TMCIc, RegisterApiDevice
-from ...modules import ParameterApiDevice
+from ...ic import TMCIc, RegisterApiDevice, RegisterTable, TableRegisterGroup
+from ...modules import ParameterApiDevice, ParameterGroup, ParameterTable, TableParameterGroup, ParameterIndex
 from ...tmcl import TMCLCommand
 from ...datalogger import DataLogger
+from ...lazy import LazyClassAttribute
 
-from .TMC9660_ap import Ap
-from .TMC9660_gpbank0 import GpBank0
-from .TMC9660_gpbank2 import GpBank2
-from .TMC9660_gpbank3 import GpBank3
-from .MCCmap import MCCMap
-from .ADCmap import ADCMap
-from .SYS_CTRLmap import SYS_CTRLMap
+
+# The maps are kept in tables, they are imported and built on first access.
+# The tables are generated from the class based maps in tools/tmc9660_maps by tools/generate_tmc9660_tables.py.
+
+def _ap():
+    from .TMC9660_ap_table import PARAMETERS
+    return TableParameterGroup("Ap", ParameterGroup.Category.AXIS, 0, ParameterTable(PARAMETERS))
+
+
+def _gp_bank0():
+    from .TMC9660_gpbank0_table import PARAMETERS
+    return TableParameterGroup("GpBank0", ParameterGroup.Category.GLOBAL, 0, ParameterTable(PARAMETERS))
+
+
+def _gp_bank2():
+    from .TMC9660_gpbank2_table import PARAMETERS
+    return TableParameterGroup("GpBank2", ParameterGroup.Category.GLOBAL, 2, ParameterTable(PARAMETERS))
+
+
+def _gp_bank3():
+    from .TMC9660_gpbank3_table import PARAMETERS
+    return TableParameterGroup("GpBank3", ParameterGroup.Category.GLOBAL, 3, ParameterTable(PARAMETERS))
+
+
+def _parameter_index():
+    return ParameterIndex([TMC9660.ap, TMC9660.gp_bank0, TMC9660.gp_bank2, TMC9660.gp_bank3])
+
+
+def _mcc():
+    from .MCCtable import REGISTERS
+    return TableRegisterGroup("ALL_REGISTERS", RegisterTable(REGISTERS), channel=0, block=0)
+
+
+def _adc():
+    from .ADCtable import REGISTERS
+    return TableRegisterGroup("ALL_REGISTERS", RegisterTable(REGISTERS), channel=0, block=1)
+
+
+def _sys_ctrl():
+    from .SYS_CTRLtable import REGISTERS
+    return TableRegisterGroup("ALL_REGISTERS", RegisterTable(REGISTERS), channel=0, block=2)
 
 
 class TMC9660(TMCIc, RegisterApiDevice, ParameterApiDevice):
@@ -26,6 +61,7 @@ class TMC9660(TMCIc, RegisterApiDevice, ParameterApiDevice):
     :cvar gp_bank0: The TMC9660's global parameters bank 0. These are only available if parameter app is running.
     :cvar gp_bank2: The TMC9660's global parameters bank 2. These are only available if parameter app is running.
     :cvar gp_bank3: The TMC9660's global parameters bank 3. These are only available if parameter app is running.
+    :cvar parameter_index: All of the above parameters by category, bank and index, e.g. to decode TMCL traces.
     :cvar MCC: The TMC9660's motion controller core registers. These are only available if register app is running.
     :cvar ADC: The TMC9660's ADC registers. These are only available if register app is running.
     :cvar SYS_CTRL: The TMC9660's system control registers. These are only available if register app is running.
@@ -62,15 +98,16 @@ class TMC9660(TMCIc, RegisterApiDevice, ParameterApiDevice):
             self.GPIO17 = self.Gpio(17)
             self.GPIO18 = self.Gpio(18)
 
-    ap = Ap()
+    ap = LazyClassAttribute(_ap)
     
-    gp_bank0 = GpBank0()
-    gp_bank2 = GpBank2()
-    gp_bank3 = GpBank3()
+    gp_bank0 = LazyClassAttribute(_gp_bank0)
+    gp_bank2 = LazyClassAttribute(_gp_bank2)
+    gp_bank3 = LazyClassAttribute(_gp_bank3)
+    parameter_index = LazyClassAttribute(_parameter_index)
 
-    MCC = MCCMap(channel=0, block=0).ALL_REGISTERS
-    ADC = ADCMap(channel=0, block=1).ALL_REGISTERS
-    SYS_CTRL = SYS_CTRLMap(channel=0, block=2).ALL_REGISTERS
+    MCC = LazyClassAttribute(_mcc)
+    ADC = LazyClassAttribute(_adc)
+    SYS_CTRL = LazyClassAttribute(_sys_ctrl)
 
     IO = _Io()
     
@@ -91,6 +128,22 @@ class TMC9660(TMCIc, RegisterApiDevice, ParameterApiDevice):
     def read_register(self, register_address, block, signed=False):
         """Implementation of the RegisterApiDevice::read_register() function."""
         return self._connection.read_register(register_address, TMCLCommand.READ_MC, block, self._module_id, signed, address_bit_width=11)
+
+    def read_registers(self, registers):
+        """Implementation of the RegisterApiDevice::read_registers() function, the reads are pipelined."""
+        requests = [
+            self._connection.build_register_request(TMCLCommand.READ_MC, register_address, block, 0, self._module_id, 11)
+            for register_address, block in registers
+        ]
+        return [reply.value for reply in self._connection.send_requests(requests)]
+
+    def write_registers(self, writes):
+        """Implementation of the RegisterApiDevice::write_registers() function, the writes are pipelined."""
+        requests = [
+            self._connection.build_register_request(TMCLCommand.WRITE_MC, register_address, block, value, self._module_id, 11)
+            for register_address, block, value in writes
+        ]
+        self._connection.send_requests(requests)
     
     def _get_axis_parameter(self, index: int, signed: bool):
         """Implementation of the ParameterApiDevice::_get_axis_parameter() function."""
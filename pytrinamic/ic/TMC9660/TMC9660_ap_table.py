@@ -0,0 +1,299 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, index, access, datatype, ((name, value), ...) or None, ((name, mask, shift), ...) or None
+PARAMETERS = (
+    ('MOTOR_TYPE', 0, 'RWE', 'ENUM', (('NO_MOTOR', 0), ('DC_MOTOR', 1), ('STEPPER_MOTOR', 2), ('BLDC_MOTOR', 3)), None),
+    ('MOTOR_POLE_PAIRS', 1, 'RWE', 'UNSIGNED', None, None),
+    ('MOTOR_DIRECTION', 2, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('MOTOR_PWM_FREQUENCY', 3, 'RWE', 'UNSIGNED', None, None),
+    ('COMMUTATION_MODE', 4, 'RW', 'ENUM', (('SYSTEM_OFF', 0), ('SYSTEM_OFF_LOW_SIDE_FETS_ON', 1), ('SYSTEM_OFF_HIGH_SIDE_FETS_ON', 2), ('FOC_OPENLOOP_VOLTAGE_MODE', 3), ('FOC_OPENLOOP_CURRENT_MODE', 4), ('FOC_ABN', 5), ('FOC_HALL_SENSOR', 6), ('RESERVED', 7), ('FOC_SPI_ENC', 8)), None),
+    ('OUTPUT_VOLTAGE_LIMIT', 5, 'RWE', 'UNSIGNED', None, None),
+    ('MAX_TORQUE', 6, 'RWE', 'UNSIGNED', None, None),
+    ('MAX_FLUX', 7, 'RWE', 'UNSIGNED', None, None),
+    ('PWM_SWITCHING_SCHEME', 8, 'RWE', 'ENUM', (('STANDARD', 0), ('SVPWM', 1), ('FLAT_BOTTOM', 2)), None),
+    ('IDLE_MOTOR_PWM_BEHAVIOR', 9, 'RWE', 'BOOLEAN', (('PWM_ON_WHEN_MOTOR_IDLE', False), ('PWM_OFF_WHEN_MOTOR_IDLE', True)), None),
+    ('ADC_SHUNT_TYPE', 12, 'RWE', 'ENUM', (('INLINE_UVW', 0), ('INLINE_VW', 1), ('INLINE_UW', 2), ('INLINE_UV', 3), ('BOTTOM_SHUNTS', 4)), None),
+    ('ADC_I0_RAW', 13, 'R', 'SIGNED', None, None),
+    ('ADC_I1_RAW', 14, 'R', 'SIGNED', None, None),
+    ('ADC_I2_RAW', 15, 'R', 'SIGNED', None, None),
+    ('ADC_I3_RAW', 16, 'R', 'SIGNED', None, None),
+    ('CSA_GAIN_ADC_I0_TO_ADC_I2', 17, 'RWE', 'ENUM', (('GAIN_5X', 0), ('GAIN_10X', 1), ('GAIN_20X', 2), ('GAIN_40X', 3), ('GAIN_1X_BYPASS_CSA', 4)), None),
+    ('CSA_GAIN_ADC_I3', 18, 'RWE', 'ENUM', (('GAIN_5X', 0), ('GAIN_10X', 1), ('GAIN_20X', 2), ('GAIN_40X', 3), ('GAIN_1X_BYPASS_CSA', 4)), None),
+    ('CSA_FILTER_ADC_I0_TO_ADC_I2', 19, 'RWE', 'ENUM', (('T_0_55_MICROSEC', 0), ('T_0_75_MICROSEC', 1), ('T_1_0_MICROSEC', 2), ('T_1_35_MICROSEC', 3)), None),
+    ('CSA_FILTER_ADC_I3', 20, 'RWE', 'ENUM', (('T_0_55_MICROSEC', 0), ('T_0_75_MICROSEC', 1), ('T_1_0_MICROSEC', 2), ('T_1_35_MICROSEC', 3)), None),
+    ('CURRENT_SCALING_FACTOR', 21, 'RWE', 'UNSIGNED', None, None),
+    ('PHASE_UX1_ADC_MAPPING', 22, 'RWE', 'ENUM', (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3)), None),
+    ('PHASE_VX2_ADC_MAPPING', 23, 'RWE', 'ENUM', (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3)), None),
+    ('PHASE_WY1_ADC_MAPPING', 24, 'RWE', 'ENUM', (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3)), None),
+    ('PHASE_Y2_ADC_MAPPING', 25, 'RWE', 'ENUM', (('ADC_I0', 0), ('ADC_I1', 1), ('ADC_I2', 2), ('ADC_I3', 3)), None),
+    ('ADC_I0_SCALE', 26, 'RWE', 'UNSIGNED', None, None),
+    ('ADC_I1_SCALE', 27, 'RWE', 'UNSIGNED', None, None),
+    ('ADC_I2_SCALE', 28, 'RWE', 'UNSIGNED', None, None),
+    ('ADC_I3_SCALE', 29, 'RWE', 'UNSIGNED', None, None),
+    ('ADC_I0_INVERTED', 30, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('ADC_I1_INVERTED', 31, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('ADC_I2_INVERTED', 32, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('ADC_I3_INVERTED', 33, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('ADC_I0_OFFSET', 34, 'RWE', 'SIGNED', None, None),
+    ('ADC_I1_OFFSET', 35, 'RWE', 'SIGNED', None, None),
+    ('ADC_I2_OFFSET', 36, 'RWE', 'SIGNED', None, None),
+    ('ADC_I3_OFFSET', 37, 'RWE', 'SIGNED', None, None),
+    ('ADC_I0', 38, 'R', 'SIGNED', None, None),
+    ('ADC_I1', 39, 'R', 'SIGNED', None, None),
+    ('ADC_I2', 40, 'R', 'SIGNED', None, None),
+    ('ADC_I3', 41, 'R', 'SIGNED', None, None),
+    ('OPENLOOP_ANGLE', 45, 'R', 'SIGNED', None, None),
+    ('OPENLOOP_CURRENT', 46, 'RWE', 'UNSIGNED', None, None),
+    ('OPENLOOP_VOLTAGE', 47, 'RWE', 'UNSIGNED', None, None),
+    ('ACCELERATION_FF_GAIN', 50, 'RWE', 'UNSIGNED', None, None),
+    ('ACCELERATION_FF_SHIFT', 51, 'RWE', 'ENUM', (('NO_SHIFT', 0), ('SHIFT_4_BIT', 1), ('SHIFT_8_BIT', 2), ('SHIFT_12_BIT', 3), ('SHIFT_16_BIT', 4), ('SHIFT_20_BIT', 5), ('SHIFT_24_BIT', 6)), None),
+    ('RAMP_ENABLE', 52, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('DIRECT_VELOCITY_MODE', 53, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('RAMP_AMAX', 54, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_A1', 55, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_A2', 56, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_DMAX', 57, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_D1', 58, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_D2', 59, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_VMAX', 60, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_V1', 61, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_V2', 62, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_VSTART', 63, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_VSTOP', 64, 'RWE', 'UNSIGNED', None, None),
+    ('RAMP_TVMAX', 65, 'RWE', 'SIGNED', None, None),
+    ('RAMP_TZEROWAIT', 66, 'RWE', 'SIGNED', None, None),
+    ('ACCELERATION_FEEDFORWARD_ENABLE', 67, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VELOCITY_FEEDFORWARD_ENABLE', 68, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('RAMP_VELOCITY', 69, 'R', 'SIGNED', None, None),
+    ('RAMP_POSITION', 70, 'R', 'SIGNED', None, None),
+    ('HALL_PHI_E', 74, 'R', 'SIGNED', None, None),
+    ('HALL_SECTOR_OFFSET', 75, 'RWE', 'ENUM', (('DEG_0', 0), ('DEG_60', 1), ('DEG_120', 2), ('DEG_180', 3), ('DEG_240', 4), ('DEG_300', 5)), None),
+    ('HALL_FILTER_LENGTH', 76, 'RWE', 'UNSIGNED', None, None),
+    ('HALL_POSITION_0_OFFSET', 77, 'RWE', 'SIGNED', None, None),
+    ('HALL_POSITION_60_OFFSET', 78, 'RWE', 'SIGNED', None, None),
+    ('HALL_POSITION_120_OFFSET', 79, 'RWE', 'SIGNED', None, None),
+    ('HALL_POSITION_180_OFFSET', 80, 'RWE', 'SIGNED', None, None),
+    ('HALL_POSITION_240_OFFSET', 81, 'RWE', 'SIGNED', None, None),
+    ('HALL_POSITION_300_OFFSET', 82, 'RWE', 'SIGNED', None, None),
+    ('HALL_INVERT_DIRECTION', 83, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('HALL_EXTRAPOLATION_ENABLE', 84, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('HALL_PHI_E_OFFSET', 85, 'RWE', 'SIGNED', None, None),
+    ('ABN_1_PHI_E', 89, 'R', 'SIGNED', None, None),
+    ('ABN_1_STEPS', 90, 'RWE', 'UNSIGNED', None, None),
+    ('ABN_1_DIRECTION', 91, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('ABN_1_INIT_METHOD', 92, 'RWE', 'ENUM', (('FORCED_PHI_E_ZERO_WITH_ACTIVE_SWING', 0), ('FORCED_PHI_E_90_ZERO', 1), ('USE_HALL', 2), ('USE_N_CHANNEL_OFFSET', 3)), None),
+    ('ABN_1_INIT_STATE', 93, 'R', 'ENUM', (('IDLE', 0), ('BUSY', 1), ('WAIT', 2), ('DONE', 3)), None),
+    ('ABN_1_INIT_DELAY', 94, 'RWE', 'UNSIGNED', None, None),
+    ('ABN_1_INIT_VELOCITY', 95, 'RWE', 'SIGNED', None, None),
+    ('ABN_1_N_CHANNEL_PHI_E_OFFSET', 96, 'RWE', 'SIGNED', None, None),
+    ('ABN_1_N_CHANNEL_INVERTED', 97, 'RWE', 'BOOLEAN', (('ACTIVE_HIGH', False), ('ACTIVE_LOW', True)), None),
+    ('ABN_1_N_CHANNEL_FILTERING', 98, 'RWE', 'ENUM', (('FILTERING_OFF', 0), ('N_EVENT_ON_A_HIGH_B_HIGH', 1), ('N_EVENT_ON_A_HIGH_B_LOW', 2), ('N_EVENT_ON_A_LOW_B_HIGH', 3), ('N_EVENT_ON_A_LOW_B_LOW', 4)), None),
+    ('ABN_1_CLEAR_ON_NEXT_NULL', 99, 'RW', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('ABN_1_VALUE', 100, 'R', 'UNSIGNED', None, None),
+    ('TARGET_TORQUE', 104, 'RW', 'SIGNED', None, None),
+    ('ACTUAL_TORQUE', 105, 'R', 'SIGNED', None, None),
+    ('TARGET_FLUX', 106, 'RW', 'SIGNED', None, None),
+    ('ACTUAL_FLUX', 107, 'R', 'SIGNED', None, None),
+    ('TORQUE_OFFSET', 108, 'RW', 'SIGNED', None, None),
+    ('TORQUE_P', 109, 'RWE', 'UNSIGNED', None, None),
+    ('TORQUE_I', 110, 'RWE', 'UNSIGNED', None, None),
+    ('FLUX_P', 111, 'RWE', 'UNSIGNED', None, None),
+    ('FLUX_I', 112, 'RWE', 'UNSIGNED', None, None),
+    ('SEPARATE_TORQUE_FLUX_PI_PARAMTERS', 113, 'RWE', 'BOOLEAN', (('TORQUE_FLUX_PI_COMBINED', False), ('TORQUE_FLUX_PI_SEPARATED', True)), None),
+    ('CURRENT_NORM_P', 114, 'RWE', 'ENUM', (('SHIFT_8_BIT', 0), ('SHIFT_16_BIT', 1)), None),
+    ('CURRENT_NORM_I', 115, 'RWE', 'ENUM', (('SHIFT_8_BIT', 0), ('SHIFT_16_BIT', 1)), None),
+    ('TORQUE_PI_ERROR', 116, 'R', 'SIGNED', None, None),
+    ('FLUX_PI_ERROR', 117, 'R', 'SIGNED', None, None),
+    ('TORQUE_PI_INTEGRATOR', 118, 'R', 'SIGNED', None, None),
+    ('FLUX_PI_INTEGRATOR', 119, 'R', 'SIGNED', None, None),
+    ('FLUX_OFFSET', 120, 'RW', 'SIGNED', None, None),
+    ('VELOCITY_SENSOR_SELECTION', 123, 'RWE', 'ENUM', (('SAME_AS_COMMUTATION', 0), ('DIGITAL_HALL', 1), ('ABN1_ENCODER', 2), ('ABN2_ENCODER', 3), ('SPI_ENCODER', 4)), None),
+    ('TARGET_VELOCITY', 124, 'RW', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY', 125, 'R', 'SIGNED', None, None),
+    ('VELOCITY_OFFSET', 126, 'RW', 'SIGNED', None, None),
+    ('VELOCITY_P', 127, 'RWE', 'UNSIGNED', None, None),
+    ('VELOCITY_I', 128, 'RWE', 'UNSIGNED', None, None),
+    ('VELOCITY_NORM_P', 129, 'RWE', 'ENUM', (('NO_SHIFT', 0), ('SHIFT_8_BIT', 1), ('SHIFT_16_BIT', 2), ('SHIFT_24_BIT', 3)), None),
+    ('VELOCITY_NORM_I', 130, 'RWE', 'ENUM', (('SHIFT_8_BIT', 0), ('SHIFT_16_BIT', 1), ('SHIFT_24_BIT', 2), ('SHIFT_32_BIT', 3)), None),
+    ('VELOCITY_PI_INTEGRATOR', 131, 'R', 'SIGNED', None, None),
+    ('VELOCITY_PI_ERROR', 132, 'R', 'SIGNED', None, None),
+    ('VELOCITY_SCALING_FACTOR', 133, 'RWE', 'UNSIGNED', None, None),
+    ('STOP_ON_VELOCITY_DEVIATION', 134, 'RW', 'UNSIGNED', None, None),
+    ('VELOCITY_LOOP_DOWNSAMPLING', 135, 'RWE', 'SIGNED', None, None),
+    ('VELOCITY_REACHED_THRESHOLD', 136, 'RWE', 'UNSIGNED', None, None),
+    ('VELOCITY_METER_SWITCH_THRESHOLD', 137, 'RWE', 'UNSIGNED', None, None),
+    ('VELOCITY_METER_SWITCH_HYSTERESIS', 138, 'RWE', 'UNSIGNED', None, None),
+    ('VELOCITY_METER_MODE', 139, 'R', 'ENUM', (('PERIOD_METER', 0), ('FREQUENCY_METER', 1), ('SOFTWARE_METER', 2)), None),
+    ('POSITION_SENSOR_SELECTION', 142, 'RWE', 'ENUM', (('SAME_AS_COMMUTATION', 0), ('DIGITAL_HALL', 1), ('ABN1_ENCODER', 2), ('ABN2_ENCODER', 3), ('SPI_ENCODER', 4)), None),
+    ('TARGET_POSITION', 143, 'RW', 'SIGNED', None, None),
+    ('ACTUAL_POSITION', 144, 'RW', 'SIGNED', None, None),
+    ('POSITION_SCALING_FACTOR', 145, 'RWE', 'UNSIGNED', None, None),
+    ('POSITION_P', 146, 'RWE', 'UNSIGNED', None, None),
+    ('POSITION_I', 147, 'RWE', 'UNSIGNED', None, None),
+    ('POSITION_NORM_P', 148, 'RWE', 'ENUM', (('NO_SHIFT', 0), ('SHIFT_8_BIT', 1), ('SHIFT_16_BIT', 2), ('SHIFT_24_BIT', 3)), None),
+    ('POSITION_NORM_I', 149, 'RWE', 'ENUM', (('SHIFT_8_BIT', 0), ('SHIFT_16_BIT', 1), ('SHIFT_24_BIT', 2), ('SHIFT_32_BIT', 3)), None),
+    ('POSITION_PI_INTEGRATOR', 150, 'R', 'SIGNED', None, None),
+    ('POSITION_PI_ERROR', 151, 'R', 'SIGNED', None, None),
+    ('STOP_ON_POSITION_DEVIATION', 152, 'RWE', 'UNSIGNED', None, None),
+    ('POSITION_LOOP_DOWNSAMPLING', 153, 'RWE', 'SIGNED', None, None),
+    ('LATCH_POSITION', 154, 'R', 'SIGNED', None, None),
+    ('POSITION_LIMIT_LOW', 155, 'RWE', 'SIGNED', None, None),
+    ('POSITION_LIMIT_HIGH', 156, 'RWE', 'SIGNED', None, None),
+    ('POSITION_REACHED_THRESHOLD', 157, 'RWE', 'UNSIGNED', None, None),
+    ('REFERENCE_SWITCH_ENABLE', 161, 'RWE', 'ENUM', (('NO_STOP_ON_SWITCH_TRIGGERED', 0), ('STOP_ON_L', 1), ('STOP_ON_R', 2), ('STOP_ON_R_AND_L', 3), ('STOP_ON_H', 4), ('STOP_ON_H_AND_L', 5), ('STOP_ON_H_AND_R', 6), ('STOP_ON_H_R_AND_L', 7)), None),
+    ('REFERENCE_SWITCH_POLARITY_AND_SWAP', 162, 'RWE', 'ENUM', (('NOT_SWAPPED_NOT_INVERTED', 0), ('L_INVERTED', 1), ('R_INVERTED', 2), ('R_AND_L_INVERTED', 3), ('H_INVERTED', 4), ('H_AND_L_INVERTED', 5), ('H_AND_R_INVERTED', 6), ('H_R_AND_L_INVERTED', 7), ('L_R_SWAPPED_L_INVERTED', 8), ('L_R_SWAPPED_R_INVERTED', 9), ('L_R_SWAPPED_R_AND_L_INVERTED', 10), ('L_R_SWAPPED_H_INVERTED', 11), ('L_R_SWAPPED_H_AND_L_INVERTED', 12), ('L_R_SWAPPED', 13), ('L_R_SWAPPED_H_AND_R_INVERTED', 14), ('L_R_SWAPPED_H_R_AND_L_INVERTED', 15)), None),
+    ('REFERENCE_SWITCH_LATCH_SETTINGS', 163, 'RWE', 'ENUM', (('NO_TRIGGER', 0), ('L_R_RISING_EDGE', 1), ('L_R_FALLING_EDGE', 2), ('L_R_BOTH_EDGES', 3), ('H_RISING_EDGE', 4), ('H_L_R_RISING_EDGE', 5), ('H_RISING_L_R_FALLING_EDGE', 6), ('H_RISING_L_R_BOTH_EDGES', 7), ('H_FALLING_EDGE', 8), ('H_FALLING_L_R_RISING_EDGE', 9), ('H_L_R_FALLING_EDGE', 10), ('H_FALLING_L_R_BOTH_EDGES', 11), ('H_BOTH_EDGES', 12), ('H_BOTH_L_R_RISING_EDGE', 13), ('H_BOTH_L_R_FALLING_EDGE', 14), ('H_L_R_BOTH_EDGES', 15)), None),
+    ('EVENT_STOP_SETTINGS', 164, 'RWE', 'ENUM', (('DO_HARD_STOP', 0), ('DO_SOFT_STOP', 1), ('STOP_ON_POS_DEVIATION', 2), ('STOP_ON_POS_DEVIATION_SOFT_STOP', 3), ('STOP_ON_VEL_DEVIATION', 4), ('STOP_ON_VEL_DEVIATION_SOFT_STOP', 5), ('STOP_ON_POS_VEL_DEVIATION', 6), ('STOP_ON_POS_VEL_DEVIATION_SOFT_STOP', 7)), None),
+    ('REFERENCE_SWITCH_SEARCH_MODE', 165, 'RWE', 'ENUM', (('LEFT_SWITCH', 1), ('RIGHT_SWITCH_LEFT_SWITCH', 2), ('RIGHT_SWITCH_LEFT_SWITCH_BOTH_SIDES', 3), ('LEFT_SWITCH_BOTH_SIDES', 4), ('HOME_SWITCH_NEG_DIR_LEFT_END_SWITCH', 5), ('HOME_SWITCH_POS_DIR_RIGHT_END_SWITCH', 6), ('HOME_SWITCH_NEG_DIR_IGNORE_END_SWITCH', 7), ('HOME_SWITCH_POS_DIR_IGNORE_END_SWITCH', 8)), None),
+    ('REFERENCE_SWITCH_SEARCH_SPEED', 166, 'RWE', 'SIGNED', None, None),
+    ('REFERENCE_SWITCH_SPEED', 167, 'RWE', 'SIGNED', None, None),
+    ('RIGHT_LIMIT_SWITCH_POSITION', 168, 'R', 'SIGNED', None, None),
+    ('HOME_SWITCH_POSITION', 169, 'R', 'SIGNED', None, None),
+    ('LAST_REFERENCE_POSITION', 170, 'R', 'SIGNED', None, None),
+    ('ABN_2_STEPS', 174, 'RWE', 'UNSIGNED', None, None),
+    ('ABN_2_DIRECTION', 175, 'RWE', 'BOOLEAN', (('NORMAL', False), ('INVERTED', True)), None),
+    ('ABN_2_GEAR_RATIO', 176, 'RWE', 'UNSIGNED', None, None),
+    ('ABN_2_ENABLE', 177, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('ABN_2_VALUE', 178, 'R', 'UNSIGNED', None, None),
+    ('SPI_ENCODE_CS_SETTLE_DELAY_TIME', 181, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_CS_IDLE_DELAY_TIME', 182, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_MAIN_TRANSFER_CMD_SIZE', 183, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_SECONDARY_TRANSFER_CMD_SIZE', 184, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_TRANSFER_DATA_3_0', 185, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_TRANSFER_DATA_7_4', 186, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_TRANSFER_DATA_11_8', 187, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_TRANSFER_DATA_15_12', 188, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_TRANSFER', 189, 'RWE', 'ENUM', (('OFF', 0), ('TRIGGER_SINGLE_TRANSFER', 1), ('CONTINUOUS_POSITION_COUNTER_READ', 2)), None),
+    ('SPI_ENCODER_POSITION_COUNTER_MASK', 190, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_POSITION_COUNTER_SHIFT', 191, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_POSITION_COUNTER_VALUE', 192, 'R', 'UNSIGNED', None, None),
+    ('SPI_ENCODER_COMMUTATION_ANGLE', 193, 'R', 'SIGNED', None, None),
+    ('SPI_ENCODER_INITIALIZATION_METHOD', 194, 'RWE', 'ENUM', (('FORCED_PHI_E_ZERO_WITH_ACTIVE_SWING', 0), ('FORCED_PHI_E_90_ZERO', 1), ('USE_OFFSET', 2)), None),
+    ('SPI_ENCODER_DIRECTION', 195, 'RWE', 'BOOLEAN', (('NOT_INVERTED', False), ('INVERTED', True)), None),
+    ('SPI_ENCODER_OFFSET', 196, 'RWE', 'UNSIGNED', None, None),
+    ('SPI_LUT_CORRECTION_ENABLE', 197, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('SPI_LUT_ADDRESS_SELECT', 198, 'RW', 'UNSIGNED', None, None),
+    ('SPI_LUT_DATA', 199, 'RW', 'SIGNED', None, None),
+    ('SPI_LUT_COMMON_SHIFT_FACTOR', 201, 'RW', 'UNSIGNED', None, None),
+    ('STEP_DIR_STEP_DIVIDER_SHIFT', 205, 'RWE', 'ENUM', (('STEP_MODE_FULL', 0), ('STEP_MODE_HALF', 1), ('STEP_MODE_QUARTER', 2), ('STEP_MODE_1_8TH', 3), ('STEP_MODE_1_16TH', 4), ('STEP_MODE_1_32ND', 5), ('STEP_MODE_1_64TH', 6), ('STEP_MODE_1_128TH', 7), ('STEP_MODE_1_256TH', 8), ('STEP_MODE_1_512TH', 9), ('STEP_MODE_1_1024TH', 10)), None),
+    ('STEP_DIR_ENABLE', 206, 'RW', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('STEP_DIR_EXTRAPOLATION_ENABLE', 207, 'RW', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('STEP_DIR_STEP_SIGNAL_TIMEOUT_LIMIT', 208, 'RW', 'UNSIGNED', None, None),
+    ('STEP_DIR_MAXIMUM_EXTRAPOLATION_VELOCITY', 209, 'RW', 'UNSIGNED', None, None),
+    ('BRAKE_CHOPPER_ENABLE', 212, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('BRAKE_CHOPPER_VOLTAGE_LIMIT', 213, 'RWE', 'UNSIGNED', None, None),
+    ('BRAKE_CHOPPER_HYSTERESIS', 214, 'RWE', 'UNSIGNED', None, None),
+    ('RELEASE_BRAKE', 216, 'RWE', 'BOOLEAN', (('BRAKE_PWM_DEACTIVATED', False), ('BRAKE_PWM_ACTIVATED', True)), None),
+    ('BRAKE_RELEASING_DUTY_CYCLE', 217, 'RWE', 'UNSIGNED', None, None),
+    ('BRAKE_HOLDING_DUTY_CYCLE', 218, 'RWE', 'UNSIGNED', None, None),
+    ('BRAKE_RELEASING_DURATION', 219, 'RWE', 'UNSIGNED', None, None),
+    ('INVERT_BRAKE_OUTPUT', 221, 'RWE', 'BOOLEAN', (('NORMAL', False), ('INVERTED', True)), None),
+    ('THERMAL_WINDING_TIME_CONSTANT_1', 224, 'RWE', 'UNSIGNED', None, None),
+    ('IIT_LIMIT_1', 225, 'RWE', 'UNSIGNED', None, None),
+    ('IIT_SUM_1', 226, 'R', 'UNSIGNED', None, None),
+    ('THERMAL_WINDING_TIME_CONSTANT_2', 227, 'RWE', 'UNSIGNED', None, None),
+    ('IIT_LIMIT_2', 228, 'RWE', 'UNSIGNED', None, None),
+    ('IIT_SUM_2', 229, 'R', 'UNSIGNED', None, None),
+    ('RESET_IIT_SUMS', 230, 'W', 'UNSIGNED', None, None),
+    ('ACTUAL_TOTAL_MOTOR_CURRENT', 231, 'R', 'UNSIGNED', None, None),
+    ('PWM_L_OUTPUT_POLARITY', 233, 'RWE', 'BOOLEAN', (('ACTIVE_HIGH', False), ('ACTIVE_LOW', True)), None),
+    ('PWM_H_OUTPUT_POLARITY', 234, 'RWE', 'BOOLEAN', (('ACTIVE_HIGH', False), ('ACTIVE_LOW', True)), None),
+    ('BREAK_BEFORE_MAKE_TIME_LOW_UVW', 235, 'RWE', 'UNSIGNED', None, None),
+    ('BREAK_BEFORE_MAKE_TIME_HIGH_UVW', 236, 'RWE', 'UNSIGNED', None, None),
+    ('BREAK_BEFORE_MAKE_TIME_LOW_Y2', 237, 'RWE', 'UNSIGNED', None, None),
+    ('BREAK_BEFORE_MAKE_TIME_HIGH_Y2', 238, 'RWE', 'UNSIGNED', None, None),
+    ('USE_ADAPTIVE_DRIVE_TIME_UVW', 239, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('USE_ADAPTIVE_DRIVE_TIME_Y2', 240, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('DRIVE_TIME_SINK_UVW', 241, 'RWE', 'UNSIGNED', None, None),
+    ('DRIVE_TIME_SOURCE_UVW', 242, 'RWE', 'UNSIGNED', None, None),
+    ('DRIVE_TIME_SINK_Y2', 243, 'RWE', 'UNSIGNED', None, None),
+    ('DRIVE_TIME_SOURCE_Y2', 244, 'RWE', 'UNSIGNED', None, None),
+    ('UVW_SINK_CURRENT', 245, 'RWE', 'ENUM', (('CUR_50_MILLIAMP', 0), ('CUR_100_MILLIAMP', 1), ('CUR_160_MILLIAMP', 2), ('CUR_210_MILLIAMP', 3), ('CUR_270_MILLIAMP', 4), ('CUR_320_MILLIAMP', 5), ('CUR_380_MILLIAMP', 6), ('CUR_430_MILLIAMP', 7), ('CUR_580_MILLIAMP', 8), ('CUR_720_MILLIAMP', 9), ('CUR_860_MILLIAMP', 10), ('CUR_1000_MILLIAMP', 11), ('CUR_1250_MILLIAMP', 12), ('CUR_1510_MILLIAMP', 13), ('CUR_1770_MILLIAMP', 14), ('CUR_2000_MILLIAMP', 15)), None),
+    ('UVW_SOURCE_CURRENT', 246, 'RWE', 'ENUM', (('CUR_25_MILLIAMP', 0), ('CUR_50_MILLIAMP', 1), ('CUR_80_MILLIAMP', 2), ('CUR_105_MILLIAMP', 3), ('CUR_135_MILLIAMP', 4), ('CUR_160_MILLIAMP', 5), ('CUR_190_MILLIAMP', 6), ('CUR_215_MILLIAMP', 7), ('CUR_290_MILLIAMP', 8), ('CUR_360_MILLIAMP', 9), ('CUR_430_MILLIAMP', 10), ('CUR_500_MILLIAMP', 11), ('CUR_625_MILLIAMP', 12), ('CUR_755_MILLIAMP', 13), ('CUR_855_MILLIAMP', 14), ('CUR_1000_MILLIAMP', 15)), None),
+    ('Y2_SINK_CURRENT', 247, 'RWE', 'ENUM', (('CUR_50_MILLIAMP', 0), ('CUR_100_MILLIAMP', 1), ('CUR_160_MILLIAMP', 2), ('CUR_210_MILLIAMP', 3), ('CUR_270_MILLIAMP', 4), ('CUR_320_MILLIAMP', 5), ('CUR_380_MILLIAMP', 6), ('CUR_430_MILLIAMP', 7), ('CUR_580_MILLIAMP', 8), ('CUR_720_MILLIAMP', 9), ('CUR_860_MILLIAMP', 10), ('CUR_1000_MILLIAMP', 11), ('CUR_1250_MILLIAMP', 12), ('CUR_1510_MILLIAMP', 13), ('CUR_1770_MILLIAMP', 14), ('CUR_2000_MILLIAMP', 15)), None),
+    ('Y2_SOURCE_CURRENT', 248, 'RWE', 'ENUM', (('CUR_25_MILLIAMP', 0), ('CUR_50_MILLIAMP', 1), ('CUR_80_MILLIAMP', 2), ('CUR_105_MILLIAMP', 3), ('CUR_135_MILLIAMP', 4), ('CUR_160_MILLIAMP', 5), ('CUR_190_MILLIAMP', 6), ('CUR_215_MILLIAMP', 7), ('CUR_290_MILLIAMP', 8), ('CUR_360_MILLIAMP', 9), ('CUR_430_MILLIAMP', 10), ('CUR_500_MILLIAMP', 11), ('CUR_625_MILLIAMP', 12), ('CUR_755_MILLIAMP', 13), ('CUR_855_MILLIAMP', 14), ('CUR_1000_MILLIAMP', 15)), None),
+    ('BOOTSTRAP_CURRENT_LIMIT', 249, 'RWE', 'ENUM', (('CUR_45_MILLIAMP', 0), ('CUR_91_MILLIAMP', 1), ('CUR_141_MILLIAMP', 2), ('CUR_191_MILLIAMP', 3), ('CUR_267_MILLIAMP', 4), ('CUR_292_MILLIAMP', 5), ('CUR_341_MILLIAMP', 6), ('CUR_391_MILLIAMP', 7)), None),
+    ('UNDERVOLTAGE_PROTECTION_SUPPLY_LEVEL', 250, 'RWE', 'UNSIGNED', None, None),
+    ('UNDERVOLTAGE_PROTECTION_VDRV_ENABLE', 251, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('UNDERVOLTAGE_PROTECTION_BST_UVW_ENABLE', 252, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('UNDERVOLTAGE_PROTECTION_BST_Y2_ENABLE', 253, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_UVW_LOW_SIDE_ENABLE', 254, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_UVW_HIGH_SIDE_ENABLE', 255, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_Y2_LOW_SIDE_ENABLE', 256, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_Y2_HIGH_SIDE_ENABLE', 257, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_UVW_LOW_SIDE_THRESHOLD', 258, 'RWE', 'ENUM', (('V_80_OR_63_MILLIVOLT', 0), ('V_165_OR_125_MILLIVOLT', 1), ('V_250_OR_187_MILLIVOLT', 2), ('V_330_OR_248_MILLIVOLT', 3), ('V_415_OR_312_MILLIVOLT', 4), ('V_500_OR_374_MILLIVOLT', 5), ('V_582_OR_434_MILLIVOLT', 6), ('V_660_OR_504_MILLIVOLT', 7), ('V_125_OR_705_MILLIVOLT', 8), ('V_250_OR_940_MILLIVOLT', 9), ('V_375_OR_1180_MILLIVOLT', 10), ('V_500_OR_1410_MILLIVOLT', 11), ('V_625_OR_1650_MILLIVOLT', 12), ('V_750_OR_1880_MILLIVOLT', 13), ('V_875_OR_2110_MILLIVOLT', 14), ('V_1000_OR_2350_MILLIVOLT', 15)), None),
+    ('OVERCURRENT_PROTECTION_UVW_HIGH_SIDE_THRESHOLD', 259, 'RWE', 'ENUM', (('V_63_MILLIVOLT', 0), ('V_125_MILLIVOLT', 1), ('V_187_MILLIVOLT', 2), ('V_248_MILLIVOLT', 3), ('V_312_MILLIVOLT', 4), ('V_374_MILLIVOLT', 5), ('V_434_MILLIVOLT', 6), ('V_504_MILLIVOLT', 7), ('V_705_MILLIVOLT', 8), ('V_940_MILLIVOLT', 9), ('V_1180_MILLIVOLT', 10), ('V_1410_MILLIVOLT', 11), ('V_1650_MILLIVOLT', 12), ('V_1880_MILLIVOLT', 13), ('V_2110_MILLIVOLT', 14), ('V_2350_MILLIVOLT', 15)), None),
+    ('OVERCURRENT_PROTECTION_Y2_LOW_SIDE_THRESHOLD', 260, 'RWE', 'ENUM', (('V_80_OR_63_MILLIVOLT', 0), ('V_165_OR_125_MILLIVOLT', 1), ('V_250_OR_187_MILLIVOLT', 2), ('V_330_OR_248_MILLIVOLT', 3), ('V_415_OR_312_MILLIVOLT', 4), ('V_500_OR_374_MILLIVOLT', 5), ('V_582_OR_434_MILLIVOLT', 6), ('V_660_OR_504_MILLIVOLT', 7), ('V_125_OR_705_MILLIVOLT', 8), ('V_250_OR_940_MILLIVOLT', 9), ('V_375_OR_1180_MILLIVOLT', 10), ('V_500_OR_1410_MILLIVOLT', 11), ('V_625_OR_1650_MILLIVOLT', 12), ('V_750_OR_1880_MILLIVOLT', 13), ('V_875_OR_2110_MILLIVOLT', 14), ('V_1000_OR_2350_MILLIVOLT', 15)), None),
+    ('OVERCURRENT_PROTECTION_Y2_HIGH_SIDE_THRESHOLD', 261, 'RWE', 'ENUM', (('V_63_MILLIVOLT', 0), ('V_125_MILLIVOLT', 1), ('V_187_MILLIVOLT', 2), ('V_248_MILLIVOLT', 3), ('V_312_MILLIVOLT', 4), ('V_374_MILLIVOLT', 5), ('V_434_MILLIVOLT', 6), ('V_504_MILLIVOLT', 7), ('V_705_MILLIVOLT', 8), ('V_940_MILLIVOLT', 9), ('V_1180_MILLIVOLT', 10), ('V_1410_MILLIVOLT', 11), ('V_1650_MILLIVOLT', 12), ('V_1880_MILLIVOLT', 13), ('V_2110_MILLIVOLT', 14), ('V_2350_MILLIVOLT', 15)), None),
+    ('OVERCURRENT_PROTECTION_UVW_LOW_SIDE_BLANKING', 262, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_UVW_HIGH_SIDE_BLANKING', 263, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_Y2_LOW_SIDE_BLANKING', 264, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_Y2_HIGH_SIDE_BLANKING', 265, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_UVW_LOW_SIDE_DEGLITCH', 266, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_UVW_HIGH_SIDE_DEGLITCH', 267, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_Y2_LOW_SIDE_DEGLITCH', 268, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_Y2_HIGH_SIDE_DEGLITCH', 269, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('OVERCURRENT_PROTECTION_UVW_LOW_SIDE_USE_VDS', 270, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('OVERCURRENT_PROTECTION_Y2_LOW_SIDE_USE_VDS', 271, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_ON_PROTECTION_UVW_LOW_SIDE_ENABLE', 272, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_OFF_PROTECTION_UVW_LOW_SIDE_ENABLE', 273, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_ON_PROTECTION_UVW_HIGH_SIDE_ENABLE', 274, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_OFF_PROTECTION_UVW_HIGH_SIDE_ENABLE', 275, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_ON_PROTECTION_Y2_LOW_SIDE_ENABLE', 276, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_OFF_PROTECTION_Y2_LOW_SIDE_ENABLE', 277, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_ON_PROTECTION_Y2_HIGH_SIDE_ENABLE', 278, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_OFF_PROTECTION_Y2_HIGH_SIDE_ENABLE', 279, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('VGS_SHORT_PROTECTION_UVW_BLANKING', 280, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3)), None),
+    ('VGS_SHORT_PROTECTION_Y2_BLANKING', 281, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3)), None),
+    ('VGS_SHORT_PROTECTION_UVW_DEGLITCH', 282, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('VGS_SHORT_PROTECTION_Y2_DEGLITCH', 283, 'RWE', 'ENUM', (('OFF', 0), ('T_0_25_MICROSEC', 1), ('T_0_5_MICROSEC', 2), ('T_1_MICROSEC', 3), ('T_2_MICROSEC', 4), ('T_4_MICROSEC', 5), ('T_6_MICROSEC', 6), ('T_8_MICROSEC', 7)), None),
+    ('GDRV_RETRY_BEHAVIOUR', 286, 'RWE', 'ENUM', (('OPEN_CIRCUIT', 0), ('ELECTRICAL_BRAKING', 1)), None),
+    ('DRIVE_FAULT_BEHAVIOUR', 287, 'RWE', 'ENUM', (('OPEN_CIRCUIT', 0), ('ELECTRICAL_BRAKING', 1), ('MECHANICAL_BRAKING_AND_OPEN_CIRCUIT', 2), ('MECHANICAL_AND_ELECTRICAL_BRAKING', 3)), None),
+    ('FAULT_HANDLER_NUMBER_OF_RETRIES', 288, 'RWE', 'UNSIGNED', None, None),
+    ('GENERAL_STATUS_FLAGS', 289, 'R', 'FIELD', None, (('REGULATION_STOPPED', 0x00000001, 0), ('REGULATION_TORQUE', 0x00000002, 1), ('REGULATION_VELOCITY', 0x00000004, 2), ('REGULATION_POSITION', 0x00000008, 3), ('CONFIG_STORED', 0x00000010, 4), ('CONFIG_LOADED', 0x00000020, 5), ('CONFIG_READ_ONLY', 0x00000040, 6), ('TMCL_SCRIPT_READ_ONLY', 0x00000080, 7), ('BRAKE_CHOPPER_ACTIVE', 0x00000100, 8), ('POSITION_REACHED', 0x00000200, 9), ('VELOCITY_REACHED', 0x00000400, 10), ('ADC_OFFSET_CALIBRATED', 0x00000800, 11), ('RAMPER_LATCHED', 0x00001000, 12), ('RAMPER_EVENT_STOP_SWITCH', 0x00002000, 13), ('RAMPER_EVENT_STOP_DEVIATION', 0x00004000, 14), ('RAMPER_VELOCITY_REACHED', 0x00008000, 15), ('RAMPER_POSITION_REACHED', 0x00010000, 16), ('RAMPER_SECOND_MOVE', 0x00020000, 17), ('IIT_1_ACTIVE', 0x00040000, 18), ('IIT_2_ACTIVE', 0x00080000, 19), ('REFSEARCH_FINISHED', 0x00100000, 20), ('Y2_USED_FOR_BRAKING', 0x00200000, 21), ('FLASH_STIMULUS_AVAILABLE', 0x00400000, 22), ('STEPDIR_INPUT_AVAILABLE', 0x00800000, 23), ('RIGHT_REF_SWITCH_AVAILABLE', 0x01000000, 24), ('HOME_REF_SWITCH_AVAILABLE', 0x02000000, 25), ('LEFT_REF_SWITCH_AVAILABLE', 0x04000000, 26), ('ABN2_FEEDBACK_AVAILABLE', 0x08000000, 27), ('HALL_FEEDBACK_AVAILABLE', 0x10000000, 28), ('ABN1_FEEDBACK_AVAILABLE', 0x20000000, 29), ('SPI_FLASH_AVAILABLE', 0x40000000, 30), ('I2C_EEPROM_AVAILABLE', 0x80000000, 31))),
+    ('SUPPLY_VOLTAGE', 290, 'R', 'UNSIGNED', None, None),
+    ('SUPPLY_OVERVOLTAGE_WARNING_THRESHOLD', 291, 'RWE', 'UNSIGNED', None, None),
+    ('SUPPLY_UNDERVOLTAGE_WARNING_THRESHOLD', 292, 'RWE', 'UNSIGNED', None, None),
+    ('EXTERNAL_TEMPERATURE', 293, 'R', 'UNSIGNED', None, None),
+    ('EXTERNAL_TEMPERATURE_SHUTDOWN_THRESHOLD', 294, 'RWE', 'UNSIGNED', None, None),
+    ('EXTERNAL_TEMPERATURE_WARNING_THRESHOLD', 295, 'RWE', 'UNSIGNED', None, None),
+    ('CHIP_TEMPERATURE', 296, 'R', 'UNSIGNED', None, None),
+    ('CHIP_TEMPERATURE_SHUTDOWN_THRESHOLD', 297, 'RWE', 'UNSIGNED', None, None),
+    ('CHIP_TEMPERATURE_WARNING_THRESHOLD', 298, 'RWE', 'UNSIGNED', None, None),
+    ('GENERAL_ERROR_FLAGS', 299, 'R', 'FIELD', None, (('CONFIG_ERROR', 0x00000001, 0), ('TMCL_SCRIPT_ERROR', 0x00000002, 1), ('HOMESWITCH_NOT_FOUND', 0x00000004, 2), ('HALL_ERROR', 0x00000020, 5), ('WATCHDOG_EVENT', 0x00000200, 9), ('EXT_TEMP_EXCEEDED', 0x00002000, 13), ('CHIP_TEMP_EXCEEDED', 0x00004000, 14), ('ITT_1_EXCEEDED', 0x00010000, 16), ('ITT_2_EXCEEDED', 0x00020000, 17), ('EXT_TEMP_WARNING', 0x00040000, 18), ('SUPPLY_OVERVOLTAGE_WARNING', 0x00080000, 19), ('SUPPLY_UNDERVOLTAGE_WARNING', 0x00100000, 20), ('ADC_IN_OVERVOLTAGE', 0x00200000, 21), ('FAULT_RETRY_HAPPEND', 0x00400000, 22), ('FAULT_RETRIES_FAILED', 0x00800000, 23), ('CHIP_TEMP_WARNING', 0x01000000, 24), ('HEARTBEAT_STOPPED', 0x04000000, 26))),
+    ('GDRV_ERROR_FLAGS', 300, 'R', 'FIELD', None, (('U_LOW_SIDE_OVERCURRENT', 0x00000001, 0), ('V_LOW_SIDE_OVERCURRENT', 0x00000002, 1), ('W_LOW_SIDE_OVERCURRENT', 0x00000004, 2), ('Y2_LOW_SIDE_OVERCURRENT', 0x00000008, 3), ('U_LOW_SIDE_DISCHARGE_SHORT', 0x00000010, 4), ('V_LOW_SIDE_DISCHARGE_SHORT', 0x00000020, 5), ('W_LOW_SIDE_DISCHARGE_SHORT', 0x00000040, 6), ('Y2_LOW_SIDE_DISCHARGE_SHORT', 0x00000080, 7), ('U_LOW_SIDE_CHARGE_SHORT', 0x00000100, 8), ('V_LOW_SIDE_CHARGE_SHORT', 0x00000200, 9), ('W_LOW_SIDE_CHARGE_SHORT', 0x00000400, 10), ('Y2_LOW_SIDE_CHARGE_SHORT', 0x00000800, 11), ('U_BOOTSTRAP_UNDERVOLTAGE', 0x00001000, 12), ('V_BOOTSTRAP_UNDERVOLTAGE', 0x00002000, 13), ('W_BOOTSTRAP_UNDERVOLTAGE', 0x00004000, 14), ('Y2_BOOTSTRAP_UNDERVOLTAGE', 0x00008000, 15), ('U_HIGH_SIDE_OVERCURRENT', 0x00010000, 16), ('V_HIGH_SIDE_OVERCURRENT', 0x00020000, 17), ('W_HIGH_SIDE_OVERCURRENT', 0x00040000, 18), ('Y2_HIGH_SIDE_OVERCURRENT', 0x00080000, 19), ('U_HIGH_SIDE_DISCHARGE_SHORT', 0x00100000, 20), ('V_HIGH_SIDE_DISCHARGE_SHORT', 0x00200000, 21), ('W_HIGH_SIDE_DISCHARGE_SHORT', 0x00400000, 22), ('Y2_HIGH_SIDE_DISCHARGE_SHORT', 0x00800000, 23), ('U_HIGH_SIDE_CHARGE_SHORT', 0x01000000, 24), ('V_HIGH_SIDE_CHARGE_SHORT', 0x02000000, 25), ('W_HIGH_SIDE_CHARGE_SHORT', 0x04000000, 26), ('Y2_HIGH_SIDE_CHARGE_SHORT', 0x08000000, 27), ('GDRV_UNDERVOLTAGE', 0x20000000, 29), ('GDRV_LOW_VOLTAGE', 0x40000000, 30), ('GDRV_SUPPLY_UNDERVOLTAGE', 0x80000000, 31))),
+    ('ADC_STATUS_FLAGS', 301, 'R', 'FIELD', None, (('I0_CLIPPED', 0x00000001, 0), ('I1_CLIPPED', 0x00000002, 1), ('I2_CLIPPED', 0x00000004, 2), ('I3_CLIPPED', 0x00000008, 3), ('U0_CLIPPED', 0x00000010, 4), ('U1_CLIPPED', 0x00000020, 5), ('U2_CLIPPED', 0x00000040, 6), ('U3_CLIPPED', 0x00000080, 7), ('AIN0_CLIPPED', 0x00000100, 8), ('AIN1_CLIPPED', 0x00000200, 9), ('AIN2_CLIPPED', 0x00000400, 10), ('AIN3_CLIPPED', 0x00000800, 11), ('VM_CLIPPED', 0x00001000, 12), ('TEMP_CLIPPED', 0x00002000, 13))),
+    ('MCC_INPUTS_RAW', 304, 'R', 'UNSIGNED', None, None),
+    ('FOC_VOLTAGE_UX', 305, 'R', 'SIGNED', None, None),
+    ('FOC_VOLTAGE_WY', 306, 'R', 'SIGNED', None, None),
+    ('FOC_VOLTAGE_V', 307, 'R', 'SIGNED', None, None),
+    ('FIELDWEAKENING_I', 308, 'RWE', 'UNSIGNED', None, None),
+    ('FIELDWEAKENING_VOLTAGE_THRESHOLD', 310, 'RWE', 'UNSIGNED', None, None),
+    ('FOC_CURRENT_UX', 311, 'R', 'SIGNED', None, None),
+    ('FOC_CURRENT_V', 312, 'R', 'SIGNED', None, None),
+    ('FOC_CURRENT_WY', 313, 'R', 'SIGNED', None, None),
+    ('FOC_VOLTAGE_UQ', 314, 'R', 'SIGNED', None, None),
+    ('FOC_CURRENT_IQ', 315, 'R', 'SIGNED', None, None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_ENABLE', 318, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_ACOEFF_1', 319, 'RWE', 'SIGNED', None, None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_ACOEFF_2', 320, 'RWE', 'SIGNED', None, None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_BCOEFF_0', 321, 'RWE', 'SIGNED', None, None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_BCOEFF_1', 322, 'RWE', 'SIGNED', None, None),
+    ('TARGET_TORQUE_BIQUAD_FILTER_BCOEFF_2', 323, 'RWE', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_ENABLE', 324, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_ACOEFF_1', 325, 'RWE', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_ACOEFF_2', 326, 'RWE', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_BCOEFF_0', 327, 'RWE', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_BCOEFF_1', 328, 'RWE', 'SIGNED', None, None),
+    ('ACTUAL_VELOCITY_BIQUAD_FILTER_BCOEFF_2', 329, 'RWE', 'SIGNED', None, None),
+    ('TORQUE_FLUX_COMBINED_TARGET_VALUES', 330, 'R', 'UNSIGNED', None, None),
+    ('TORQUE_FLUX_COMBINED_ACTUAL_VALUES', 331, 'R', 'UNSIGNED', None, None),
+    ('VOLTAGE_D_Q_COMBINED_ACTUAL_VALUES', 332, 'R', 'UNSIGNED', None, None),
+    ('INTEGRATED_ACTUAL_TORQUE_VALUE', 333, 'R', 'UNSIGNED', None, None),
+    ('INTEGRATED_ACTUAL_VELOCITY_VALUE', 334, 'R', 'UNSIGNED', None, None),
+)
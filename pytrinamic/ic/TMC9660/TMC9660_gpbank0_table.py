@@ -0,0 +1,27 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, index, access, datatype, ((name, value), ...) or None, ((name, mask, shift), ...) or None
+PARAMETERS = (
+    ('SERIAL_ADDRESS', 1, 'RWE', 'UNSIGNED', None, None),
+    ('SERIAL_HOST_ADDRESS', 2, 'RWE', 'UNSIGNED', None, None),
+    ('HEARTBEAT_MONITORING_CONFIG', 3, 'RWE', 'ENUM', (('DISABLED', 0), ('TMCL_UART_INTERFACE', 1), ('SPI_INTERFACE', 2), ('TMCL_UART_AND_SPI_INTERFACE', 3)), None),
+    ('HEARTBEAT_MONITORING_TIMEOUT', 4, 'RWE', 'UNSIGNED', None, None),
+    ('IO_DIRECTION_MASK', 5, 'RWE', 'UNSIGNED', None, None),
+    ('IO_INPUT_PULLUP_PULLDOWN_ENABLE_MASK', 6, 'RWE', 'UNSIGNED', None, None),
+    ('IO_INPUT_PULLUP_PULLDOWN_DIRECTION_MASK', 7, 'RWE', 'UNSIGNED', None, None),
+    ('WAKE_PIN_CONTROL_ENABLE', 10, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('GO_TO_TIMEOUT_POWER_DOWN_STATE', 11, 'W', 'ENUM', (('T_250_MILLISEC', 0), ('T_500_MILLISEC', 1), ('T_1_SEC', 2), ('T_2_SEC', 3), ('T_4_SEC', 4), ('T_8_SEC', 5), ('T_16_SEC', 6), ('T_32_SEC', 7)), None),
+    ('STIMULUS_FSM_STATE', 25, 'RW', 'ENUM', (('IDLE', 0), ('INITIALIZING', 1), ('RUNNING', 2), ('DONE', 3)), None),
+    ('STIMULUS_FREQUENCY_DIVISOR', 26, 'RW', 'UNSIGNED', None, None),
+    ('STIMULUS_CHANNEL_0_TARGET_ADDRESS', 27, 'RW', 'UNSIGNED', None, None),
+    ('STIMULUS_CHANNEL_1_TARGET_ADDRESS', 28, 'RW', 'UNSIGNED', None, None),
+    ('STIMULUS_CHANNEL_0_SCALING_FACTOR', 29, 'RW', 'UNSIGNED', None, None),
+    ('STIMULUS_CHANNEL_1_SCALING_FACTOR', 30, 'RW', 'UNSIGNED', None, None),
+    ('AUTO_START_ENABLE', 77, 'RWE', 'BOOLEAN', (('DISABLED', False), ('ENABLED', True)), None),
+    ('CLEAR_USER_VARIABLES', 85, 'RWE', 'BOOLEAN', (('TRY_LOAD_FROM_STORAGE', False), ('CLEAR', True)), None),
+)
@@ -0,0 +1,26 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, index, access, datatype, ((name, value), ...) or None, ((name, mask, shift), ...) or None
+PARAMETERS = (
+    ('USER_VARIABLE_0', 0, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_1', 1, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_2', 2, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_3', 3, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_4', 4, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_5', 5, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_6', 6, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_7', 7, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_8', 8, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_9', 9, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_10', 10, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_11', 11, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_12', 12, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_13', 13, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_14', 14, 'RWE', 'SIGNED', None, None),
+    ('USER_VARIABLE_15', 15, 'RWE', 'SIGNED', None, None),
+)
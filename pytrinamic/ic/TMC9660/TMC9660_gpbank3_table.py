@@ -0,0 +1,35 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+# name, index, access, datatype, ((name, value), ...) or None, ((name, mask, shift), ...) or None
+PARAMETERS = (
+    ('TIMER_0_PERIOD', 0, 'RW', 'UNSIGNED', None, None),
+    ('TIMER_1_PERIOD', 1, 'RW', 'UNSIGNED', None, None),
+    ('TIMER_2_PERIOD', 2, 'RW', 'UNSIGNED', None, None),
+    ('STOP_LEFT_TRIGGER_TRANSITION', 10, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('STOP_RIGHT_TRIGGER_TRANSITION', 11, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('HOME_RIGHT_TRIGGER_TRANSITION', 12, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_0_TRIGGER_TRANSITION', 13, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_1_TRIGGER_TRANSITION', 14, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_2_TRIGGER_TRANSITION', 15, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_3_TRIGGER_TRANSITION', 16, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_4_TRIGGER_TRANSITION', 17, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_5_TRIGGER_TRANSITION', 18, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_6_TRIGGER_TRANSITION', 19, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_7_TRIGGER_TRANSITION', 20, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_8_TRIGGER_TRANSITION', 21, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_9_TRIGGER_TRANSITION', 22, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_10_TRIGGER_TRANSITION', 23, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_11_TRIGGER_TRANSITION', 24, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_12_TRIGGER_TRANSITION', 25, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_13_TRIGGER_TRANSITION', 26, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_14_TRIGGER_TRANSITION', 27, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_15_TRIGGER_TRANSITION', 28, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_16_TRIGGER_TRANSITION', 29, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_17_TRIGGER_TRANSITION', 30, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+    ('INPUT_18_TRIGGER_TRANSITION', 31, 'RW', 'ENUM', (('OFF', 0), ('RISING', 1), ('FALLING', 2), ('BOTH', 3)), None),
+)
@@ -0,0 +1,58 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Decoding fields and finding changes over arrays of register or parameter values."""
+
+import array
+
+
+def _is_ndarray(samples):
+    # NumPy arrays and alike are used as they are, without importing NumPy.
+    return hasattr(samples, "dtype") and hasattr(samples, "astype")
+
+
+def extract_field_array(samples, mask, shift, signed=False):
+    """
+    Extract a field from every sample of a sequence of register or parameter values.
+
+    :param samples: A NumPy array, or any sequence of integers like an array.array,
+        a memoryview of a capture or a list.
+    :return: A NumPy int64 array for a NumPy array, an array.array("q") otherwise.
+    """
+    base_mask = mask >> shift
+    sign_mask = base_mask & (~base_mask >> 1) if signed else 0
+    if _is_ndarray(samples):
+        values = (samples.astype("int64") & mask) >> shift
+        return (values ^ sign_mask) - sign_mask if signed else values
+    if signed:
+        return array.array("q", [(((sample & mask) >> shift) ^ sign_mask) - sign_mask for sample in samples])
+    return array.array("q", [(sample & mask) >> shift for sample in samples])
+
+
+def find_changes(samples, mask=-1):
+    """
+    Return the indices of the samples whose masked bits differ from the previous sample.
+
+    :return: A NumPy array for a NumPy array, an array.array("q") otherwise.
+    """
+    if _is_ndarray(samples):
+        samples = samples.astype("int64")
+        return ((samples[1:] ^ samples[:-1]) & mask).nonzero()[0] + 1
+    return array.array("q", [i for i in range(1, len(samples)) if (samples[i] ^ samples[i - 1]) & mask])
+
+
+def find_bit_changes(samples, masks):
+    """
+    Return for every mask the indices of the samples whose masked bits differ from the previous sample.
+
+    Without NumPy the samples are compared only once for all masks.
+    """
+    if _is_ndarray(samples):
+        return [find_changes(samples, mask) for mask in masks]
+    combined = 0
+    for mask in masks:
+        combined |= mask
+    changes = [(i, samples[i] ^ samples[i - 1]) for i in find_changes(samples, combined)]
+    return [array.array("q", [i for i, change in changes if change & mask]) for mask in masks]
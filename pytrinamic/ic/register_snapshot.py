@@ -0,0 +1,187 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Register map snapshots.
+
+A RegisterSnapshot holds the contents of the registers of a RegisterGroup as
+read by RegisterApiDevice.dump(). It decodes the fields, compares two
+snapshots field by field and stores itself in a compact binary format.
+
+Binary format, all numbers little-endian::
+
+    Header:     b"RSNP", format version (u16), block (u16), register width (u16),
+                group name length (u16), register count (u32)
+    Group name: UTF-8
+    Addresses:  u32 * register count
+    Values:     u32 * register count
+
+Usage::
+
+    working = device.dump(TMC9660.MCC)
+    broken = device.dump(TMC9660.MCC)
+    for change in working.diff(broken):
+        print(change)
+"""
+
+from __future__ import annotations
+from typing import List, Optional, Union
+from dataclasses import dataclass
+from array import array
+import struct
+import sys
+
+from .tmc_ic import RegisterGroup, Register, Field, _extractor
+
+
+_MAGIC = b"RSNP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHHHI")
+
+
+class RegisterSnapshotError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A field which differs between two snapshots, None if the register is missing in one of them."""
+    register: Register
+    field: Optional[Field]
+    old: Optional[int]
+    new: Optional[int]
+
+    def __str__(self):
+        name = self.register.name if self.field is None else f"{self.register.name}.{self.field.name}"
+        return f"{name}: {self.old} -> {self.new}"
+
+
+class RegisterSnapshot:
+    """
+    The unsigned register contents of a RegisterGroup, sorted by address.
+
+    :param register_group: The group the registers belong to, it is used to decode the contents.
+    :param addresses: The register addresses in ascending order, all of them registers of the group.
+    :param values: The unsigned register contents.
+    """
+
+    def __init__(self, register_group: RegisterGroup, addresses, values):
+        if len(addresses) != len(values):
+            raise ValueError("Expected as many values as addresses!")
+        unknown = _unknown_addresses(register_group, addresses)
+        if unknown:
+            raise ValueError(f"No registers at {unknown} in register group {register_group.name}!")
+        self.register_group = register_group
+        self.addresses = array("I", addresses)
+        self.values = array("I", values)
+        self._positions = {address: i for i, address in enumerate(self.addresses)}
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def __contains__(self, register: Union[Register, int]):
+        address = register.address if isinstance(register, Register) else register
+        return address in self._positions
+
+    def __getitem__(self, target: Union[Register, Field, int]) -> int:
+        """Returns the value of a register or field, or the unsigned content at a register address."""
+        if isinstance(target, int):
+            return self.values[self._positions[target]]
+        register = target.parent if isinstance(target, Field) else target
+        return _extractor(target)(self.values[self._positions[register.address]])
+
+    def registers(self) -> List[Register]:
+        """Returns the registers of the snapshot, sorted by address."""
+        return [self.register_group.by_address(address) for address in self.addresses]
+
+    def decode(self) -> dict:
+        """
+        Returns the register and field values by name.
+
+        Registers map to a dict of their field values, registers without
+        fields or with a single field named like the register map to their
+        value.
+        """
+        decoded = {}
+        for register, register_content in zip(self.registers(), self.values):
+            fields = register.fields()
+            if not fields or (len(fields) == 1 and fields[0].name == register.name):
+                decoded[register.name] = _extractor(register)(register_content)
+            else:
+                decoded[register.name] = {field.name: _extractor(field)(register_content) for field in fields}
+        return decoded
+
+    def diff(self, other: RegisterSnapshot) -> List[FieldChange]:
+        """
+        Returns the fields which differ from the other snapshot, in address and shift order.
+
+        Registers without fields are compared as a whole. Registers which are
+        only in one of the snapshots are reported with None on the other side.
+        """
+        changes = []
+        for address in sorted(set(self._positions) | set(other._positions)):
+            register = self.register_group.by_address(address)
+            old = self.values[self._positions[address]] if address in self._positions else None
+            new = other.values[other._positions[address]] if address in other._positions else None
+            if old == new:
+                continue
+            fields = register.fields()
+            if old is None or new is None or not fields:
+                extract = _extractor(register)
+                changes.append(FieldChange(register, None, None if old is None else extract(old), None if new is None else extract(new)))
+                continue
+            for field in fields:
+                if (old ^ new) & field.mask:
+                    extract = _extractor(field)
+                    changes.append(FieldChange(register, field, extract(old), extract(new)))
+        return changes
+
+    def to_bytes(self) -> bytes:
+        name = self.register_group.name.encode()
+        addresses = array("I", self.addresses)
+        values = array("I", self.values)
+        if sys.byteorder != "little":
+            addresses.byteswap()
+            values.byteswap()
+        header = _HEADER.pack(_MAGIC, _VERSION, self.register_group.block, self.register_group.width, len(name), len(self))
+        return header + name + addresses.tobytes() + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, register_group: RegisterGroup) -> RegisterSnapshot:
+        """
+        Loads a snapshot created by to_bytes(), the register group has to be the one it was taken of.
+
+        Raises a RegisterSnapshotError if the snapshot holds addresses which
+        are no registers of the group, e.g. of an older register map.
+        """
+        try:
+            magic, version, block, width, name_length, count = _HEADER.unpack_from(data)
+        except struct.error:
+            raise RegisterSnapshotError("Not a register snapshot") from None
+        if magic != _MAGIC:
+            raise RegisterSnapshotError("Not a register snapshot")
+        if version != _VERSION:
+            raise RegisterSnapshotError(f"Unsupported snapshot format version {version}")
+        offset = _HEADER.size
+        name = bytes(data[offset:offset + name_length]).decode()
+        if (name, block, width) != (register_group.name, register_group.block, register_group.width):
+            raise RegisterSnapshotError(f"The snapshot is of register group {name}, not {register_group.name}")
+        offset += name_length
+        if len(data) != offset + 8*count:
+            raise RegisterSnapshotError("Truncated register snapshot")
+        addresses = array("I")
+        addresses.frombytes(data[offset:offset + 4*count])
+        values = array("I")
+        values.frombytes(data[offset + 4*count:])
+        if sys.byteorder != "little":
+            addresses.byteswap()
+            values.byteswap()
+        unknown = _unknown_addresses(register_group, addresses)
+        if unknown:
+            raise RegisterSnapshotError(f"The snapshot holds addresses without register in {register_group.name}: {unknown}")
+        return cls(register_group, addresses, values)
+
+
+def _unknown_addresses(register_group, addresses) -> str:
+    return ", ".join(f"0x{address:X}" for address in addresses if register_group.by_address(address) is None)
@@ -0,0 +1,242 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Table backed register maps.
+
+A RegisterTable holds a whole register map in a few flat arrays instead of a
+class and an object per register, field and option. A TableRegisterGroup
+hands out small views of it on attribute access, so
+`group.MOTOR_CONFIG.TYPE.choice.BLDC` works like with the class based maps.
+"""
+
+from array import array
+from types import MappingProxyType
+
+from .tmc_ic import Access, RegisterGroup, Register, Field, Choice, Option
+
+
+class RegisterTable:
+    """
+    The registers, fields and options of a register map.
+
+    :param registers: Tuple of (name, access, address, signed, fields) per register,
+        with access as name of an Access member.
+        fields is a tuple of (name, access, mask, shift, signed, options) per field and
+        options is None or a tuple of (name, value) per option.
+    """
+
+    def __init__(self, registers):
+        self.register_names = tuple(register[0] for register in registers)
+        self.register_access = array("B", (Access[register[1]] for register in registers))
+        self.addresses = array("I", (register[2] for register in registers))
+        self.register_signed = array("B", (register[3] for register in registers))
+
+        # The fields of register i are field_start[i] to field_start[i + 1] - 1
+        self.field_start = array("I", [0])
+        field_names = []
+        self.field_access = array("B")
+        self.masks = array("I")
+        self.shifts = array("B")
+        self.field_signed = array("B")
+        self.field_options = []
+        for register in registers:
+            for name, access, mask, shift, signed, options in sorted(register[4], key=lambda x: x[3]):
+                field_names.append(name)
+                self.field_access.append(Access[access])
+                self.masks.append(mask)
+                self.shifts.append(shift)
+                self.field_signed.append(signed)
+                self.field_options.append(None if options is None else tuple(sorted(options, key=lambda x: x[1])))
+            self.field_start.append(len(field_names))
+        self.field_names = tuple(field_names)
+        self.field_options = tuple(self.field_options)
+
+        self._register_index = MappingProxyType({name: i for i, name in enumerate(self.register_names)})
+        self.address_order = tuple(sorted(range(len(self.register_names)), key=lambda i: self.addresses[i]))
+        # The first register wins if several share an address.
+        self._address_index = MappingProxyType({self.addresses[i]: i for i in reversed(self.address_order)})
+        # Field position -> {value: (name, value)}, built on first use per field
+        self._option_values = {}
+
+    def __len__(self):
+        return len(self.register_names)
+
+    def register_index(self, name):
+        """Return the position of the register `name`, raise a KeyError if there is none."""
+        return self._register_index[name]
+
+    def field_index(self, register_index, name):
+        """Return the position of the field `name` of a register, raise a ValueError if there is none."""
+        return self.field_names.index(name, self.field_start[register_index], self.field_start[register_index + 1])
+
+    def address_index(self, address):
+        """Return the position of the register at `address`, raise a KeyError if there is none."""
+        return self._address_index[address]
+
+    def option(self, field_index, value):
+        """Return (name, value) of the option of a field with the given value, raise a KeyError if there is none."""
+        values = self._option_values.get(field_index)
+        if values is None:
+            values = self._option_values[field_index] = MappingProxyType({option[1]: option for option in reversed(self.field_options[field_index])})
+        return values[value]
+
+
+class TableRegisterGroup(RegisterGroup):
+    """A RegisterGroup backed by a RegisterTable."""
+
+    def __init__(self, name, table: RegisterTable, channel, block, width=None):
+        super().__init__(name, channel, block, width)
+        self.table = table
+
+    def __getattr__(self, name):
+        # Only called for names which are no regular attributes
+        try:
+            index = self.__dict__["table"].register_index(name)
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__} {self.name} has no register {name}") from None
+        return TableRegister(self, index)
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self.table.register_names)
+
+    def find(self, name: str):
+        """Returns the register with the given name, or None."""
+        try:
+            return TableRegister(self, self.table.register_index(name))
+        except KeyError:
+            return None
+
+    def by_address(self, address: int):
+        """Returns the register at the given address, or None. Helps to decode raw register traces."""
+        try:
+            return TableRegister(self, self.table.address_index(address))
+        except KeyError:
+            return None
+
+    def registers(self) -> list:
+        """Returns a list of all the registers, sorted by address."""
+        return [TableRegister(self, i) for i in self.table.address_order]
+
+
+class TableRegister(Register):
+    """View of a register in a TableRegisterGroup."""
+
+    def __init__(self, parent: TableRegisterGroup, index: int):
+        self.parent = parent
+        self._index = index
+
+    @property
+    def name(self):
+        return self.parent.table.register_names[self._index]
+
+    @property
+    def access(self):
+        return Access(self.parent.table.register_access[self._index])
+
+    @property
+    def address(self):
+        return self.parent.table.addresses[self._index]
+
+    @property
+    def signed(self):
+        return bool(self.parent.table.register_signed[self._index])
+
+    def __getattr__(self, name):
+        try:
+            index = self.parent.table.field_index(self._index, name)
+        except ValueError:
+            raise AttributeError(f"Register {self.name} has no field {name}") from None
+        return TableField(self, index)
+
+    def __dir__(self):
+        table = self.parent.table
+        return list(super().__dir__()) + list(table.field_names[table.field_start[self._index]:table.field_start[self._index + 1]])
+
+    def fields(self) -> list:
+        """Returns a list of all the fields, sorted by shift."""
+        table = self.parent.table
+        return [TableField(self, i) for i in range(table.field_start[self._index], table.field_start[self._index + 1])]
+
+    def __eq__(self, other):
+        return isinstance(other, TableRegister) and self.parent is other.parent and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self.parent), self._index))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.parent.name}.{self.name}>"
+
+
+class TableField(Field):
+    """View of a field of a TableRegister."""
+
+    def __init__(self, parent: TableRegister, index: int):
+        self.parent = parent
+        self._index = index
+
+    @property
+    def name(self):
+        return self.parent.parent.table.field_names[self._index]
+
+    @property
+    def access(self):
+        return Access(self.parent.parent.table.field_access[self._index])
+
+    @property
+    def mask(self):
+        return self.parent.parent.table.masks[self._index]
+
+    @property
+    def shift(self):
+        return self.parent.parent.table.shifts[self._index]
+
+    @property
+    def signed(self):
+        return bool(self.parent.parent.table.field_signed[self._index])
+
+    @property
+    def choice(self):
+        if self.parent.parent.table.field_options[self._index] is None:
+            return None
+        return TableChoice(self)
+
+    def __eq__(self, other):
+        return isinstance(other, TableField) and self.parent == other.parent and self._index == other._index
+
+    def __hash__(self):
+        return hash((hash(self.parent), self._index))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.parent.name}.{self.name}>"
+
+
+class TableChoice(Choice):
+    """View of the options of a TableField."""
+
+    def __init__(self, parent: TableField):
+        self.parent = parent
+
+    def _options(self):
+        return self.parent.parent.parent.table.field_options[self.parent._index]
+
+    def __getattr__(self, name):
+        for option_name, value in self._options():
+            if option_name == name:
+                return Option(value, self.parent, option_name)
+        raise AttributeError(f"Field {self.parent.name} has no option {name}")
+
+    def __dir__(self):
+        return list(super().__dir__()) + [name for name, _ in self._options()]
+
+    def options(self):
+        return [Option(value, self.parent, name) for name, value in self._options()]
+
+    def get(self, value):
+        """Extracts the option name from a value."""
+        try:
+            name, value = self.parent.parent.parent.table.option(self.parent._index, value)
+        except KeyError:
+            raise IndexError(f"Unknown value {value} for choice {self.parent.name}!") from None
+        return Option(value, self.parent, name)
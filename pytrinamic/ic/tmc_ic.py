@@ -9,8 +9,12 @@ from __future__ import annotations      #start at python 3.7
 from typing import Optional, Union
 from enum import IntFlag
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from types import MappingProxyType
 import inspect
 
+from .field_arrays import extract_field_array, find_bit_changes
+
 
 class TMCIc(object):
 
@@ -25,8 +29,172 @@ class TMCIc(object):
         return self.__info
 
 
+class PendingRegisterWrite:
+    """
+    A register write collected by a transaction.
+
+    The written value is the field bits on top of a base value. The base is
+    None until it is known, then the register has to be read first.
+    """
+
+    __slots__ = ("base", "mask", "bits")
+
+    def __init__(self, base=None):
+        self.base = base
+        self.mask = 0
+        self.bits = 0
+
+    def set_field(self, mask, shift, value):
+        self.bits = (self.bits & ~mask) | ((value << shift) & mask)
+        self.mask |= mask
+
+    def value(self):
+        return (self.base & ~self.mask) | self.bits
+
+
 class RegisterApiDevice(ABC):
 
+    _shadow = None
+    """(block, address) -> (register, last known value) while shadowing is enabled, see enable_shadow()"""
+
+    _transaction = None
+    """(block, address) -> (register, PendingRegisterWrite) while a transaction() is open"""
+
+    @contextmanager
+    def transaction(self):
+        """Collect the register and field writes of a with-block and do them at its end.
+
+        The writes are grouped by register, every touched register is read at
+        most once and written once, in address order and with
+        read_registers() and write_registers(), which pipeline the requests
+        where the device supports it. A register write replaces the earlier
+        field writes of its register. Registers whose fields were all written
+        are not read. Write to clear fields are written at once, merging them
+        would clear other flags.
+
+        write() returns None inside the block and reads do not see the
+        pending writes. If the block raises, nothing is written. A nested
+        transaction joins the outer one.
+        """
+        if self._transaction is not None:
+            yield
+            return
+        pending = self._transaction = {}
+        try:
+            yield
+        finally:
+            self._transaction = None
+        self._commit(pending)
+
+    def _commit(self, pending):
+        entries = [pending[key] for key in sorted(pending)]
+        unknown = []
+        for register, write in entries:
+            if write.base is None and write.mask == (1 << register.parent.width) - 1:
+                write.base = 0
+            elif write.base is None:
+                entry = self._shadow.get((register.parent.block, register.address)) if self._shadow is not None else None
+                if entry is not None:
+                    write.base = entry[1]
+                else:
+                    unknown.append((register, write))
+        contents = self.read_registers([(register.address, register.parent.block) for register, _ in unknown])
+        for (register, write), register_content in zip(unknown, contents):
+            write.base = register_content
+        self.write_registers([(register.address, register.parent.block, write.value()) for register, write in entries])
+        for register, write in entries:
+            self._shadow_store(register, write.value())
+
+    def _pending_write(self, register: Register) -> PendingRegisterWrite:
+        key = (register.parent.block, register.address)
+        if key not in self._transaction:
+            self._transaction[key] = (register, PendingRegisterWrite())
+        return self._transaction[key][1]
+
+    def read_registers(self, registers: list) -> list:
+        """Read several registers, given as (register_address, block) tuples, and return their unsigned contents.
+
+        Devices which can pipeline requests override this, by default the registers are read one after the other.
+        """
+        return [self.read_register(register_address, block) for register_address, block in registers]
+
+    def write_registers(self, writes: list):
+        """Write several registers, given as (register_address, block, value) tuples, in order.
+
+        Devices which can pipeline requests override this, by default the registers are written one after the other.
+        """
+        for register_address, block, value in writes:
+            self.write_register(register_address, block, value)
+
+    def enable_shadow(self, enable: bool = True):
+        """Keep shadow copies of the writable registers.
+
+        Field writes then take the register content from the shadow instead of
+        reading it first, so writing several fields of a register costs one
+        register write each. Only registers with RW or W access are shadowed,
+        and none with RC, RWC or D fields, as their content changes without a
+        write. A register enters the shadow when it is read or written.
+
+        Use invalidate() when the registers were changed behind the shadow's
+        back, e.g. by a reset, or refresh() to read them again.
+        """
+        self._shadow = {} if enable else None
+
+    def refresh(self, target: Union[Register, Field, RegisterGroup, None] = None):
+        """Read the shadowed registers again.
+
+        :param target: Only refresh this register, the register of this field or the registers of this group.
+            Defaults to all shadowed registers. Write only registers keep their last written value.
+        """
+        if self._shadow is None:
+            return
+        for key, (register, _) in list(self._shadow_entries(target)):
+            if Access.R in register.access:
+                self._shadow[key] = (register, self.read_register(register.address, register.parent.block))
+
+    def invalidate(self, target: Union[Register, Field, RegisterGroup, None] = None):
+        """Drop shadowed registers, the next field write reads them from the device again.
+
+        :param target: Only drop this register, the register of this field or the registers of this group.
+            Defaults to all shadowed registers.
+        """
+        if self._shadow is None:
+            return
+        for key, _ in list(self._shadow_entries(target)):
+            del self._shadow[key]
+
+    def _shadow_entries(self, target):
+        if isinstance(target, Field):
+            target = target.parent
+        if target is None:
+            return self._shadow.items()
+        if isinstance(target, Register):
+            key = (target.parent.block, target.address)
+            return [(key, self._shadow[key])] if key in self._shadow else []
+        if isinstance(target, RegisterGroup):
+            return [(key, entry) for key, entry in self._shadow.items() if key[0] == target.block]
+        raise ValueError(f"Argument target {target} does not appear to be either a Register, Field or RegisterGroup.")
+
+    @staticmethod
+    def _is_shadowable(register: Register) -> bool:
+        if register.access not in (Access.RW, Access.W):
+            return False
+        return not any(field.access in (Access.RC, Access.RWC, Access.D) for field in register.fields())
+
+    def _shadow_store(self, register: Register, value: int):
+        if self._shadow is not None and self._is_shadowable(register):
+            self._shadow[(register.parent.block, register.address)] = (register, value & ((1 << register.parent.width) - 1))
+
+    def _register_content(self, register: Register) -> int:
+        """Returns the register content for a read-modify-write, from the shadow if it is known."""
+        if self._shadow is not None:
+            entry = self._shadow.get((register.parent.block, register.address))
+            if entry is not None:
+                return entry[1]
+        register_content = self.read_register(register.address, register.parent.block)
+        self._shadow_store(register, register_content)
+        return register_content
+
     def read(self, read_target: Union[Register, Field]) -> int:
         """Generic read function to read a register or a field within a register
 
@@ -39,6 +207,7 @@ class RegisterApiDevice(ABC):
             register_address = read_target.parent.address
             register_block = read_target.parent.parent.block
             register_content = self.read_register(register_address, register_block)
+            self._shadow_store(read_target.parent, register_content)
             return read_target.get(register_content)  # Mask and shift is done in the Field.get function
 
         elif isinstance(read_target, Register):
@@ -46,7 +215,9 @@ class RegisterApiDevice(ABC):
             signed = bool(read_target.signed)
             register_address = read_target.address
             register_block = read_target.parent.block
-            return self.read_register(register_address, register_block, signed=signed)
+            value = self.read_register(register_address, register_block, signed=signed)
+            self._shadow_store(read_target, value)
+            return value
 
         else:
             # Our target is neither a Register nor a Field.
@@ -54,6 +225,60 @@ class RegisterApiDevice(ABC):
                 f"Argument read_target {read_target} does not appear to be either a Register, or a Field."
             )
 
+    def read_many(self, read_targets) -> dict:
+        """Read several registers and fields with as few register reads as possible.
+
+        Every register is read once however many of its fields are requested,
+        all reads go out in address order with read_registers(), pipelined
+        where the device supports it. Requesting several flags of a read to
+        clear register in one call therefore does not lose any of them.
+
+        :param read_targets: Iterable of Register and Field objects.
+        :return: Dict of read target to value, sign extended like with read().
+        """
+        plan = []
+        registers = {}
+        for read_target in read_targets:
+            if isinstance(read_target, Field):
+                register = read_target.parent
+            elif isinstance(read_target, Register):
+                register = read_target
+            else:
+                raise ValueError(f"Argument read_target {read_target} does not appear to be either a Register, or a Field.")
+            key = (register.parent.block, register.address)
+            registers.setdefault(key, register)
+            plan.append((read_target, key, _extractor(read_target)))
+
+        keys = sorted(registers)
+        contents = dict(zip(keys, self.read_registers([(register_address, block) for block, register_address in keys])))
+        for key in keys:
+            self._shadow_store(registers[key], contents[key])
+        return {read_target: extract(contents[key]) for read_target, key, extract in plan}
+
+    def dump(self, register_group: RegisterGroup):
+        """Read all registers of a group in one sweep and return them as RegisterSnapshot.
+
+        Write only registers and registers with read to clear flags are
+        skipped. The reads go out in address order with read_registers(),
+        pipelined where the device supports it.
+        """
+        from .register_snapshot import RegisterSnapshot
+
+        registers = {}
+        for register in register_group.registers():
+            if self._is_dumpable(register):
+                registers.setdefault(register.address, register)
+        values = self.read_registers([(register_address, register_group.block) for register_address in registers])
+        for register, register_content in zip(registers.values(), values):
+            self._shadow_store(register, register_content)
+        return RegisterSnapshot(register_group, list(registers), values)
+
+    @staticmethod
+    def _is_dumpable(register: Register) -> bool:
+        if Access.R not in register.access or register.access == Access.RC:
+            return False
+        return not any(field.access == Access.RC for field in register.fields())
+
     def write(self, write_target: Union[Register, Field, Option], value: Optional[Union[int, bool]] = None, *, omit_bounds_check=False, omit_permission_checks=False) -> int:
         """Generic write function, to write a register or a field within a register
 
@@ -76,16 +301,23 @@ class RegisterApiDevice(ABC):
                 if not write_target.is_in_bounds(value):
                     raise ValueError(f"Input value {value} is not in the allowed value range!")
 
+            register = write_target.parent
+            register_address = register.address
+            register_block = register.parent.block
+
             if write_target.access == Access.RWC:
                 register_content_new = (value << write_target.shift) & write_target.mask
-                self.write_register(write_target.parent.address, write_target.parent.bloc, register_content_new)
+                self.write_register(register_address, register_block, register_content_new)
                 return register_content_new
 
-            register_address = write_target.parent.address
-            register_block = write_target.parent.parent.block
-            register_content_old = self.read_register(register_address, register_block)
+            if self._transaction is not None:
+                self._pending_write(register).set_field(write_target.mask, write_target.shift, value)
+                return None
+
+            register_content_old = self._register_content(register)
             register_content_new = write_target.set(register_content_old, value)  # Mask and shift is done in the Field.set function
             self.write_register(register_address, register_block, register_content_new)
+            self._shadow_store(register, register_content_new)
             return register_content_new
 
         elif isinstance(write_target, Register) and isinstance(value, int):
@@ -101,7 +333,12 @@ class RegisterApiDevice(ABC):
 
             register_address = write_target.address
             register_block = write_target.parent.block
-            return self.write_register(register_address, register_block, value)
+            if self._transaction is not None:
+                self._transaction[(register_block, register_address)] = (write_target, PendingRegisterWrite(value & ((1 << write_target.parent.width) - 1)))
+                return None
+            result = self.write_register(register_address, register_block, value)
+            self._shadow_store(write_target, value)
+            return result
 
         else:
             # Our target is neither a Register nor a Field, nor Option.
@@ -118,6 +355,21 @@ class RegisterApiDevice(ABC):
         raise NotImplementedError
 
 
+def _extractor(read_target):
+    """Returns a function which takes the unsigned register content and returns the value of a Register or Field."""
+    if isinstance(read_target, Field):
+        mask, shift = read_target.mask, read_target.shift
+        if not read_target.signed:
+            return lambda register_content: (register_content & mask) >> shift
+        base_mask = mask >> shift
+        sign_mask = base_mask & (~base_mask >> 1)
+        return lambda register_content: (((register_content & mask) >> shift) ^ sign_mask) - sign_mask
+    if not read_target.signed:
+        return lambda register_content: register_content
+    sign_mask = 1 << (read_target.parent.width - 1)
+    return lambda register_content: (register_content ^ sign_mask) - sign_mask
+
+
 class Access(IntFlag):
     R   = 0x01 # read
     W   = 0x02 # write
@@ -152,21 +404,42 @@ class RegisterGroup:
         else:
             self.width = width
 
+    def _index(self):
+        # The registers are attributes of the derived classes, the index is built on first use.
+        index = self.__dict__.get("_register_index")
+        if index is None:
+            registers = []
+            for key in self.__dir__():
+                obj = getattr(self, key)
+                if isinstance(obj, Register):
+                    registers.append(obj)
+            registers.sort(key=lambda x: x.address)
+            index = self._register_index = _RegisterIndex(registers)
+        return index
+
     def find(self, name: str):
-        for register in self.registers():
-            if register.name == name:
-                return register
+        """Returns the register with the given name, or None."""
+        return self._index().by_name.get(name)
+
+    def by_address(self, address: int):
+        """Returns the register at the given address, or None. Helps to decode raw register traces."""
+        return self._index().by_address.get(address)
 
     def registers(self) -> list:
         """Returns a list of all the Register attributes."""
-        registers = []
-        for key in self.__dir__():
-            obj = getattr(self, key)
-            if isinstance(obj, Register):
-                registers.append(obj)
-        registers.sort(key=lambda x: x.address)
+        return list(self._index().registers)
+
+
+class _RegisterIndex:
+    """The registers of a RegisterGroup, sorted by address and indexed by name and address."""
+
+    __slots__ = ("registers", "by_name", "by_address")
 
-        return registers
+    def __init__(self, registers):
+        self.registers = tuple(registers)
+        self.by_name = MappingProxyType({register.name: register for register in registers})
+        # The first register wins if several share an address.
+        self.by_address = MappingProxyType({register.address: register for register in reversed(registers)})
 
 
 class Field:
@@ -212,6 +485,14 @@ class Field:
         """
         return (register_value & ~self.mask) | (new_field_value << self.shift)
 
+    def extract_array(self, register_values):
+        """Get the field values of many register values at once, e.g. of DataLogger samples.
+
+        NumPy arrays are processed vectorized and give a NumPy array, other
+        sequences of integers give an array.array.
+        """
+        return extract_field_array(register_values, self.mask, self.shift, self.signed)
+
     def is_in_bounds(self, value: Union[int, bool]) -> bool:
         """Check if the value is within the bounds of the field."""
         base_mask = self.mask >> self.shift
@@ -227,6 +508,7 @@ class Register:
 
     The main purpose is to give these classes an easy way to set the value of a field for use with the bulk write functionality of the reg module.
     """
+
     def __init__(self, name, parent, access, address, signed=False) -> None:
         self.name = name
         self.parent = parent
@@ -244,17 +526,51 @@ class Register:
         """
         Returns a list of all the Field attributes.
         """
-        fields = []
-        for key in self.__dir__():
-            obj = getattr(self, key)
-            if isinstance(obj, Field):
-                fields.append(obj)
-        fields.sort(key=lambda x: x.shift)
-
-        return fields
+        # The fields are attributes of the derived classes, the list is built on first use.
+        fields = self.__dict__.get("_fields")
+        if fields is None:
+            fields = []
+            for key in self.__dir__():
+                obj = getattr(self, key)
+                if isinstance(obj, Field):
+                    fields.append(obj)
+            fields.sort(key=lambda x: x.shift)
+            fields = self._fields = tuple(fields)
+        return list(fields)
+
+    def decode_array(self, register_values, *, choices=False) -> dict:
+        """Get the values of all fields of many register values at once, see Field.extract_array().
+
+        :param choices: Map the values of fields with a choice to their Option, unknown values to None.
+        :return: Dict of field name to field values, a list of options for mapped fields.
+        """
+        decoded = {}
+        for field in self.fields():
+            values = field.extract_array(register_values)
+            if choices and field.choice:
+                values = values.tolist()
+                options = {}
+                for value in set(values):
+                    try:
+                        options[value] = field.choice.get(value)
+                    except IndexError:
+                        options[value] = None
+                values = [options[value] for value in values]
+            decoded[field.name] = values
+        return decoded
+
+    def find_flag_changes(self, register_values) -> dict:
+        """Find where the flags, the single bit fields, change in many register values.
+
+        :return: Dict of field name to the indices of the values where the flag differs from the value before.
+        """
+        flags = [field for field in self.fields() if field.mask >> field.shift == 1]
+        return dict(zip((flag.name for flag in flags), find_bit_changes(register_values, [flag.mask for flag in flags])))
 
 
 class Option:
+    __slots__ = ("value", "parent", "name")
+
     def __init__(self, value, parent, name=None) -> None:
         self.value = value
         self.parent = parent
@@ -265,12 +581,20 @@ class Choice:
     def __init__(self, parent) -> None:
         self.parent = parent
 
+    def _index(self):
+        # The options are attributes of the derived classes, the index is built on first use.
+        index = self.__dict__.get("_option_index")
+        if index is None:
+            options = sorted([member for name, member in inspect.getmembers(self) if isinstance(member, Option)], key=lambda x: x.value)
+            index = self._option_index = (tuple(options), MappingProxyType({option.value: option for option in reversed(options)}))
+        return index
+
     def options(self):
-        return sorted([member for name, member in inspect.getmembers(self) if isinstance(member, Option)], key=lambda x: x.value)
+        return list(self._index()[0])
 
     def get(self, value):
         """Extracts the option name from a value."""
         try:
-            return next(option for option in self.options() if option.value == value)
-        except StopIteration:
-            raise IndexError(f"Unknown value {value} for choice {self.parent.name}!")
+            return self._index()[1][value]
+        except KeyError:
+            raise IndexError(f"Unknown value {value} for choice {self.parent.name}!") from None
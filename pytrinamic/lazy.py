@@ -0,0 +1,61 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Importing classes and building class attributes on first use."""
+
+import importlib
+import types
+
+
+class LazyPackage(types.ModuleType):
+    """
+    Module type of packages which import their classes on first access (PEP 562).
+
+    Such a package maps every lazy name to the submodule defining it in
+    `_LAZY_ATTRIBUTES` and resolves them in its module level `__getattr__()`
+    with lazy_import().
+
+    Importing a submodule binds it as attribute of its package, e.g.
+    `import pytrinamic.ic.TMC4671` sets `pytrinamic.ic.TMC4671` to the module.
+    As most classes are named like their submodule this would hide the class,
+    so these bindings are ignored and the class is resolved lazily instead.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get("_LAZY_ATTRIBUTES", ()):
+            return
+        super().__setattr__(name, value)
+
+
+def lazy_import(package, name):
+    """Import the lazy attribute `name` of a LazyPackage and cache it in the package."""
+    try:
+        module_name = package._LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {package.__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, package.__name__), name)
+    package.__dict__[name] = value
+    return value
+
+
+class LazyClassAttribute:
+    """
+    A class attribute which is built on first access, from the class or an instance.
+
+    The built value replaces the descriptor in the defining class.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    def __get__(self, instance, owner):
+        value = self._factory()
+        setattr(self._owner, self._name, value)
+        return value
@@ -7,6 +7,7 @@
 ################################################################################
 
 from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.poller import wait_until
 
 
 class IDEEPROM:
@@ -153,8 +154,10 @@ class Landungsbruecke:
         """
         Start an IDDetection and read out the IDs of the detected boards.
         """
-        while not self._connection.send(TMCLCommand.ASSIGNMENT, 0, 0, 0).is_valid():
-            pass
+        wait_until(
+            lambda: self._connection.send(TMCLCommand.ASSIGNMENT, 0, 0, 0).is_valid(),
+            description="the board ID detection",
+        )
 
         return self.get_board_ids()
 
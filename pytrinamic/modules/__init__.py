@@ -1,42 +1,67 @@
+"""The module classes are imported on first access, e.g. `from pytrinamic.modules import TMCM1617` only imports TMCM1617."""
+
+import sys
+
+from pytrinamic.lazy import LazyPackage, lazy_import
 from .tmcl_module import TMCLModule, ParameterGroup, Parameter, ParameterApiDevice
-from .TMCC160 import TMCC160
-from .TMCM1021 import TMCM1021
-from .TMCM1110 import TMCM1110
-from .TMCM1111 import TMCM1111
-from .TMCM1140 import TMCM1140
-from .TMCM1141 import TMCM1141
-from .TMCM1160 import TMCM1160
-from .TMCM1161 import TMCM1161
-from .TMCM1210 import TMCM1210
-from .TMCM1211 import TMCM1211
-from .TMCM1240 import TMCM1240
-from .TMCM1241 import TMCM1241
-from .TMCM1260 import TMCM1260
-from .TMCM1270 import TMCM1270
-from .TMCM1276 import TMCM1276
-from .TMCM1278 import TMCM1278
-from .TMCM1290 import TMCM1290
-from .TMCM1311 import TMCM1311
-from .TMCM1316 import TMCM1316
-from .TMCM1321 import TMCM1321
-from .TMCM1370 import TMCM1370
-from .TMCM1378 import TMCM1378
-from .TMCM1617 import TMCM1617
-from .TMCM1630 import TMCM1630
-from .TMCM1633 import TMCM1633
-from .TMCM1636 import TMCM1636
-from .TMCM1637 import TMCM1637
-from .TMCM1638 import TMCM1638
-from .TMCM1640 import TMCM1640
-from .TMCM1670 import TMCM1670
-from .TMCM1690 import TMCM1690
-from .TMCM3110 import TMCM3110
-from .TMCM3216 import TMCM3216
-from .TMCM3312 import TMCM3312
-from .TMCM3351 import TMCM3351
-from .TMCM6110 import TMCM6110
-from .TMCM6212 import TMCM6212
-from .TMCM6214 import TMCM6214
-from .TMCM123x_0_1 import TMCM123x_0_1
-from .TMCM2611 import TMCM2611
-from .Landungsbruecke import Landungsbruecke
\ No newline at end of file
+from .parameter_table import ParameterTable, TableParameterGroup
+from .parameter_index import ParameterIndex
+
+_LAZY_ATTRIBUTES = {
+    "TMCC160": ".TMCC160",
+    "TMCM1021": ".TMCM1021",
+    "TMCM1110": ".TMCM1110",
+    "TMCM1111": ".TMCM1111",
+    "TMCM1140": ".TMCM1140",
+    "TMCM1141": ".TMCM1141",
+    "TMCM1160": ".TMCM1160",
+    "TMCM1161": ".TMCM1161",
+    "TMCM1210": ".TMCM1210",
+    "TMCM1211": ".TMCM1211",
+    "TMCM1240": ".TMCM1240",
+    "TMCM1241": ".TMCM1241",
+    "TMCM1260": ".TMCM1260",
+    "TMCM1270": ".TMCM1270",
+    "TMCM1276": ".TMCM1276",
+    "TMCM1278": ".TMCM1278",
+    "TMCM1290": ".TMCM1290",
+    "TMCM1311": ".TMCM1311",
+    "TMCM1316": ".TMCM1316",
+    "TMCM1321": ".TMCM1321",
+    "TMCM1370": ".TMCM1370",
+    "TMCM1378": ".TMCM1378",
+    "TMCM1617": ".TMCM1617",
+    "TMCM1630": ".TMCM1630",
+    "TMCM1633": ".TMCM1633",
+    "TMCM1636": ".TMCM1636",
+    "TMCM1637": ".TMCM1637",
+    "TMCM1638": ".TMCM1638",
+    "TMCM1640": ".TMCM1640",
+    "TMCM1670": ".TMCM1670",
+    "TMCM1690": ".TMCM1690",
+    "TMCM3110": ".TMCM3110",
+    "TMCM3216": ".TMCM3216",
+    "TMCM3312": ".TMCM3312",
+    "TMCM3351": ".TMCM3351",
+    "TMCM6110": ".TMCM6110",
+    "TMCM6212": ".TMCM6212",
+    "TMCM6214": ".TMCM6214",
+    "TMCM123x_0_1": ".TMCM123x_0_1",
+    "TMCM2611": ".TMCM2611",
+    "Landungsbruecke": ".Landungsbruecke",
+    "scan": ".scan",
+    "FoundModule": ".scan",
+}
+
+__all__ = ['TMCLModule', 'ParameterGroup', 'Parameter', 'ParameterApiDevice', 'ParameterTable', 'TableParameterGroup', 'ParameterIndex'] + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    return lazy_import(sys.modules[__name__], name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = LazyPackage
@@ -9,6 +9,8 @@
 import time
 import canopen
 
+from pytrinamic.poller import Poller
+
 
 class TmcmNode(canopen.RemoteNode):
     class ModeOfOperation:
@@ -38,11 +40,11 @@ class TmcmNode(canopen.RemoteNode):
         state = self.get_state(motor)
         if state == 'Fault':
             self.sdo['Controlword {number}'.format(number=motor)].raw = self.Cmd.FAULT_RESET
-            while 1:
-                state = self.get_state(motor)
-                if state == 'Switch on disable':
-                    break
-                time.sleep(1)
+            Poller(initial_interval_s=0.01, max_interval_s=1).wait_until(
+                lambda: self.get_state(motor) == 'Switch on disable',
+                description="the fault reset",
+            )
+            state = 'Switch on disable'
         sequence_from_state = {
             'Switch on disable': [(self.Cmd.SHUTDOWN, 'Ready to switch on'),
                                   (self.Cmd.SWITCH_ON, 'Switched on'),
@@ -56,12 +58,14 @@ class TmcmNode(canopen.RemoteNode):
         for cmd, expected_status in sequence_from_state[state]:
             self.sdo['Controlword {number}'.format(number=motor)].raw = cmd
             time.sleep(0.1)
-            while 1:
+
+            def reached(expected_status=expected_status):
                 state = self.get_state(motor)
                 if state == 'Fault':
                     raise self.StateMachineFault(f'Fault when transitioning to {expected_status}')
-                if state == expected_status:
-                    break
+                return state == expected_status
+
+            Poller(initial_interval_s=0.001, max_interval_s=0.05).wait_until(reached, description=expected_status)
 
     def shutdown(self, motor=1):
         if self.get_state(motor) != 'Switch on disable':
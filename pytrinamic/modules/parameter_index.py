@@ -0,0 +1,76 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Lookup of parameters by number.
+
+A ParameterIndex maps (category, block, index), as found in TMCL traces and
+RAMDebug channels, to the Parameter of several parameter groups, e.g. all
+groups of an IC, and decodes raw values with the signedness of the parameter.
+"""
+
+from types import MappingProxyType
+
+from .tmcl_module import ParameterGroup, Parameter
+from .parameter_table import TableParameterGroup, TableParameter
+
+
+class ParameterIndex:
+    """
+    The parameters of several parameter groups by number.
+
+    The tables are built once and read only. The block of axis parameters is
+    the block of their group, not the axis.
+
+    :param groups: The parameter groups, at most one per category and block.
+    """
+
+    def __init__(self, groups):
+        tables = {}
+        for group in groups:
+            key = (ParameterGroup.Category(group.category), group.block)
+            if key in tables:
+                raise ValueError(f"Parameter groups {tables[key][0].name} and {group.name} share category {key[0].name} and block {key[1]}")
+            tables[key] = (group, self._build_table(group))
+        self._groups = MappingProxyType({key: group for key, (group, _) in tables.items()})
+        self._tables = MappingProxyType({key: table for key, (_, table) in tables.items()})
+
+    @staticmethod
+    def _build_table(group):
+        # index -> (parameter, signed), the first parameter wins if several share an index
+        if isinstance(group, TableParameterGroup):
+            table = group.table
+            return MappingProxyType({table.indexes[i]: (TableParameter(group, i), bool(table.signed[i])) for i in reversed(table.index_order)})
+        return MappingProxyType({
+            parameter.index: (parameter, parameter.datatype == Parameter.Datatype.SIGNED)
+            for parameter in reversed(group.parameters())
+        })
+
+    def groups(self) -> list:
+        """Returns the parameter groups."""
+        return list(self._groups.values())
+
+    def group(self, category, block):
+        """Returns the parameter group of the category and block, or None."""
+        return self._groups.get((category, block))
+
+    def find(self, category, block, index):
+        """Returns the parameter with the given number, or None."""
+        entry = self._tables.get((category, block), {}).get(index)
+        return None if entry is None else entry[0]
+
+    def decode(self, category, block, index, value):
+        """
+        Returns the parameter with the given number and the value interpreted with its signedness.
+
+        The value is a raw 32 bit value like in a TMCL reply. Unknown
+        parameters give None and the unchanged value.
+        """
+        entry = self._tables.get((category, block), {}).get(index)
+        if entry is None:
+            return None, value
+        parameter, signed = entry
+        if signed:
+            value = ((value & 0xFFFF_FFFF) ^ 0x8000_0000) - 0x8000_0000
+        return parameter, value
@@ -0,0 +1,186 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Table backed parameter maps.
+
+A ParameterTable holds the parameters of a group in a few flat arrays instead
+of a class and an object per parameter and option. A TableParameterGroup
+hands out small views of it on attribute access, so
+`ap.MOTOR_TYPE.choice.BLDC_MOTOR` works like with the class based maps.
+"""
+
+from array import array
+from types import MappingProxyType
+
+from .tmcl_module import ParameterGroup, Parameter
+
+
+class ParameterTable:
+    """
+    The parameters of a parameter group.
+
+    :param parameters: Tuple of (name, index, access, datatype, options, fields) per parameter,
+        with access and datatype as names of Parameter.Access and Parameter.Datatype members.
+        options is None or a tuple of (name, value) per option,
+        fields is None or a tuple of (name, mask, shift) per field.
+    """
+
+    def __init__(self, parameters):
+        # The tables are read only, they are shared by all users of the group.
+        self.names = tuple(parameter[0] for parameter in parameters)
+        self.indexes = memoryview(array("H", (parameter[1] for parameter in parameters))).toreadonly()
+        self.access = bytes(Parameter.Access[parameter[2]] for parameter in parameters)
+        self.datatypes = bytes(Parameter.Datatype[parameter[3]] for parameter in parameters)
+        self.signed = bytes(datatype == Parameter.Datatype.SIGNED for datatype in self.datatypes)
+        self.options = tuple(parameter[4] for parameter in parameters)
+        self.fields = tuple(parameter[5] for parameter in parameters)
+
+        self._position = MappingProxyType({name: i for i, name in enumerate(self.names)})
+        self.index_order = tuple(sorted(range(len(self.names)), key=lambda i: self.indexes[i]))
+        # The first parameter wins if several share an index.
+        self._index_position = MappingProxyType({self.indexes[i]: i for i in reversed(self.index_order)})
+        # Position -> {value: (name, value)}, built on first use per parameter
+        self._option_values = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def position(self, name):
+        """Return the position of the parameter `name`, raise a KeyError if there is none."""
+        return self._position[name]
+
+    def index_position(self, index):
+        """Return the position of the parameter with the given index, raise a KeyError if there is none."""
+        return self._index_position[index]
+
+    def option(self, position, value):
+        """Return (name, value) of the option of a parameter with the given value, raise a KeyError if there is none."""
+        values = self._option_values.get(position)
+        if values is None:
+            values = self._option_values[position] = MappingProxyType({option[1]: option for option in reversed(self.options[position])})
+        return values[value]
+
+
+class TableParameterGroup(ParameterGroup):
+    """A ParameterGroup backed by a ParameterTable."""
+
+    def __init__(self, name, category, block, table: ParameterTable):
+        super().__init__(name, category, block)
+        self.table = table
+
+    def __getattr__(self, name):
+        # Only called for names which are no regular attributes
+        try:
+            position = self.__dict__["table"].position(name)
+        except KeyError:
+            raise AttributeError(f"{self.__class__.__name__} {self.name} has no parameter {name}") from None
+        return TableParameter(self, position)
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self.table.names)
+
+    def parameters(self) -> list:
+        """Returns a list of all the parameters, sorted by index."""
+        return [TableParameter(self, i) for i in self.table.index_order]
+
+    def find(self, name: str):
+        """Returns the parameter with the given name, or None."""
+        try:
+            return TableParameter(self, self.table.position(name))
+        except KeyError:
+            return None
+
+    def by_index(self, index: int):
+        """Returns the parameter with the given index, or None."""
+        try:
+            return TableParameter(self, self.table.index_position(index))
+        except KeyError:
+            return None
+
+
+class TableParameter(Parameter):
+    """View of a parameter in a TableParameterGroup."""
+
+    def __init__(self, parent: TableParameterGroup, position: int):
+        self.parent = parent
+        self._position = position
+
+    @property
+    def name(self):
+        return self.parent.table.names[self._position]
+
+    @property
+    def index(self):
+        return self.parent.table.indexes[self._position]
+
+    @property
+    def access(self):
+        return Parameter.Access(self.parent.table.access[self._position])
+
+    @property
+    def datatype(self):
+        return Parameter.Datatype(self.parent.table.datatypes[self._position])
+
+    @property
+    def choice(self):
+        # Like the generated parameters only parameters with options have a choice
+        if self.parent.table.options[self._position] is None:
+            raise AttributeError(f"Parameter {self.name} has no choice")
+        return TableParameterChoice(self)
+
+    @property
+    def fields(self):
+        fields = self.parent.table.fields[self._position]
+        if fields is None:
+            raise AttributeError(f"Parameter {self.name} has no fields")
+        return [Parameter.Field(self, name, mask, shift) for name, mask, shift in fields]
+
+    def __getattr__(self, name):
+        for field_name, mask, shift in self.parent.table.fields[self._position] or ():
+            if field_name == name:
+                return Parameter.Field(self, field_name, mask, shift)
+        raise AttributeError(f"Parameter {self.name} has no field {name}")
+
+    def __dir__(self):
+        return list(super().__dir__()) + [field[0] for field in self.parent.table.fields[self._position] or ()]
+
+    def __eq__(self, other):
+        return isinstance(other, TableParameter) and self.parent is other.parent and self._position == other._position
+
+    def __hash__(self):
+        return hash((id(self.parent), self._position))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.parent.name}.{self.name}>"
+
+
+class TableParameterChoice(Parameter.Choice):
+    """View of the options of a TableParameter."""
+
+    def __init__(self, parent: TableParameter):
+        self.parent = parent
+
+    def _options(self):
+        return self.parent.parent.table.options[self.parent._position]
+
+    def __getattr__(self, name):
+        for option_name, value in self._options():
+            if option_name == name:
+                return Parameter.Option(self.parent, value, option_name)
+        raise AttributeError(f"Parameter {self.parent.name} has no option {name}")
+
+    def __dir__(self):
+        return list(super().__dir__()) + [name for name, _ in self._options()]
+
+    def options(self):
+        return [Parameter.Option(self.parent, value, name) for name, value in self._options()]
+
+    def get(self, parameter_value):
+        """Extracts the choice value from a parameter value."""
+        try:
+            name, value = self.parent.parent.table.option(self.parent._position, parameter_value)
+        except KeyError:
+            raise IndexError(f"Unknown value {parameter_value} for choice parameter {self.parent.name}!") from None
+        return Parameter.Option(self.parent, value, name)
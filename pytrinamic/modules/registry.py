@@ -0,0 +1,64 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Map the module numbers reported by GET_FIRMWARE_VERSION to module classes.
+
+The classes are referenced by name and only imported when looked up.
+"""
+
+import importlib
+
+
+MODULE_CLASS_NAMES = {
+    160: "TMCC160",
+    1021: "TMCM1021",
+    1110: "TMCM1110",
+    1111: "TMCM1111",
+    1140: "TMCM1140",
+    1141: "TMCM1141",
+    1160: "TMCM1160",
+    1161: "TMCM1161",
+    1210: "TMCM1210",
+    1211: "TMCM1211",
+    1230: "TMCM123x_0_1",
+    1231: "TMCM123x_0_1",
+    1240: "TMCM1240",
+    1241: "TMCM1241",
+    1260: "TMCM1260",
+    1270: "TMCM1270",
+    1276: "TMCM1276",
+    1278: "TMCM1278",
+    1290: "TMCM1290",
+    1311: "TMCM1311",
+    1316: "TMCM1316",
+    1321: "TMCM1321",
+    1370: "TMCM1370",
+    1378: "TMCM1378",
+    1617: "TMCM1617",
+    1630: "TMCM1630",
+    1633: "TMCM1633",
+    1636: "TMCM1636",
+    1637: "TMCM1637",
+    1638: "TMCM1638",
+    1640: "TMCM1640",
+    1670: "TMCM1670",
+    1690: "TMCM1690",
+    2611: "TMCM2611",
+    3110: "TMCM3110",
+    3216: "TMCM3216",
+    3312: "TMCM3312",
+    3351: "TMCM3351",
+    6110: "TMCM6110",
+    6212: "TMCM6212",
+    6214: "TMCM6214",
+}
+
+
+def module_class(module_number):
+    """Return the class of the module with the given number, or None if there is no such class."""
+    name = MODULE_CLASS_NAMES.get(module_number)
+    if name is None:
+        return None
+    return getattr(importlib.import_module(f"pytrinamic.modules.{name}"), name)
@@ -0,0 +1,77 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Find the modules on a bus and identify them.
+
+Every module ID is probed with GET_FIRMWARE_VERSION in the binary format. On
+CAN every probe addresses a different module, so all probes are sent at once
+and the scan is over after a single timeout on a quiet bus. Other links are
+probed with their pipeline window, one ID after another on RS485.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from pytrinamic.tmcl import TMCLCommand, TMCLStatus
+from pytrinamic.modules.registry import module_class
+
+
+@dataclass
+class FoundModule:
+    module_id: int
+    module_number: int
+    firmware_version: Tuple[int, int]
+    """Major and minor version."""
+    module: Optional[object] = None
+    """An instance of the module class, None if the module number is unknown."""
+
+    @property
+    def name(self) -> str:
+        if self.module is not None:
+            return self.module.name
+        return f"Unknown module {self.module_number}"
+
+
+def scan(connection, module_ids: Iterable[int] = range(1, 256), *, timeout_s=0.02, window=None) -> List[FoundModule]:
+    """Probe the module IDs and return the responding modules.
+
+    :param timeout_s: The receive timeout during the scan, the timeout of the connection is restored afterwards.
+    :param window: Number of probes sent at once. Defaults to all probes on
+        CAN and to the pipeline window of the connection otherwise.
+    """
+    module_ids = list(module_ids)
+    if window is None:
+        window = len(module_ids) if _is_can(connection) else connection.get_pipeline_window()
+    requests = [connection.build_request(TMCLCommand.GET_FIRMWARE_VERSION, 1, 0, 0, module_id) for module_id in module_ids]
+
+    previous_timeout = connection.get_timeout() if hasattr(connection, "get_timeout") else None
+    if hasattr(connection, "set_timeout"):
+        connection.set_timeout(timeout_s)
+    try:
+        replies = connection.send_probes(requests, window=max(1, window))
+    finally:
+        if hasattr(connection, "set_timeout"):
+            connection.set_timeout(previous_timeout)
+
+    found = []
+    for module_id, reply in zip(module_ids, replies):
+        if reply is None or reply.status != TMCLStatus.SUCCESS:
+            continue
+        module_number = reply.value >> 16
+        cls = module_class(module_number)
+        found.append(FoundModule(
+            module_id=module_id,
+            module_number=module_number,
+            firmware_version=((reply.value >> 8) & 0xFF, reply.value & 0xFF),
+            module=cls(connection, module_id=module_id) if cls is not None else None,
+        ))
+    return found
+
+
+def _is_can(connection) -> bool:
+    # A CAN connection has loaded its module already, python-can is not imported otherwise.
+    can_tmcl_interface = sys.modules.get("pytrinamic.connections.can_tmcl_interface")
+    return can_tmcl_interface is not None and isinstance(connection, can_tmcl_interface.CanTmclInterface)
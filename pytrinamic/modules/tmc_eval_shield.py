@@ -6,6 +6,9 @@
 # This software is proprietary to Analog Devices, Inc. and its licensors.
 ################################################################################
 
+from pytrinamic.poller import wait_until
+
+
 class TmcEvalShield:
     """
     Arguments:
@@ -21,10 +24,10 @@ class TmcEvalShield:
     def __init__(self, connection, shield, module_id=1):
         self.shields = []
 
-        while not(connection.get_global_parameter(self.GP.AttachedAxes, 0, module_id)):
-            pass
-
-        attached_axes = connection.get_global_parameter(self.GP.AttachedAxes, 0, module_id)
+        attached_axes = wait_until(
+            lambda: connection.get_global_parameter(self.GP.AttachedAxes, 0, module_id),
+            description="attached axes",
+        )
         for i in range(attached_axes):
             self.shields.append(shield(connection, i, module_id))
 
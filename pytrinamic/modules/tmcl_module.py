@@ -10,6 +10,7 @@ import enum
 import inspect
 import warnings
 
+from types import MappingProxyType
 from typing import Optional, Union
 
 
@@ -170,6 +171,30 @@ class ParameterGroup:
         self.category = category
         self.block = block
 
+    def _index(self):
+        # The parameters are attributes of the derived classes, the index is built on first use.
+        index = self.__dict__.get("_parameter_index")
+        if index is None:
+            parameters = sorted([obj for obj in vars(self).values() if isinstance(obj, Parameter)], key=lambda x: x.index)
+            index = self._parameter_index = (
+                tuple(parameters),
+                MappingProxyType({parameter.name: parameter for parameter in parameters}),
+                MappingProxyType({parameter.index: parameter for parameter in reversed(parameters)}),
+            )
+        return index
+
+    def parameters(self) -> list:
+        """Returns a list of all the parameters, sorted by index."""
+        return list(self._index()[0])
+
+    def find(self, name: str):
+        """Returns the parameter with the given name, or None."""
+        return self._index()[1].get(name)
+
+    def by_index(self, index: int):
+        """Returns the parameter with the given index, or None."""
+        return self._index()[2].get(index)
+
 
 class Parameter:
 
@@ -190,23 +215,35 @@ class Parameter:
         def __init__(self, parent: "Parameter"):
             self.parent = parent
 
+        def _index(self):
+            # The options are attributes of the derived classes, the index is built on first use.
+            index = self.__dict__.get("_option_index")
+            if index is None:
+                options = [member for name, member in inspect.getmembers(self) if isinstance(member, Parameter.Option)]
+                index = self._option_index = (tuple(options), MappingProxyType({option.value: option for option in reversed(options)}))
+            return index
+
         def options(self):
-            return [member for name, member in inspect.getmembers(self) if isinstance(member, Parameter.Option)]
+            return list(self._index()[0])
 
         def get(self, parameter_value):
             """Extracts the choice value from a parameter value."""
             try:
-                return next(option for option in self.options() if option.value == parameter_value)
-            except StopIteration:
-                raise IndexError(f"Unknown value {parameter_value} for choice parameter {self.parent.name}!")
+                return self._index()[1][parameter_value]
+            except KeyError:
+                raise IndexError(f"Unknown value {parameter_value} for choice parameter {self.parent.name}!") from None
 
     class Option:
+        __slots__ = ("parent", "value", "name")
+
         def __init__(self, parent: "Parameter", value: int, name: str):
             self.parent = parent
             self.value = value
             self.name = name
 
     class Field:
+        __slots__ = ("parent", "name", "mask", "shift")
+
         def __init__(self, parent: "Parameter", name: str, mask: int, shift: int):
             self.parent = parent
             self.name = name
@@ -221,6 +258,12 @@ class Parameter:
             """Sets the field value in a parameter value."""
             return (parameter_value & ~self.mask) | ((new_field_value << self.shift) & self.mask)
 
+        def extract_array(self, parameter_values):
+            """Extracts the field values of many parameter values at once, see field_arrays.extract_field_array()."""
+            # Imported here, a module import should not load the IC package.
+            from ..ic.field_arrays import extract_field_array
+            return extract_field_array(parameter_values, self.mask, self.shift)
+
     def __init__(self, parent: ParameterGroup, name: str, index: int, access: "Parameter.Access", datatype: "Parameter.Datatype"):
         self.parent = parent
         self.name = name
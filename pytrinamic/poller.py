@@ -0,0 +1,139 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Polling a condition without saturating the link.
+
+Waiting for a device usually means sending the same request again and again.
+The Poller spaces these requests out: it starts with a short interval and backs
+off exponentially. If the expected duration of the operation is known, it
+sleeps most of that time before it starts polling. A deadline and a
+cancellation event end the wait early.
+
+Usage::
+
+    poller = Poller(timeout_s=5, expected_duration_s=0.5)
+    poller.wait_until(datalogger.is_done)
+
+    # Or within an asyncio event loop
+    await poller.wait_until_async(datalogger.is_done)
+"""
+
+from typing import Callable, Optional
+import asyncio
+import threading
+import time
+
+
+# Slice length of the pauses of wait_until_async(), bounds the reaction time to the cancel event.
+_CANCEL_CHECK_INTERVAL_S = 0.01
+
+
+class PollTimeoutError(TimeoutError):
+    pass
+
+
+class PollCancelledError(Exception):
+    pass
+
+
+class Poller:
+
+    def __init__(
+            self,
+            *,
+            timeout_s: Optional[float] = None,
+            initial_interval_s: float = 0.001,
+            max_interval_s: float = 0.1,
+            backoff: float = 2.0,
+            expected_duration_s: Optional[float] = None,
+            cancel_event: Optional[threading.Event] = None,
+        ):
+        """
+        :param timeout_s: Raise a PollTimeoutError if the condition is not met within this time. Wait forever if None.
+        :param initial_interval_s: The first pause between two polls.
+        :param max_interval_s: The pause between two polls never exceeds this value.
+        :param backoff: Factor the pause is multiplied with after every unsuccessful poll.
+        :param expected_duration_s: The expected time until the condition is met.
+            The poller closes in on this time with halving pauses before it backs off.
+        :param cancel_event: Raise a PollCancelledError as soon as this event is set.
+        """
+        if initial_interval_s <= 0 or max_interval_s < initial_interval_s:
+            raise ValueError("The intervals must be positive and `max_interval_s` must not be smaller than `initial_interval_s`!")
+        if backoff < 1:
+            raise ValueError("The `backoff` factor must be at least 1!")
+        self.timeout_s = timeout_s
+        self.initial_interval_s = initial_interval_s
+        self.max_interval_s = max_interval_s
+        self.backoff = backoff
+        self.expected_duration_s = expected_duration_s
+        self.cancel_event = cancel_event
+        self.poll_count = 0
+        """The number of times the condition was evaluated during the last wait."""
+
+    def wait_until(self, condition: Callable[[], object], *, description: str = "condition"):
+        """Evaluate `condition` until it returns a truthy value and return that value."""
+        intervals = self._intervals(description)
+        while True:
+            result = condition()
+            self.poll_count += 1
+            if result:
+                return result
+            pause_s = next(intervals)
+            if self.cancel_event is not None:
+                if self.cancel_event.wait(pause_s):
+                    raise PollCancelledError(f"Waiting for {description} was cancelled!")
+            else:
+                time.sleep(pause_s)
+
+    async def wait_until_async(self, condition: Callable[[], object], *, description: str = "condition"):
+        """Like wait_until(), but pauses with asyncio.sleep() and evaluates `condition` in a worker thread."""
+        intervals = self._intervals(description)
+        while True:
+            result = await asyncio.get_running_loop().run_in_executor(None, condition)
+            self.poll_count += 1
+            if result:
+                return result
+            pause_s = next(intervals)
+            if self.cancel_event is None:
+                await asyncio.sleep(pause_s)
+                continue
+            # Sleep in slices to notice the cancel event during long pauses.
+            wake_s = time.perf_counter() + pause_s
+            while True:
+                if self.cancel_event.is_set():
+                    raise PollCancelledError(f"Waiting for {description} was cancelled!")
+                remaining_s = wake_s - time.perf_counter()
+                if remaining_s <= 0:
+                    break
+                await asyncio.sleep(min(remaining_s, _CANCEL_CHECK_INTERVAL_S))
+
+    def _intervals(self, description):
+        """Start a wait: reset the poll count and return the generator of the pauses between polls."""
+        self.poll_count = 0
+        return self._pauses(time.perf_counter(), description)
+
+    def _pauses(self, start_s, description):
+        """Yield the pauses between polls, raise a PollTimeoutError once the deadline is reached."""
+        deadline_s = None if self.timeout_s is None else start_s + self.timeout_s
+        interval_s = self.initial_interval_s
+        while True:
+            now_s = time.perf_counter()
+            elapsed_s = now_s - start_s
+            if self.expected_duration_s is not None and elapsed_s < self.expected_duration_s:
+                # Close in on the expected completion time instead of polling early.
+                pause_s = max((self.expected_duration_s - elapsed_s)/2, self.initial_interval_s)
+            else:
+                pause_s = interval_s
+                interval_s = min(interval_s*self.backoff, self.max_interval_s)
+            if deadline_s is not None:
+                if now_s >= deadline_s:
+                    raise PollTimeoutError(f"Timeout after {self.timeout_s} s while waiting for {description}!")
+                pause_s = min(pause_s, deadline_s - now_s)
+            yield pause_s
+
+
+def wait_until(condition: Callable[[], object], *, description: str = "condition", **kwargs):
+    """Shorthand for Poller(**kwargs).wait_until(condition)."""
+    return Poller(**kwargs).wait_until(condition, description=description)
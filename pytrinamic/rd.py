@@ -8,6 +8,23 @@ from enum import IntEnum
 from pytrinamic.tmcl import TMCLCommand
 
 
+def build_column_decoder(mask: int = 0xFFFF_FFFF, shift: int = 0, signed: bool = False):
+    """Return a function that decodes a list of raw 32 bit samples of one channel.
+
+    The mask, shift and sign handling is resolved once here, the returned
+    function only runs a single list comprehension over the samples.
+    """
+    base_mask = mask >> shift
+    sign_mask = base_mask & (~base_mask >> 1) if signed else 0
+    if mask == 0xFFFF_FFFF and shift == 0:
+        if sign_mask:
+            return lambda samples: [(x ^ sign_mask) - sign_mask for x in samples]
+        return list
+    if sign_mask:
+        return lambda samples: [(((x & mask) >> shift) ^ sign_mask) - sign_mask for x in samples]
+    return lambda samples: [(x & mask) >> shift for x in samples]
+
+
 class Rd:
 
     class Channel(IntEnum):
@@ -79,8 +96,24 @@ class Rd:
         self._connection = connection
         self._module_id = module_id
 
+    @property
+    def connection(self):
+        return self._connection
+
+    @property
+    def module_id(self) -> int:
+        return self._module_id
+
     def _command(self, cmd_type: _Command, index: int, value: int) -> int:
         return self._connection.send(TMCLCommand.RAMDEBUG, cmd_type, index, value, self._module_id).value
+
+    def build_command(self, cmd_type: _Command, index: int, value: int):
+        """Create the TMCL request of a RAMDebug command without sending it."""
+        return self._connection.build_request(TMCLCommand.RAMDEBUG, cmd_type, index, value, self._module_id)
+
+    def send_commands(self, requests, *, window=None) -> list:
+        """Send RAMDebug requests created by build_command() pipelined and return the reply values."""
+        return [reply.value for reply in self._connection.send_requests(requests, window=window)]
     
     def get_state(self) -> int:
         return self._command(self._Command.GET_STATE, 0, 0)
@@ -90,6 +123,13 @@ class Rd:
     
     def get_sample(self, offset: int) -> int:
         return self._command(self._Command.GET_SAMPLE, 0, offset)
+
+    def build_get_sample(self, offset: int):
+        return self.build_command(self._Command.GET_SAMPLE, 0, offset)
+
+    def get_samples(self, offset: int, count: int, *, window=None) -> list:
+        """Download `count` consecutive samples starting at `offset` using pipelined requests."""
+        return self.send_commands([self.build_get_sample(i) for i in range(offset, offset+count)], window=window)
     
     def init(self) -> int:
         return self._command(self._Command.INIT, 0, 0)
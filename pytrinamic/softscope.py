@@ -0,0 +1,301 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Host-side fixed-rate sampling for devices without RAMDebug.
+
+The SoftScope polls a set of parameters, registers and fields from a sampler
+thread. On TMCL connections all reads of one sample are prepared once and sent
+as one pipelined batch. Each sample is timestamped with perf_counter_ns() and
+written into a preallocated ring buffer. The result is a DataLogger.Log, so
+tooling written for the DataLogger works with the SoftScope as well.
+
+Usage::
+
+    scope = SoftScope(my_interface, module_id=1)
+    scope.config.log_data = [module.ics[0].MCC.ADC_I1_I0_RAW.I0]
+    scope.config.samples_per_channel = 500
+    scope.config.rate_hz = 200
+    scope.start()
+    scope.wait_till_done()
+    log = scope.get_log()
+    print(scope.get_statistics())
+"""
+
+from __future__ import annotations
+from typing import Callable, List, Optional, Union
+from dataclasses import dataclass
+from array import array
+import threading
+import statistics
+import time
+
+from pytrinamic.connections.tmcl_interface import TmclInterface
+from pytrinamic.datalogger import DataLogger, DataLoggerConfigError
+from pytrinamic.modules.tmcl_module import ParameterGroup, Parameter
+from pytrinamic.ic.tmc_ic import RegisterApiDevice, Register, Field
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.helpers import to_signed_32
+
+
+class SoftScope:
+
+    @dataclass
+    class Config:
+        samples_per_channel: int = 0
+        log_data: Union[list, dict, None] = None
+        rate_hz: float = 100.0
+        continuous: bool = False
+        """If set, the oldest samples get overwritten until stop() is called."""
+        spin_s: float = 0.0
+        """Busy-wait up to this long before each sample for less jitter where sleep() is coarse, at the cost of a CPU core and the GIL.
+
+        At most a quarter of the period is spun. With 0 the sampler thread only sleeps."""
+
+    @dataclass
+    class Statistics:
+        sample_count: int
+        requested_rate_hz: float
+        achieved_rate_hz: float
+        mean_period_s: float
+        jitter_s: float
+        """Standard deviation of the sample period."""
+        max_deviation_s: float
+        """Largest deviation of a sample period from the requested period."""
+        overruns: int
+        """Number of sample slots skipped because a read took too long."""
+
+    @dataclass
+    class _Channel:
+        name: str
+        datatype: Optional[DataLogger.DataType]
+        request_object: object
+        reader: Optional[Callable[[], int]]
+
+    def __init__(
+            self,
+            connection,
+            module_id: int = 1,
+            *,
+            device=None,
+            ap_index_bit_width: Optional[int] = None,
+            register_address_bit_width: Optional[int] = None,
+        ):
+        """
+        :param connection: A TMCL interface or a direct IC interface like the UartIcInterface.
+        :param module_id: The module ID used for the TMCL reads.
+        :param device: Used for register reads if the connection is not a TMCL
+            interface, e.g. a TMC4671 object on an UartIcInterface.
+        :param ap_index_bit_width: Axis parameter index bit-width of the device.
+        :param register_address_bit_width: Register address bit-width of the device.
+        """
+        self._connection = connection
+        self._module_id = module_id
+        self._device = device
+        self._ap_index_bit_width = ap_index_bit_width
+        self._register_address_bit_width = register_address_bit_width
+        self.config = SoftScope.Config()
+        self._channels: List[SoftScope._Channel] = []
+        self._requests = []
+        self._timestamps_ns = array("q")
+        self._buffers: List[array] = []
+        self._write_index = 0
+        self._sample_count = 0
+        self._overruns = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._error = None
+
+    def start(self) -> None:
+        """Prepare the reads, allocate the ring buffer and start the sampler thread."""
+        if self.is_running():
+            raise RuntimeError("The SoftScope is already running!")
+        if self.config.samples_per_channel < 1:
+            raise DataLoggerConfigError("No samples per channel specified via `config.samples_per_channel`!")
+        if self.config.rate_hz <= 0:
+            raise DataLoggerConfigError("The `config.rate_hz` must be greater than 0!")
+        if self.config.spin_s < 0:
+            raise DataLoggerConfigError("The `config.spin_s` must not be negative!")
+        self._prepare()
+
+        capacity = self.config.samples_per_channel
+        self._timestamps_ns = array("q", bytes(8*capacity))
+        self._buffers = [array("q", bytes(8*capacity)) for _ in self._channels]
+        self._write_index = 0
+        self._sample_count = 0
+        self._overruns = 0
+        self._error = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SoftScope", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.wait_till_done()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_done(self) -> bool:
+        return not self.is_running()
+
+    def wait_till_done(self, timeout_s: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+        if self._error is not None:
+            raise self._error
+
+    def get_log(self) -> DataLogger.Log:
+        """Return the captured samples in the same structure as the DataLogger does."""
+        order = self._ordered_indices()
+        timestamps_ns = [self._timestamps_ns[i] for i in order]
+        start_ns = timestamps_ns[0] if timestamps_ns else 0
+        log = DataLogger.Log(
+            rate_hz=self.config.rate_hz,
+            period_s=1/self.config.rate_hz,
+            time_vector=[(t - start_ns)*1e-9 for t in timestamps_ns],
+            data={},
+        )
+        for channel, buffer in zip(self._channels, self._buffers):
+            samples = [buffer[i] for i in order]
+            if isinstance(channel.datatype, DataLogger.DataTypeField):
+                samples = [channel.datatype.get(sample) for sample in samples]
+            elif channel.datatype is not None and channel.datatype.signed:
+                samples = [to_signed_32(sample) for sample in samples]
+            log.data[channel.name] = DataLogger.LogData(samples=samples, request_object=channel.request_object)
+        return log
+
+    def get_statistics(self) -> SoftScope.Statistics:
+        order = self._ordered_indices()
+        timestamps_ns = [self._timestamps_ns[i] for i in order]
+        periods_s = [(b - a)*1e-9 for a, b in zip(timestamps_ns, timestamps_ns[1:])]
+        requested_period_s = 1/self.config.rate_hz
+        if periods_s:
+            mean_period_s = statistics.fmean(periods_s)
+            jitter_s = statistics.pstdev(periods_s)
+            max_deviation_s = max(abs(period - requested_period_s) for period in periods_s)
+        else:
+            mean_period_s = jitter_s = max_deviation_s = 0.0
+        return SoftScope.Statistics(
+            sample_count=len(timestamps_ns),
+            requested_rate_hz=self.config.rate_hz,
+            achieved_rate_hz=1/mean_period_s if mean_period_s else 0.0,
+            mean_period_s=mean_period_s,
+            jitter_s=jitter_s,
+            max_deviation_s=max_deviation_s,
+            overruns=self._overruns,
+        )
+
+    def _ordered_indices(self) -> list:
+        capacity = len(self._timestamps_ns)
+        if self._sample_count <= capacity:
+            return list(range(self._sample_count))
+        return [(self._write_index + i) % capacity for i in range(capacity)]
+
+    def _prepare(self) -> None:
+        if isinstance(self.config.log_data, list):
+            entries = []
+            for x in self.config.log_data:
+                name = f"{x.parent.name}.{x.name}" if isinstance(x, Field) else x.name
+                entries.append((name, self._transform_to_datatype(x), x))
+        elif isinstance(self.config.log_data, dict):
+            entries = [(name, x if isinstance(x, DataLogger.DataType) else None, x) for name, x in self.config.log_data.items()]
+        else:
+            raise DataLoggerConfigError("`config.log_data` must be a list or a dict!")
+
+        self._channels = []
+        self._requests = []
+        for name, datatype, request_object in entries:
+            if datatype is None:
+                if not callable(request_object):
+                    raise DataLoggerConfigError(f"Entry {name} must be a DataLogger.DataType or a callable!")
+                self._channels.append(SoftScope._Channel(name, None, request_object, request_object))
+            elif isinstance(self._connection, TmclInterface):
+                self._requests.append(self._build_request(datatype))
+                self._channels.append(SoftScope._Channel(name, datatype, request_object, None))
+            else:
+                self._channels.append(SoftScope._Channel(name, datatype, request_object, self._build_reader(datatype)))
+
+    def _build_request(self, datatype: DataLogger.DataType):
+        if isinstance(datatype, DataLogger.DataTypeAp):
+            return self._connection._build_ap_request(TMCLCommand.GAP, datatype.index, datatype.axis, 0, self._module_id, self._ap_index_bit_width)
+        elif isinstance(datatype, DataLogger.DataTypeGp):
+            return self._connection.build_request(TMCLCommand.GGP, datatype.index, datatype.bank, 0, self._module_id)
+        elif isinstance(datatype, (DataLogger.DataTypeRegister, DataLogger.DataTypeField)):
+            return self._connection.build_register_request(TMCLCommand.READ_MC, datatype.address, datatype.block, 0, self._module_id, self._register_address_bit_width)
+        else:
+            raise DataLoggerConfigError(f"The SoftScope cannot sample {type(datatype).__name__}!")
+
+    def _build_reader(self, datatype: DataLogger.DataType) -> Callable[[], int]:
+        if not isinstance(datatype, (DataLogger.DataTypeRegister, DataLogger.DataTypeField)):
+            raise DataLoggerConfigError("Only registers and fields can be sampled without a TMCL connection!")
+        if self._device is None:
+            raise DataLoggerConfigError("A `device` is needed to read registers without a TMCL connection!")
+        address = datatype.address
+        if isinstance(self._device, RegisterApiDevice):
+            block = datatype.block
+            return lambda: self._device.read_register(address, block)
+        return lambda: self._device.read_register(address)
+
+    def _transform_to_datatype(self, x: Union[Parameter, Register, Field]) -> DataLogger.DataType:
+        if isinstance(x, Parameter):
+            if x.category == ParameterGroup.Category.AXIS:
+                return DataLogger.DataTypeAp.from_parameter(x)
+            elif x.category == ParameterGroup.Category.GLOBAL:
+                return DataLogger.DataTypeGp.from_parameter(x)
+            else:
+                raise DataLoggerConfigError("Parameter object must be of category AXIS or GLOBAL!")
+        elif isinstance(x, Register):
+            return DataLogger.DataTypeRegister.from_register(x)
+        elif isinstance(x, Field):
+            return DataLogger.DataTypeField.from_field(x)
+        else:
+            raise DataLoggerConfigError("Only Parameter, Register or Field objects can be sampled!")
+
+    def _sample(self) -> List[int]:
+        values = []
+        if self._requests:
+            replies = self._connection.send_requests(self._requests)
+            values = [reply.value for reply in replies]
+        # Merge the pipelined values and the values of the custom readers in channel order.
+        merged = []
+        pipelined = iter(values)
+        for channel in self._channels:
+            merged.append(channel.reader() if channel.reader else next(pipelined))
+        return merged
+
+    def _run(self) -> None:
+        period_ns = round(1e9/self.config.rate_hz)
+        capacity = len(self._timestamps_ns)
+        spin_ns = min(period_ns//4, round(self.config.spin_s*1e9))
+        deadline_ns = time.perf_counter_ns()
+        try:
+            while not self._stop_event.is_set():
+                now_ns = time.perf_counter_ns()
+                if deadline_ns - now_ns > spin_ns:
+                    time.sleep((deadline_ns - now_ns - spin_ns)*1e-9)
+                if spin_ns:
+                    while time.perf_counter_ns() < deadline_ns:
+                        pass
+
+                timestamp_ns = time.perf_counter_ns()
+                values = self._sample()
+                index = self._write_index
+                self._timestamps_ns[index] = timestamp_ns
+                for buffer, value in zip(self._buffers, values):
+                    buffer[index] = value
+                self._write_index = (index + 1) % capacity
+                self._sample_count += 1
+                if self._sample_count >= capacity and not self.config.continuous:
+                    break
+
+                deadline_ns += period_ns
+                now_ns = time.perf_counter_ns()
+                if now_ns > deadline_ns:
+                    # Skip the slots we missed instead of bursting to catch up.
+                    missed = (now_ns - deadline_ns)//period_ns + 1
+                    self._overruns += missed
+                    deadline_ns += missed*period_ns
+        except Exception as e:
+            self._error = e
@@ -0,0 +1,6 @@
+from .program import Instruction, Program
+from .binary import assemble, disassemble, load, save
+from .loader import ProgramLoader, ProgramVerifyError
+from .sequence import Sequence, SequenceError, Label
+from .constants import MoveType, WaitType, CalcOperation, JumpCondition, IoBank, ApplicationState
+from .interpreter import Interpreter, VirtualModule, RunReport, check_jumps, InterpreterError, BadJumpError, EndlessLoopError, UnsupportedInstructionError
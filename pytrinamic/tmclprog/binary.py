@@ -0,0 +1,49 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""The binary program format of the TMCL-IDE and TMCLAsm.
+
+Every instruction takes 8 bytes: opcode, type, motor/bank, the value as 32 bit
+big-endian integer and a checksum byte (sum of the first 7 bytes). The checksum
+byte is not checked when reading, some tools write 0 there.
+"""
+
+import struct
+
+from pytrinamic.tmclprog.program import Instruction, Program
+
+
+INSTRUCTION_SIZE = 8
+_INSTRUCTION_STRUCTURE = struct.Struct(">BBBIB")
+
+
+def assemble(program: Program) -> bytes:
+    """Return the binary representation of the program."""
+    data = bytearray()
+    for instruction in program:
+        raw = _INSTRUCTION_STRUCTURE.pack(instruction.opcode, instruction.type, instruction.motor, instruction.value & 0xFFFF_FFFF, 0)
+        data += raw[:-1]
+        data.append(sum(raw[:-1]) & 0xFF)
+    return bytes(data)
+
+
+def disassemble(data: bytes) -> Program:
+    """Create a program from its binary representation."""
+    if len(data) % INSTRUCTION_SIZE:
+        raise ValueError(f"The length of a TMCL binary must be a multiple of {INSTRUCTION_SIZE} bytes!")
+    return Program(
+        Instruction(opcode, command_type, motor, value)
+        for opcode, command_type, motor, value, _ in _INSTRUCTION_STRUCTURE.iter_unpack(data)
+    )
+
+
+def load(path) -> Program:
+    with open(path, "rb") as f:
+        return disassemble(f.read())
+
+
+def save(program: Program, path) -> None:
+    with open(path, "wb") as f:
+        f.write(assemble(program))
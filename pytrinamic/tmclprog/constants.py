@@ -0,0 +1,71 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Type values of the TMCL instructions used in standalone programs."""
+
+from enum import IntEnum
+
+
+class MoveType(IntEnum):
+    ABS = 0
+    REL = 1
+    COORD = 2
+
+
+class WaitType(IntEnum):
+    TICKS = 0
+    POS = 1
+    REFSW = 2
+    LIMSW = 3
+    RFS = 4
+
+
+class CalcOperation(IntEnum):
+    ADD = 0
+    SUB = 1
+    MUL = 2
+    DIV = 3
+    MOD = 4
+    AND = 5
+    OR = 6
+    XOR = 7
+    NOT = 8
+    LOAD = 9
+
+
+class JumpCondition(IntEnum):
+    ZE = 0
+    NZ = 1
+    EQ = 2
+    NE = 3
+    GT = 4
+    GE = 5
+    LT = 6
+    LE = 7
+    ETO = 8
+    EAL = 9
+    EDV = 12
+    EPO = 13
+    ESD = 14
+
+
+class IoBank(IntEnum):
+    DIGITAL_INPUTS = 0
+    ANALOG_INPUTS = 1
+    DIGITAL_OUTPUTS = 2
+
+
+class ApplicationState(IntEnum):
+    STOPPED = 0
+    RUNNING = 1
+    STEP = 2
+    RESET = 3
+
+
+USER_VARIABLE_BANK = 2
+"""Global parameter bank of the user variables."""
+
+TICK_S = 0.01
+"""Duration of a WAIT TICKS tick."""
@@ -0,0 +1,536 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Run TMCL programs on the host against a virtual module.
+
+The interpreter executes the program step by step in simulated time, far
+faster than real time, and reports instruction counts, branch coverage and
+the predicted run and wait time. Endless loops and bad jumps are reported as
+exceptions, so programs can be checked in CI without hardware::
+
+    report = Interpreter(program, max_time_s=60).run()
+    print(report.instruction_count, report.wait_time_s, report.branch_coverage)
+
+The virtual module moves its axes with constant velocity, without
+acceleration ramps, in position units per second. Predicted times are
+therefore lower bounds. Instructions themselves take no time, except in a
+loop polling a moving axis: when such a loop comes back to the same state,
+the simulated time advances by one tick, or up to the arrival of the axis.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import math
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.helpers import to_signed_32
+from pytrinamic.tmclprog.program import Program
+from pytrinamic.tmclprog.constants import MoveType, WaitType, CalcOperation, JumpCondition, IoBank, TICK_S
+
+
+class InterpreterError(Exception):
+    def __init__(self, message, index=None):
+        self.index = index
+        if index is not None:
+            message = f"Instruction {index}: {message}"
+        super().__init__(message)
+
+
+class BadJumpError(InterpreterError):
+    pass
+
+
+class EndlessLoopError(InterpreterError):
+    pass
+
+
+class UnsupportedInstructionError(InterpreterError):
+    pass
+
+
+class VirtualAxis:
+    """Constant velocity motion model of one axis."""
+
+    def __init__(self, max_velocity):
+        self.max_velocity = max_velocity
+        self.target_position = 0
+        self.target_velocity = 0
+        self._position = 0
+        self._time_s = 0.0
+        self._velocity = 0
+        self._arrival_s = 0.0
+
+    def _rebase(self, time_s):
+        self._position = self.actual_position(time_s)
+        self._time_s = time_s
+        if self._velocity and self.target_velocity == 0 and time_s >= self._arrival_s:
+            self._velocity = 0
+
+    def actual_position(self, time_s) -> int:
+        elapsed = time_s - self._time_s
+        if self.target_velocity:
+            return to_signed_32(self._position + round(self._velocity * elapsed))
+        if time_s >= self._arrival_s:
+            return self.target_position if self._velocity else self._position
+        return self._position + round(self._velocity * elapsed)
+
+    def actual_velocity(self, time_s) -> int:
+        if self.target_velocity or time_s < self._arrival_s:
+            return self._velocity
+        return 0
+
+    def arrival_time_s(self) -> float:
+        """The time the target position is reached, infinite in velocity mode or without velocity."""
+        if self.target_velocity:
+            return math.inf
+        return self._arrival_s
+
+    def move_to(self, position, time_s):
+        self._rebase(time_s)
+        self.target_velocity = 0
+        self.target_position = to_signed_32(position)
+        distance = self.target_position - self._position
+        if distance == 0:
+            self._velocity = 0
+            self._arrival_s = time_s
+        elif self.max_velocity == 0:
+            self._velocity = 0
+            self._arrival_s = math.inf
+        else:
+            self._velocity = math.copysign(self.max_velocity, distance)
+            self._arrival_s = time_s + abs(distance) / self.max_velocity
+
+    def rotate(self, velocity, time_s):
+        self._rebase(time_s)
+        self.target_velocity = velocity
+        self._velocity = velocity
+        if velocity == 0:
+            self.target_position = self._position
+            self._arrival_s = time_s
+
+    def set_actual_position(self, position, time_s):
+        self._rebase(time_s)
+        self._position = to_signed_32(position)
+        if not self.target_velocity:
+            # Setting the position ends a positioning, the axis stays where it is.
+            self.target_position = self._position
+            self._velocity = 0
+            self._arrival_s = time_s
+
+    def set_max_velocity(self, velocity, time_s):
+        self._rebase(time_s)
+        self.max_velocity = abs(velocity)
+        if not self.target_velocity:
+            self.move_to(self.target_position, time_s)
+
+
+class VirtualModule:
+    """The state a TMCL program can see: axis and global parameters, inputs and outputs.
+
+    Axis parameters 0 to 4 and 8 (target/actual position and velocity,
+    maximum velocity, position reached) follow the motion model, all other
+    parameters are plain storage.
+    """
+
+    TARGET_POSITION = 0
+    ACTUAL_POSITION = 1
+    TARGET_VELOCITY = 2
+    ACTUAL_VELOCITY = 3
+    MAX_VELOCITY = 4
+    POSITION_REACHED = 8
+
+    def __init__(self, *, max_velocity=51200, inputs=None):
+        """
+        :param max_velocity: The initial maximum velocity of all axes.
+        :param inputs: Input values by (bank, port).
+        """
+        self._default_max_velocity = max_velocity
+        self.axes: Dict[int, VirtualAxis] = {}
+        self.axis_parameters: Dict[Tuple[int, int], int] = {}
+        self.global_parameters: Dict[Tuple[int, int], int] = {}
+        self.inputs: Dict[Tuple[int, int], int] = dict(inputs or {})
+        self.outputs: Dict[int, int] = {}
+        self.time_s = 0.0
+
+    def axis(self, axis) -> VirtualAxis:
+        if axis not in self.axes:
+            self.axes[axis] = VirtualAxis(self._default_max_velocity)
+        return self.axes[axis]
+
+    def get_axis_parameter(self, index, axis) -> int:
+        motion = self.axis(axis)
+        if index == self.TARGET_POSITION:
+            return motion.target_position
+        if index == self.ACTUAL_POSITION:
+            return motion.actual_position(self.time_s)
+        if index == self.TARGET_VELOCITY:
+            return motion.target_velocity
+        if index == self.ACTUAL_VELOCITY:
+            return motion.actual_velocity(self.time_s)
+        if index == self.MAX_VELOCITY:
+            return motion.max_velocity
+        if index == self.POSITION_REACHED:
+            return int(self.time_s >= motion.arrival_time_s())
+        return self.axis_parameters.get((axis, index), 0)
+
+    def set_axis_parameter(self, index, axis, value):
+        motion = self.axis(axis)
+        if index == self.TARGET_POSITION:
+            motion.move_to(value, self.time_s)
+        elif index == self.ACTUAL_POSITION:
+            motion.set_actual_position(value, self.time_s)
+        elif index == self.TARGET_VELOCITY:
+            motion.rotate(value, self.time_s)
+        elif index == self.MAX_VELOCITY:
+            motion.set_max_velocity(value, self.time_s)
+        else:
+            self.axis_parameters[(axis, index)] = value
+
+    def get_global_parameter(self, index, bank) -> int:
+        return self.global_parameters.get((bank, index), 0)
+
+    def set_global_parameter(self, index, bank, value):
+        self.global_parameters[(bank, index)] = value
+
+    def get_io(self, port, bank) -> int:
+        if bank == IoBank.DIGITAL_OUTPUTS:
+            return self.outputs.get(port, 0)
+        return self.inputs.get((bank, port), 0)
+
+    def snapshot(self) -> tuple:
+        """A hashable view of the state, used to detect loops without progress."""
+        axes = tuple(sorted(
+            (index, axis.target_position, axis.target_velocity, axis.max_velocity, axis.actual_position(self.time_s))
+            for index, axis in self.axes.items()
+        ))
+        return (
+            self.time_s,
+            axes,
+            tuple(sorted(self.axis_parameters.items())),
+            tuple(sorted(self.global_parameters.items())),
+            tuple(sorted(self.outputs.items())),
+        )
+
+
+@dataclass
+class RunReport:
+    program_length: int
+    instruction_count: int = 0
+    """The number of executed instructions."""
+    instruction_counts: List[int] = field(default_factory=list)
+    """Execution count per instruction index."""
+    branch_outcomes: Dict[int, Set[bool]] = field(default_factory=dict)
+    """The seen outcomes (taken or not) per conditional jump index."""
+    time_s: float = 0.0
+    """The predicted run time."""
+    wait_time_s: float = 0.0
+    """The predicted time spent in WAIT instructions."""
+    stopped: bool = False
+    """The program ended with a STOP instruction, otherwise the time limit was reached."""
+
+    @property
+    def coverage(self) -> float:
+        """The share of instructions executed at least once."""
+        if not self.program_length:
+            return 1.0
+        return sum(1 for count in self.instruction_counts if count) / self.program_length
+
+    @property
+    def branch_coverage(self) -> float:
+        """The share of seen outcomes of all conditional jumps, each jump has two."""
+        if not self.branch_outcomes:
+            return 1.0
+        return sum(len(outcomes) for outcomes in self.branch_outcomes.values()) / (2 * len(self.branch_outcomes))
+
+    def unexecuted(self) -> List[int]:
+        return [index for index, count in enumerate(self.instruction_counts) if not count]
+
+
+def check_jumps(program: Program) -> None:
+    """Check the targets of all jumps and subroutine calls, executed or not.
+
+    :raises BadJumpError: On the first target outside of the program.
+    """
+    for index, instruction in enumerate(program):
+        if instruction.opcode in (TMCLCommand.JA, TMCLCommand.JC, TMCLCommand.CSUB):
+            if not 0 <= instruction.value < len(program):
+                raise BadJumpError(f"Jump target {instruction.value} is outside of the program", index)
+
+
+class Interpreter:
+
+    _CONDITIONS = {
+        JumpCondition.ZE: lambda c: c == 0,
+        JumpCondition.EQ: lambda c: c == 0,
+        JumpCondition.NZ: lambda c: c != 0,
+        JumpCondition.NE: lambda c: c != 0,
+        JumpCondition.GT: lambda c: c > 0,
+        JumpCondition.GE: lambda c: c >= 0,
+        JumpCondition.LT: lambda c: c < 0,
+        JumpCondition.LE: lambda c: c <= 0,
+    }
+    _ERROR_FLAGS = (JumpCondition.ETO, JumpCondition.EAL, JumpCondition.EDV, JumpCondition.EPO, JumpCondition.ESD)
+    _NO_OPERATION = (
+        TMCLCommand.STAP, TMCLCommand.RSAP, TMCLCommand.STGP, TMCLCommand.RSGP,
+        TMCLCommand.EI, TMCLCommand.DI, TMCLCommand.VECT,
+    )
+    # Loops with a longer period than this are only ended by max_steps.
+    _MAX_SEEN_STATES = 100_000
+
+    def __init__(self, program: Program, module: Optional[VirtualModule] = None, *, max_steps=1_000_000, max_time_s=None, max_call_depth=8):
+        """
+        :param max_steps: Raise an EndlessLoopError after this many instructions.
+        :param max_time_s: End the run when the simulated time reaches this limit, for programs that loop forever on purpose.
+        :param max_call_depth: The depth of the subroutine stack.
+        """
+        self.program = program
+        self.module = module or VirtualModule()
+        self.max_steps = max_steps
+        self.max_time_s = max_time_s
+        self.max_call_depth = max_call_depth
+        self.pc = 0
+        self.accumulator = 0
+        self.x_register = 0
+        self.comparison = 0
+        self.error_flags: Set[JumpCondition] = set()
+        self.call_stack: List[int] = []
+        self._handlers = {
+            TMCLCommand.ROR: self._ror,
+            TMCLCommand.ROL: self._rol,
+            TMCLCommand.MST: self._mst,
+            TMCLCommand.MVP: self._mvp,
+            TMCLCommand.SAP: self._sap,
+            TMCLCommand.GAP: self._gap,
+            TMCLCommand.AAP: self._aap,
+            TMCLCommand.SGP: self._sgp,
+            TMCLCommand.GGP: self._ggp,
+            TMCLCommand.AGP: self._agp,
+            TMCLCommand.SIO: self._sio,
+            TMCLCommand.GIO: self._gio,
+            TMCLCommand.CALC: self._calc,
+            TMCLCommand.CALCX: self._calcx,
+            TMCLCommand.COMP: self._comp,
+            TMCLCommand.JC: self._jc,
+            TMCLCommand.JA: self._ja,
+            TMCLCommand.CSUB: self._csub,
+            TMCLCommand.RSUB: self._rsub,
+            TMCLCommand.WAIT: self._wait,
+            TMCLCommand.CLE: self._cle,
+        }
+        self.report = RunReport(len(program), instruction_counts=[0] * len(program))
+
+    def run(self) -> RunReport:
+        """Run the program until it stops or the time limit is reached.
+
+        :raises BadJumpError: On a jump outside of the program, or when running past its end.
+        :raises EndlessLoopError: When the state repeats or the step limit is reached.
+        """
+        seen_states = set()
+        seen_time_s = self.module.time_s
+        report = self.report
+        while True:
+            if self.max_time_s is not None and self.module.time_s >= self.max_time_s:
+                break
+            if not 0 <= self.pc < len(self.program):
+                raise BadJumpError("The program ran past its end without STOP", self.pc)
+            if report.instruction_count >= self.max_steps:
+                raise EndlessLoopError(f"No STOP within {self.max_steps} instructions", self.pc)
+
+            index = self.pc
+            instruction = self.program[index]
+            report.instruction_count += 1
+            report.instruction_counts[index] += 1
+            if instruction.opcode == TMCLCommand.STOP:
+                report.stopped = True
+                break
+            self.pc += 1
+            handler = self._handlers.get(instruction.opcode)
+            if handler is not None:
+                handler(instruction, index)
+            elif instruction.opcode not in self._NO_OPERATION:
+                raise UnsupportedInstructionError(f"{instruction.mnemonic} is not supported by the interpreter", index)
+
+            # A jump back into a state already seen can never make progress,
+            # unless an axis is moving. States from before the time advanced never repeat.
+            if self.pc <= index:
+                if self.module.time_s != seen_time_s or len(seen_states) >= self._MAX_SEEN_STATES:
+                    seen_states.clear()
+                    seen_time_s = self.module.time_s
+                state = (self.pc, self.accumulator, self.x_register, self.comparison, frozenset(self.error_flags), tuple(self.call_stack), self.module.snapshot())
+                if state in seen_states:
+                    if not self._poll_step():
+                        raise EndlessLoopError("Endless loop, the state repeats without progress", index)
+                else:
+                    seen_states.add(state)
+
+        report.time_s = self.module.time_s
+        return report
+
+    def _jump(self, target, index):
+        if not 0 <= target < len(self.program):
+            raise BadJumpError(f"Jump target {target} is outside of the program", index)
+        self.pc = target
+
+    def _load(self, value):
+        self.accumulator = to_signed_32(value)
+
+    def _advance(self, duration_s):
+        self.module.time_s += duration_s
+        self.report.wait_time_s += duration_s
+
+    def _poll_step(self) -> bool:
+        """Let one tick pass while the program polls, at most up to the next arrival.
+
+        Returns False if no axis moves, then polling can never see a change.
+        """
+        time_s = self.module.time_s
+        arrivals = [axis.arrival_time_s() for axis in self.module.axes.values() if axis.actual_velocity(time_s)]
+        if not arrivals:
+            return False
+        self.module.time_s = min(min(arrivals), time_s + TICK_S)
+        return True
+
+    # Motion
+
+    def _ror(self, instruction, index):
+        self.module.axis(instruction.motor).rotate(instruction.value, self.module.time_s)
+
+    def _rol(self, instruction, index):
+        self.module.axis(instruction.motor).rotate(-instruction.value, self.module.time_s)
+
+    def _mst(self, instruction, index):
+        self.module.axis(instruction.motor).rotate(0, self.module.time_s)
+
+    def _mvp(self, instruction, index):
+        axis = self.module.axis(instruction.motor)
+        if instruction.type == MoveType.ABS:
+            axis.move_to(instruction.value, self.module.time_s)
+        elif instruction.type == MoveType.REL:
+            axis.move_to(axis.actual_position(self.module.time_s) + instruction.value, self.module.time_s)
+        else:
+            raise UnsupportedInstructionError("MVP COORD is not supported by the interpreter", index)
+
+    # Parameters and I/O
+
+    def _sap(self, instruction, index):
+        self.module.set_axis_parameter(instruction.type, instruction.motor, instruction.value)
+
+    def _gap(self, instruction, index):
+        self._load(self.module.get_axis_parameter(instruction.type, instruction.motor))
+
+    def _aap(self, instruction, index):
+        self.module.set_axis_parameter(instruction.type, instruction.motor, self.accumulator)
+
+    def _sgp(self, instruction, index):
+        self.module.set_global_parameter(instruction.type, instruction.motor, instruction.value)
+
+    def _ggp(self, instruction, index):
+        self._load(self.module.get_global_parameter(instruction.type, instruction.motor))
+
+    def _agp(self, instruction, index):
+        self.module.set_global_parameter(instruction.type, instruction.motor, self.accumulator)
+
+    def _sio(self, instruction, index):
+        if instruction.motor != IoBank.DIGITAL_OUTPUTS:
+            raise InterpreterError(f"SIO to bank {instruction.motor}, only the digital outputs can be set", index)
+        self.module.outputs[instruction.type] = instruction.value
+
+    def _gio(self, instruction, index):
+        self._load(self.module.get_io(instruction.type, instruction.motor))
+
+    # Arithmetic
+
+    @staticmethod
+    def _arithmetic(operation, a, b, index):
+        if operation == CalcOperation.ADD:
+            return a + b
+        if operation == CalcOperation.SUB:
+            return a - b
+        if operation == CalcOperation.MUL:
+            return a * b
+        if operation in (CalcOperation.DIV, CalcOperation.MOD):
+            if b == 0:
+                raise InterpreterError("Division by zero", index)
+            quotient = int(a / b)
+            return quotient if operation == CalcOperation.DIV else a - quotient * b
+        if operation == CalcOperation.AND:
+            return a & b
+        if operation == CalcOperation.OR:
+            return a | b
+        if operation == CalcOperation.XOR:
+            return a ^ b
+        if operation == CalcOperation.NOT:
+            return ~a
+        if operation == CalcOperation.LOAD:
+            return b
+        raise UnsupportedInstructionError(f"Unknown operation {operation}", index)
+
+    def _calc(self, instruction, index):
+        self._load(self._arithmetic(instruction.type, self.accumulator, instruction.value, index))
+        self.comparison = self.accumulator
+
+    def _calcx(self, instruction, index):
+        if instruction.type == CalcOperation.LOAD:
+            # Load the X register into the accumulator.
+            self._load(self.x_register)
+        elif instruction.type == 10:
+            # Swap accumulator and X register.
+            self.accumulator, self.x_register = self.x_register, self.accumulator
+        else:
+            self._load(self._arithmetic(instruction.type, self.accumulator, self.x_register, index))
+        self.comparison = self.accumulator
+
+    def _comp(self, instruction, index):
+        self.comparison = self.accumulator - instruction.value
+
+    # Control flow
+
+    def _jc(self, instruction, index):
+        condition = instruction.type
+        if condition in self._CONDITIONS:
+            taken = self._CONDITIONS[condition](self.comparison)
+        elif condition in self._ERROR_FLAGS:
+            taken = condition in self.error_flags
+        else:
+            raise UnsupportedInstructionError(f"Unknown jump condition {condition}", index)
+        self.report.branch_outcomes.setdefault(index, set()).add(taken)
+        if taken:
+            self._jump(instruction.value, index)
+
+    def _ja(self, instruction, index):
+        self._jump(instruction.value, index)
+
+    def _csub(self, instruction, index):
+        if len(self.call_stack) >= self.max_call_depth:
+            raise InterpreterError(f"Subroutine calls nested deeper than {self.max_call_depth}", index)
+        self.call_stack.append(self.pc)
+        self._jump(instruction.value, index)
+
+    def _rsub(self, instruction, index):
+        if not self.call_stack:
+            raise InterpreterError("RSUB without CSUB", index)
+        self.pc = self.call_stack.pop()
+
+    def _cle(self, instruction, index):
+        # All flags are cleared, the model only ever sets ETO.
+        self.error_flags.clear()
+
+    def _wait(self, instruction, index):
+        timeout_s = instruction.value * TICK_S
+        if instruction.type == WaitType.TICKS:
+            self._advance(timeout_s)
+        elif instruction.type == WaitType.POS:
+            arrival_s = self.module.axis(instruction.motor).arrival_time_s()
+            remaining_s = max(0.0, arrival_s - self.module.time_s)
+            if instruction.value and remaining_s > timeout_s:
+                self._advance(timeout_s)
+                self.error_flags.add(JumpCondition.ETO)
+            elif math.isinf(remaining_s):
+                raise EndlessLoopError(f"WAIT POS on axis {instruction.motor} which never reaches its target", index)
+            else:
+                self._advance(remaining_s)
+        else:
+            raise UnsupportedInstructionError(f"WAIT type {instruction.type} is not supported by the interpreter", index)
@@ -0,0 +1,122 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+from typing import List, Tuple
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.helpers import to_signed_32
+from pytrinamic.tmclprog.program import Program
+from pytrinamic.tmclprog.constants import ApplicationState
+from pytrinamic.poller import Poller
+
+
+class ProgramVerifyError(Exception):
+    def __init__(self, index, expected, actual):
+        self.index = index
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f"Program verification failed at instruction {index}: expected {expected}, read back {actual}")
+
+
+class ProgramLoader:
+    """Download TMCL programs to the standalone memory of a module.
+
+    The instructions are streamed pipelined inside START_DOWNLOAD_MODE and
+    QUIT_DOWNLOAD_MODE and verified by reading the memory back.
+    """
+
+    def __init__(self, connection, module_id=None):
+        self._connection = connection
+        self._module_id = module_id
+
+    def _request(self, opcode, op_type=0, motor=0, value=0):
+        return self._connection.build_request(opcode, op_type, motor, value, self._module_id)
+
+    def download(self, program: Program, *, verify=True, skip_if_matching=True) -> bool:
+        """Download the program, return False if the download was skipped.
+
+        :param skip_if_matching: Read the memory first and skip the download if it already holds the program.
+        :raises ProgramVerifyError: When the read back does not match the program.
+        """
+        if skip_if_matching and len(program) and self.matches(program):
+            return False
+
+        self._connection.send(TMCLCommand.START_DOWNLOAD_MODE, 0, 0, 0, self._module_id)
+        try:
+            self._connection.send_requests(
+                [self._request(instruction.opcode, instruction.type, instruction.motor, instruction.value) for instruction in program]
+            )
+        finally:
+            self._connection.send(TMCLCommand.QUIT_DOWNLOAD_MODE, 0, 0, 0, self._module_id)
+
+        if verify:
+            self.verify(program)
+        return True
+
+    def read_memory(self, length: int) -> List[Tuple[int, int, int]]:
+        """Read `length` instructions from the start of the program memory.
+
+        Returns (opcode, type, value) per instruction, see _instruction_from_memory_reply().
+        """
+        replies = self._connection.send_requests(
+            [self._request(TMCLCommand.READ_TMCL_MEMORY, 0, 0, address) for address in range(length)]
+        )
+        return [self._instruction_from_memory_reply(reply) for reply in replies]
+
+    @staticmethod
+    def _instruction_from_memory_reply(reply):
+        """Extract the stored instruction from a READ_TMCL_MEMORY reply.
+
+        The module answers with the opcode in the status byte, the type in the
+        command byte and the value in the value field. The motor/bank byte is
+        not part of the reply and therefore can not be compared.
+        """
+        return reply.status, reply.command, to_signed_32(reply.value)
+
+    def _mismatch(self, program: Program):
+        """Return the index of the first differing instruction and the read back data, or None."""
+        stored = self.read_memory(len(program))
+        for index, (instruction, actual) in enumerate(zip(program, stored)):
+            if (instruction.opcode, instruction.type, instruction.value) != actual:
+                return index, actual
+        return None
+
+    def matches(self, program: Program) -> bool:
+        """Check whether the module memory already holds the program."""
+        return self._mismatch(program) is None
+
+    def verify(self, program: Program) -> None:
+        mismatch = self._mismatch(program)
+        if mismatch is not None:
+            index, actual = mismatch
+            raise ProgramVerifyError(index, program[index], actual)
+
+    def run(self, address=None):
+        """Start the program, from the given instruction index or where it was stopped."""
+        if address is None:
+            self._connection.send(TMCLCommand.RUN_APPLICATION, 0, 0, 0, self._module_id)
+        else:
+            self._connection.send(TMCLCommand.RUN_APPLICATION, 1, 0, address, self._module_id)
+
+    def stop(self):
+        self._connection.send(TMCLCommand.STOP_APPLICATION, 0, 0, 0, self._module_id)
+
+    def reset(self):
+        self._connection.send(TMCLCommand.RESET_APPLICATION, 0, 0, 0, self._module_id)
+
+    def application_state(self) -> ApplicationState:
+        """Return the state of the standalone application, it is in the lowest byte of the reply value."""
+        reply = self._connection.send(TMCLCommand.GET_APPLICATION_STATUS, 0, 0, 0, self._module_id)
+        return ApplicationState(reply.value & 0xFF)
+
+    def wait_until_stopped(self, timeout_s=None, **poller_kwargs) -> None:
+        """Poll the application state until the program has stopped, e.g. by a STOP instruction.
+
+        :param poller_kwargs: Passed on to the Poller, e.g. expected_duration_s or cancel_event.
+        """
+        Poller(timeout_s=timeout_s, max_interval_s=0.05, **poller_kwargs).wait_until(
+            lambda: self.application_state() == ApplicationState.STOPPED,
+            description="TMCL application stopped",
+        )
@@ -0,0 +1,68 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+from __future__ import annotations
+from typing import Iterable, List
+from dataclasses import dataclass
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.helpers import to_signed_32
+
+
+@dataclass(frozen=True)
+class Instruction:
+    """One TMCL instruction of a program, e.g. Instruction(TMCLCommand.ROR, 0, 0, 500).
+
+    The value is stored as signed 32 bit integer.
+    """
+    opcode: int
+    type: int = 0
+    motor: int = 0
+    value: int = 0
+
+    def __post_init__(self):
+        if not (0 <= self.opcode <= 255 and 0 <= self.type <= 255 and 0 <= self.motor <= 255):
+            raise ValueError(f"Opcode, type and motor must be between 0 and 255: {self.opcode}, {self.type}, {self.motor}")
+        object.__setattr__(self, "value", to_signed_32(self.value))
+
+    @property
+    def mnemonic(self) -> str:
+        return TMCLCommand.get_name(self.opcode)
+
+    def __str__(self):
+        return f"{self.mnemonic} {self.type}, {self.motor}, {self.value}"
+
+
+class Program:
+    """A TMCL program, a sequence of instructions.
+
+    Jump targets (JA, JC, CSUB, ...) are instruction indices within the program.
+    """
+
+    def __init__(self, instructions: Iterable[Instruction] = ()):
+        self.instructions: List[Instruction] = list(instructions)
+
+    def append(self, opcode: int, type: int = 0, motor: int = 0, value: int = 0) -> int:
+        """Append an instruction and return its index."""
+        self.instructions.append(Instruction(opcode, type, motor, value))
+        return len(self.instructions) - 1
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def __iter__(self):
+        return iter(self.instructions)
+
+    def __getitem__(self, index):
+        return self.instructions[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, Program):
+            return NotImplemented
+        return self.instructions == other.instructions
+
+    def listing(self) -> str:
+        """Return a human readable listing with the instruction indices."""
+        return "\n".join(f"{index:4}: {instruction}" for index, instruction in enumerate(self.instructions))
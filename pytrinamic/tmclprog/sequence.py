@@ -0,0 +1,236 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+"""Compile motion sequences into TMCL programs that run on the module.
+
+A host driven sequence needs at least one round trip per step. Compiled into
+a TMCL program it runs on the module with deterministic timing and without
+any link traffic::
+
+    seq = Sequence()
+    seq.set_axis_parameter(4, 0, 51200)         # Maximum velocity
+    with seq.repeat(10):
+        seq.move_to(0, 51200)
+        seq.wait_position_reached(0)
+        seq.set_output(0, True)
+        seq.move_to(0, 0)
+        seq.wait_position_reached(0)
+        seq.set_output(0, False)
+    seq.run(my_interface, timeout_s=60)
+
+Loop counters are kept in user variables (global parameters of bank 2),
+starting at `first_variable`.
+"""
+
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.tmclprog.program import Program
+from pytrinamic.tmclprog.loader import ProgramLoader
+from pytrinamic.tmclprog.constants import MoveType, WaitType, CalcOperation, JumpCondition, IoBank, USER_VARIABLE_BANK, TICK_S
+
+
+class SequenceError(Exception):
+    pass
+
+
+class Label:
+    """A jump target, placed with Sequence.place()."""
+
+    def __init__(self):
+        self.address: Optional[int] = None
+
+
+_INVERSE_CONDITION = {
+    JumpCondition.ZE: JumpCondition.NZ,
+    JumpCondition.NZ: JumpCondition.ZE,
+    JumpCondition.EQ: JumpCondition.NE,
+    JumpCondition.NE: JumpCondition.EQ,
+    JumpCondition.GT: JumpCondition.LE,
+    JumpCondition.LE: JumpCondition.GT,
+    JumpCondition.GE: JumpCondition.LT,
+    JumpCondition.LT: JumpCondition.GE,
+}
+
+
+class Sequence:
+
+    def __init__(self, *, first_variable=0, max_variables=256):
+        self._program = Program()
+        self._fixups: List[Tuple[int, Label]] = []
+        self._next_variable = first_variable
+        self._end_variable = first_variable + max_variables
+        self._open_blocks = 0
+
+    def _emit(self, opcode, op_type=0, motor=0, value=0) -> int:
+        return self._program.append(opcode, op_type, motor, value)
+
+    def _emit_jump(self, opcode, op_type, label: Label) -> int:
+        index = self._emit(opcode, op_type, 0, 0)
+        self._fixups.append((index, label))
+        return index
+
+    def _allocate_variable(self) -> int:
+        if self._next_variable >= self._end_variable:
+            raise SequenceError("No user variable left for the loop counter!")
+        variable = self._next_variable
+        self._next_variable += 1
+        return variable
+
+    # Motion and parameters
+
+    def set_axis_parameter(self, index, axis, value):
+        self._emit(TMCLCommand.SAP, index, axis, value)
+
+    def get_axis_parameter(self, index, axis):
+        """Load an axis parameter into the accumulator."""
+        self._emit(TMCLCommand.GAP, index, axis)
+
+    def set_global_parameter(self, index, bank, value):
+        self._emit(TMCLCommand.SGP, index, bank, value)
+
+    def rotate(self, axis, velocity):
+        if velocity >= 0:
+            self._emit(TMCLCommand.ROR, 0, axis, velocity)
+        else:
+            self._emit(TMCLCommand.ROL, 0, axis, -velocity)
+
+    def stop_motor(self, axis):
+        self._emit(TMCLCommand.MST, 0, axis)
+
+    def move_to(self, axis, position):
+        self._emit(TMCLCommand.MVP, MoveType.ABS, axis, position)
+
+    def move_by(self, axis, distance):
+        self._emit(TMCLCommand.MVP, MoveType.REL, axis, distance)
+
+    # Waiting
+
+    def wait_ticks(self, ticks):
+        self._emit(TMCLCommand.WAIT, WaitType.TICKS, 0, ticks)
+
+    def wait_s(self, seconds):
+        """Wait the given time, rounded to WAIT ticks of 10 ms."""
+        self.wait_ticks(round(seconds / TICK_S))
+
+    def wait_position_reached(self, axis, timeout_ticks=0):
+        """Wait until the axis reached its target position. A timeout of 0 waits forever."""
+        self._emit(TMCLCommand.WAIT, WaitType.POS, axis, timeout_ticks)
+
+    def wait_input(self, port, value):
+        """Wait until the digital input has the given value."""
+        label = self.label()
+        self.get_input(port)
+        self.compare(int(value))
+        self.jump_if(JumpCondition.NE, label)
+
+    # I/O
+
+    def set_output(self, port, value):
+        self._emit(TMCLCommand.SIO, port, IoBank.DIGITAL_OUTPUTS, int(value))
+
+    def get_input(self, port, bank=IoBank.DIGITAL_INPUTS):
+        """Load an input into the accumulator."""
+        self._emit(TMCLCommand.GIO, port, bank)
+
+    # Accumulator
+
+    def calc(self, operation: CalcOperation, value=0):
+        self._emit(TMCLCommand.CALC, operation, 0, value)
+
+    def compare(self, value):
+        self._emit(TMCLCommand.COMP, 0, 0, value)
+
+    # Control flow
+
+    def label(self) -> Label:
+        """Return a label placed at the next instruction."""
+        return self.place(Label())
+
+    def place(self, label: Label) -> Label:
+        if label.address is not None:
+            raise SequenceError("The label is already placed!")
+        label.address = len(self._program)
+        return label
+
+    def jump(self, label: Label):
+        self._emit_jump(TMCLCommand.JA, 0, label)
+
+    def jump_if(self, condition: JumpCondition, label: Label):
+        """Jump if the condition of the last COMP or CALC is met."""
+        self._emit_jump(TMCLCommand.JC, condition, label)
+
+    @contextmanager
+    def repeat(self, count):
+        """Run the block `count` times, counting down a user variable."""
+        if count < 1:
+            raise SequenceError("A loop must run at least once!")
+        variable = self._allocate_variable()
+        self.set_global_parameter(variable, USER_VARIABLE_BANK, count)
+        start = self.label()
+        with self._block():
+            yield
+        self._emit(TMCLCommand.GGP, variable, USER_VARIABLE_BANK)
+        self.calc(CalcOperation.SUB, 1)
+        self._emit(TMCLCommand.AGP, variable, USER_VARIABLE_BANK)
+        self.compare(0)
+        self.jump_if(JumpCondition.NE, start)
+        self._next_variable -= 1
+
+    @contextmanager
+    def forever(self):
+        start = self.label()
+        with self._block():
+            yield
+        self.jump(start)
+
+    @contextmanager
+    def when(self, condition: JumpCondition):
+        """Run the block only if the condition of the preceding COMP is met."""
+        if condition not in _INVERSE_CONDITION:
+            raise SequenceError(f"{condition!r} can not be used with when()!")
+        skip = Label()
+        self.jump_if(_INVERSE_CONDITION[condition], skip)
+        with self._block():
+            yield
+        self.place(skip)
+
+    @contextmanager
+    def _block(self):
+        self._open_blocks += 1
+        try:
+            yield
+        finally:
+            self._open_blocks -= 1
+
+    def stop(self):
+        """End the program."""
+        self._emit(TMCLCommand.STOP)
+
+    def compile(self) -> Program:
+        """Return the TMCL program, a STOP is appended unless the program ends with one."""
+        if self._open_blocks:
+            raise SequenceError("A block is still open!")
+        program = Program(self._program)
+        if not len(program) or program[-1].opcode != TMCLCommand.STOP:
+            program.append(TMCLCommand.STOP)
+        for index, label in self._fixups:
+            if label.address is None:
+                raise SequenceError(f"Instruction {index} jumps to a label that was never placed!")
+            instruction = program[index]
+            program.instructions[index] = type(instruction)(instruction.opcode, instruction.type, instruction.motor, label.address)
+        return program
+
+    def run(self, connection, *, module_id=None, wait=True, timeout_s=None) -> Program:
+        """Download the compiled program if needed, start it and optionally wait until it stopped."""
+        program = self.compile()
+        loader = ProgramLoader(connection, module_id)
+        loader.stop()
+        loader.download(program)
+        loader.run(0)
+        if wait:
+            loader.wait_until_stopped(timeout_s)
+        return program
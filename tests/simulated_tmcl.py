@@ -0,0 +1,63 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""A TMCL interface with simulated modules behind it, shared by the tests.
+
+The tests only implement the command handling of their modules in handle().
+"""
+
+import collections
+import struct
+
+from pytrinamic.connections.tmcl_interface import TmclInterface
+from pytrinamic.tmcl import TMCLRequest, TMCLStatus
+
+
+class SimulatedTmclInterface(TmclInterface):
+    """
+    Answers every request with handle() and queues the replies.
+
+    As the replies are queued, several requests can be in flight like on a CAN
+    or USB link. max_in_flight records the most replies queued at once. A
+    _recv() without a queued reply raises a ConnectionError like a timeout.
+    """
+
+    def __init__(self, host_id=2, default_module_id=1):
+        TmclInterface.__init__(self, host_id, default_module_id)
+        self.replies = collections.deque()
+        self.max_in_flight = 0
+
+    def handle(self, request, module_id):
+        """
+        Answer a request to the module `module_id`.
+
+        :return: The value of the reply, a (status, value) or (status, command, value)
+            tuple, or None if the module does not reply.
+        """
+        raise NotImplementedError
+
+    def queue_reply(self, host_id, module_id, status, command, value):
+        reply = struct.pack(">BBBBI", host_id, module_id, status, command, value & 0xFFFF_FFFF)
+        self.replies.append(reply + bytes([sum(reply) & 0xFF]))
+        self.max_in_flight = max(self.max_in_flight, len(self.replies))
+
+    def _send(self, host_id, module_id, data):
+        request = TMCLRequest.from_buffer(data)
+        reply = self.handle(request, module_id)
+        if reply is None:
+            return
+        status, command, value = TMCLStatus.SUCCESS, request.command, reply
+        if isinstance(reply, tuple) and len(reply) == 2:
+            status, value = reply
+        elif isinstance(reply, tuple):
+            status, command, value = reply
+        self.queue_reply(host_id, module_id, status, command, value)
+
+    def _recv(self, host_id, module_id):
+        if not self.replies:
+            raise ConnectionError("TMCL datagram timed out")
+        return self.replies.popleft()
+
+    def close(self):
+        pass
@@ -0,0 +1,72 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Round trip tests for the capture file format."""
+
+import pytest
+
+from pytrinamic.datalogger import DataLogger
+from pytrinamic.capture_file import CaptureFileWriter, CaptureFileReader, CaptureFileError
+
+
+def _make_log(offset):
+    sample_count = 50
+    return DataLogger.Log(
+        rate_hz=1000.0,
+        period_s=0.001,
+        time_vector=[i*0.001 for i in range(sample_count)],
+        data={
+            "velocity": DataLogger.LogData(
+                samples=[offset - i*1000 for i in range(sample_count)],
+                request_object=DataLogger.DataTypeAp(index=3, axis=1, signed=True),
+            ),
+            "status": DataLogger.LogData(
+                samples=[0xFFFF_FF00 + i for i in range(sample_count)],
+                request_object=DataLogger.DataTypeField(block=0, field=(0x20, 0xFFFF_FF00, 8), channel=0),
+            ),
+        },
+    )
+
+
+def test_append_and_random_access(tmp_path):
+    path = tmp_path / "captures.tmclog"
+    logs = [_make_log(offset) for offset in (0, 7, 2**40)]
+    for i, log in enumerate(logs):
+        with CaptureFileWriter(path) as writer:
+            assert writer.append(log, metadata={"run": i}) == i
+
+    reader = CaptureFileReader(path)
+    assert len(reader) == 3
+    capture = reader[1]
+    assert capture.metadata == {"run": 1}
+    assert capture.samples("velocity")[2] == 7 - 2000
+    assert capture.channels["status"].typecode == "I"
+    assert reader[2].channels["velocity"].typecode == "q"
+
+    for log, capture in zip(logs, reader):
+        restored = capture.to_log()
+        assert restored.rate_hz == log.rate_hz
+        assert restored.time_vector == log.time_vector
+        for name, log_data in log.data.items():
+            assert restored.data[name].samples == log_data.samples
+            assert vars(restored.data[name].request_object) == vars(log_data.request_object)
+    del capture
+    reader.close()
+
+
+def test_float_samples(tmp_path):
+    path = tmp_path / "captures.tmclog"
+    log = _make_log(0)
+    log.data["current"] = DataLogger.LogData(samples=[i*0.25 for i in range(50)], request_object=None)
+    with CaptureFileWriter(path) as writer:
+        writer.append(log)
+        log.data["current"].samples[1] = "1.0"
+        with pytest.raises(CaptureFileError):
+            writer.append(log)
+
+    with CaptureFileReader(path) as reader:
+        capture = reader[0]
+        assert capture.channels["current"].typecode == "d"
+        assert capture.to_log().data["current"].samples == [i*0.25 for i in range(50)]
+        del capture
@@ -0,0 +1,95 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the probe mode of the ConnectionManager using simulated serial ports.
+
+No hardware is needed to run these tests.
+"""
+
+import threading
+
+import pytest
+
+from pytrinamic.connections import ConnectionManager
+from pytrinamic.tmcl import TMCLCommand
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class SimulatedSerialPort(SimulatedTmclInterface):
+
+    PROBE_DATA_RATES = [9600, 19200, 115200]
+    # Port -> (baud rate, module number)
+    devices = {}
+    opened = []
+    lock = threading.Lock()
+
+    def __init__(self, port, datarate=9600, host_id=2, module_id=1, timeout_s=5):
+        if port == "busy":
+            raise ConnectionError("Port is busy")
+        super().__init__(host_id, module_id)
+        self.port = port
+        self.datarate = datarate
+        self.timeout = timeout_s
+        self.closed = False
+        with self.lock:
+            self.opened.append((port, datarate))
+
+    def handle(self, request, module_id):
+        device = self.devices.get(self.port)
+        if device is None or device[0] != self.datarate:
+            return None
+        assert request.command == TMCLCommand.GET_FIRMWARE_VERSION and request.commandType == 1
+        return (device[1] << 16) | 0x0105
+
+    def set_timeout(self, timeout):
+        self.timeout = timeout
+
+    def close(self):
+        self.closed = True
+
+    @staticmethod
+    def supports_tmcl():
+        return True
+
+    @staticmethod
+    def list():
+        return ["busy", "silent", "COM5", "COM7"]
+
+
+@pytest.fixture
+def simulated_ports(monkeypatch):
+    monkeypatch.setattr(ConnectionManager, "INTERFACES", ConnectionManager.INTERFACES + [("simulated_tmcl", SimulatedSerialPort, 9600)])
+    SimulatedSerialPort.devices = {"COM5": (115200, 1636), "COM7": (9600, 1617)}
+    SimulatedSerialPort.opened = []
+
+
+def test_probe_all(simulated_ports):
+    connection_manager = ConnectionManager("--interface simulated_tmcl")
+    assert connection_manager.probe_data_rates()[:2] == [9600, 19200]
+    results = connection_manager.probe(first_only=False)
+    assert sorted((result.port, result.data_rate, result.module_number) for result in results) == [("COM5", 115200, 1636), ("COM7", 9600, 1617)]
+    assert all(result.connection is None for result in results)
+    assert results[0].firmware_version == (1, 5)
+    # The silent port was tried with every data rate
+    assert len([entry for entry in SimulatedSerialPort.opened if entry[0] == "silent"]) == len(connection_manager.probe_data_rates())
+
+
+def test_probe_given_data_rate(simulated_ports):
+    connection_manager = ConnectionManager("--interface simulated_tmcl --data-rate 115200")
+    assert connection_manager.probe_data_rates() == [115200]
+    results = connection_manager.probe(first_only=False)
+    assert [result.port for result in results] == ["COM5"]
+
+
+def test_connect_probe(simulated_ports):
+    connection_manager = ConnectionManager("--interface simulated_tmcl --port probe --timeout 2")
+    connection = connection_manager.connect()
+    assert connection.port in ("COM5", "COM7")
+    assert not connection.closed
+    assert connection.timeout == 2
+
+    SimulatedSerialPort.devices = {}
+    with pytest.raises(ConnectionError):
+        connection_manager.connect()
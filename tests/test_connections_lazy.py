@@ -0,0 +1,69 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Guard the lazy imports of the interface backends in pytrinamic.connections.
+
+Every check runs in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+import json
+
+import pytest
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+_LOADED = """
+import sys, json
+{}
+print(json.dumps(sorted(name for name in ("can", "serial", "canopen") if name in sys.modules)))
+"""
+
+# Blocks the import of python-can as if it was not installed
+_WITHOUT_CAN = "import sys; sys.modules['can'] = None\n"
+
+
+def test_backends_are_imported_on_use():
+    assert _run(_LOADED.format("import pytrinamic.connections")) == []
+    assert _run(_LOADED.format("from pytrinamic.connections import ConnectionManager; ConnectionManager('--interface socket_serial_tmcl')")) == []
+    assert _run(_LOADED.format("from pytrinamic.connections import ConnectionManager; ConnectionManager('--interface pcan_tmcl')")) == ["can"]
+
+
+def test_missing_backend_fails_only_when_requested():
+    _run(_LOADED.format(_WITHOUT_CAN + "from pytrinamic.connections import ConnectionManager; ConnectionManager('--interface dummy_tmcl')"))
+    code = _WITHOUT_CAN + """
+from pytrinamic.connections import ConnectionManager
+try:
+    ConnectionManager('--interface pcan_tmcl')
+except ImportError as e:
+    assert "pcan_tmcl" in str(e)
+else:
+    raise AssertionError("ImportError expected")
+"""
+    _run(_LOADED.format(code))
+
+
+def test_interface_class():
+    from pytrinamic.connections import ConnectionManager, DummyTmclInterface
+    assert ConnectionManager.interface_class("dummy_tmcl") is DummyTmclInterface
+    with pytest.raises(ValueError):
+        ConnectionManager.interface_class("unknown")
+    with pytest.raises(ValueError):
+        ConnectionManager("--interface uart_ic", connection_type="tmcl")
+
+
+def test_interfaces_keep_their_shape():
+    from pytrinamic.connections import ConnectionManager, DummyTmclInterface
+    assert ConnectionManager.INTERFACES[0] == ("dummy_tmcl", DummyTmclInterface, 0)
+    assert all(isinstance(interface_class, type) for _, interface_class, _ in ConnectionManager.INTERFACES)
+    extended = ConnectionManager.INTERFACES + [("extra_tmcl", DummyTmclInterface, 0)]
+    assert extended[-1][1] is DummyTmclInterface
+    # Reading one entry only imports its backend.
+    assert _run(_LOADED.format("from pytrinamic.connections import ConnectionManager; ConnectionManager.INTERFACES[1]")) == ["can"]
+    assert _run(_LOADED.format("from pytrinamic.connections import ConnectionManager; ConnectionManager.list_supported_interfaces()")) == []
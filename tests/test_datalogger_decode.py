@@ -0,0 +1,64 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the channel reduction and decoding of the DataLogger.
+
+No hardware is needed to run these tests.
+"""
+
+from pytrinamic.rd import Rd
+from pytrinamic.datalogger import DataLogger
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class ConstantSamplesModule(SimulatedTmclInterface):
+    """Every register channel samples 0xA5A5_F00F, every parameter channel -7."""
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self):
+        super().__init__()
+        self.channels = []
+
+    def handle(self, request, module_id):
+        if request.commandType == Rd._Command.INIT:
+            self.channels = []
+        elif request.commandType == Rd._Command.SET_CHANNEL:
+            self.channels.append(request.motorBank)
+        elif request.commandType == Rd._Command.GET_INFO:
+            return {Rd.Info.MAX_CHANNELS: 8, Rd.Info.BUFFER_ELEMENTS: 1000, Rd.Info.SAMPLING_FREQUENCY: 1000}[request.value]
+        elif request.commandType == Rd._Command.GET_STATE:
+            return Rd.State.COMPLETE
+        elif request.commandType == Rd._Command.GET_SAMPLE:
+            channel_type = self.channels[request.value % len(self.channels)]
+            return 0xA5A5_F00F if channel_type == Rd.Channel.REGISTER else -7
+        return 0
+
+
+def test_datatypes_are_hashable():
+    assert len({DataLogger.DataTypeAp(index=3), DataLogger.DataTypeAp(index=3, signed=True), DataLogger.DataTypeAp(index=3, axis=1)}) == 2
+    register = DataLogger.DataTypeRegister(block=0, channel=0, address=0x20)
+    field = DataLogger.DataTypeField(block=0, channel=0, field=(0x20, 0xF0, 4))
+    assert field.channel_key == register.channel_key
+
+
+def test_fields_share_their_register_channel():
+    dl = DataLogger(ConstantSamplesModule())
+    dl.config.samples_per_channel = 4
+    dl.config.log_data = {f"NIBBLE_{i}": DataLogger.DataTypeField(block=0, channel=0, field=(0x20, 0xF << 4*i, 4*i), signed=True) for i in range(8)}
+    dl.config.log_data["REGISTER"] = DataLogger.DataTypeRegister(block=0, channel=0, address=0x20)
+    dl.config.log_data["AP_SIGNED"] = DataLogger.DataTypeAp(index=3, signed=True)
+    dl.config.log_data["AP_UNSIGNED"] = DataLogger.DataTypeAp(index=3)
+    dl.start_logging()
+    assert len(dl._effectively_log_data) == 2
+
+    dl.download_log()
+    nibbles = [0xF, 0x0, 0x0, 0xF, 0x5, 0xA, 0x5, 0xA]
+    for i, nibble in enumerate(nibbles):
+        expected = nibble - 16 if nibble & 0x8 else nibble
+        assert dl.log.data[f"NIBBLE_{i}"].samples == [expected]*4
+    assert dl.log.data["REGISTER"].samples == [0xA5A5_F00F]*4
+    assert dl.log.data["AP_SIGNED"].samples == [-7]*4
+    assert dl.log.data["AP_UNSIGNED"].samples == [0xFFFF_FFF9]*4
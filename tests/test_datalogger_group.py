@@ -0,0 +1,110 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the DataLoggerGroup using a simulated RAMDebug bus.
+
+No hardware is needed to run these tests.
+"""
+
+import pytest
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.rd import Rd
+from pytrinamic.datalogger import DataLogger
+from pytrinamic.datalogger_group import DataLoggerGroup
+from pytrinamic.poller import PollTimeoutError
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class SimulatedRamDebugBus(SimulatedTmclInterface):
+    """A bus with RAMDebug capable modules, replies are queued like on a CAN bus."""
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self, module_ids, systick_start):
+        super().__init__()
+        self.modules = {module_id: {"channels": [], "count": 0, "systick": systick_start[module_id], "busy_polls": 0} for module_id in module_ids}
+        self.log = []
+
+    def handle(self, request, module_id):
+        self.log.append(request)
+        module = self.modules[module_id]
+        if request.command != TMCLCommand.RAMDEBUG:
+            return 0
+        if request.commandType == Rd._Command.INIT:
+            module["channels"] = []
+        elif request.commandType == Rd._Command.SET_CHANNEL:
+            module["channels"].append((request.motorBank, request.value))
+        elif request.commandType == Rd._Command.SET_SAMPLE_COUNT:
+            module["count"] = request.value
+        elif request.commandType == Rd._Command.GET_STATE:
+            if module["busy_polls"]:
+                # Still capturing
+                module["busy_polls"] -= 1
+                return Rd.State.CAPTURE
+            return Rd.State.COMPLETE
+        elif request.commandType == Rd._Command.GET_INFO:
+            return {Rd.Info.MAX_CHANNELS: 4, Rd.Info.BUFFER_ELEMENTS: 1000, Rd.Info.SAMPLING_FREQUENCY: 1000}[request.value]
+        elif request.commandType == Rd._Command.GET_SAMPLE:
+            channel_type, select = module["channels"][request.value % len(module["channels"])]
+            sample_index = request.value // len(module["channels"])
+            if channel_type == Rd.Channel.SYSTICK:
+                return module["systick"] + sample_index
+            return select*1000 + sample_index
+        return 0
+
+
+def _make_logger(bus, module_id):
+    datalogger = DataLogger(bus, module_id)
+    datalogger.config.samples_per_channel = 5
+    datalogger.config.log_data = {"gp": DataLogger.DataTypeGp(index=module_id)}
+    return datalogger
+
+
+def test_send_requests_interleaved_modules():
+    bus = SimulatedRamDebugBus([1, 2], {1: 0, 2: 0})
+    requests = [bus.build_request(TMCLCommand.GGP, i, 0, 0, module_id=1 + i % 2) for i in range(10)]
+    replies = bus.send_requests(requests, window=3)
+    assert [reply.module_address for reply in replies] == [1 + i % 2 for i in range(10)]
+    assert bus.max_in_flight == 3
+
+
+def test_group_capture_and_merge():
+    bus = SimulatedRamDebugBus([1, 2], {1: 100, 2: 0xFFFF_FFFE})
+    members = [_make_logger(bus, 1), _make_logger(bus, 2)]
+    group = DataLoggerGroup(members)
+    group.start_logging()
+    # The group settings do not stick to the members.
+    assert all(member._extra_log_data == [] for member in members)
+
+    # The trigger enable requests of both members are sent back-to-back.
+    enables = [request.moduleAddress for request in bus.log if request.commandType == Rd._Command.ENABLE_TRIGGER]
+    assert enables == [1, 2]
+    assert bus.log[-2].commandType == Rd._Command.ENABLE_TRIGGER
+
+    # Module 2 is still capturing, the download waits for it.
+    bus.modules[2]["busy_polls"] = 3
+    log = group.download_log(timeout_s=5)
+    assert bus.modules[2]["busy_polls"] == 0
+    states = [request for request in bus.log if request.command == TMCLCommand.RAMDEBUG and request.commandType == Rd._Command.GET_STATE]
+    first_sample = next(i for i, request in enumerate(bus.log) if request.command == TMCLCommand.RAMDEBUG and request.commandType == Rd._Command.GET_SAMPLE)
+    assert bus.log.index(states[-1]) < first_sample
+    assert bus.max_in_flight <= bus.get_pipeline_window()
+    assert log.data["1.gp"].samples == [1000*1 + i for i in range(5)]
+    assert log.data["2.gp"].samples == [1000*2 + i for i in range(5)]
+    # The SYSTICK counter wraps on module 2, the aligned time base must not.
+    for member in log.members.values():
+        steps = [b - a for a, b in zip(member.time_vector, member.time_vector[1:])]
+        assert all(abs(step - 0.001) < 1e-9 for step in steps)
+
+
+def test_download_waits_for_all_members():
+    bus = SimulatedRamDebugBus([1, 2], {1: 0, 2: 0})
+    group = DataLoggerGroup([_make_logger(bus, 1), _make_logger(bus, 2)])
+    group.start_logging()
+    bus.modules[1]["busy_polls"] = 1_000_000
+    with pytest.raises(PollTimeoutError):
+        group.download_log(timeout_s=0.05)
+    assert not any(request.commandType == Rd._Command.GET_SAMPLE for request in bus.log)
@@ -0,0 +1,60 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for decoding fields and flags of many register values at once.
+
+No hardware is needed to run these tests.
+"""
+
+from array import array
+
+import pytest
+
+from pytrinamic.ic import TMC9660
+
+
+SAMPLES = [0x0003_0004, 0xFFFE_0002, 0x0001_FFFF, 0x0007_0004]
+
+
+def test_extract_array_matches_get():
+    for field in [TMC9660.MCC.ADC_I1_I0_RAW.I1, TMC9660.MCC.ADC_I1_I0_RAW.I0, TMC9660.MCC.MOTOR_CONFIG.TYPE]:
+        for samples in [SAMPLES, array("I", SAMPLES), memoryview(array("I", SAMPLES))]:
+            values = field.extract_array(samples)
+            assert isinstance(values, array)
+            assert list(values) == [field.get(sample) for sample in SAMPLES]
+    assert list(TMC9660.MCC.ADC_I1_I0_RAW.I1.extract_array(SAMPLES)) == [3, -2, 1, 7]
+
+    flag = TMC9660.ap.GENERAL_STATUS_FLAGS.REGULATION_STOPPED
+    assert list(flag.extract_array([0, 1, 3, 2])) == [0, 1, 1, 0]
+
+
+def test_decode_array():
+    decoded = TMC9660.MCC.MOTOR_CONFIG.decode_array(SAMPLES)
+    assert set(decoded) == {field.name for field in TMC9660.MCC.MOTOR_CONFIG.fields()}
+    assert list(decoded["N_POLE_PAIRS"]) == [4, 2, 0x7F, 4]
+    assert list(decoded["TYPE"]) == [3, 2, 1, 3]
+
+    decoded = TMC9660.MCC.MOTOR_CONFIG.decode_array(SAMPLES, choices=True)
+    assert [option.name if option else None for option in decoded["TYPE"]] == ["BLDC", "STEPPER", "DC", "BLDC"]
+    assert list(decoded["N_POLE_PAIRS"]) == [4, 2, 0x7F, 4]
+
+
+def test_find_flag_changes():
+    register = TMC9660.MCC.GDRV_STATUS
+    samples = array("I", [0b000, 0b001, 0b001, 0b011, 0b010, 0b010, 0b000])
+    changes = register.find_flag_changes(samples)
+    assert len(changes) == len(register.fields())
+    assert list(changes["LS_SHORT_U"]) == [1, 4]
+    assert list(changes["LS_SHORT_V"]) == [3, 6]
+    assert list(changes["LS_SHORT_W"]) == []
+
+
+def test_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+    samples = numpy.array(SAMPLES, dtype=numpy.uint32)
+    values = TMC9660.MCC.ADC_I1_I0_RAW.I1.extract_array(samples)
+    assert values.tolist() == [3, -2, 1, 7]
+    changes = TMC9660.MCC.GDRV_STATUS.find_flag_changes(numpy.array([0, 1, 1, 3, 2, 2, 0], dtype=numpy.uint32))
+    assert changes["LS_SHORT_U"].tolist() == [1, 4]
+    assert changes["LS_SHORT_V"].tolist() == [3, 6]
@@ -15,8 +15,11 @@ from intelhex import IntelHex
 
 from pytrinamic.connections.connection_manager import ConnectionManager
 from pytrinamic.connections.tmcl_interface import TmclInterface
-from pytrinamic.tmcl import TMCLCommand
-from pytrinamic.cli.tmclfwupload import main
+from pytrinamic.tmcl import TMCLCommand, TMCLRequest
+from pytrinamic.cli.tmclfwupload import main, firmware_update
+from pytrinamic.cli.tmclfwfleet import Target, run_fleet, save_results, load_results
+
+from simulated_tmcl import SimulatedTmclInterface
 
 
 @dataclasses.dataclass
@@ -32,6 +35,7 @@ class DeviceMetadata:
 class MockTmclInterface(TmclInterface):
     
     def __init__(self, device_metadata, device_is_already_in_boot_mode):
+        TmclInterface.__init__(self)
         self._device_metadata = device_metadata
         self._in_boot = device_is_already_in_boot_mode
 
@@ -67,6 +71,10 @@ class MockTmclInterface(TmclInterface):
             return None
         return None
 
+    def send_requests(self, requests, *, window=None):
+        # Record the pipelined requests as if they were sent one by one.
+        return [self.send(request.command, request.commandType, request.motorBank, request.value) for request in requests]
+
     def close(self):
         pass
 
@@ -101,6 +109,7 @@ def test_minimal_upload(tmp_path, monkeypatch, mocker, inboot, module_number_str
 
     mock_tmcl_interface = MockTmclInterface(device_metadata, device_is_already_in_boot_mode=inboot)
     spy_send = mocker.spy(mock_tmcl_interface, "send")
+    spy_send_requests = mocker.spy(mock_tmcl_interface, "send_requests")
 
     def mock_init(self, _=None):
         pass
@@ -129,10 +138,10 @@ def test_minimal_upload(tmp_path, monkeypatch, mocker, inboot, module_number_str
         ])
     expected_calls.extend([
         call(TMCLCommand.GET_FIRMWARE_VERSION, 0, 0, 0, 1),
-        call(TMCLCommand.BOOT_GET_INFO, 0, 0, 0),
-        call(TMCLCommand.BOOT_GET_INFO, 1, 0, 0),
-        call(TMCLCommand.BOOT_GET_INFO, 2, 0, 0),
-        call(TMCLCommand.BOOT_ERASE_ALL, 0, 0, 0),
+        call(TMCLCommand.BOOT_GET_INFO, 0, 0, 0, None),
+        call(TMCLCommand.BOOT_GET_INFO, 1, 0, 0, None),
+        call(TMCLCommand.BOOT_GET_INFO, 2, 0, 0, None),
+        call(TMCLCommand.BOOT_ERASE_ALL, 0, 0, 0, None),
     ])
     addr = 0
     page = 0
@@ -146,7 +155,7 @@ def test_minimal_upload(tmp_path, monkeypatch, mocker, inboot, module_number_str
             addr += 1
             buffer = []
         if addr > 0 and (addr*4 % device_metadata.mem_page_size) == 0:
-            expected_calls.append(call(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, device_metadata.mem_start_address + page*device_metadata.mem_page_size))
+            expected_calls.append(call(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, device_metadata.mem_start_address + page*device_metadata.mem_page_size, None))
             addr = 0
             page += 1
     if len(buffer) > 0:
@@ -154,15 +163,195 @@ def test_minimal_upload(tmp_path, monkeypatch, mocker, inboot, module_number_str
         addr_high = (addr & 0xFF00) >> 8
         expected_calls.append(call(TMCLCommand.BOOT_WRITE_BUFFER, addr_low, addr_high, int.from_bytes(buffer, byteorder="little")))
     if addr != 0:
-        expected_calls.append(call(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, device_metadata.mem_start_address + page*device_metadata.mem_page_size))
+        expected_calls.append(call(TMCLCommand.BOOT_WRITE_PAGE, 0, 0, device_metadata.mem_start_address + page*device_metadata.mem_page_size, None))
     expected_calls.extend([
-        call(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, device_metadata.mem_start_address + fw_length - 1),
-        call(TMCLCommand.BOOT_WRITE_LENGTH, 0, 0, fw_length),
-        call(TMCLCommand.BOOT_WRITE_LENGTH, 1, 0, fw_checksum),
+        call(TMCLCommand.BOOT_GET_CHECKSUM, 0, 0, device_metadata.mem_start_address + fw_length - 1, None),
+        call(TMCLCommand.BOOT_WRITE_LENGTH, 0, 0, fw_length, None),
+        call(TMCLCommand.BOOT_WRITE_LENGTH, 1, 0, fw_checksum, None),
         call(TMCLCommand.BOOT_START_APPL, 0, 0, 0, module_id=None, no_reply=True),
     ])
 
     assert len(spy_send.call_args_list) == len(expected_calls)
 
     for call_n, expected_call_n in zip(spy_send.call_args_list, expected_calls):
-        assert call_n == expected_call_n
\ No newline at end of file
+        assert call_n == expected_call_n
+
+    # The buffer writes are sent pipelined, one batch per page.
+    batches = [call_n.args[0] for call_n in spy_send_requests.call_args_list]
+    assert all(request.command == TMCLCommand.BOOT_WRITE_BUFFER for batch in batches for request in batch)
+    assert len(batches) == sum(1 for expected_call_n in expected_calls if expected_call_n.args[0] == TMCLCommand.BOOT_WRITE_PAGE)
+
+
+class SimulatedBootloader(SimulatedTmclInterface):
+    """A TMCL bootloader with a flash memory, erased bytes read 0xFF."""
+
+    def __init__(self, mem_start_address, mem_size, mem_page_size):
+        super().__init__()
+        self.mem_start_address = mem_start_address
+        self.mem_page_size = mem_page_size
+        self.flash = bytearray(b"\xFF" * mem_size)
+        self.page_buffer = bytearray(b"\xFF" * mem_page_size)
+        self.written_pages = []
+
+    def _send(self, host_id, module_id, data):
+        if TMCLRequest.from_buffer(data).command == TMCLCommand.GET_FIRMWARE_VERSION:
+            # The version string is replied instead of status and value.
+            self.replies.append(bytes([host_id]) + b"1617B108")
+            return
+        super()._send(host_id, module_id, data)
+
+    def handle(self, request, module_id):
+        if request.command in (TMCLCommand.BOOT, TMCLCommand.BOOT_START_APPL):
+            return None
+        elif request.command == TMCLCommand.BOOT_GET_INFO:
+            return [self.mem_page_size, self.mem_start_address, len(self.flash)][request.commandType]
+        elif request.command == TMCLCommand.BOOT_ERASE_ALL:
+            self.flash[:] = b"\xFF" * len(self.flash)
+        elif request.command == TMCLCommand.BOOT_WRITE_BUFFER:
+            offset = 4*(request.commandType + 256*request.motorBank)
+            self.page_buffer[offset:offset + 4] = request.value.to_bytes(4, "little")
+        elif request.command == TMCLCommand.BOOT_WRITE_PAGE:
+            start = request.value - self.mem_start_address
+            self.flash[start:start + self.mem_page_size] = self.page_buffer
+            self.page_buffer[:] = b"\xFF" * self.mem_page_size
+            self.written_pages.append(request.value)
+        elif request.command == TMCLCommand.BOOT_GET_CHECKSUM:
+            return sum(self.flash[:request.value - self.mem_start_address + 1])
+        elif request.command == TMCLCommand.BOOT_READ_MEMORY:
+            start = request.value - self.mem_start_address
+            return int.from_bytes(self.flash[start:start + 4], "little")
+        return 0
+
+
+class PipelinedBootloader(SimulatedBootloader):
+    """A bootloader on a link that keeps several requests in flight, e.g. USB."""
+
+    _PIPELINE_WINDOW = 4
+
+
+def _write_hex(path, start_address, data, extra_segment=None):
+    ih = IntelHex()
+    ih.putsz(start_address, "1617V000")
+    ih.puts(start_address + 9, bytes(data))
+    if extra_segment is not None:
+        ih.puts(*extra_segment)
+    ih.write_hex_file(path)
+    return ih
+
+
+def test_delta_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda _: None)
+    bootloader = SimulatedBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256)
+    data = bytearray(range(256))*3
+
+    _write_hex(tmp_path / "v1.hex", 0x0800_0000, data)
+    assert firmware_update(bootloader, str(tmp_path / "v1.hex"), cache_dir=str(tmp_path)) is None
+    assert len(bootloader.written_pages) == 4
+
+    # One changed byte only rewrites its page.
+    data[300] ^= 0xFF
+    _write_hex(tmp_path / "v2.hex", 0x0800_0000, data)
+    bootloader.written_pages = []
+    assert firmware_update(bootloader, str(tmp_path / "v2.hex"), delta=True, cache_dir=str(tmp_path)) is None
+    assert bootloader.written_pages == [0x0800_0100]
+
+    # Swapped bytes keep the checksum, only the memory compare notices them.
+    data[600], data[601] = data[601], data[600]
+    _write_hex(tmp_path / "v3.hex", 0x0800_0000, data)
+    bootloader.written_pages = []
+    assert firmware_update(bootloader, str(tmp_path / "v3.hex"), delta=True, cache_dir=str(tmp_path)) is None
+    assert bootloader.written_pages == []
+    assert firmware_update(bootloader, str(tmp_path / "v3.hex"), delta=True, verify_memory=True, cache_dir=str(tmp_path)) is None
+    assert bootloader.written_pages == [0x0800_0200]
+
+
+def test_pipelined_upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda _: None)
+    bootloader = PipelinedBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256)
+    data = bytes(range(256))*3
+    ih = _write_hex(tmp_path / "fw.hex", 0x0800_0000, data)
+    assert firmware_update(bootloader, str(tmp_path / "fw.hex"), cache_dir=str(tmp_path)) is None
+    assert bootloader.max_in_flight == 4
+    image = ih.tobinarray()
+    assert bootloader.flash[:len(image)] == image
+
+
+class NonErasingBootloader(SimulatedBootloader):
+    """A bootloader whose page writes can only clear bits, like flash without an erase."""
+
+    def handle(self, request, module_id):
+        if request.command == TMCLCommand.BOOT_WRITE_PAGE:
+            start = request.value - self.mem_start_address
+            for i, byte in enumerate(self.page_buffer):
+                self.flash[start + i] &= byte
+            self.page_buffer[:] = self.flash[start:start + self.mem_page_size]
+        return super().handle(request, module_id)
+
+
+def test_delta_upload_stops_without_erase_on_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda _: None)
+    bootloader = NonErasingBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256)
+    data = bytearray(range(256))*3
+    _write_hex(tmp_path / "v1.hex", 0x0800_0000, data)
+    assert firmware_update(bootloader, str(tmp_path / "v1.hex"), cache_dir=str(tmp_path)) is None
+
+    data[300] ^= 0xFF
+    data[600] ^= 0xFF
+    _write_hex(tmp_path / "v2.hex", 0x0800_0000, data)
+    bootloader.written_pages = []
+    assert firmware_update(bootloader, str(tmp_path / "v2.hex"), delta=True, cache_dir=str(tmp_path)) == 1
+    assert bootloader.written_pages == [0x0800_0100]
+
+
+def test_blank_pages_are_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda _: None)
+    bootloader = SimulatedBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256)
+    _write_hex(tmp_path / "fw.hex", 0x0800_0000, b"\x55"*100, extra_segment=(0x0800_0400, b"\xAA"*16))
+    assert firmware_update(bootloader, str(tmp_path / "fw.hex"), blank_value=0xFF, cache_dir=str(tmp_path)) is None
+    assert bootloader.written_pages == [0x0800_0000, 0x0800_0400]
+
+
+class SimulatedBootloaderBus(SimulatedTmclInterface):
+    """Several simulated bootloaders sharing one bus."""
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self, bootloaders):
+        super().__init__()
+        self.bootloaders = bootloaders
+        self.trace = []
+
+    def _send(self, host_id, module_id, data):
+        bootloader = self.bootloaders[module_id]
+        bootloader._send(host_id, module_id, data)
+        self.replies.extend(bootloader.replies)
+        bootloader.replies.clear()
+        self.trace.append((module_id, TMCLRequest.from_buffer(data).command))
+
+
+def test_fleet_update_and_retry(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda _: None)
+    bus = SimulatedBootloaderBus({
+        1: SimulatedBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256),
+        2: SimulatedBootloader(mem_start_address=0x0800_0000, mem_size=4096, mem_page_size=256),
+        3: SimulatedBootloader(mem_start_address=0x0800_4000, mem_size=4096, mem_page_size=256),
+    })
+    _write_hex(tmp_path / "fw.hex", 0x0800_0000, bytes(range(256))*2)
+    targets = [Target(interface="pcan_tmcl", port="0", module_id=module_id, hex_file=str(tmp_path / "fw.hex")) for module_id in (1, 2, 3)]
+
+    results = run_fleet(targets, connect_link=lambda link: bus, cache_dir=str(tmp_path))
+    assert [results[target.name].success for target in targets] == [True, True, False]
+    assert [results[target.name].verified for target in targets] == [True, True, False]
+    assert "Start address" in results[targets[2].name].error
+    assert bus.bootloaders[1].written_pages == bus.bootloaders[2].written_pages == [0x0800_0000, 0x0800_0100, 0x0800_0200]
+    # The buffer writes of both modules are interleaved.
+    writes = [module_id for module_id, command in bus.trace if command == TMCLCommand.BOOT_WRITE_BUFFER]
+    assert writes[:4] == [1, 2, 1, 2]
+
+    # A rerun with the results only retries the failed module.
+    save_results(tmp_path / "results.json", results)
+    bus.trace = []
+    bus.bootloaders[3].mem_start_address = 0x0800_0000
+    results = run_fleet(targets, results=load_results(tmp_path / "results.json"), connect_link=lambda link: bus, cache_dir=str(tmp_path))
+    assert all(result.success for result in results.values())
+    assert {module_id for module_id, _ in bus.trace} == {3}
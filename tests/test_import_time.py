@@ -0,0 +1,56 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Guard the lazy imports of pytrinamic.ic, pytrinamic.modules and pytrinamic.evalboards.
+
+Every check runs in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+import json
+
+import pytest
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+_LOADED = """
+import sys, json
+{}
+print(json.dumps(sorted(name for name in sys.modules if name.startswith("pytrinamic."))))
+"""
+
+def test_single_module_import_stays_small():
+    loaded = _run(_LOADED.format("from pytrinamic.modules import TMCM1617"))
+    assert "pytrinamic.modules.TMCM1617" in loaded
+    assert "pytrinamic.modules.TMCM1636" not in loaded
+    assert "pytrinamic.ic.TMC9660.MCCtable" not in loaded
+    assert "pytrinamic.ic.TMC9660.TMC9660_ap_table" not in loaded
+
+
+def test_tmc9660_maps_are_built_on_access():
+    loaded = _run(_LOADED.format("from pytrinamic.ic import TMC9660; TMC9660.ADC"))
+    assert "pytrinamic.ic.TMC9660.ADCtable" in loaded
+    assert "pytrinamic.ic.TMC9660.MCCtable" not in loaded
+
+
+@pytest.mark.parametrize("code", [
+    "import pytrinamic.datalogger",
+    "from pytrinamic.evalboards import TMC9660_3PH_eval",
+    "import pytrinamic.ic.TMC4671; from pytrinamic.ic import TMC4671; assert isinstance(TMC4671, type)",
+])
+def test_import_order(code):
+    _run(_LOADED.format(code))
+
+
+def test_single_import_loads_a_fraction_of_the_package():
+    # Counting the loaded modules instead of timing the imports keeps the check independent of the machine.
+    lazy = _run(_LOADED.format("from pytrinamic.modules import TMCM1617"))
+    full = _run(_LOADED.format("import pytrinamic.modules as m; [getattr(m, name) for name in m.__all__]"))
+    assert set(lazy) < set(full)
+    assert len(lazy) < len(full) / 2
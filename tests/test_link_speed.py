@@ -0,0 +1,163 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the link speed upgrade using simulated serial devices.
+
+No hardware is needed to run these tests.
+"""
+
+import logging
+import struct
+
+from pytrinamic.connections import SerialTmclInterface, UartIcInterface, UsbTmclInterface
+from pytrinamic.connections.tmcl_interface import TmclInterface
+from pytrinamic.tmcl import TMCLCommand, TMCLRequest, TMCLStatus
+
+
+class SimulatedSerial:
+    """A serial port with a device behind it.
+
+    Bytes only get through when both sides use the same rate. Above `reliable_up_to`
+    the device still receives, but its replies are lost.
+    """
+
+    def __init__(self, device_rate, reliable_up_to):
+        self.baudrate = device_rate
+        self.device_rate = device_rate
+        self.reliable_up_to = reliable_up_to
+        self.rx = bytearray()
+        self.switches = []
+        self.timeout = 5
+        self.read_timeouts = set()
+
+    def write(self, data):
+        if self.baudrate == self.device_rate:
+            reliable = self.device_rate <= self.reliable_up_to
+            reply = self.handle(bytes(data))
+            if reliable:
+                self.rx += reply
+
+    def read(self, size):
+        self.read_timeouts.add(self.timeout)
+        data, self.rx = bytes(self.rx[:size]), self.rx[size:]
+        return data
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        self.rx.clear()
+
+    def close(self):
+        pass
+
+
+class SimulatedTmclModule(SimulatedSerial):
+
+    def handle(self, data):
+        request = TMCLRequest.from_buffer(data)
+        status = TMCLStatus.SUCCESS
+        reply = b""
+        if request.command == TMCLCommand.SGP and request.commandType == 65:
+            rates = {index: rate for rate, index in SerialTmclInterface.BAUD_RATE_INDEX.items()}
+            new_rate = rates[request.value]
+            if new_rate > 500000:
+                status = TMCLStatus.INVALID_VALUE
+        reply = bytearray(struct.pack(">BBBBI", 2, 1, status, request.command, 0x06360105))
+        reply.append(sum(reply) & 0xFF)
+        if status == TMCLStatus.SUCCESS and request.command == TMCLCommand.SGP:
+            # The reply goes out at the old rate, then the module switches.
+            self.device_rate = new_rate
+            self.switches.append(new_rate)
+        return bytes(reply)
+
+
+class SimulatedRestartingTmclModule(SimulatedTmclModule):
+    """A module which stores the new baud rate and only applies it after a restart."""
+
+    def handle(self, data):
+        device_rate = self.device_rate
+        reply = super().handle(data)
+        self.device_rate = device_rate
+        return reply
+
+
+class SimulatedTmc4671(SimulatedSerial):
+
+    def __init__(self, device_rate, reliable_up_to):
+        super().__init__(device_rate, reliable_up_to)
+        self.uart_bps = int(f"{device_rate:08d}", 16)
+
+    def handle(self, data):
+        address, value = struct.unpack(">BI", data)
+        if address == 0x79 | 0x80:
+            self.uart_bps = value
+            self.device_rate = int(f"{value:08x}")
+            self.switches.append(self.device_rate)
+            return b""
+        return struct.pack(">BI", address, self.uart_bps)
+
+
+def _serial_tmcl_interface(device, cls=SerialTmclInterface):
+    iface = cls.__new__(cls)
+    TmclInterface.__init__(iface, 2, 1)
+    iface.logger = logging.getLogger("test")
+    iface._baudrate = device.baudrate
+    iface._serial = device
+    return iface
+
+
+def _uart_ic_interface(device):
+    iface = UartIcInterface.__new__(UartIcInterface)
+    iface.logger = logging.getLogger("test")
+    iface.baudrate = device.baudrate
+    iface.serial = device
+    return iface
+
+
+def test_tmcl_upgrade_with_fall_back():
+    device = SimulatedTmclModule(9600, reliable_up_to=230400)
+    iface = _serial_tmcl_interface(device)
+    steps = iface.upgrade_link_speed(round_trips=2)
+    # 1000000 is refused by the module, 500000 and 250000 do not work, 230400 does
+    assert [(step.data_rate, step.success) for step in steps] == [(9600, True), (1000000, False), (500000, False), (250000, False), (230400, True)]
+    assert all(step.throughput_bytes_s > 0 for step in steps if step.success)
+    assert steps[1].error
+    # Every fall back switches back at the failed rate and confirms at the original rate
+    assert device.switches == [500000, 9600, 9600, 250000, 9600, 9600, 230400]
+    assert iface._baudrate == device.baudrate == device.device_rate == 230400
+    # The rates are tried with the short timeout, the timeout of the interface is restored
+    assert device.read_timeouts == {SerialTmclInterface._LINK_NEGOTIATION_TIMEOUT_S}
+    assert device.timeout == 5
+    iface.send(TMCLCommand.GET_FIRMWARE_VERSION, 1, 0, 0)
+
+
+def test_tmcl_upgrade_stops_if_the_rate_is_not_applied():
+    device = SimulatedRestartingTmclModule(9600, reliable_up_to=230400)
+    iface = _serial_tmcl_interface(device)
+    steps = iface.upgrade_link_speed(round_trips=2)
+    assert [(step.data_rate, step.success) for step in steps] == [(9600, True), (1000000, False), (500000, False)]
+    assert "accepted" in steps[-1].error
+    # The stored request is taken back
+    assert device.switches == [500000, 9600]
+    assert iface._baudrate == device.baudrate == device.device_rate == 9600
+
+
+def test_uart_ic_upgrade():
+    device = SimulatedTmc4671(9600, reliable_up_to=115200)
+    iface = _uart_ic_interface(device)
+    steps = iface.upgrade_link_speed(round_trips=2)
+    assert [(step.data_rate, step.success) for step in steps] == [(9600, True), (3000000, False), (921600, False), (115200, True)]
+    assert device.uart_bps == 0x00115200
+    assert iface.send(0x79, 0).value == 0x00115200
+    assert device.timeout == 5
+
+
+def test_no_upgrade_over_usb():
+    device = SimulatedTmclModule(115200, reliable_up_to=115200)
+    iface = _serial_tmcl_interface(device, UsbTmclInterface)
+    steps = iface.upgrade_link_speed([1000000], round_trips=2)
+    assert [(step.data_rate, step.success) for step in steps] == [(115200, True)]
+    assert device.switches == []
+    assert device.timeout == 5
@@ -0,0 +1,197 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Compare the table backed TMC9660 maps with the class based maps in tools/tmc9660_maps they are generated from.
+
+No hardware is needed to run these tests.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+from pytrinamic.ic import TMC9660, RegisterGroup, Register, Field, Choice, Option, Access
+from pytrinamic.modules import Parameter, ParameterGroup, ParameterIndex
+
+
+def _load_generator():
+    # The generator imports the class based maps, they are not part of the package.
+    path = os.path.join(os.path.dirname(__file__), os.pardir, "tools", "generate_tmc9660_tables.py")
+    spec = importlib.util.spec_from_file_location("generate_tmc9660_tables", path)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    return generator
+
+
+generator = _load_generator()
+MCCMap, ADCMap, SYS_CTRLMap = generator.MCCMap, generator.ADCMap, generator.SYS_CTRLMap
+Ap, GpBank0, GpBank2, GpBank3 = generator.Ap, generator.GpBank0, generator.GpBank2, generator.GpBank3
+
+
+def _options(choice):
+    if choice is None:
+        return None
+    return sorted((option.name, option.value) for option in choice.options())
+
+
+@pytest.mark.parametrize("table_group, class_group", [
+    (TMC9660.MCC, MCCMap(channel=0, block=0).ALL_REGISTERS),
+    (TMC9660.ADC, ADCMap(channel=0, block=1).ALL_REGISTERS),
+    (TMC9660.SYS_CTRL, SYS_CTRLMap(channel=0, block=2).ALL_REGISTERS),
+])
+def test_register_tables(table_group, class_group):
+    assert (table_group.name, table_group.channel, table_group.block, table_group.width) == (class_group.name, class_group.channel, class_group.block, class_group.width)
+    assert [register.name for register in table_group.registers()] == [register.name for register in class_group.registers()]
+    for expected in class_group.registers():
+        register = getattr(table_group, expected.name)
+        assert isinstance(register, Register)
+        assert (register.access, register.address, register.signed) == (expected.access, expected.address, bool(expected.signed))
+        assert [field.name for field in register.fields()] == [field.name for field in expected.fields()]
+        for expected_field in expected.fields():
+            field = getattr(register, expected_field.name)
+            assert isinstance(field, Field)
+            assert field.parent == register
+            assert (field.access, field.mask, field.shift, field.signed) == (expected_field.access, expected_field.mask, expected_field.shift, expected_field.signed)
+            assert _options(field.choice) == _options(expected_field.choice)
+
+
+@pytest.mark.parametrize("table_group, class_group", [
+    (TMC9660.ap, Ap()),
+    (TMC9660.gp_bank0, GpBank0()),
+    (TMC9660.gp_bank2, GpBank2()),
+    (TMC9660.gp_bank3, GpBank3()),
+])
+def test_parameter_tables(table_group, class_group):
+    assert (table_group.name, table_group.category, table_group.block) == (class_group.name, class_group.category, class_group.block)
+    expected_parameters = [parameter for parameter in vars(class_group).values() if isinstance(parameter, Parameter)]
+    assert len(table_group.parameters()) == len(expected_parameters)
+    for expected in expected_parameters:
+        parameter = getattr(table_group, expected.name)
+        assert isinstance(parameter, Parameter)
+        assert (parameter.index, parameter.access, parameter.datatype, parameter.block, parameter.category) == (expected.index, expected.access, expected.datatype, expected.block, expected.category)
+        assert hasattr(parameter, "choice") == hasattr(expected, "choice")
+        if hasattr(expected, "choice"):
+            assert _options(parameter.choice) == _options(expected.choice)
+        assert hasattr(parameter, "fields") == hasattr(expected, "fields")
+        if hasattr(expected, "fields"):
+            assert [(field.name, field.mask, field.shift) for field in parameter.fields] == [(field.name, field.mask, field.shift) for field in expected.fields]
+
+
+def test_direct_construction():
+    group = RegisterGroup("GROUP", channel=None, block=0, width=32)
+    register = Register("CONFIG", group, Access.RW, 0x10)
+    field = Field("MODE", register, Access.RW, 0x0F, 0)
+    choice = Choice(field)
+    assert (register.address, field.get(0x1F), choice.parent) == (0x10, 0x0F, field)
+
+    parameter_group = ParameterGroup("Parameters", ParameterGroup.Category.AXIS, 0)
+    parameter = Parameter(parameter_group, "SPEED", 4, Parameter.Access.RW, Parameter.Datatype.SIGNED)
+    parameter_choice = Parameter.Choice(parameter)
+    assert (parameter.index, parameter_choice.parent) == (4, parameter)
+
+
+def test_views():
+    field = TMC9660.MCC.ADC_I1_I0_RAW.I1
+    assert field.get(0x8000_0000) == -0x8000
+    assert field.parent.parent is TMC9660.MCC
+    assert TMC9660.MCC.ADC_I1_I0_RAW == TMC9660.MCC.ADC_I1_I0_RAW
+    assert len({TMC9660.MCC.ADC_I1_I0_RAW.I0, TMC9660.MCC.ADC_I1_I0_RAW.I0, field}) == 2
+    # A view only keeps its parent and its position in the table.
+    assert set(vars(field)) == {"parent", "_index"}
+
+    option = TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC
+    assert isinstance(option, Option)
+    assert (option.value, option.parent) == (3, TMC9660.MCC.MOTOR_CONFIG.TYPE)
+    assert TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.get(2).name == "STEPPER"
+    assert TMC9660.MCC.STATUS_FLAGS.access == Access.RWC
+
+    assert TMC9660.ap.MOTOR_TYPE.choice.BLDC_MOTOR.value == 3
+    assert TMC9660.ap.GENERAL_STATUS_FLAGS.POSITION_REACHED.get(0x200) == 1
+    assert "MOTOR_TYPE" in dir(TMC9660.ap)
+
+    with pytest.raises(AttributeError):
+        TMC9660.MCC.NO_SUCH_REGISTER
+    with pytest.raises(AttributeError):
+        TMC9660.MCC.ADC_I1_I0_RAW.NO_SUCH_FIELD
+    with pytest.raises(AttributeError):
+        TMC9660.ap.MOTOR_POLE_PAIRS.choice
+
+
+@pytest.mark.parametrize("group", [TMC9660.MCC, MCCMap(channel=0, block=0).ALL_REGISTERS], ids=["table", "classes"])
+def test_register_lookups(group):
+    register = group.find("PID_VELOCITY_TARGET")
+    assert register.address == 0x0190
+    assert group.by_address(0x0190) == register
+    assert group.find("NO_SUCH_REGISTER") is None
+    assert group.by_address(0xFFFF) is None
+    assert [register.address for register in group.registers()] == sorted(register.address for register in group.registers())
+    # The lists handed out are copies of the index
+    group.registers().clear()
+    assert group.registers()
+
+    choice = group.MOTOR_CONFIG.TYPE.choice
+    assert choice.get(3).name == "BLDC"
+    assert [option.value for option in choice.options()] == [0, 1, 2, 3]
+    with pytest.raises(IndexError):
+        choice.get(4)
+
+
+@pytest.mark.parametrize("group", [TMC9660.ap, Ap()], ids=["table", "classes"])
+def test_parameter_lookups(group):
+    parameter = group.find("COMMUTATION_MODE")
+    assert parameter.index == 4
+    assert group.by_index(4) == parameter
+    assert group.find("NO_SUCH_PARAMETER") is None
+    assert group.by_index(0xFFF) is None
+    assert [parameter.index for parameter in group.parameters()] == sorted(parameter.index for parameter in group.parameters())
+
+    assert parameter.choice.get(5).name == "FOC_ABN"
+    option = group.MOTOR_DIRECTION.choice.get(1)
+    assert option.value is True and option.name == "INVERTED"
+    with pytest.raises(IndexError):
+        parameter.choice.get(100)
+
+
+@pytest.mark.parametrize("groups", [
+    [TMC9660.ap, TMC9660.gp_bank0, TMC9660.gp_bank2, TMC9660.gp_bank3],
+    [Ap(), GpBank0(), GpBank2(), GpBank3()],
+], ids=["table", "classes"])
+def test_parameter_index(groups):
+    index = ParameterIndex(groups)
+    for group in groups:
+        assert index.group(group.category, group.block) is group
+        for parameter in group.parameters():
+            if group.by_index(parameter.index) == parameter:
+                assert index.find(group.category, group.block, parameter.index) == parameter
+
+    parameter, value = index.decode(ParameterGroup.Category.AXIS, 0, TMC9660.ap.ADC_I0_RAW.index, 0xFFFF_FFFE)
+    assert parameter.name == "ADC_I0_RAW" and value == -2
+    parameter, value = index.decode(ParameterGroup.Category.AXIS, 0, TMC9660.ap.MOTOR_POLE_PAIRS.index, 0xFFFF_FFFE)
+    assert parameter.name == "MOTOR_POLE_PAIRS" and value == 0xFFFF_FFFE
+    assert index.decode(ParameterGroup.Category.GLOBAL, 1, 0, 7) == (None, 7)
+    assert index.find(ParameterGroup.Category.AXIS, 0, 0xFFF) is None
+
+    with pytest.raises(ValueError):
+        ParameterIndex([groups[0], groups[0]])
+
+
+def test_parameter_tables_are_read_only():
+    table = TMC9660.ap.table
+    assert TMC9660.parameter_index.group(ParameterGroup.Category.GLOBAL, 2) is TMC9660.gp_bank2
+    assert bool(table.signed[table.position("ADC_I0_RAW")]) and not table.signed[table.position("MOTOR_POLE_PAIRS")]
+    with pytest.raises(TypeError):
+        table.indexes[0] = 1
+    with pytest.raises(TypeError):
+        table.datatypes[0] = 1
+
+
+def test_tables_are_up_to_date():
+    directory = os.path.join(os.path.dirname(__file__), os.pardir, "pytrinamic", "ic", "TMC9660")
+    for name, group in generator.REGISTER_TABLES.items():
+        with open(os.path.join(directory, name), encoding="utf-8") as file:
+            assert file.read() == generator.register_table(group()), name
+    for name, group in generator.PARAMETER_TABLES.items():
+        with open(os.path.join(directory, name), encoding="utf-8") as file:
+            assert file.read() == generator.parameter_table(group()), name
@@ -0,0 +1,71 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pytrinamic.poller import Poller, PollTimeoutError, PollCancelledError, wait_until
+
+
+def test_backoff_limits_poll_count():
+    done_at_s = time.perf_counter() + 0.2
+    poller = Poller(initial_interval_s=0.001, max_interval_s=0.05)
+    assert poller.wait_until(lambda: time.perf_counter() >= done_at_s and "done") == "done"
+    # Busy polling would evaluate the condition many thousand times.
+    assert poller.poll_count < 20
+
+
+def test_expected_duration():
+    done_at_s = time.perf_counter() + 0.1
+    poller = Poller(expected_duration_s=0.1)
+    poller.wait_until(lambda: time.perf_counter() >= done_at_s)
+    assert poller.poll_count < 15
+
+
+def test_timeout():
+    start_s = time.perf_counter()
+    with pytest.raises(PollTimeoutError, match="the impossible"):
+        wait_until(lambda: False, timeout_s=0.05, description="the impossible")
+    assert time.perf_counter() - start_s < 0.5
+
+
+def test_cancel():
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+    with pytest.raises(PollCancelledError):
+        Poller(max_interval_s=10, initial_interval_s=1, cancel_event=cancel_event).wait_until(lambda: False)
+
+
+def test_async():
+    done_at_s = time.perf_counter() + 0.05
+    result = asyncio.run(Poller().wait_until_async(lambda: time.perf_counter() >= done_at_s))
+    assert result is True
+
+
+def test_poll_count():
+    poller = Poller(initial_interval_s=0.001)
+    poller.wait_until(lambda: "done")
+    assert poller.poll_count == 1
+    results = iter([False, False, True])
+    poller.wait_until(lambda: next(results))
+    assert poller.poll_count == 3
+    # The count of the previous wait must not leak into an immediate success.
+    poller.wait_until(lambda: True)
+    assert poller.poll_count == 1
+    results = iter([False, False, False, False, True])
+    asyncio.run(poller.wait_until_async(lambda: next(results)))
+    assert poller.poll_count == 5
+
+
+def test_cancel_async_during_pause():
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+    start_s = time.perf_counter()
+    with pytest.raises(PollCancelledError):
+        asyncio.run(Poller(max_interval_s=10, initial_interval_s=5, cancel_event=cancel_event).wait_until_async(lambda: False))
+    assert time.perf_counter() - start_s < 1
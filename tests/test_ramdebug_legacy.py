@@ -0,0 +1,65 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the legacy RAMDebug interface using a simulated module.
+
+No hardware is needed to run these tests.
+"""
+
+from pytrinamic.tmcl import TMCLCommand, TMCLStatus
+from pytrinamic.RAMDebug import RAMDebug, RAMDebug_Channel, RAMDebug_Command, RAMDebug_State, Channel
+from pytrinamic.rd import Rd
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class SimulatedRamDebugModule(SimulatedTmclInterface):
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self, raw_samples):
+        super().__init__()
+        self.raw_samples = raw_samples
+        self.log = []
+
+    def handle(self, request, module_id):
+        self.log.append(request)
+        if request.commandType == Rd._Command.GET_INFO:
+            return {Rd.Info.MAX_CHANNELS: 4, Rd.Info.BUFFER_ELEMENTS: 100, Rd.Info.SAMPLING_FREQUENCY: 1000}[request.value]
+        elif request.commandType == Rd._Command.GET_STATE:
+            return Rd.State.COMPLETE
+        elif request.commandType == Rd._Command.GET_SAMPLE:
+            return self.raw_samples[request.value]
+        elif request.commandType == Rd._Command.SET_PROCESS_FREQUENCY:
+            return TMCLStatus.WRONG_TYPE, 0
+        return 0
+
+
+def test_legacy_enums_match_rd():
+    assert RAMDebug_Command.GET_SAMPLE == Rd._Command.GET_SAMPLE
+    assert RAMDebug_Channel.CHANNEL_GLOBAL_PARAMETER == Rd.Channel.GLOBAL_PARAMETER
+    assert RAMDebug_State(42) == RAMDebug_State.UNKNOWN_STATUS
+
+
+def test_measurement_and_decode():
+    raw_samples = []
+    for i in range(10):
+        raw_samples.append(0xFFFF_FFFF - i)  # Signed register, -1 - i
+        raw_samples.append((0x1F0 - i) << 4)  # Signed 9 bit field at shift 4
+    module = SimulatedRamDebugModule(raw_samples)
+
+    debug = RAMDebug(module)
+    assert (debug.MAX_CHANNELS, debug.MAX_ELEMENTS, debug.MAX_FREQUENCY) == (4, 100, 1000)
+    debug.set_channel(Channel.register(0, 0x20, signed=True))
+    debug.set_channel(Channel.field(0, (0x21, 0x1FF << 4, 4), signed=True))
+    debug.set_sample_count(10)
+    debug.start_measurement()
+    assert module.log[-1].commandType == Rd._Command.ENABLE_TRIGGER
+    assert debug.is_measurement_done()
+
+    samples = debug.get_samples()
+    assert samples[0] == [-1 - i for i in range(10)]
+    assert samples[1] == [0x1F0 - i - 0x200 for i in range(10)]
+    sample_requests = [request for request in module.log if request.command == TMCLCommand.RAMDEBUG and request.commandType == Rd._Command.GET_SAMPLE]
+    assert [request.value for request in sample_requests] == list(range(20))
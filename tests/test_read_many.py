@@ -0,0 +1,62 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the batched register and field reads using simulated register maps.
+
+No hardware is needed to run these tests.
+"""
+
+import pytest
+
+from pytrinamic.ic import TMC9660, MAX22216
+from pytrinamic.evalboards import MAX22216_eval
+
+from test_register_shadow import SimulatedRegisterDevice
+from test_register_transaction import SimulatedRegisterBus
+
+
+def test_read_many_reads_every_register_once():
+    device = SimulatedRegisterDevice()
+    device.registers[(0, 0x20)] = 0xFFFE_0005
+    device.registers[(0, 0x48)] = 0xFFFF_FFFF
+    device.registers[(0, 0x60)] = 0x0003_0004
+    targets = [
+        TMC9660.MCC.MOTOR_CONFIG.TYPE,
+        TMC9660.MCC.ADC_I1_I0_RAW.I1,
+        TMC9660.MCC.ADC_I1_I0_RAW.I0,
+        TMC9660.MCC.ADC_IV,
+        TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS,
+        TMC9660.MCC.ADC_I1_I0_RAW,
+    ]
+    values = device.read_many(targets)
+    assert device.log == [("read", 0, 0x20), ("read", 0, 0x48), ("read", 0, 0x60)]
+    assert values == {target: device.read(target) for target in targets}
+    assert values[TMC9660.MCC.ADC_I1_I0_RAW.I1] == -2
+    assert values[TMC9660.MCC.ADC_IV] == -1
+    assert values[TMC9660.MCC.MOTOR_CONFIG.TYPE] == 3
+
+
+def test_read_many_is_pipelined():
+    bus = SimulatedRegisterBus()
+    ic = TMC9660(bus)
+    ic.read_many([TMC9660.MCC.MOTOR_CONFIG.TYPE, TMC9660.MCC.PID_CONFIG, TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS])
+    assert [entry[0] for entry in bus.log] == ["read", "read"]
+    assert bus.max_in_flight == 2
+
+    with pytest.raises(ValueError):
+        ic.read_many([0x60])
+
+
+def test_solenoid_reads_each_register_once():
+    bus = SimulatedRegisterBus()
+    bus.registers[(1, MAX22216.FIELD.VDR_NDUTY[0])] = 0x10
+    bus.registers[(1, MAX22216.FIELD.CTRL_MODE_0[0])] = 0x4000
+    bus.registers[(1, MAX22216.FIELD.DC_H_0[0])] = 0xFFFF
+    eval_board = MAX22216_eval(bus)
+    solenoid = eval_board.ics[0].motors[0]
+    solenoid.set_voltage_supply(24)
+    # Current drive with a full scale factor of 2/3
+    assert solenoid.get_voltage_high() == pytest.approx(36700 * 0.000075 * 2 / 3)
+    assert sorted(entry[1][1] for entry in bus.log) == [0x01, 0x0A, 0x0D]
+    assert bus.max_in_flight == 3
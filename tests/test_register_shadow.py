@@ -0,0 +1,93 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the shadow registers of the RegisterApiDevice using a simulated register map.
+
+No hardware is needed to run these tests.
+"""
+
+import collections
+
+import pytest
+
+from pytrinamic.ic import TMC9660, RegisterApiDevice
+
+
+class SimulatedRegisterDevice(RegisterApiDevice):
+
+    def __init__(self):
+        self.registers = collections.defaultdict(int)
+        self.log = []
+
+    def read_register(self, register_address, block, signed=False):
+        self.log.append(("read", block, register_address))
+        value = self.registers[(block, register_address)]
+        if signed and value & 0x8000_0000:
+            value -= 1 << 32
+        return value
+
+    def write_register(self, register_address, block, value):
+        self.log.append(("write", block, register_address))
+        self.registers[(block, register_address)] = value & 0xFFFF_FFFF
+
+
+def test_field_writes_without_shadow():
+    device = SimulatedRegisterDevice()
+    device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+    device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC)
+    assert [entry[0] for entry in device.log] == ["read", "write", "read", "write"]
+    assert device.registers[(0, 0x60)] == 0x0003_0004
+
+
+def test_field_writes_from_shadow():
+    device = SimulatedRegisterDevice()
+    device.registers[(0, 0x60)] = 0x0001_0000
+    device.enable_shadow()
+    device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+    device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC)
+    device.write(TMC9660.MCC.PID_CONFIG, 0x10)
+    device.write(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET, 1)
+    assert [entry[0] for entry in device.log] == ["read", "write", "write", "write", "write"]
+    assert device.registers[(0, 0x60)] == 0x0003_0004
+    assert device.registers[(0, 0x180)] == 0x11
+
+    # Changes behind the shadow's back are only seen after refresh() or invalidate()
+    device.registers[(0, 0x60)] = 0x0001_0000
+    device.refresh(TMC9660.MCC.MOTOR_CONFIG)
+    device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 2)
+    assert device.registers[(0, 0x60)] == 0x0001_0002
+
+    device.registers[(0, 0x180)] = 0
+    device.invalidate(TMC9660.MCC)
+    device.log.clear()
+    device.write(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET, 1)
+    assert [entry[0] for entry in device.log] == ["read", "write"]
+    assert device.registers[(0, 0x180)] == 0x1
+
+
+def test_volatile_registers_are_not_shadowed():
+    device = SimulatedRegisterDevice()
+    device.enable_shadow()
+    # Write to clear flags are written directly
+    device.write(TMC9660.MCC.GDRV_STATUS.LS_SHORT_V, 1)
+    # Read only registers are read every time
+    device.read(TMC9660.MCC.ADC_I1_I0_RAW)
+    device.read(TMC9660.MCC.ADC_I1_I0_RAW.I0)
+    assert [entry[0] for entry in device.log] == ["write", "read", "read"]
+    assert device._shadow == {}
+
+    # Reads fill the shadow of writable registers
+    device.read(TMC9660.MCC.MOTOR_CONFIG.TYPE)
+    device.log.clear()
+    device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE, 2)
+    assert [entry[0] for entry in device.log] == ["write"]
+
+    device.enable_shadow(False)
+    device.refresh()
+    device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE, 1)
+    assert [entry[0] for entry in device.log] == ["write", "read", "write"]
+
+    with pytest.raises(ValueError):
+        device.enable_shadow()
+        device.invalidate(42)
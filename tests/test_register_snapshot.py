@@ -0,0 +1,89 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for register dumps and snapshots using simulated register maps.
+
+No hardware is needed to run these tests.
+"""
+
+import pytest
+
+from pytrinamic.ic import TMC9660, RegisterTable, TableRegisterGroup, RegisterSnapshot, RegisterSnapshotError
+
+from test_register_shadow import SimulatedRegisterDevice
+from test_register_transaction import SimulatedRegisterBus
+
+
+FLAGS = TableRegisterGroup("FLAGS", RegisterTable((
+    ("CONFIG", "RW", 0x00, False, (("MODE", "RW", 0x0F, 0, False, None), ("OFFSET", "RW", 0xFF00, 8, True, None))),
+    ("STATUS", "R", 0x01, False, (("BUSY", "R", 0x01, 0, False, None), ("ERROR", "RC", 0x02, 1, False, None))),
+    ("EVENTS", "RC", 0x02, False, ()),
+    ("COMMAND", "W", 0x03, False, ()),
+    ("POSITION", "R", 0x04, True, ()),
+)), channel=0, block=2)
+
+
+def test_dump_skips_write_only_and_read_to_clear():
+    device = SimulatedRegisterDevice()
+    device.registers[(2, 0x00)] = 0xFE05
+    device.registers[(2, 0x04)] = 0xFFFF_FFFF
+    snapshot = device.dump(FLAGS)
+    assert device.log == [("read", 2, 0x00), ("read", 2, 0x04)]
+    assert list(snapshot.addresses) == [0x00, 0x04]
+    assert snapshot.decode() == {"CONFIG": {"MODE": 5, "OFFSET": -2}, "POSITION": -1}
+    assert snapshot[FLAGS.CONFIG.OFFSET] == -2
+    assert snapshot[0x04] == 0xFFFF_FFFF
+    assert FLAGS.STATUS not in snapshot
+
+
+def test_dump_is_pipelined():
+    bus = SimulatedRegisterBus()
+    ic = TMC9660(bus)
+    bus.registers[(0, 0x60)] = 0x0003_0004
+    snapshot = ic.dump(TMC9660.MCC)
+    assert len(snapshot) == len(TMC9660.MCC.registers())
+    assert [entry[0] for entry in bus.log] == ["read"] * len(snapshot)
+    assert bus.max_in_flight == 8
+    assert snapshot.decode()["MOTOR_CONFIG"]["N_POLE_PAIRS"] == 4
+    assert snapshot[TMC9660.MCC.MOTOR_CONFIG.TYPE] == 3
+
+
+def test_diff_and_serialization():
+    device = SimulatedRegisterDevice()
+    device.registers[(0, 0x60)] = 0x0003_0004
+    working = device.dump(TMC9660.MCC)
+    device.registers[(0, 0x60)] = 0x0003_0007
+    device.registers[(0, 0x48)] = 0xFFFF_FFFF
+    broken = device.dump(TMC9660.MCC)
+
+    changes = broken.diff(working)
+    assert [(change.register.name, change.field and change.field.name, change.old, change.new) for change in changes] == [
+        ("ADC_IV", "IV", -1, 0),
+        ("MOTOR_CONFIG", "N_POLE_PAIRS", 7, 4),
+    ]
+    assert working.diff(working) == []
+
+    data = broken.to_bytes()
+    assert len(data) == 16 + len("ALL_REGISTERS") + 8*len(broken)
+    loaded = RegisterSnapshot.from_bytes(data, TMC9660.MCC)
+    assert loaded.diff(broken) == []
+    assert loaded.decode() == broken.decode()
+
+    with pytest.raises(RegisterSnapshotError):
+        RegisterSnapshot.from_bytes(data, TMC9660.ADC)
+    with pytest.raises(RegisterSnapshotError):
+        RegisterSnapshot.from_bytes(data[:-1], TMC9660.MCC)
+    with pytest.raises(RegisterSnapshotError):
+        RegisterSnapshot.from_bytes(b"TMCL", TMC9660.MCC)
+
+
+def test_unknown_addresses_are_rejected():
+    snapshot = RegisterSnapshot(FLAGS, [0x00, 0x04], [1, 2])
+    data = bytearray(snapshot.to_bytes())
+    # Move the POSITION entry to an address without register
+    data[-12] = 0x05
+    with pytest.raises(RegisterSnapshotError, match="0x5"):
+        RegisterSnapshot.from_bytes(bytes(data), FLAGS)
+    with pytest.raises(ValueError):
+        RegisterSnapshot(FLAGS, [0x00, 0x05], [1, 2])
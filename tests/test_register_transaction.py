@@ -0,0 +1,151 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for register transactions using simulated register maps.
+
+No hardware is needed to run these tests.
+"""
+
+import collections
+
+import pytest
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.ic import TMC9660, TMC5072, TMC5160
+from pytrinamic.evalboards import TMC5072_eval, TMC5160_eval
+
+from simulated_tmcl import SimulatedTmclInterface
+from test_register_shadow import SimulatedRegisterDevice
+
+
+class SimulatedRegisterBus(SimulatedTmclInterface):
+    """A module with registers behind the WRITE_MC/READ_MC and WRITE_DRV/READ_DRV commands."""
+
+    _PIPELINE_WINDOW = 8
+
+    def __init__(self):
+        super().__init__()
+        self.registers = collections.defaultdict(int)
+        self.log = []
+
+    def handle(self, request, module_id):
+        key = (request.motorBank, request.commandType)
+        if request.command in (TMCLCommand.WRITE_MC, TMCLCommand.WRITE_DRV):
+            self.log.append(("write", key))
+            self.registers[key] = request.value & 0xFFFF_FFFF
+        elif request.command in (TMCLCommand.READ_MC, TMCLCommand.READ_DRV):
+            self.log.append(("read", key))
+            return self.registers[key]
+        return 0
+
+
+def test_field_writes_are_merged():
+    device = SimulatedRegisterDevice()
+    device.registers[(0, 0x180)] = 0xFF
+    with device.transaction():
+        assert device.write(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET, 1) is None
+        device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+        device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC)
+        device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 7)
+        assert device.log == []
+    assert device.log == [("read", 0, 0x60), ("read", 0, 0x180), ("write", 0, 0x60), ("write", 0, 0x180)]
+    assert device.registers[(0, 0x60)] == 0x0003_0007
+    assert device.registers[(0, 0x180)] == 0xFF
+
+
+def test_register_write_replaces_field_writes():
+    device = SimulatedRegisterDevice()
+    with device.transaction():
+        device.write(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET, 1)
+        device.write(TMC9660.MCC.PID_CONFIG, 0x10)
+        with device.transaction():
+            device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+        assert device.log == []
+    # The register write makes the content known, PID_CONFIG is not read
+    assert device.log == [("read", 0, 0x60), ("write", 0, 0x60), ("write", 0, 0x180)]
+    assert device.registers[(0, 0x180)] == 0x10
+
+
+def test_transaction_uses_the_shadow():
+    device = SimulatedRegisterDevice()
+    device.enable_shadow()
+    device.read(TMC9660.MCC.MOTOR_CONFIG)
+    device.log.clear()
+    with device.transaction():
+        device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+    assert device.log == [("write", 0, 0x60)]
+    with device.transaction():
+        device.write(TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC)
+    assert device.registers[(0, 0x60)] == 0x0003_0004
+
+
+def test_failed_transaction_writes_nothing():
+    device = SimulatedRegisterDevice()
+    with pytest.raises(RuntimeError):
+        with device.transaction():
+            device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+            raise RuntimeError("abort")
+    assert device.log == []
+    # Invalid writes are still rejected at once
+    with pytest.raises(ValueError):
+        with device.transaction():
+            device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, -1)
+    assert device.log == []
+    device.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+    assert [entry[0] for entry in device.log] == ["read", "write"]
+
+
+def test_tmc9660_transaction_is_pipelined():
+    bus = SimulatedRegisterBus()
+    ic = TMC9660(bus)
+    with ic.transaction():
+        ic.write(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET, 1)
+        ic.write(TMC9660.MCC.MOTOR_CONFIG.N_POLE_PAIRS, 4)
+        ic.write(TMC9660.MCC.MOTOR_CONFIG.TYPE.choice.BLDC)
+    assert [entry[0] for entry in bus.log] == ["read", "read", "write", "write"]
+    assert bus.max_in_flight == 2
+    assert ic.read(TMC9660.MCC.MOTOR_CONFIG) == 0x0003_0004
+    assert ic.read(TMC9660.MCC.PID_CONFIG.KEEP_POS_TARGET) == 1
+
+
+def test_move_to_is_one_transaction():
+    bus = SimulatedRegisterBus()
+    bus.registers[(0, TMC5072.REG.RAMPMODE_M2)] = 0x1C
+    eval_board = TMC5072_eval(bus)
+    eval_board.ics[0].motors[1].move_to(1000, 5000)
+    # XTARGET covers the whole register and is not read
+    assert bus.log == [
+        ("read", (0, TMC5072.REG.RAMPMODE_M2)),
+        ("read", (0, TMC5072.REG.VMAX_M2)),
+        ("write", (0, TMC5072.REG.RAMPMODE_M2)),
+        ("write", (0, TMC5072.REG.VMAX_M2)),
+        ("write", (0, TMC5072.REG.XTARGET_M2)),
+    ]
+    assert bus.max_in_flight == 3
+    assert bus.registers[(0, TMC5072.REG.RAMPMODE_M2)] == 0x1C
+    assert bus.registers[(0, TMC5072.REG.VMAX_M2)] == 5000
+    assert bus.registers[(0, TMC5072.REG.XTARGET_M2)] == 1000
+
+
+def test_eval_transaction_without_pipelining():
+    class Connection:
+        def __init__(self):
+            self.registers = collections.defaultdict(int)
+            self.log = []
+
+        def write_mc(self, register_address, value, module_id=None):
+            self.log.append(("write", register_address))
+            self.registers[register_address] = value
+
+        def read_mc(self, register_address, module_id=None, signed=False):
+            self.log.append(("read", register_address))
+            return self.registers[register_address]
+
+    connection = Connection()
+    eval_board = TMC5160_eval(connection)
+    with eval_board.transaction():
+        eval_board.write_register_field(TMC5160.FIELD.XTARGET, -1)
+        eval_board.write_register_field(TMC5160.FIELD.RAMPMODE, 2)
+    assert connection.log == [("read", TMC5160.REG.RAMPMODE), ("write", TMC5160.REG.RAMPMODE), ("write", TMC5160.REG.XTARGET)]
+    assert connection.registers[TMC5160.REG.XTARGET] == 0xFFFF_FFFF
@@ -0,0 +1,90 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the bus scan using a simulated CAN bus.
+
+No hardware is needed to run these tests.
+"""
+
+from pytrinamic.connections.can_tmcl_interface import CanTmclInterface
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.modules import scan, TMCM1636
+from pytrinamic.modules.registry import module_class
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class SimulatedBus(SimulatedTmclInterface):
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self, modules):
+        super().__init__()
+        self.modules = modules
+        self.timeout = 5
+        self.sent = 0
+        self.received = 0
+
+    def handle(self, request, module_id):
+        if module_id not in self.modules:
+            return None
+        assert request.command == TMCLCommand.GET_FIRMWARE_VERSION and request.commandType == 1
+        module_number, major, minor = self.modules[module_id]
+        return (module_number << 16) | (major << 8) | minor
+
+    def _send(self, host_id, module_id, data):
+        # Silent modules queue no reply, count the requests in flight instead.
+        self.sent += 1
+        self.max_in_flight = max(self.max_in_flight, self.sent - self.received)
+        super()._send(host_id, module_id, data)
+
+    def _recv(self, host_id, module_id):
+        if not self.replies:
+            # The probes still outstanding time out together.
+            self.received = self.sent
+        else:
+            self.received += 1
+        return super()._recv(host_id, module_id)
+
+    def set_timeout(self, timeout):
+        self.timeout = timeout
+
+    def get_timeout(self):
+        return self.timeout
+
+
+class SimulatedCanBus(SimulatedBus, CanTmclInterface):
+    pass
+
+
+def test_scan():
+    bus = SimulatedBus({3: (1636, 1, 2), 7: (4242, 3, 10)})
+    found = scan(bus, timeout_s=0.01)
+    assert bus.sent == 255
+    assert bus.max_in_flight == 4
+    assert bus.timeout == 5
+    assert [(module.module_id, module.module_number, module.firmware_version) for module in found] == [(3, 1636, (1, 2)), (7, 4242, (3, 10))]
+    assert isinstance(found[0].module, TMCM1636)
+    assert found[0].module.module_id == 3
+    assert found[1].module is None
+    assert found[1].name == "Unknown module 4242"
+
+
+def test_scan_can_sends_all_probes_at_once():
+    bus = SimulatedCanBus({3: (1636, 1, 2)})
+    found = scan(bus, timeout_s=0.01)
+    assert bus.max_in_flight == 255
+    assert [module.module_id for module in found] == [3]
+
+
+def test_scan_one_by_one():
+    bus = SimulatedBus({2: (1636, 1, 0)})
+    bus.set_pipeline_window(1)
+    found = scan(bus, range(1, 5))
+    assert [module.module_id for module in found] == [2]
+
+
+def test_registry():
+    assert module_class(1636) is TMCM1636
+    assert module_class(1) is None
@@ -0,0 +1,79 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the SoftScope using a simulated TMCL module.
+
+No hardware is needed to run these tests.
+"""
+
+import time
+
+import pytest
+
+from pytrinamic.tmcl import TMCLCommand
+from pytrinamic.datalogger import DataLogger
+from pytrinamic.softscope import SoftScope
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class CountingModule(SimulatedTmclInterface):
+    """Every GAP returns an increasing counter, every READ_MC a negative 16 bit field."""
+
+    def __init__(self):
+        super().__init__()
+        self.counter = 0
+
+    def handle(self, request, module_id):
+        if request.command == TMCLCommand.GAP:
+            self.counter += 1
+            return self.counter
+        elif request.command == TMCLCommand.READ_MC:
+            return 0xFFFE_0000
+        return 0
+
+
+@pytest.mark.parametrize("spin_s", [0, 0.0005])
+def test_fixed_rate_capture(spin_s):
+    scope = SoftScope(CountingModule())
+    scope.config.spin_s = spin_s
+    scope.config.log_data = {
+        "counter": DataLogger.DataTypeAp(index=1),
+        "field": DataLogger.DataTypeField(block=0, field=(0x10, 0xFFFF_0000, 16), channel=0, signed=True),
+        "custom": lambda: -5,
+    }
+    scope.config.samples_per_channel = 20
+    scope.config.rate_hz = 500
+    scope.start()
+    scope.wait_till_done(timeout_s=5)
+
+    log = scope.get_log()
+    assert log.data["counter"].samples == list(range(1, 21))
+    assert log.data["field"].samples == [-2]*20
+    assert log.data["custom"].samples == [-5]*20
+    assert log.time_vector[0] == 0
+    assert abs(log.time_vector[-1] - 19/500) < 0.01
+
+    statistics = scope.get_statistics()
+    assert statistics.sample_count == 20
+    assert abs(statistics.achieved_rate_hz - 500) < 50
+
+
+def test_continuous_ring_buffer():
+    scope = SoftScope(CountingModule())
+    scope.config.log_data = {"counter": DataLogger.DataTypeAp(index=1)}
+    scope.config.samples_per_channel = 5
+    scope.config.rate_hz = 1000
+    scope.config.continuous = True
+    scope.start()
+    deadline = time.monotonic() + 5
+    while scope._sample_count < 12:
+        assert time.monotonic() < deadline, "The continuous scope stopped sampling"
+        time.sleep(0.001)
+    scope.stop()
+
+    samples = scope.get_log().data["counter"].samples
+    assert len(samples) == 5
+    assert samples == list(range(samples[0], samples[0] + 5))
+    assert samples[0] > 1
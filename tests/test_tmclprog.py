@@ -0,0 +1,292 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""Tests for the TMCL program representation, binary format and loader using a simulated module.
+
+No hardware is needed to run these tests.
+"""
+
+import pytest
+
+from pytrinamic.tmcl import TMCLCommand, TMCLStatus
+from pytrinamic.tmclprog import Instruction, Program, ProgramLoader, ProgramVerifyError, assemble, disassemble, load, save
+from pytrinamic.tmclprog import Sequence, SequenceError, Label, JumpCondition
+from pytrinamic.tmclprog import Interpreter, VirtualModule, check_jumps, BadJumpError, EndlessLoopError
+
+from simulated_tmcl import SimulatedTmclInterface
+
+
+class SimulatedStandaloneModule(SimulatedTmclInterface):
+
+    _PIPELINE_WINDOW = 4
+
+    def __init__(self):
+        super().__init__()
+        self.memory = {}
+        self.download_mode = False
+        self.address = 0
+        self.running = False
+        self.log = []
+
+    def handle(self, request, module_id):
+        self.log.append(request.command)
+        if request.command == TMCLCommand.START_DOWNLOAD_MODE:
+            self.download_mode = True
+            self.address = request.value
+        elif request.command == TMCLCommand.QUIT_DOWNLOAD_MODE:
+            self.download_mode = False
+        elif self.download_mode:
+            self.memory[self.address] = (request.command, request.commandType, request.value)
+            self.address += 1
+            return TMCLStatus.COMMAND_LOADED, 0
+        elif request.command == TMCLCommand.READ_TMCL_MEMORY:
+            return self.memory.get(request.value, (0, 0, 0))
+        elif request.command == TMCLCommand.RUN_APPLICATION:
+            self.running = True
+        elif request.command == TMCLCommand.GET_APPLICATION_STATUS:
+            # The program finishes after being polled once
+            running, self.running = self.running, False
+            return int(running)
+        return 0
+
+
+def _example_program():
+    program = Program()
+    program.append(TMCLCommand.SAP, 4, 0, 51200)
+    loop = program.append(TMCLCommand.MVP, 0, 0, 51200)
+    program.append(TMCLCommand.WAIT, 1, 0, 0)
+    program.append(TMCLCommand.MVP, 0, 0, -51200)
+    program.append(TMCLCommand.WAIT, 1, 0, 0)
+    program.append(TMCLCommand.JA, 0, 0, loop)
+    return program
+
+
+def test_assemble_disassemble(tmp_path):
+    program = _example_program()
+    data = assemble(program)
+    assert len(data) == 8 * len(program)
+    # MVP ABS 0, -51200 with checksum
+    assert data[24:32] == bytes([TMCLCommand.MVP, 0, 0, 0xFF, 0xFF, 0x38, 0x00, (TMCLCommand.MVP + 0xFF + 0xFF + 0x38) & 0xFF])
+    assert disassemble(data) == program
+
+    path = tmp_path / "program.bin"
+    save(program, path)
+    assert load(path) == program
+
+    with pytest.raises(ValueError):
+        disassemble(data[:-1])
+
+
+def test_instruction():
+    instruction = Instruction(TMCLCommand.MVP, 0, 0, 0xFFFF_FFFF)
+    assert instruction.value == -1
+    assert str(instruction) == "MVP 0, 0, -1"
+    with pytest.raises(ValueError):
+        Instruction(256)
+
+
+def test_download_verify_and_skip():
+    module = SimulatedStandaloneModule()
+    loader = ProgramLoader(module)
+    program = _example_program()
+
+    assert loader.download(program)
+    assert module.log.count(TMCLCommand.START_DOWNLOAD_MODE) == 1
+    assert module.log.count(TMCLCommand.QUIT_DOWNLOAD_MODE) == 1
+    assert [module.memory[i] for i in range(len(program))] == [(i.opcode, i.type, i.value & 0xFFFF_FFFF) for i in program]
+
+    # The same program again is only read back
+    module.log.clear()
+    assert not loader.download(program)
+    assert set(module.log) == {TMCLCommand.READ_TMCL_MEMORY}
+
+    # A changed program is downloaded again
+    changed = Program(program)
+    changed.instructions[1] = Instruction(TMCLCommand.MVP, 0, 0, 1000)
+    assert loader.download(changed)
+    assert loader.matches(changed)
+
+
+def test_verify_error():
+    module = SimulatedStandaloneModule()
+    loader = ProgramLoader(module)
+    program = _example_program()
+    loader.download(program)
+    module.memory[2] = (TMCLCommand.WAIT, 0, 0)
+    with pytest.raises(ProgramVerifyError) as excinfo:
+        loader.verify(program)
+    assert excinfo.value.index == 2
+
+
+def test_sequence_repeat():
+    seq = Sequence(first_variable=10)
+    with seq.repeat(3):
+        seq.move_to(0, 1000)
+        seq.wait_position_reached(0)
+        seq.set_output(1, True)
+    program = seq.compile()
+    assert [str(instruction) for instruction in program] == [
+        "SGP 10, 2, 3",
+        "MVP 0, 0, 1000",
+        "WAIT 1, 0, 0",
+        "SIO 1, 2, 1",
+        "GGP 10, 2, 0",
+        "CALC 1, 0, 1",
+        "AGP 10, 2, 0",
+        "COMP 0, 0, 0",
+        "JC 3, 0, 1",
+        "STOP 0, 0, 0",
+    ]
+
+
+def test_sequence_nested_blocks_and_labels():
+    seq = Sequence()
+    with seq.forever():
+        with seq.repeat(2):
+            with seq.repeat(5):
+                seq.rotate(0, -100)
+        seq.get_input(0)
+        seq.compare(1)
+        with seq.when(JumpCondition.EQ):
+            seq.stop()
+    program = seq.compile()
+    counters = [instruction.type for instruction in program if instruction.opcode == TMCLCommand.SGP]
+    assert counters == [0, 1]
+    rol = [instruction for instruction in program if instruction.opcode == TMCLCommand.ROL]
+    assert rol[0].value == 100
+    skip = [instruction for instruction in program if instruction.opcode == TMCLCommand.JC][-1]
+    assert skip.type == JumpCondition.NE
+    assert program[skip.value].opcode == TMCLCommand.JA
+    assert program[-1].opcode == TMCLCommand.STOP
+
+    seq = Sequence()
+    seq.jump(Label())
+    with pytest.raises(SequenceError):
+        seq.compile()
+
+
+def test_sequence_run():
+    module = SimulatedStandaloneModule()
+    seq = Sequence()
+    seq.move_by(0, 100)
+    seq.wait_s(0.5)
+    program = seq.run(module, timeout_s=1)
+    assert program[1].value == 50
+    assert module.log.count(TMCLCommand.START_DOWNLOAD_MODE) == 1
+    assert TMCLCommand.RUN_APPLICATION in module.log
+    assert module.log[-1] == TMCLCommand.GET_APPLICATION_STATUS
+
+    # Running again does not download again
+    module.log.clear()
+    seq.run(module, timeout_s=1)
+    assert TMCLCommand.START_DOWNLOAD_MODE not in module.log
+
+
+def test_interpreter_repeat_loop():
+    seq = Sequence()
+    seq.set_axis_parameter(4, 0, 1000)
+    with seq.repeat(3):
+        seq.move_to(0, 500)
+        seq.wait_position_reached(0)
+        seq.set_output(0, True)
+        seq.move_to(0, 0)
+        seq.wait_position_reached(0)
+        seq.wait_ticks(10)
+    program = seq.compile()
+
+    module = VirtualModule()
+    report = Interpreter(program, module).run()
+    assert report.stopped
+    assert report.coverage == 1.0
+    assert report.branch_coverage == 1.0
+    assert report.instruction_counts[1] == 1  # The loop body starts after the counter initialization
+    assert report.instruction_counts[2] == 3
+    # 3 times 2 * 0.5 s of motion and 0.1 s of waiting
+    assert abs(report.wait_time_s - 3.3) < 1e-9
+    assert report.time_s == report.wait_time_s
+    assert module.outputs == {0: 1}
+    assert module.get_axis_parameter(1, 0) == 0
+
+
+def test_interpreter_subroutines_and_arithmetic():
+    program = Program()
+    program.append(TMCLCommand.CALC, 9, 0, 7)       # LOAD 7
+    program.append(TMCLCommand.CSUB, 0, 0, 5)
+    program.append(TMCLCommand.AGP, 0, 2, 0)
+    program.append(TMCLCommand.STOP)
+    program.append(TMCLCommand.STOP)
+    program.append(TMCLCommand.CALC, 2, 0, -3)      # MUL -3
+    program.append(TMCLCommand.CALC, 3, 0, 2)       # DIV 2, truncated towards zero
+    program.append(TMCLCommand.RSUB)
+    interpreter = Interpreter(program)
+    report = interpreter.run()
+    assert interpreter.module.get_global_parameter(0, 2) == -10
+    assert report.unexecuted() == [4]
+
+
+def test_interpreter_poll_loop():
+    # MVP ABS 0, 1000; loop: GAP 8, 0; COMP 1; JC NE, loop; STOP
+    program = Program()
+    program.append(TMCLCommand.SAP, 4, 0, 1000)
+    program.append(TMCLCommand.MVP, 0, 0, 1000)
+    program.append(TMCLCommand.GAP, 8, 0, 0)
+    program.append(TMCLCommand.COMP, 0, 0, 1)
+    program.append(TMCLCommand.JC, JumpCondition.NE, 0, 2)
+    program.append(TMCLCommand.STOP)
+    report = Interpreter(program).run()
+    assert report.stopped
+    assert report.time_s == pytest.approx(1.0)
+    assert report.wait_time_s == 0
+
+    # Polling the position of a rotating motor ends when it passes the threshold
+    program = Program()
+    program.append(TMCLCommand.ROR, 0, 0, 100)
+    program.append(TMCLCommand.GAP, 1, 0, 0)
+    program.append(TMCLCommand.COMP, 0, 0, 50)
+    program.append(TMCLCommand.JC, JumpCondition.LT, 0, 1)
+    program.append(TMCLCommand.STOP)
+    report = Interpreter(program).run()
+    assert report.stopped
+    assert report.time_s == pytest.approx(0.5)
+
+
+def test_interpreter_detects_endless_loops_and_bad_jumps():
+    # Waiting for an input which never changes
+    seq = Sequence()
+    seq.wait_input(3, 1)
+    with pytest.raises(EndlessLoopError) as excinfo:
+        Interpreter(seq.compile()).run()
+    assert excinfo.value.index == 2
+    report = Interpreter(seq.compile(), VirtualModule(inputs={(0, 3): 1})).run()
+    assert report.stopped
+    assert report.branch_coverage == 0.5
+
+    # Waiting for a rotating motor
+    program = Program()
+    program.append(TMCLCommand.ROR, 0, 0, 100)
+    program.append(TMCLCommand.WAIT, 1, 0, 0)
+    program.append(TMCLCommand.STOP)
+    with pytest.raises(EndlessLoopError):
+        Interpreter(program).run()
+
+    # A forever loop with waits is ended by the time limit
+    seq = Sequence()
+    with seq.forever():
+        seq.wait_s(1)
+    report = Interpreter(seq.compile(), max_time_s=10).run()
+    assert not report.stopped
+    assert report.time_s == pytest.approx(10)
+    with pytest.raises(EndlessLoopError):
+        Interpreter(seq.compile(), max_steps=100).run()
+
+    program = Program()
+    program.append(TMCLCommand.JA, 0, 0, 5)
+    with pytest.raises(BadJumpError):
+        check_jumps(program)
+    with pytest.raises(BadJumpError):
+        Interpreter(program).run()
+    program = Program()
+    program.append(TMCLCommand.WAIT, 0, 0, 1)
+    with pytest.raises(BadJumpError):
+        Interpreter(program).run()
@@ -0,0 +1,118 @@
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+"""
+Generate the table backed TMC9660 maps from the class based maps.
+
+The class based maps in tools/tmc9660_maps are the source of the register and
+parameter maps, the TMC9660 uses the *table.py modules generated from them.
+Run this after the class based maps changed, from the repository root:
+
+    python tools/generate_tmc9660_tables.py
+
+Use --check to only report outdated tables, e.g. in CI.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "tmc9660_maps"))
+
+from pytrinamic.ic import Option
+from pytrinamic.modules import Parameter
+from MCCmap import MCCMap
+from ADCmap import ADCMap
+from SYS_CTRLmap import SYS_CTRLMap
+from TMC9660_ap import Ap
+from TMC9660_gpbank0 import GpBank0
+from TMC9660_gpbank2 import GpBank2
+from TMC9660_gpbank3 import GpBank3
+
+
+HEADER = """\
+################################################################################
+# Copyright © 2025 Analog Devices Inc. All Rights Reserved.
+# This software is proprietary to Analog Devices, Inc. and its licensors.
+################################################################################
+
+# This file was generated. Do not modify it manually!
+
+"""
+
+REGISTER_TABLES = {
+    "MCCtable.py": lambda: MCCMap().ALL_REGISTERS,
+    "ADCtable.py": lambda: ADCMap().ALL_REGISTERS,
+    "SYS_CTRLtable.py": lambda: SYS_CTRLMap().ALL_REGISTERS,
+}
+
+PARAMETER_TABLES = {
+    "TMC9660_ap_table.py": Ap,
+    "TMC9660_gpbank0_table.py": GpBank0,
+    "TMC9660_gpbank2_table.py": GpBank2,
+    "TMC9660_gpbank3_table.py": GpBank3,
+}
+
+
+def _options(choice, option_type):
+    # The options in the order the map defines them
+    if choice is None:
+        return None
+    return tuple((option.name, option.value) for option in vars(choice).values() if isinstance(option, option_type))
+
+
+def register_table(register_group):
+    lines = [HEADER, "# name, access, address, signed, ((name, access, mask, shift, signed, options), ...)\n", "REGISTERS = (\n"]
+    for register in register_group.registers():
+        lines.append(f"    ({register.name!r}, {register.access.name!r}, 0x{register.address:04X}, {bool(register.signed)}, (\n")
+        for field in register.fields():
+            options = _options(field.choice, Option)
+            lines.append(f"        ({field.name!r}, {field.access.name!r}, 0x{field.mask:08X}, {field.shift}, {field.signed}, {options!r}),\n")
+        lines.append("    )),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def parameter_table(parameter_group):
+    lines = [HEADER, "# name, index, access, datatype, ((name, value), ...) or None, ((name, mask, shift), ...) or None\n", "PARAMETERS = (\n"]
+    for parameter in vars(parameter_group).values():
+        if not isinstance(parameter, Parameter):
+            continue
+        options = _options(getattr(parameter, "choice", None), Parameter.Option)
+        fields = getattr(parameter, "fields", None)
+        if fields is not None:
+            items = [f"({field.name!r}, 0x{field.mask:08X}, {field.shift})" for field in fields]
+            fields = "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
+        lines.append(f"    ({parameter.name!r}, {parameter.index}, {parameter.access.name!r}, {parameter.datatype.name!r}, {options!r}, {fields}),\n")
+    lines.append(")\n")
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only check that the tables are up to date")
+    args = parser.parse_args()
+
+    directory = os.path.join(os.path.dirname(__file__), os.pardir, "pytrinamic", "ic", "TMC9660")
+    tables = {name: register_table(group()) for name, group in REGISTER_TABLES.items()}
+    tables.update({name: parameter_table(group()) for name, group in PARAMETER_TABLES.items()})
+    outdated = []
+    for name, content in tables.items():
+        path = os.path.join(directory, name)
+        with open(path, encoding="utf-8") as file:
+            current = file.read()
+        if current == content:
+            continue
+        outdated.append(name)
+        if not args.check:
+            with open(path, "w", encoding="utf-8", newline="\n") as file:
+                file.write(content)
+    for name in outdated:
+        print(f"{'Outdated' if args.check else 'Updated'}: {name}")
+    return 1 if args.check and outdated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())